@@ -215,6 +215,9 @@ Some suggestions:
                     output_file.write(state["last_chat_response"])
                     output_file.write("\n")
 
+        # Make sure the thinking files are complete and their handles released
+        input_processor.close()
+
     def parse_args(self):
         """
         Parse command line arguments into member variables
@@ -0,0 +1,175 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+from typing import List
+from typing import TextIO
+from typing import Tuple
+
+import atexit
+import threading
+
+from collections import OrderedDict
+from logging import getLogger
+from logging import Logger
+from pathlib import Path
+
+DEFAULT_MAX_OPEN_FILES: int = 64
+DEFAULT_FLUSH_INTERVAL_SECONDS: float = 0.25
+
+
+# pylint: disable=too-many-instance-attributes
+class BufferedFileWriter:
+    """
+    Appends text to any number of files without the caller ever waiting on disk I/O.
+
+    Writes are buffered in memory and a background thread periodically
+    appends them to their files.  Open file handles are kept around between
+    flushes, but only up to a maximum number of them, with the least recently
+    used handles getting closed first.
+
+    Anything still buffered is written out on flush(), close() or when the
+    process exits.
+    """
+
+    def __init__(self, max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+                 flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS):
+        """
+        Constructor
+
+        :param max_open_files: The maximum number of file handles kept open at any one time
+        :param flush_interval_seconds: The number of seconds between background flushes
+        """
+        self.max_open_files: int = max(1, max_open_files)
+        self.flush_interval_seconds: float = flush_interval_seconds
+        self.logger: Logger = getLogger(self.__class__.__name__)
+
+        # Guards the buffers, which are filled by callers and emptied by flushes
+        self.buffer_lock = threading.Lock()
+        # Path -> (header for a new file, list of text to append)
+        self.buffers: Dict[Path, Tuple[str, List[str]]] = {}
+
+        # Guards the open files, which are only touched by flushes
+        self.io_lock = threading.Lock()
+        self.open_files: OrderedDict[Path, TextIO] = OrderedDict()
+
+        self.wakeup = threading.Event()
+        self.closed: bool = False
+        self.thread: threading.Thread = None
+
+    def write(self, path: Path, text: str, header: str = None):
+        """
+        Buffers text to be appended to a file.  Returns right away.
+
+        :param path: The path of the file to append to
+        :param text: The text to append
+        :param header: Text to write first if the file does not exist yet. Can be None.
+        """
+        with self.buffer_lock:
+            if self.closed:
+                raise ValueError("BufferedFileWriter is closed")
+
+            buffered: Tuple[str, List[str]] = self.buffers.get(path)
+            if buffered is None:
+                buffered = (header, [])
+                self.buffers[path] = buffered
+            buffered[1].append(text)
+
+            if self.thread is None:
+                self._start()
+
+    def flush(self):
+        """
+        Synchronously writes out everything buffered so far.
+        """
+        # Hold the io_lock from taking the buffers until they are written, so that
+        # a flush never returns while another one still has earlier text in hand.
+        with self.io_lock:
+            with self.buffer_lock:
+                buffers: Dict[Path, Tuple[str, List[str]]] = self.buffers
+                self.buffers = {}
+
+            for path, (header, texts) in buffers.items():
+                try:
+                    self._append(path, header, texts)
+                except OSError as os_error:
+                    # Nobody is waiting on us to report this to, so log and move on.
+                    self.logger.error("Could not write to %s: %s", path, os_error)
+            for thinking in self.open_files.values():
+                thinking.flush()
+
+    def close(self):
+        """
+        Writes out everything buffered and releases all open files.
+        The instance cannot be written to afterwards.
+        """
+        with self.buffer_lock:
+            if self.closed:
+                return
+            self.closed = True
+            thread: threading.Thread = self.thread
+
+        if thread is not None:
+            self.wakeup.set()
+            thread.join()
+            atexit.unregister(self.close)
+
+        self.flush()
+        with self.io_lock:
+            for thinking in self.open_files.values():
+                thinking.close()
+            self.open_files.clear()
+
+    def _start(self):
+        """
+        Starts the background flush thread.
+        Must be called while holding the buffer_lock.
+        """
+        self.thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self.thread.start()
+        # Daemon threads do not get to finish on their own at exit, so make sure nothing is lost.
+        atexit.register(self.close)
+
+    def _run(self):
+        """
+        Main loop of the background flush thread
+        """
+        while not self.closed:
+            self.wakeup.wait(self.flush_interval_seconds)
+            self.flush()
+
+    def _append(self, path: Path, header: str, texts: List[str]):
+        """
+        Appends text to a single file.
+        Must be called while holding the io_lock.
+
+        :param path: The path of the file to append to
+        :param header: Text to write first if the file does not exist yet. Can be None.
+        :param texts: The list of text to append
+        """
+        thinking: TextIO = self.open_files.get(path)
+        if thinking is not None:
+            self.open_files.move_to_end(path)
+        else:
+            is_new: bool = not path.exists()
+            thinking = path.open(mode="a", encoding="utf-8")
+            if is_new and header is not None:
+                thinking.write(header)
+
+            self.open_files[path] = thinking
+            while len(self.open_files) > self.max_open_files:
+                _, least_recent = self.open_files.popitem(last=False)
+                least_recent.close()
+
+        thinking.write("".join(texts))
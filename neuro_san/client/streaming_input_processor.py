@@ -42,8 +42,10 @@ class StreamingInputProcessor:
         self.default_input: str = default_input
         self.session: AgentSession = session
         self.processor = BasicMessageProcessor()
+        self.thinking_processor: ThinkingFileMessageProcessor = None
         if thinking_dir is not None and thinking_file is not None:
-            self.processor.add_processor(ThinkingFileMessageProcessor(thinking_file, thinking_dir))
+            self.thinking_processor = ThinkingFileMessageProcessor(thinking_file, thinking_dir)
+            self.processor.add_processor(self.thinking_processor)
 
         if self.session is None:
             raise ValueError("StreamingInputProcessor session cannot be None")
@@ -105,6 +107,11 @@ class StreamingInputProcessor:
         if origin_str is None or len(origin_str) == 0:
             origin_str = "agent network"
 
+        if self.thinking_processor is not None:
+            # Thinking files are written in the background while streaming.
+            # Make sure they are complete by the time anyone looks at this exchange's result.
+            self.thinking_processor.flush()
+
         update = {
             "chat_context": chat_context,
             "num_input": num_input + 1,
@@ -118,6 +125,14 @@ class StreamingInputProcessor:
 
         return return_state
 
+    def close(self):
+        """
+        Releases the background writer and any open files of the thinking processor.
+        This instance cannot write thinking files afterwards.
+        """
+        if self.thinking_processor is not None:
+            self.thinking_processor.close()
+
     def formulate_chat_request(self, user_input: str,
                                sly_data: Dict[str, Any] = None,
                                chat_context: Dict[str, Any] = None,
@@ -15,10 +15,12 @@ from typing import Dict
 from typing import List
 
 import json
+import os
 import uuid
 
 from pathlib import Path
 
+from neuro_san.client.buffered_file_writer import BufferedFileWriter
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
 from neuro_san.internals.messages.origination import Origination
 from neuro_san.message_processing.message_processor import MessageProcessor
@@ -28,8 +30,15 @@ from neuro_san.message_processing.message_processor import MessageProcessor
 class ThinkingFileMessageProcessor(MessageProcessor):
     """
     Processes AgentCli input by using the neuro-san streaming API.
+
+    Files are written by a BufferedFileWriter in the background so that
+    processing the message stream never waits on the disk.
+    Call flush() to be sure everything so far is in the files.
     """
 
+    # Most file systems do not allow longer file names than this
+    DEFAULT_MAX_FILENAME_BYTES: int = 255
+
     def __init__(self, thinking_file: str, thinking_dir: str):
         """
         Constructor
@@ -53,12 +62,20 @@ class ThinkingFileMessageProcessor(MessageProcessor):
         # Dictionary for storing origins that differ from what might be expected
         self.origins: Dict[str, str] = {}
 
+        self.writer = BufferedFileWriter()
+        self.max_filename_bytes: int = None
+        # Paths within the thinking_dir by file name, so they are only built once
+        self.paths: Dict[str, Path] = {}
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
         Process the message.
         :param chat_message_dict: The ChatMessage dictionary to process.
         :param message_type: The ChatMessageType of the chat_message_dictionary to process.
         """
+        if message_type == ChatMessageType.AI_MESSAGE_CHUNK:
+            # The complete message will follow. No need to clutter the thinking files.
+            return
 
         # Process any text in the message
         text: str = chat_message_dict.get("text")
@@ -104,25 +121,44 @@ class ThinkingFileMessageProcessor(MessageProcessor):
         # Determine the filename to use given the origin_str.
         # Previously we might have used a uuid as a filename, but by default
         # we want the filenames to match the full origin_str.
-        origin_filename: str = self.origins.get(origin_str, origin_str)
+        origin_filename: str = self.origins.get(origin_str)
+        if origin_filename is None:
+            origin_filename = origin_str
+            # For very deep networks the origin can be too long for a file name.
+            # Writes happen in the background, so find that out up front.
+            if self.thinking_dir and self._is_filename_too_long(origin_filename):
+                # Use a uuid as file name instead and squirrel that away
+                # so results continue to go to the same file over and over again.
+                origin_filename = str(uuid.uuid4())
+            self.origins[origin_str] = origin_filename
 
-        try:
-            self._write_to_file(origin_filename, origin_str, message_type_str, use_origin, text)
-        except OSError as os_error:
-            # For very deep networks we can sometimes get a "File name too long",
-            # which is Error code 63.
-            if os_error.errno == 63:
+        self._write_to_file(origin_filename, origin_str, message_type_str, use_origin, text)
 
-                # Retry with a uuid as file name.
-                # If this fails, there's no helping ya.
-                origin_filename = str(uuid.uuid4())
-                self._write_to_file(origin_filename, origin_str, message_type_str, use_origin, text)
+    def flush(self):
+        """
+        Waits until everything processed so far is written to the thinking files.
+        """
+        self.writer.flush()
 
-                # Squirell that uuid away so results continue to go to the same
-                # file over and over again.
-                self.origins[origin_str] = origin_filename
-            else:
-                raise os_error
+    def close(self):
+        """
+        Writes out everything processed so far and releases any open thinking files.
+        """
+        self.writer.close()
+
+    def _is_filename_too_long(self, origin_filename: str) -> bool:
+        """
+        :param origin_filename: The file name to check
+        :return: True if the file name is too long to be used within the thinking_dir
+        """
+        if self.max_filename_bytes is None:
+            self.max_filename_bytes = self.DEFAULT_MAX_FILENAME_BYTES
+            try:
+                self.max_filename_bytes = os.pathconf(self.thinking_dir, "PC_NAME_MAX")
+            except (OSError, ValueError, AttributeError):
+                # Directory does not exist yet, or no such notion on this platform
+                pass
+        return len(origin_filename.encode("utf-8")) > self.max_filename_bytes
 
     def _write_to_file(self, origin_filename: str, origin_str: str,
                        message_type_str: str, use_origin: str, text: str):
@@ -131,21 +167,14 @@ class ThinkingFileMessageProcessor(MessageProcessor):
         if self.thinking_dir:
             if origin_filename is None or len(origin_filename) == 0:
                 return
-            filename = Path(self.thinking_dir, origin_filename)
-
-        how_to_open_file: str = "a"
-        if not filename.exists():
-            how_to_open_file = "w"
-
-        with filename.open(mode=how_to_open_file, encoding="utf-8") as thinking:
-            if how_to_open_file == "w":
-                # New file, preface it with an origin log.
-                thinking.write(f"Agent: {origin_str}\n")
-
-            # Write the message out
-            thinking.write(f"\n[{message_type_str}{use_origin}]:\n")
-            thinking.write(text)
-            thinking.write("\n")
+            filename = self.paths.get(origin_filename)
+            if filename is None:
+                filename = Path(self.thinking_dir, origin_filename)
+                self.paths[origin_filename] = filename
+
+        # New files get prefaced with an origin log.
+        header: str = f"Agent: {origin_str}\n"
+        self.writer.write(filename, f"\n[{message_type_str}{use_origin}]:\n{text}\n", header)
 
     def _determine_origin_reporting(self, response: Dict[str, Any], origin_str: str) -> str:
 
@@ -0,0 +1,163 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import os
+import threading
+import time
+
+from asyncio import AbstractEventLoop
+from asyncio import Semaphore
+from asyncio import get_running_loop
+from weakref import WeakKeyDictionary
+
+from ddgs import DDGS
+
+DEFAULT_CACHE_TTL_SECONDS: float = 300.0
+DEFAULT_MAX_CONCURRENT: int = 4
+
+
+class AsyncDuckDuckGoSearch:
+    """
+    A non-blocking DuckDuckGo search client for CodedTools.
+
+    The ddgs client only has synchronous calls, so searches are run in a
+    worker thread so that waiting on the network does not hold up other
+    agents running on the same event loop.
+    Results are cached for a number of seconds, and the number of searches
+    in flight at the same time on any one event loop is limited so that
+    a burst of agent activations does not get the server rate-limited.
+
+    Instances are safe to share across event loops and threads.
+    Use get_shared() to get the instance shared by all search CodedTools.
+    """
+
+    # The instance shared by all callers of get_shared(). Created lazily.
+    shared: "AsyncDuckDuckGoSearch" = None
+    shared_lock = threading.Lock()
+
+    def __init__(self, cache_ttl_seconds: float = None,
+                 max_concurrent: int = None):
+        """
+        Constructor
+
+        :param cache_ttl_seconds: The number of seconds a result stays in the cache.
+                    Default of None looks at the AGENT_WEB_SEARCH_CACHE_TTL_SECONDS env var
+                    before falling back to 5 minutes. A value <= 0 turns off caching.
+        :param max_concurrent: The maximum number of searches in flight per event loop.
+                    Default of None looks at the AGENT_WEB_SEARCH_MAX_CONCURRENT env var
+                    before falling back to 4.
+        """
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = float(os.environ.get("AGENT_WEB_SEARCH_CACHE_TTL_SECONDS",
+                                                     str(DEFAULT_CACHE_TTL_SECONDS)))
+        if max_concurrent is None:
+            max_concurrent = int(os.environ.get("AGENT_WEB_SEARCH_MAX_CONCURRENT",
+                                                str(DEFAULT_MAX_CONCURRENT)))
+        self.cache_ttl_seconds: float = cache_ttl_seconds
+        self.max_concurrent: int = max(1, max_concurrent)
+
+        self.lock = threading.Lock()
+        # Maps (query, num_results) -> (expiration time, links)
+        self.cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.semaphores: WeakKeyDictionary = WeakKeyDictionary()
+
+    @classmethod
+    def get_shared(cls) -> "AsyncDuckDuckGoSearch":
+        """
+        :return: The instance shared by all search CodedTools, so that
+                results are cached and rate-limited across all of their calls.
+        """
+        with cls.shared_lock:
+            if AsyncDuckDuckGoSearch.shared is None:
+                AsyncDuckDuckGoSearch.shared = cls()
+            return AsyncDuckDuckGoSearch.shared
+
+    async def search(self, query: str, num_results: int = 5) -> List[str]:
+        """
+        Search the web for a given query and return a list of result URLs.
+
+        :param query: The search query (e.g., "10.5 white men sneakers").
+        :param num_results: Number of links to retrieve (default=5).
+        :return: List of hyperlink strings.
+        """
+        key: Tuple[str, int] = (query, num_results)
+        links: List[str] = self.get_cached(key)
+        if links is not None:
+            return links
+
+        async with self.get_semaphore():
+            # Someone else might have done the same search while we waited.
+            links = self.get_cached(key)
+            if links is not None:
+                return links
+
+            links = await asyncio.to_thread(self.search_sync, query, num_results)
+
+        if self.cache_ttl_seconds > 0:
+            with self.lock:
+                self.prune_cache()
+                self.cache[key] = (time.monotonic() + self.cache_ttl_seconds, links)
+
+        return list(links)
+
+    def search_sync(self, query: str, num_results: int) -> List[str]:
+        """
+        Does the actual blocking search. Called from a worker thread.
+
+        :param query: The search query
+        :param num_results: Number of links to retrieve
+        :return: List of hyperlink strings.
+        """
+        results: List[Dict[str, Any]] = DDGS().text(query, max_results=num_results)
+
+        # Extract and return only the URLs from the returned list of dictionaries
+        return [res["href"] for res in results if "href" in res]
+
+    def get_cached(self, key: Tuple[str, int]) -> List[str]:
+        """
+        :param key: The (query, num_results) key
+        :return: A copy of the unexpired cached links for the key, or None
+        """
+        with self.lock:
+            entry: Tuple[float, List[str]] = self.cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return list(entry[1])
+
+    def prune_cache(self):
+        """
+        Removes expired entries. Must be called while holding the lock.
+        """
+        now: float = time.monotonic()
+        expired: List[Tuple[str, int]] = [key for key, entry in self.cache.items() if entry[0] < now]
+        for key in expired:
+            del self.cache[key]
+
+    def get_semaphore(self) -> Semaphore:
+        """
+        :return: The Semaphore limiting concurrent searches on the running event loop.
+                Asyncio primitives cannot be shared across loops, so there is one per loop.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        with self.lock:
+            semaphore: Semaphore = self.semaphores.get(loop)
+            if semaphore is None:
+                semaphore = Semaphore(self.max_concurrent)
+                self.semaphores[loop] = semaphore
+        return semaphore
@@ -14,13 +14,18 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+import asyncio
+
+import numpy
+
 from langchain_community.document_loaders import WebBaseLoader
-from langchain_community.vectorstores import InMemoryVectorStore
 from langchain_core.documents import Document
-from langchain_core.vectorstores.base import VectorStoreRetriever
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import TextSplitter
 
+from neuro_san.coded_tools.rag_index_cache import RagIndexCache
 from neuro_san.interfaces.coded_tool import CodedTool
 
 
@@ -35,11 +40,20 @@ class Rag(CodedTool):
 
     This is useful in workflows where external search tools provide candidate links,
     and RAG is applied afterward to synthesize a meaningful answer from the linked content.
+
+    Embedded chunks of each URL are kept in a RagIndexCache shared by all instances,
+    so the same content is not re-fetched, re-chunked and re-embedded for every question.
     """
 
+    # Number of chunks to return for a query
+    NUM_RESULTS: int = 4
+
+    # Shared across all calls and requests. Created lazily.
+    index_cache: RagIndexCache = None
+
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
-        Load documents from URLs, build a vector store, and run a query against it.
+        Load documents from URLs, build a vector index, and run a query against it.
 
         :param args: Dictionary containing 'urls' (list of URLs) and 'query' (search string)
         :param sly_data: A dictionary whose keys are defined by the agent hierarchy,
@@ -54,7 +68,7 @@ class Rag(CodedTool):
 
             Keys expected for this implementation are:
                 None
-        :return: Text result from querying the built vector store, or error message
+        :return: Text result from querying the built vector index, or error message
         """
         # Extract arguments from the input dictionary
         urls: List[str] = args.get("urls")
@@ -66,54 +80,145 @@ class Rag(CodedTool):
         if not query:
             return "Error: No query provided."
 
-        # Build the vector store and run the query
-        vectorstore: InMemoryVectorStore = await self.generate_vectorstore(urls)
-        return await self.query_vectorstore(vectorstore, query)
+        # Build the vector index and run the query
+        embeddings: Embeddings = self.create_embeddings()
+        entries: List[Dict[str, Any]] = await self.generate_index(urls, embeddings)
+        return await self.query_index(entries, query, embeddings)
 
-    async def generate_vectorstore(self, urls: List[str]) -> InMemoryVectorStore:
+    def get_index_cache(self) -> RagIndexCache:
+        """
+        :return: The RagIndexCache shared by all Rag instances
         """
-        Asynchronously loads web documents from given URLs, split them into chunks,
-        and build an in-memory vector store using OpenAI embeddings.
+        if Rag.index_cache is None:
+            Rag.index_cache = RagIndexCache()
+        return Rag.index_cache
 
-        :param urls: List of URLs to fetch and embed
-        :return: In-memory vector store containing the embedded document chunks
+    def create_embeddings(self) -> Embeddings:
         """
+        :return: The Embeddings to use for documents and queries
+        """
+        return OpenAIEmbeddings()
 
+    def create_text_splitter(self) -> TextSplitter:
+        """
+        :return: The TextSplitter to use to split documents into chunks
+        """
+        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            chunk_size=100, chunk_overlap=50
+        )
+
+    async def load_documents(self, urls: List[str]) -> List[Document]:
+        """
+        :param urls: List of URLs to fetch
+        :return: A list of documents whose "source" metadata is the URL they came from
+        """
         # Concurrently load documents from all URLs
         loader = WebBaseLoader(urls)
-        docs = []
+        docs: List[Document] = []
         async for doc in loader.alazy_load():
             docs.append(doc)
+        return docs
 
-        # Split documents into smaller chunks for better embedding and retrieval
-        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            chunk_size=100, chunk_overlap=50
-        )
-        doc_chunks: List[Document] = text_splitter.split_documents(docs)
-
-        # Create an in-memory vector store with embeddings
-        vectorstore: InMemoryVectorStore = await InMemoryVectorStore.afrom_documents(
-            documents=doc_chunks,
-            collection_name="rag-in-memory",
-            embedding=OpenAIEmbeddings(),
-        )
-
-        return vectorstore
+    # pylint: disable=too-many-locals
+    async def generate_index(self, urls: List[str], embeddings: Embeddings) -> List[Dict[str, Any]]:
+        """
+        Gets the embedded chunks of the given URLs from the shared index cache.
+        URLs that are not in the cache, or whose cache entries are stale, are
+        re-fetched, but only re-chunked and re-embedded if their content has changed.
 
-    async def query_vectorstore(self, vectorstore: InMemoryVectorStore, query: str) -> str:
+        :param urls: List of URLs to fetch and embed
+        :param embeddings: The Embeddings to use
+        :return: A list of RagIndexCache entry dictionaries, one per URL with content
+        """
+        cache: RagIndexCache = self.get_index_cache()
+        model: str = self.get_embeddings_model_name(embeddings)
+
+        entries: List[Dict[str, Any]] = []
+        stale_urls: List[str] = []
+        for url in urls:
+            # Cache lookups can touch the disk, so keep them off the event loop
+            entry: Dict[str, Any] = await asyncio.to_thread(cache.get, url, model)
+            if cache.is_fresh(entry):
+                entries.append(entry)
+            else:
+                stale_urls.append(url)
+
+        if len(stale_urls) == 0:
+            return entries
+
+        # Group the freshly loaded documents by the URL they came from
+        docs_by_url: Dict[str, List[Document]] = {url: [] for url in stale_urls}
+        for doc in await self.load_documents(stale_urls):
+            docs_by_url.setdefault(doc.metadata.get("source"), []).append(doc)
+
+        text_splitter: TextSplitter = None
+        for url, docs in docs_by_url.items():
+            if len(docs) == 0:
+                continue
+
+            content_hash: str = RagIndexCache.hash_content("\n".join(doc.page_content for doc in docs))
+            entry: Dict[str, Any] = await asyncio.to_thread(cache.get, url, model)
+            if entry is not None and entry.get("content_hash") == content_hash:
+                # Content did not change. No need to re-embed.
+                await asyncio.to_thread(cache.refresh, entry)
+                entries.append(entry)
+                continue
+
+            # Split documents into smaller chunks for better embedding and retrieval
+            if text_splitter is None:
+                text_splitter = self.create_text_splitter()
+            doc_chunks: List[Document] = text_splitter.split_documents(docs)
+            if len(doc_chunks) == 0:
+                continue
+
+            texts: List[str] = [chunk.page_content for chunk in doc_chunks]
+            vectors: List[List[float]] = await embeddings.aembed_documents(texts)
+            entry = await asyncio.to_thread(cache.put, url, model, content_hash, texts,
+                                            [chunk.metadata for chunk in doc_chunks], vectors)
+            entries.append(entry)
+
+        return entries
+
+    async def query_index(self, entries: List[Dict[str, Any]], query: str, embeddings: Embeddings) -> str:
         """
-        Query the given vector store using the provided query string
-        and return the combined content of retrieved documents.
+        Query the given index entries using the provided query string
+        and return the combined content of the most similar chunks.
 
-        :param vectorstore: The in-memory vector store to query
+        :param entries: A list of RagIndexCache entry dictionaries to query
         :param query: The user query to search for relevant documents
-        :return: Concatenated text content of the retrieved documents
+        :param embeddings: The Embeddings to use for the query
+        :return: Concatenated text content of the retrieved chunks
         """
-        # Create a retriever interface from the vector store
-        retriever: VectorStoreRetriever = vectorstore.as_retriever()
-
-        # Perform an asynchronous similarity search
-        results: List[Document] = await retriever.ainvoke(query)
-
-        # Concatenate the content of all retrieved documents
-        return "\n\n".join(doc.page_content for doc in results)
+        if len(entries) == 0:
+            return ""
+
+        query_vector = numpy.asarray(await embeddings.aembed_query(query), dtype=numpy.float32)
+        query_norm: float = float(numpy.linalg.norm(query_vector)) or 1.0
+
+        # Cosine similarity of the query against every chunk of every entry
+        texts: List[str] = []
+        scores: List[numpy.ndarray] = []
+        for entry in entries:
+            vectors: numpy.ndarray = entry.get("vectors")
+            norms: numpy.ndarray = numpy.linalg.norm(vectors, axis=1)
+            norms[norms == 0.0] = 1.0
+            scores.append(vectors @ query_vector / (norms * query_norm))
+            texts.extend(entry.get("texts"))
+
+        all_scores: numpy.ndarray = numpy.concatenate(scores)
+        best: List[int] = numpy.argsort(-all_scores, kind="stable")[:self.NUM_RESULTS]
+
+        # Concatenate the content of all retrieved chunks
+        return "\n\n".join(texts[index] for index in best)
+
+    @staticmethod
+    def get_embeddings_model_name(embeddings: Embeddings) -> str:
+        """
+        :param embeddings: The Embeddings instance
+        :return: A name identifying the embedding model, so that vectors
+                from different models are never mixed in the cache
+        """
+        model: str = getattr(embeddings, "model", None)
+        if model is None:
+            model = getattr(embeddings, "model_name", None)
+        return f"{embeddings.__class__.__name__}:{model}"
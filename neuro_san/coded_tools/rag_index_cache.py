@@ -0,0 +1,334 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+from collections import OrderedDict
+from logging import getLogger
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+import uuid
+
+import numpy
+
+DEFAULT_MAX_AGE_SECONDS: float = 3600.0
+DEFAULT_MAX_ENTRIES: int = 256
+
+
+class RagIndexCache:
+    """
+    A persistent cache of embedded document chunks for the Rag CodedTool.
+
+    Each source (usually a URL) embedded with a particular embedding model
+    gets its own entry on local disk consisting of:
+        * a JSON file with the chunk texts, their metadata, the hash of the
+          source content the chunks came from and when the source was last fetched.
+        * a .npy file with the float32 embedding vectors of the chunks.
+
+    The JSON file names the .npy file it goes with, and every put() writes
+    a new .npy file before atomically replacing the JSON file.  This way the
+    pair always changes as one unit and readers never pair new chunk texts
+    with old vectors (or vice versa).
+
+    Entries are loaded lazily and kept in memory with their vectors memory-mapped
+    so that a single instance can be shared across tool calls and requests
+    without every caller holding its own copy of the vectors.  The number of
+    entries kept in memory is bounded, with the least recently used ones
+    being dropped first.  Dropped entries are simply reloaded from disk.
+
+    Entries are considered fresh for a given number of seconds after the source
+    was last fetched.  After that, callers are expected to re-fetch the source
+    and only re-embed it if its content hash has changed.
+
+    Whoever can write to the cache directory can plant entries, so entries are only
+    read from and written to a directory that is owned by the current user and
+    not writable by anyone else.  Otherwise, entries are only kept in memory.
+    """
+
+    def __init__(self, cache_dir: str = None, max_age_seconds: float = None, max_entries: int = None):
+        """
+        Constructor
+
+        :param cache_dir: The directory where entries are stored.
+                    Default of None looks at the AGENT_RAG_INDEX_CACHE_DIR env var,
+                    and falls back to a directory for the current user in the system temp dir.
+        :param max_age_seconds: The number of seconds after which an entry needs
+                    its source re-fetched.  Default of None looks at the
+                    AGENT_RAG_INDEX_CACHE_MAX_AGE_SECONDS env var, and falls back
+                    to one hour.  A value <= 0 means entries never need a re-fetch.
+        :param max_entries: The maximum number of entries kept in memory.
+                    Default of None looks at the AGENT_RAG_INDEX_CACHE_MAX_ENTRIES env var,
+                    and falls back to 256.
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("AGENT_RAG_INDEX_CACHE_DIR", self.get_default_cache_dir())
+        if max_age_seconds is None:
+            max_age_seconds = float(os.environ.get("AGENT_RAG_INDEX_CACHE_MAX_AGE_SECONDS",
+                                                   str(DEFAULT_MAX_AGE_SECONDS)))
+        if max_entries is None:
+            max_entries = int(os.environ.get("AGENT_RAG_INDEX_CACHE_MAX_ENTRIES",
+                                             str(DEFAULT_MAX_ENTRIES)))
+        self.cache_dir: str = cache_dir
+        self.max_age_seconds: float = max_age_seconds
+        self.max_entries: int = max(1, max_entries)
+        self.entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.logger = getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def get_default_cache_dir() -> str:
+        """
+        :return: A cache directory in the system temp dir that is not shared with other users
+        """
+        name: str = "neuro_san_rag_index"
+        if hasattr(os, "getuid"):
+            name = f"{name}_{os.getuid()}"
+        return os.path.join(tempfile.gettempdir(), name)
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """
+        :param content: The content of a source
+        :return: A hash string of the content
+        """
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_key(source: str, model: str) -> str:
+        """
+        :param source: The source (usually a URL) of the documents
+        :param model: The name of the embedding model
+        :return: The key for the entry of the source/model pair
+        """
+        return hashlib.sha256(f"{model}\n{source}".encode("utf-8")).hexdigest()
+
+    def get(self, source: str, model: str) -> Dict[str, Any]:
+        """
+        :param source: The source (usually a URL) of the documents
+        :param model: The name of the embedding model
+        :return: The entry dictionary for the source/model pair, or None if there is none.
+                Entry dictionaries have the following keys:
+                    "source"        The source
+                    "model"         The embedding model name
+                    "content_hash"  The hash of the content that was embedded
+                    "fetched_at"    The epoch time at which the source was last fetched
+                    "texts"         A list of chunk texts
+                    "metadatas"     A list of chunk metadata dictionaries
+                    "vectors_file"  The name of the .npy file holding the vectors
+                    "vectors"       A 2D float32 numpy array of chunk embeddings
+        """
+        key: str = self.get_key(source, model)
+        with self.lock:
+            entry: Dict[str, Any] = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry
+
+        # Do the disk I/O outside the lock
+        entry = self._load(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        :param entry: An entry dictionary
+        :return: True if the source of the entry does not need to be re-fetched
+        """
+        if entry is None:
+            return False
+        if self.max_age_seconds <= 0:
+            return True
+        return time.time() - entry.get("fetched_at", 0.0) < self.max_age_seconds
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def put(self, source: str, model: str, content_hash: str,
+            texts: List[str], metadatas: List[Dict[str, Any]], vectors: List[List[float]]) -> Dict[str, Any]:
+        """
+        Stores a freshly embedded source.
+
+        :param source: The source (usually a URL) of the documents
+        :param model: The name of the embedding model
+        :param content_hash: The hash of the source content that was embedded
+        :param texts: A list of chunk texts
+        :param metadatas: A list of chunk metadata dictionaries
+        :param vectors: A list of embedding vectors, one per chunk
+        :return: The new entry dictionary
+        """
+        key: str = self.get_key(source, model)
+        array = numpy.asarray(vectors, dtype=numpy.float32)
+        if array.ndim != 2:
+            array = array.reshape((len(texts), -1))
+        entry: Dict[str, Any] = {
+            "source": source,
+            "model": model,
+            "content_hash": content_hash,
+            "fetched_at": time.time(),
+            "texts": texts,
+            "metadatas": metadatas,
+            "vectors_file": f"{key}.{uuid.uuid4().hex}.npy",
+        }
+
+        if not self._is_cache_dir_trusted(create=True):
+            entry["vectors"] = array
+            self._remember(key, entry)
+            return entry
+
+        previous_vectors_file: str = self._read_vectors_file(key)
+
+        # The vectors go in a new file which nothing refers to until the JSON
+        # file that names it atomically replaces the old one.
+        vectors_path: str = os.path.join(self.cache_dir, entry.get("vectors_file"))
+        self._atomic_write(vectors_path, lambda file: numpy.save(file, array))
+        self._write_info(key, entry)
+        entry["vectors"] = numpy.load(vectors_path, mmap_mode="r")
+
+        if previous_vectors_file is not None and previous_vectors_file != entry.get("vectors_file"):
+            try:
+                os.remove(os.path.join(self.cache_dir, previous_vectors_file))
+            except OSError:
+                # Best effort. Possibly still mapped on platforms that do not allow removal.
+                pass
+
+        self._remember(key, entry)
+        return entry
+
+    def refresh(self, entry: Dict[str, Any]):
+        """
+        Marks the source of an entry as having just been re-fetched without changes.
+        :param entry: The entry dictionary
+        """
+        entry["fetched_at"] = time.time()
+        key: str = self.get_key(entry.get("source"), entry.get("model"))
+        self._write_info(key, entry)
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """
+        Keeps an entry in memory, dropping the least recently used ones
+        if there are too many.
+        :param key: The key of the entry
+        :param entry: The entry dictionary
+        """
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _load(self, key: str) -> Dict[str, Any]:
+        """
+        :param key: The key of the entry
+        :return: The entry loaded from disk, or None if there is no valid entry
+        """
+        if not self._is_cache_dir_trusted():
+            return None
+
+        try:
+            with open(self._info_path(key), "r", encoding="utf-8") as info_file:
+                entry: Dict[str, Any] = json.load(info_file)
+            vectors_file: str = entry.get("vectors_file")
+            if not isinstance(vectors_file, str) or os.path.basename(vectors_file) != vectors_file:
+                return None
+            vectors = numpy.load(os.path.join(self.cache_dir, vectors_file), mmap_mode="r")
+        except (OSError, ValueError):
+            # Missing or corrupt entries are simply rebuilt.
+            return None
+
+        # Make sure the vectors actually go with the chunk texts
+        texts: List[str] = entry.get("texts")
+        if vectors.ndim != 2 or not isinstance(texts, list) or vectors.shape[0] != len(texts):
+            return None
+
+        entry["vectors"] = vectors
+        return entry
+
+    def _is_cache_dir_trusted(self, create: bool = False) -> bool:
+        """
+        :param create: When True, creates the cache directory if it does not exist yet
+        :return: True if the cache directory is a real directory owned by the current user
+                that nobody else can write to.
+        """
+        try:
+            if create:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            dir_stat: os.stat_result = os.lstat(self.cache_dir)
+        except OSError:
+            # Missing or not creatable
+            return False
+
+        trusted: bool = stat.S_ISDIR(dir_stat.st_mode) and \
+            not dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        if hasattr(os, "getuid"):
+            trusted = trusted and dir_stat.st_uid == os.getuid()
+        if not trusted:
+            self.logger.warning("Not using RAG index cache directory %s, as it is not a directory "
+                                "owned by and only writable by the current user.", self.cache_dir)
+        return trusted
+
+    def _read_vectors_file(self, key: str) -> str:
+        """
+        :param key: The key of the entry
+        :return: The name of the vectors file currently on disk for the entry,
+                or None if there is none
+        """
+        try:
+            with open(self._info_path(key), "r", encoding="utf-8") as info_file:
+                info: Dict[str, Any] = json.load(info_file)
+        except (OSError, ValueError):
+            return None
+        vectors_file: str = info.get("vectors_file") if isinstance(info, dict) else None
+        if not isinstance(vectors_file, str) or os.path.basename(vectors_file) != vectors_file:
+            return None
+        return vectors_file
+
+    def _write_info(self, key: str, entry: Dict[str, Any]):
+        """
+        :param key: The key of the entry
+        :param entry: The entry dictionary whose non-vector parts are to be written
+        """
+        info: Dict[str, Any] = {name: value for name, value in entry.items() if name != "vectors"}
+        self._atomic_write(self._info_path(key),
+                           lambda file: file.write(json.dumps(info).encode("utf-8")))
+
+    @staticmethod
+    def _atomic_write(path: str, writer):
+        """
+        Writes a file such that concurrent readers never see a partial file.
+        :param path: The final path of the file
+        :param writer: A function taking a binary file object to write to
+        """
+        directory: str = os.path.dirname(path)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                writer(temp_file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _info_path(self, key: str) -> str:
+        """
+        :param key: The key of the entry
+        :return: The path to the JSON file of the entry
+        """
+        return os.path.join(self.cache_dir, f"{key}.json")
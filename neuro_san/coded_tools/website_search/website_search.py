@@ -11,12 +11,12 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Union
 
 import logging
 
-from ddgs import DDGS
-
+from neuro_san.coded_tools.async_duckduckgo_search import AsyncDuckDuckGoSearch
 from neuro_san.interfaces.coded_tool import CodedTool
 
 
@@ -29,14 +29,6 @@ class WebsiteSearch(CodedTool):
         self.top_n = 5
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
-        """
-        As much as we'd prefer an asynchronous entry point, the code below uses synchronous
-        calls for a simple example. Asynchronous calls make for a more performant server
-        environment.
-        """
-        raise NotImplementedError
-
-    def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
         """
         :param args: An argument dictionary whose keys are the parameters
                 to the coded tool and whose values are the values passed for them
@@ -76,7 +68,7 @@ class WebsiteSearch(CodedTool):
         logger = logging.getLogger(self.__class__.__name__)
         logger.info(">>>>>>>>>>>>>>>>>>>WebsiteSearch>>>>>>>>>>>>>>>>>>")
         logger.info("BSearch Terms: %s", str(search_terms))
-        the_links = self.search_web(search_terms, self.top_n)
+        the_links = await self.search_web(search_terms, self.top_n)
         links_str = ""
         for index, the_link in enumerate(the_links, start=1):
             links_str += f"{index}. {the_link} ; "
@@ -84,7 +76,7 @@ class WebsiteSearch(CodedTool):
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return links_str
 
-    def search_web(self, query: str, num_results: int = 5) -> list:
+    async def search_web(self, query: str, num_results: int = 5) -> List[str]:
         """
         Search the web for a given query using DuckDuckGo Search
         and return a list of result URLs.
@@ -93,13 +85,4 @@ class WebsiteSearch(CodedTool):
         :param num_results: Number of links to retrieve (default=5).
         :return: List of hyperlink strings.
         """
-        # Use duckduckgo_search to retrieve results
-        search = DDGS()
-        # Synchronous call below!
-        # Try to use asynchronous calls for a more performant neuro-san server
-        results = search.text(query, max_results=num_results)
-
-        # Extract and return only the URLs from the returned list of dictionaries
-        returned_links = [res["href"] for res in results if "href" in res]
-
-        return returned_links
+        return await AsyncDuckDuckGoSearch.get_shared().search(query, num_results)
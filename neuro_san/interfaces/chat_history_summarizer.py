@@ -0,0 +1,35 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+
+class ChatHistorySummarizer:
+    """
+    Interface for summarizing the older part of a chat history that would
+    otherwise be dropped to keep the history within a front man's
+    max_history_tokens or max_message_history limits.
+
+    Implementations are referenced by the fully qualified class name given
+    in the front man's history_summarizer field and must have a no-args constructor.
+    """
+
+    async def summarize(self, dropped_messages: List[Dict[str, Any]]) -> str:
+        """
+        :param dropped_messages: The ChatMessage dictionaries about to be dropped
+                    from the chat history, oldest first.
+        :return: Text summarizing the dropped messages to be kept in the history instead.
+                    None or an empty string means nothing takes their place.
+        """
+        raise NotImplementedError
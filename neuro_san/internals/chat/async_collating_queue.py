@@ -12,17 +12,57 @@
 
 from typing import Any
 from typing import AsyncIterator
+from typing import Deque
 from typing import Dict
+from typing import List
+from typing import Set
+
+import asyncio
+import threading
+
+from asyncio import AbstractEventLoop
+from collections import deque
 
 from janus import Queue
 
 from neuro_san.internals.interfaces.async_hopper import AsyncHopper
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.origination import Origination
+
 
+class MessageBatch(list):
+    """
+    A list of items that went onto the queue with a single queue operation.
+    Consumers of AsyncCollatingQueue never see these, only the items within.
+    """
 
+
+# pylint: disable=too-many-instance-attributes
 class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     """
     AsyncIterator instance to asynchronously iterate over/consume the contents of
     a Queue as they come in.
+
+    The queue can optionally be bounded so that a slow consumer does not cause
+    every message from a chatty agent network to be buffered in memory.
+    What happens when a bounded queue is full is determined by the overflow policy:
+
+        "block"     The producer waits until the consumer makes room.
+                    Note that synchronous puts block the producer's whole event loop.
+        "drop"      Low-priority messages (see droppable_types) are discarded.
+                    All other messages are always kept, in order.
+        "coalesce"  Low-priority messages are held aside with only the latest one
+                    per origin kept.  Held messages are sent ahead of the next
+                    high-priority message or as soon as the consumer makes room.
+
+    Puts made from the same event loop as the consumer use the asynchronous side
+    of the queue, even when asked to be synchronous, as there is no other loop to
+    cross over to.
+
+    An unbounded queue can optionally batch messages: all messages put within
+    the same tick of the producer's event loop go onto the underlying queue with
+    a single operation.  The consumer still gets every message individually and
+    in the order they were put.
     """
     # Constant for the end key
     END_KEY: str = "end"
@@ -30,16 +70,74 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     # Constant for the end message to be put in a Queue when all the messages are done
     END_MESSAGE: Dict[str, Any] = {END_KEY: True}
 
-    def __init__(self, queue: Queue = None):
+    # Overflow policies
+    BLOCK: str = "block"
+    DROP: str = "drop"
+    COALESCE: str = "coalesce"
+    OVERFLOW_POLICIES: Set[str] = {BLOCK, DROP, COALESCE}
+
+    # By default only the intermediate progress messages of agents are considered low-priority.
+    # AI messages and the final AGENT_FRAMEWORK message are always kept.
+    DEFAULT_DROPPABLE_TYPES: Set[ChatMessageType] = {ChatMessageType.AGENT}
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, queue: Queue = None,
+                 max_size: int = 0,
+                 overflow_policy: str = BLOCK,
+                 droppable_types: Set[ChatMessageType] = None,
+                 batch_messages: bool = False):
         """
         Constructor
 
         :param queue: The queue we will be iterating over.
                       Default value is None, indicating a standard Queue will be used.
+        :param max_size: The capacity of the queue when the queue is created by this instance.
+                      Default value of 0 indicates the queue is unbounded.
+        :param overflow_policy: One of "block", "drop" or "coalesce" describing
+                      what happens when a bounded queue is full. Default is "block".
+        :param droppable_types: The set of ChatMessageTypes which are considered low-priority
+                      for the "drop" and "coalesce" policies.
+                      Default of None uses DEFAULT_DROPPABLE_TYPES.
+        :param batch_messages: When True, messages put within the same tick of the
+                      producer's event loop are put on the queue with a single operation.
+                      This only applies to unbounded queues. Default is False.
         """
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow_policy {overflow_policy}. "
+                             f"Expected one of {sorted(self.OVERFLOW_POLICIES)}")
+
+        self.max_size: int = max(0, max_size)
+        self.overflow_policy: str = overflow_policy
+        self.droppable_types: Set[ChatMessageType] = droppable_types
+        if self.droppable_types is None:
+            self.droppable_types = self.DEFAULT_DROPPABLE_TYPES
+
         self.queue: Queue = queue
         if self.queue is None:
-            self.queue = Queue()
+            # Only a blocking queue gets its capacity enforced by the underlying Queue itself.
+            # Other policies need to see every put() to decide what to keep.
+            queue_max_size: int = self.max_size if self.overflow_policy == self.BLOCK else 0
+            self.queue = Queue(queue_max_size)
+
+        # Guards the overflow bookkeeping, as producer and consumer live on different threads.
+        self.lock = threading.Lock()
+        self.held: Dict[str, Dict[str, Any]] = {}
+
+        # Batching state. Pending items are guarded by the lock.
+        # The consumer-side batch is only ever touched by the consumer.
+        self.batch_messages: bool = batch_messages and self.max_size == 0
+        self.pending: List[Any] = []
+        self.pending_flush_scheduled: bool = False
+        self.consumer_batch: Deque[Any] = deque()
+
+        # Set once the consumer starts iterating
+        self.consumer_loop: AbstractEventLoop = None
+
+        # Metrics
+        self.put_count: int = 0
+        self.max_depth: int = 0
+        self.dropped_count: int = 0
+        self.coalesced_count: int = 0
 
     def get_queue(self) -> Queue:
         """
@@ -60,7 +158,23 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 Will throw StopAsyncIteration when the final item is detected
                 via the is_final_item() method..
         """
-        message = await self.queue.async_q.get()
+        if self.consumer_loop is None:
+            self.consumer_loop = asyncio.get_running_loop()
+
+        if len(self.held) > 0:
+            # The consumer is making room. Release held messages while there is space.
+            with self.lock:
+                self._release_held(synchronous=True, limit=True)
+
+        message: Any = None
+        if len(self.consumer_batch) > 0:
+            message = self.consumer_batch.popleft()
+        else:
+            message = await self.queue.async_q.get()
+            if isinstance(message, MessageBatch):
+                self.consumer_batch.extend(message)
+                message = self.consumer_batch.popleft()
+
         if self.is_final_item(message):
             raise StopAsyncIteration
 
@@ -78,10 +192,162 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 This ends up being necessary when each end of the queue is serviced
                 in a different asyncio event loop.
         """
+        if synchronous and self.is_consumer_loop():
+            # Both ends of the queue are on this loop, so there is no boundary to cross.
+            synchronous = False
+
+        if self.batch_messages:
+            self._put_batched(item, synchronous)
+            return
+
+        if self.max_size > 0 and self.overflow_policy != self.BLOCK:
+            # Decisions about what to keep and the put itself need to be atomic.
+            # Puts cannot block here, as the underlying queue is unbounded.
+            with self.lock:
+                self._put_with_overflow(item, synchronous)
+            return
+
         if synchronous:
             self.queue.sync_q.put(item)
         else:
             await self.queue.async_q.put(item)
+        self._update_depth()
+
+    def is_consumer_loop(self) -> bool:
+        """
+        :return: True if the caller is running on the same event loop as the consumer
+        """
+        if self.consumer_loop is None:
+            return False
+        try:
+            return asyncio.get_running_loop() is self.consumer_loop
+        except RuntimeError:
+            # No running loop
+            return False
+
+    def _put_batched(self, item: Any, synchronous: bool):
+        """
+        Adds an item to the pending batch, arranging for the batch to be put on the
+        queue once the current tick of the producer's event loop is done.
+
+        :param item: The item to put on the queue.
+        :param synchronous: Whether to use the synchronous side of the queue.
+        """
+        with self.lock:
+            self.pending.append(item)
+            if self.pending_flush_scheduled:
+                return
+            self.pending_flush_scheduled = True
+        asyncio.get_running_loop().call_soon(self.flush_pending, synchronous)
+
+    def flush_pending(self, synchronous: bool = False):
+        """
+        Puts any pending batch of items on the queue with a single queue operation.
+
+        :param synchronous: Whether to use the synchronous side of the queue.
+        """
+        with self.lock:
+            batch: List[Any] = self.pending
+            self.pending = []
+            self.pending_flush_scheduled = False
+
+        if len(batch) == 0:
+            return
+
+        if synchronous and self.is_consumer_loop():
+            synchronous = False
+
+        if len(batch) == 1:
+            self._put_nowait(batch[0], synchronous)
+        else:
+            self._put_nowait(MessageBatch(batch), synchronous, count=len(batch))
+
+    def _put_with_overflow(self, item: Any, synchronous: bool):
+        """
+        Puts an item on the queue according to the "drop" or "coalesce" overflow policies.
+        Must be called while holding the lock.
+
+        :param item: The item to put on the queue.
+        :param synchronous: Whether to use the synchronous side of the queue.
+        """
+        droppable: bool = self.is_droppable_item(item)
+        if not droppable:
+            # High-priority items are always kept, but anything held
+            # from before needs to go out ahead of them to preserve ordering.
+            self._release_held(synchronous, limit=False)
+            self._put_nowait(item, synchronous)
+            return
+
+        if self.queue.sync_q.qsize() < self.max_size and len(self.held) == 0:
+            self._put_nowait(item, synchronous)
+            return
+
+        if self.overflow_policy == self.DROP:
+            self.dropped_count += 1
+            return
+
+        # Coalesce. Only keep the latest held item per origin, but move it
+        # to the back of the line as it is now the most recent.
+        origin_key: str = Origination.get_full_name_from_origin(item.get("origin"))
+        if self.held.pop(origin_key, None) is not None:
+            self.coalesced_count += 1
+        self.held[origin_key] = item
+
+    def _release_held(self, synchronous: bool, limit: bool):
+        """
+        Puts held items on the queue in the order they were held.
+        Must be called while holding the lock.
+
+        :param synchronous: Whether to use the synchronous side of the queue.
+        :param limit: When True, only release as many items as there is room for.
+        """
+        while len(self.held) > 0:
+            if limit and self.queue.sync_q.qsize() >= self.max_size:
+                break
+            origin_key: str = next(iter(self.held))
+            self._put_nowait(self.held.pop(origin_key), synchronous)
+
+    def _put_nowait(self, item: Any, synchronous: bool, count: int = 1):
+        """
+        Puts an item on the unbounded queue without waiting.
+        :param item: The item to put on the queue.
+        :param synchronous: Whether to use the synchronous side of the queue.
+        :param count: The number of messages the item represents
+        """
+        if synchronous:
+            self.queue.sync_q.put_nowait(item)
+        else:
+            self.queue.async_q.put_nowait(item)
+        self._update_depth(count)
+
+    def _update_depth(self, count: int = 1):
+        """
+        Updates the put and queue depth metrics
+        :param count: The number of messages just put
+        """
+        self.put_count += count
+        self.max_depth = max(self.max_depth, self.queue.sync_q.qsize())
+
+    def is_droppable_item(self, item: Any) -> bool:
+        """
+        :param item: An item that is about to be put on the queue
+        :return: True if this item is considered low-priority and can be
+                 dropped or coalesced when the queue is full. False otherwise.
+        """
+        return isinstance(item, Dict) and item.get("type") in self.droppable_types
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of queue metrics
+        """
+        return {
+            "depth": self.queue.sync_q.qsize(),
+            "max_depth": self.max_depth,
+            "held": len(self.held),
+            "put": self.put_count,
+            "dropped": self.dropped_count,
+            "coalesced": self.coalesced_count,
+        }
 
     async def put_final_item(self, synchronous: bool = False):
         """
@@ -96,6 +362,9 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 in a different asyncio event loop.
         """
         await self.put(self.END_MESSAGE, synchronous)
+        if self.batch_messages:
+            # Nothing more is coming, so do not wait for the end of the tick.
+            self.flush_pending(synchronous)
 
     def is_final_item(self, item: Any) -> bool:
         """
@@ -16,17 +16,32 @@ from typing import List
 
 from copy import copy
 
+from neuro_san.interfaces.chat_history_summarizer import ChatHistorySummarizer
+from neuro_san.internals.chat.token_length_estimator import TokenLengthEstimator
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
 from neuro_san.message_processing.message_processor import MessageProcessor
 
 
+# pylint: disable=too-many-instance-attributes
 class ChatHistoryMessageProcessor(MessageProcessor):
     """
     MessageProcessor implementation for processing a single message
     in a chat history.
+
+    The history can be trimmed by a maximum number of messages, by a budget
+    of estimated tokens, or both.  Messages trimmed off can be replaced by
+    a summary from an optional ChatHistorySummarizer.
+
+    Token estimates are made once per message as it comes in, and text is only
+    escaped for the messages that are kept, so processing a long history
+    takes time linear in its number of messages.
     """
 
-    def __init__(self, max_message_history: int = None):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, max_message_history: int = None,
+                 max_history_tokens: int = None,
+                 summarizer: ChatHistorySummarizer = None,
+                 estimator: TokenLengthEstimator = None):
         """
         Constructor
 
@@ -34,45 +49,129 @@ class ChatHistoryMessageProcessor(MessageProcessor):
                 in the message history, not including the instructions.
                 The default value of None implies there is no maximum.
                 Non-positive numbers revert to no-maximum behavior.
+        :param max_history_tokens: The maximum number of estimated tokens to preserve
+                in the message history, not including the instructions.
+                The most recent message is always kept, whatever its size.
+                The default value of None implies there is no maximum.
+                Non-positive numbers revert to no-maximum behavior.
+        :param summarizer: An optional ChatHistorySummarizer for the messages trimmed
+                off the history.  Only async_process_messages()
+                consults it.  Default is None.
+        :param estimator: The TokenLengthEstimator to use.  Default of None uses the
+                basic TokenLengthEstimator.
         """
-        self.max_message_history: int = max_message_history
-        if self.max_message_history is not None:
-            if not isinstance(self.max_message_history, Number):
-                # If we don't have a number we don't have a max.
-                self.max_message_history = None
-            else:
-                # Be sure we are dealing with an integer
-                self.max_message_history = int(self.max_message_history)
+        self.max_message_history: int = self.to_limit(max_message_history)
+        self.max_history_tokens: int = self.to_limit(max_history_tokens)
+        self.summarizer: ChatHistorySummarizer = summarizer
+        self.estimator: TokenLengthEstimator = estimator
+        if self.estimator is None:
+            self.estimator = TokenLengthEstimator()
 
         self.message_history: List[Dict[str, Any]] = []
+        self.message_tokens: List[int] = []
+        self.dropped_messages: List[Dict[str, Any]] = []
         self.saw_first_system: bool = False
 
+        # Number of messages at the front of the message history already escaped
+        self.num_escaped: int = 0
+
+    @staticmethod
+    def to_limit(value: Any) -> int:
+        """
+        :param value: A limit value as it comes from an agent spec
+        :return: The integer limit, or None if there is no limit
+        """
+        if value is None or not isinstance(value, Number):
+            # If we don't have a number we don't have a max.
+            return None
+        # Be sure we are dealing with an integer
+        return int(value)
+
     def get_message_history(self) -> List[Dict[str, Any]]:
         """
         :return: The filtered message history
         """
+        # Escape whatever has come in since the last time
+        for index in range(self.num_escaped, len(self.message_history)):
+            self.message_history[index] = self.escape_message(self.message_history[index])
+        self.num_escaped = len(self.message_history)
         return self.message_history
 
+    def get_history_tokens(self) -> int:
+        """
+        :return: The estimated number of tokens in the filtered message history,
+                not including the instructions.
+        """
+        return sum(self.message_tokens[1:])
+
     def process_messages(self, chat_message_dicts: List[Dict[str, Any]]):
         """
         Convenience method for processing lists of messages.
         :param chat_message_dicts: The messages to process.
         """
         super().process_messages(chat_message_dicts)
+        self.trim_history()
 
-        # See if we need to curtail chat history at all.
-        if self.max_message_history is None or self.max_message_history <= 1:
-            # Nothing to do.
+    async def async_process_messages(self, chat_message_dicts: List[Dict[str, Any]]):
+        """
+        Convenience method for asynchronously processing lists of messages.
+        Messages trimmed off the history are summarized by the summarizer, if there is one.
+        :param chat_message_dicts: The messages to process.
+        """
+        await super().async_process_messages(chat_message_dicts)
+        self.trim_history()
+
+        if self.summarizer is None or len(self.dropped_messages) == 0:
+            return
+
+        summary: str = await self.summarizer.summarize(self.dropped_messages)
+        if not summary:
+            return
+
+        summary_message: Dict[str, Any] = {
+            "type": ChatMessageType.AI,
+            "text": summary
+        }
+        # The summary goes right after the instructions, where the dropped messages were.
+        self.message_history.insert(1, summary_message)
+        self.message_tokens.insert(1, self.estimator.estimate_message(summary))
+        self.num_escaped = min(self.num_escaped, 1)
+
+    def trim_history(self):
+        """
+        Trims the message history down to its limits in a single pass from the most recent message back.
+        Messages that do not make the cut are left in self.dropped_messages.
+        """
+        # The first item in the list is the redacted placeholder for instructions
+        num_messages: int = len(self.message_history) - 1
+        if num_messages <= 0:
             return
 
-        # Save the first item in the list. This is the redacted placeholder for instructions
-        instructions: Dict[str, Any] = self.message_history.pop(0)
+        # Index of the oldest message to keep
+        start: int = 1
+
+        # Preserve the most recent n elements in the message history.
+        # Historically, a max of 1 has meant no maximum.
+        if self.max_message_history is not None and self.max_message_history > 1:
+            start = max(start, len(self.message_history) - self.max_message_history)
+
+        if self.max_history_tokens is not None and self.max_history_tokens > 0:
+            # Always keep the most recent message
+            index: int = len(self.message_history) - 1
+            total_tokens: int = self.message_tokens[index]
+            while index > start and total_tokens + self.message_tokens[index - 1] <= self.max_history_tokens:
+                index -= 1
+                total_tokens += self.message_tokens[index]
+            start = index
 
-        # Preserve the most recent n elements in the message history
-        self.message_history = self.message_history[-self.max_message_history:]
+        if start == 1:
+            # Nothing to do.
+            return
 
-        # Prepend the instructions to the list
-        self.message_history.insert(0, instructions)
+        self.dropped_messages = self.message_history[1:start]
+        self.message_history = self.message_history[:1] + self.message_history[start:]
+        self.message_tokens = self.message_tokens[:1] + self.message_tokens[start:]
+        self.num_escaped = min(self.num_escaped, 1)
 
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
@@ -84,19 +183,20 @@ class ChatHistoryMessageProcessor(MessageProcessor):
             # Don't send any messages over the wire that won't be re-ingestable.
             return
 
-        transformed_message_dict: Dict[str, Any] = chat_message_dict
+        text: str = chat_message_dict.get("text")
         if not self.saw_first_system and message_type == ChatMessageType.SYSTEM:
             # Redact the first SYSTEM message we see. This has the front-man prompt in it,
             # and when read in, we replace it with what the agent has anyway to prevent
             # a prompting takeover.
-            transformed_message_dict = self.redact_instructions(chat_message_dict)
+            redacted: Dict[str, Any] = self.redact_instructions(chat_message_dict)
+            self.message_history.append(redacted)
+            self.message_tokens.append(self.estimator.estimate_message(redacted.get("text")))
             self.saw_first_system = True
-        else:
-            # Transform the message with properly escaped text.
-            transformed_message_dict = self.escape_message(chat_message_dict)
-
-        if transformed_message_dict is not None:
-            self.message_history.append(transformed_message_dict)
+        elif text is not None:
+            # The message is transformed with properly escaped text in get_message_history(),
+            # once we know it is going to be kept.
+            self.message_history.append(chat_message_dict)
+            self.message_tokens.append(self.estimator.estimate_message(text))
 
     def redact_instructions(self, chat_message_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -119,22 +219,27 @@ class ChatHistoryMessageProcessor(MessageProcessor):
         if text is None:
             return None
 
+        transformed["text"] = self.escape_text(text)
+        return transformed
+
+    @staticmethod
+    def escape_text(text: str) -> str:
+        """
+        :param text: The text to escape
+        :return: The text with all braces escaped
+        """
         # Braces are a problem for chat history being read back into the system
         # if they are not properly escaped.
-
-        # First replace any pre-escaped braces with normal braces
-        text = text.replace("{{", "{")
-        text = text.replace("}}", "}")
-
-        # Now replace normal braces with escaped braces.
-        # Idea is to catch everything pre-escaped or not
-        text = text.replace("{", "{{")
-        text = text.replace("}", "}}")
+        if "{" in text:
+            # First replace any pre-escaped braces with normal braces
+            # Now replace normal braces with escaped braces.
+            # Idea is to catch everything pre-escaped or not
+            text = text.replace("{{", "{").replace("{", "{{")
+        if "}" in text:
+            text = text.replace("}}", "}").replace("}", "}}")
 
         # JSON spec does not allow control characters in strings and newlines in particular
         # can be a problem for http clients that expect one full JSON message per line.
         # Replace any lurking newlines with the 2 raw characters \ and n.
         # DEF - for the future.
-
-        transformed["text"] = text
-        return transformed
+        return text
@@ -15,6 +15,7 @@ from typing import Iterator
 from typing import List
 from typing import Union
 
+import asyncio
 import copy
 import traceback
 
@@ -22,13 +23,13 @@ from logging import getLogger
 from logging import Logger
 from inspect import iscoroutinefunction
 
-from openai import BadRequestError
-
+from neuro_san.interfaces.chat_history_summarizer import ChatHistorySummarizer
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.chat.chat_history_message_processor import ChatHistoryMessageProcessor
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.graph.registry.agent_tool_registry import AgentToolRegistry
 from neuro_san.internals.graph.activations.sly_data_redactor import SlyDataRedactor
+from neuro_san.internals.graph.activations.sly_data_size_limiter import SlyDataSizeLimiter
 from neuro_san.internals.interfaces.front_man import FrontMan
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.journal import Journal
@@ -36,6 +37,9 @@ from neuro_san.internals.messages.agent_framework_message import AgentFrameworkM
 from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
 from neuro_san.internals.run_context.factory.run_context_factory import RunContextFactory
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
+from neuro_san.internals.utils.loaded_classes import LoadedClasses
+from neuro_san.internals.utils.request_deadline import RequestDeadline
+from neuro_san.internals.utils.resolver_util import ResolverUtil
 from neuro_san.message_processing.message_processor import MessageProcessor
 from neuro_san.message_processing.answer_message_processor import AnswerMessageProcessor
 from neuro_san.message_processing.structure_message_processor import StructureMessageProcessor
@@ -122,14 +126,31 @@ class DataDrivenChatSession:
         # because it is expected they share the reference and only interact with it
         # in a read-only fashion.
         if sly_data is not None:
+            limiter = SlyDataSizeLimiter(self.registry.get_config())
+            limiter.check(sly_data, "sent by the client")
             self.sly_data.update(sly_data)
 
+        # Give up on the request when the client's deadline or that of the network passes.
+        # Timing out cancels everything the front man has going on down the agent graph,
+        # including LLM calls and requests to external agents.
+        deadline: RequestDeadline = invocation_context.get_deadline().limit_for_network(self.registry.get_config())
+
         try:
             # DEF - drill further down for iterator from here to enable getting
             #       messages from downstream agents.
-            raw_messages: List[Any] = await self.front_man.submit_message(user_input)
+            raw_messages: List[Any] = await asyncio.wait_for(self.front_man.submit_message(user_input),
+                                                             timeout=deadline.get_remaining_seconds())
+
+        except asyncio.TimeoutError:
+            raw_messages: List[Any] = [
+                AgentFrameworkMessage(content="Error: The request ran out of time before the agent network "
+                                              "could finish.")
+            ]
 
-        except BadRequestError:
+            logger: Logger = getLogger(self.__class__.__name__)
+            logger.warning("Request ran out of time and was cancelled")
+
+        except LoadedClasses.get("openai.BadRequestError"):
             # This can happen if the user is trying to send a new message
             # while it is still working on a previous message that has not
             # yet returned.
@@ -174,7 +195,7 @@ class DataDrivenChatSession:
         message_list: List[Dict[str, Any]] = list(chat_messages)
 
         # Determine the chat_context to enable continuing the conversation
-        return_chat_context: Dict[str, Any] = self.prepare_chat_context(message_list)
+        return_chat_context: Dict[str, Any] = await self.prepare_chat_context(message_list)
 
         # Get the front man spec. We will need it later for a few things.
         front_man_spec: Dict[str, Any] = self.front_man.get_agent_tool_spec()
@@ -226,7 +247,7 @@ class DataDrivenChatSession:
             await self.front_man.delete_any_resources()
             self.front_man = None
 
-    def prepare_chat_context(self, chat_message_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def prepare_chat_context(self, chat_message_history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Prepare the chat context.
 
@@ -236,10 +257,18 @@ class DataDrivenChatSession:
                 the conversation such that it could be taken up on a different
                 server instance
         """
-        # OK if this is None
-        max_message_history: int = self.front_man.get_agent_tool_spec().get("max_message_history")
-        processor: MessageProcessor = ChatHistoryMessageProcessor(max_message_history)
-        processor.process_messages(chat_message_history)
+        front_man_spec: Dict[str, Any] = self.front_man.get_agent_tool_spec()
+
+        # OK if these are None
+        max_message_history: int = front_man_spec.get("max_message_history")
+        max_history_tokens: int = front_man_spec.get("max_history_tokens")
+        summarizer: ChatHistorySummarizer = ResolverUtil.create_instance(front_man_spec.get("history_summarizer"),
+                                                                         "history_summarizer of the front man",
+                                                                         ChatHistorySummarizer)
+        processor: MessageProcessor = ChatHistoryMessageProcessor(max_message_history,
+                                                                  max_history_tokens=max_history_tokens,
+                                                                  summarizer=summarizer)
+        await processor.async_process_messages(chat_message_history)
 
         chat_history: Dict[str, Any] = {
             "origin": self.front_man.get_origin(),
@@ -0,0 +1,43 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+# Rule of thumb for English text with the tokenizers of the popular LLMs
+CHARS_PER_TOKEN: int = 4
+
+# Roughly what each message costs on top of its text for role markers and the like
+MESSAGE_OVERHEAD_TOKENS: int = 4
+
+
+class TokenLengthEstimator:
+    """
+    Quickly estimates how many tokens a chat message will take up as LLM input
+    without going through any particular model's tokenizer.
+
+    Estimates only look at the length of the text, so they take constant time.
+    Subclasses can override estimate_text() with an exact tokenizer.
+    """
+
+    def estimate_text(self, text: str) -> int:
+        """
+        :param text: The text to estimate
+        :return: The estimated number of tokens for the text
+        """
+        if not text:
+            return 0
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    def estimate_message(self, text: str) -> int:
+        """
+        :param text: The text of a single chat message
+        :return: The estimated number of tokens for a message with the given text
+        """
+        return self.estimate_text(text) + MESSAGE_OVERHEAD_TOKENS
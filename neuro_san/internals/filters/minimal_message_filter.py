@@ -11,6 +11,7 @@
 # END COPYRIGHT
 from typing import List
 
+from neuro_san.internals.filters.answer_chunk_message_filter import AnswerChunkMessageFilter
 from neuro_san.internals.filters.chat_context_message_filter import ChatContextMessageFilter
 from neuro_san.internals.filters.compound_message_filter import CompoundMessageFilter
 from neuro_san.internals.filters.message_filter import MessageFilter
@@ -20,6 +21,9 @@ class MinimalMessageFilter(CompoundMessageFilter):
     """
     A CompoundMessageFilter that lets the minimal messages needed for an agent interaction
     go through.
+
+    Streamed pieces of the front man's answer also go through, but these are only
+    ever sent when the front man has opted into token streaming.
     """
 
     def __init__(self):
@@ -28,5 +32,6 @@ class MinimalMessageFilter(CompoundMessageFilter):
         """
         filters: List[MessageFilter] = [
             ChatContextMessageFilter(),
+            AnswerChunkMessageFilter(),
         ]
         super().__init__(filters)
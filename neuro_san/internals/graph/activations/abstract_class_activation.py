@@ -12,6 +12,7 @@
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Type
 
 import json
 
@@ -26,6 +27,7 @@ from leaf_common.config.resolver import Resolver
 from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.internals.graph.activations.abstract_callable_activation import AbstractCallableActivation
 from neuro_san.internals.graph.activations.branch_activation import BranchActivation
+from neuro_san.internals.graph.activations.sly_data_size_limiter import SlyDataSizeLimiter
 from neuro_san.internals.graph.interfaces.agent_tool_factory import AgentToolFactory
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.agent_message import AgentMessage
@@ -99,17 +101,18 @@ class AbstractClassActivation(AbstractCallableActivation):
         """
         raise NotImplementedError
 
-    # pylint: disable=too-many-locals
-    async def build(self) -> str:
+    @staticmethod
+    def resolve_class(full_class_ref: str, agent_tool_path: str) -> Type[CodedTool]:
         """
-        Main entry point to the class.
-
-        :return: A string representing a List of messages produced during this process.
+        Resolves the class of a CodedTool, first looking for the module specific
+        to the agent network and then for one shared by all agent networks.
+
+        :param full_class_ref: A dot-separated string representing the full class path
+                    of the CodedTool relative to the agent tool path.
+        :param agent_tool_path: The agent tool path of the agent network, as a python package path.
+        :return: The class of the CodedTool.
+                Raises ValueError or AttributeError when the class cannot be found.
         """
-        messages: List[Any] = []
-
-        full_class_ref: str = self.get_full_class_ref()
-        self.logger.info("Calling class %s", full_class_ref)
         class_split = full_class_ref.split(".")
         class_name = class_split[-1]
         # Remove the class name from the end to get the module name
@@ -118,28 +121,45 @@ class AbstractClassActivation(AbstractCallableActivation):
         while module_name.endswith("."):
             module_name = module_name[:-1]
 
-        # Resolve the class and the method
-        this_agent_tool_path: str = self.factory.get_agent_tool_path()
-        packages: List[str] = [this_agent_tool_path]
+        packages: List[str] = [agent_tool_path]
         resolver: Resolver = Resolver(packages)
 
         try:
-            python_class = resolver.resolve_class_in_module(class_name, module_name)
+            python_class: Type[CodedTool] = resolver.resolve_class_in_module(class_name, module_name)
         except (ValueError, AttributeError):
             # Drop the last segment to go one level up in the module path
-            parent_path: str = this_agent_tool_path.rsplit(".", 1)[0]
+            parent_path: str = agent_tool_path.rsplit(".", 1)[0]
             packages = [parent_path]
             resolver = Resolver(packages)
+            python_class = resolver.resolve_class_in_module(class_name, module_name)
+
+        return python_class
 
-            try:
-                python_class = resolver.resolve_class_in_module(class_name, module_name)
-            except (ValueError, AttributeError) as second_exception:
-                # Get all but the last module in the path.
-                # This is what was actually used for AGENT_TOOL_PATH
-                agent_tool_path: str = ".".join(this_agent_tool_path.split(".")[:-1])
-                agent_network: str = this_agent_tool_path.split(".")[-1]
-                agent_name: str = self.factory.get_name_from_spec(self.agent_tool_spec)
-                message = f"""
+    # pylint: disable=too-many-locals
+    async def build(self) -> str:
+        """
+        Main entry point to the class.
+
+        :return: A string representing a List of messages produced during this process.
+        """
+        messages: List[Any] = []
+
+        full_class_ref: str = self.get_full_class_ref()
+        self.logger.info("Calling class %s", full_class_ref)
+
+        # Resolve the class and the method
+        this_agent_tool_path: str = self.factory.get_agent_tool_path()
+        try:
+            python_class: Type[CodedTool] = self.resolve_class(full_class_ref, this_agent_tool_path)
+        except (ValueError, AttributeError) as exception:
+            class_name: str = full_class_ref.split(".")[-1]
+            module_name: str = full_class_ref[:-len(class_name)].rstrip(".")
+            # Get all but the last module in the path.
+            # This is what was actually used for AGENT_TOOL_PATH
+            agent_tool_path: str = ".".join(this_agent_tool_path.split(".")[:-1])
+            agent_network: str = this_agent_tool_path.split(".")[-1]
+            agent_name: str = self.factory.get_name_from_spec(self.agent_tool_spec)
+            message = f"""
     Could not find class "{class_name}"
     in module "{module_name}"
     under AGENT_TOOL_PATH "{agent_tool_path}"
@@ -161,7 +181,7 @@ class AbstractClassActivation(AbstractCallableActivation):
         e)  If an agent network contains both specific and global CodedTools,
             the global module must not have the same name as the agent network.
     """
-                raise ValueError(message) from second_exception
+            raise ValueError(message) from exception
 
         # Instantiate the CodedTool
         coded_tool: CodedTool = None
@@ -256,6 +276,10 @@ This can lead to performance problems when running within a server. Consider por
             loop: AbstractEventLoop = executor.get_event_loop()
             retval = await loop.run_in_executor(None, coded_tool.invoke, arguments, sly_data)
 
+        # CodedTools can stash large things in the sly_data.
+        limiter = SlyDataSizeLimiter(self.factory.get_config())
+        limiter.check(self.sly_data, f"after {coded_tool.__class__.__name__} ran")
+
         retval_dict: Dict[str, Any] = {
             "tool_end": True,
             "tool_output": retval
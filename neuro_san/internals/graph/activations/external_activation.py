@@ -26,16 +26,19 @@ from neuro_san.interfaces.async_agent_session import AsyncAgentSession
 from neuro_san.internals.graph.activations.abstract_callable_activation import AbstractCallableActivation
 from neuro_san.internals.graph.activations.external_message_processor import ExternalMessageProcessor
 from neuro_san.internals.graph.activations.sly_data_redactor import SlyDataRedactor
+from neuro_san.internals.graph.activations.sly_data_size_limiter import SlyDataSizeLimiter
 from neuro_san.internals.graph.interfaces.agent_tool_factory import AgentToolFactory
 from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.agent_message import AgentMessage
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.chat_response_envelope import ChatResponseEnvelope
 from neuro_san.internals.messages.origination import Origination
 from neuro_san.internals.run_context.factory.run_context_factory import RunContextFactory
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
 from neuro_san.message_processing.basic_message_processor import BasicMessageProcessor
+from neuro_san.session.async_http_service_agent_session import AsyncHttpServiceAgentSession
 
 
 # pylint: disable=too-many-instance-attributes
@@ -142,7 +145,8 @@ class ExternalActivation(AbstractCallableActivation):
         try:
             # Note that we are not await-ing the response here because what is returned is a generator.
             # Proper await-ing for generator results is done in the "async for"-loop below.
-            chat_responses: AsyncGenerator[Dict[str, Any], None] = self.session.streaming_chat(chat_request)
+            chat_responses: AsyncGenerator[ChatResponseEnvelope, None] = \
+                self.streaming_chat_envelopes(chat_request)
         except ValueError:
             # Could not reach the server for the external agent, so tell about it
             messages_str: str = f"Agent/tool {self.agent_url} was unreachable. " + \
@@ -155,9 +159,14 @@ class ExternalActivation(AbstractCallableActivation):
         # The asynchronous generator will wait until the next response is available
         # from the stream.  When the other side is done, the iterator will exit the loop.
         empty = {}
-        async for chat_response in chat_responses:
+        async for envelope in chat_responses:
 
-            response: Dict[str, Any] = chat_response.get("response", empty)
+            if self.can_skip(envelope):
+                # Nothing we do with the stream cares about this message,
+                # so do not bother parsing all of it.
+                continue
+
+            response: Dict[str, Any] = envelope.get_chat_response().get("response", empty)
             await self.processor.async_process_message(response)
 
         # Get stuff back from the message processing
@@ -174,6 +183,9 @@ class ExternalActivation(AbstractCallableActivation):
         #       This ends up needing to be re-integrated in the RunContext.
         self.sly_data = redactor.filter_config(returned_sly_data)
 
+        limiter = SlyDataSizeLimiter(self.factory.get_config())
+        limiter.check(self.sly_data, f"returned by {self.agent_url}")
+
         answer_dict: Dict[str, Any] = {
             "tool_end": True,
             "tool_output": answer
@@ -195,6 +207,36 @@ class ExternalActivation(AbstractCallableActivation):
         messages_str = json.dumps(message_list)
         return messages_str
 
+    async def streaming_chat_envelopes(self, chat_request: Dict[str, Any]) \
+            -> AsyncGenerator[ChatResponseEnvelope, None]:
+        """
+        :param chat_request: The ChatRequest dictionary to send to the external agent
+        :return: An iterator of ChatResponseEnvelopes for the responses.
+                When the external agent is reached over HTTP, each response
+                is only parsed if something asks for all of it.
+        """
+        if isinstance(self.session, AsyncHttpServiceAgentSession):
+            async for envelope in self.session.streaming_chat_envelopes(chat_request):
+                yield envelope
+            return
+
+        async for chat_response in self.session.streaming_chat(chat_request):
+            yield ChatResponseEnvelope(chat_response=chat_response)
+
+    def can_skip(self, envelope: ChatResponseEnvelope) -> bool:
+        """
+        :param envelope: The ChatResponseEnvelope to consider
+        :return: True if the type and origin of the message within tell us
+                that none of our message processing would do anything with it.
+                False if the message needs to be processed.
+        """
+        message_type: ChatMessageType = envelope.peek_message_type()
+        origin: List[Dict[str, Any]] = envelope.peek_origin()
+        if message_type is None or origin is None:
+            # Cannot tell without looking at the whole thing
+            return False
+        return not self.processor.may_process_message(message_type, origin)
+
     def gather_input(self, agent_input: str, sly_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send input to the external agent
@@ -13,13 +13,12 @@ from typing import Any
 from typing import Dict
 from typing import List
 
-from copy import copy
-
 from langchain_core.messages.base import BaseMessage
 
 from neuro_san.internals.journals.originating_journal import OriginatingJournal
 from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.origin_path import OriginPath
 from neuro_san.message_processing.message_processor import MessageProcessor
 
 
@@ -48,8 +47,7 @@ class ExternalMessageProcessor(MessageProcessor):
             return
 
         # Append the origin information from the external agent to our own
-        origin: List[Dict[str, Any]] = copy(self.journal.get_origin())
-        origin.extend(message_origin)
+        origin: List[Dict[str, Any]] = OriginPath(list(self.journal.get_origin()) + list(message_origin))
 
         # Send the message to the client with deepened origin information
         converter = BaseMessageDictionaryConverter(langchain_only=False)
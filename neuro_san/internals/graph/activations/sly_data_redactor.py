@@ -76,6 +76,9 @@ class SlyDataRedactor(ConfigFilter):
                 }
             }
         }
+
+    Redaction only ever builds a new top-level dictionary.  The values themselves
+    are never copied, so large sly_data values cost nothing extra per hop.
     """
 
     def __init__(self, calling_agent_tool_spec: Dict[str, Any],
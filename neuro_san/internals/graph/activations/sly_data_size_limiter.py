@@ -0,0 +1,93 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+
+import os
+import sys
+
+
+class SlyDataSizeLimiter:
+    """
+    Enforces a limit on how much memory the sly_data of a single request
+    can hold on to, as set by the max_sly_data_bytes key of an agent network.
+    When the agent network does not say, the AGENT_MAX_SLY_DATA_BYTES env var is used.
+    A limit <= 0 (the default) means there is no limit.
+
+    Sizes are estimates of the memory held by the sly_data containers and
+    everything they refer to, counting objects shared between keys only once.
+    They are not the length of the sly_data as JSON, which would mean serializing it.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Constructor
+
+        :param config: The config dictionary of the agent network. Can be None.
+        """
+        max_bytes: Any = None
+        if config is not None:
+            max_bytes = config.get("max_sly_data_bytes")
+        if max_bytes is None:
+            max_bytes = os.environ.get("AGENT_MAX_SLY_DATA_BYTES", "0")
+        self.max_bytes: int = int(max_bytes)
+
+    def get_max_bytes(self) -> int:
+        """
+        :return: The limit in bytes.  A value <= 0 means there is no limit.
+        """
+        return self.max_bytes
+
+    def check(self, sly_data: Dict[str, Any], description: str):
+        """
+        :param sly_data: The sly_data dictionary to check
+        :param description: A description of where the sly_data is from, for the error message
+        :raises ValueError: If the sly_data is over the limit
+        """
+        if self.max_bytes <= 0 or not sly_data:
+            return
+
+        size: int = self.estimate_size(sly_data, self.max_bytes)
+        if size > self.max_bytes:
+            raise ValueError(f"The sly_data {description} takes more than the {self.max_bytes} bytes "
+                             "allowed by max_sly_data_bytes for the agent network.")
+
+    @staticmethod
+    def estimate_size(value: Any, stop_after: int = 0) -> int:
+        """
+        :param value: The value whose size is to be estimated
+        :param stop_after: When > 0, stop counting once the size goes over this many bytes.
+                    A size > stop_after is returned then, but not the whole size.
+        :return: An estimate of the number of bytes of memory held by the value
+        """
+        size: int = 0
+        seen: Set[int] = set()
+        pending: List[Any] = [value]
+        while pending:
+            one_value: Any = pending.pop()
+            if id(one_value) in seen:
+                continue
+            seen.add(id(one_value))
+
+            size += sys.getsizeof(one_value)
+            if 0 < stop_after < size:
+                break
+
+            if isinstance(one_value, dict):
+                pending.extend(one_value.keys())
+                pending.extend(one_value.values())
+            elif isinstance(one_value, (list, tuple, set, frozenset)):
+                pending.extend(one_value)
+
+        return size
@@ -40,6 +40,7 @@ class DefaultsConfigFilter(ConfigFilter):
         "verbose": None,
         "max_iterations": None,
         "max_execution_seconds": None,
+        "stream_tokens": None,
         "error_formatter": None,
         "error_fragments": None,
     }
@@ -21,6 +21,7 @@ from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextT
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 
 
 class InvocationContext:
@@ -99,3 +100,9 @@ class InvocationContext:
         :return: The ContextTypeToolboxFactory instance for the session
         """
         raise NotImplementedError
+
+    def get_deadline(self) -> RequestDeadline:
+        """
+        :return: The RequestDeadline by which the invocation needs to be done
+        """
+        raise NotImplementedError
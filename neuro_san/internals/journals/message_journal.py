@@ -54,5 +54,6 @@ class MessageJournal(Journal):
         # The synchronous=True is necessary when an async HTTP request is at the get()-ing end of the queue,
         # as the journal messages come from inside a separate event loop from that request. The lock
         # taken here ends up being harmless in the synchronous request case (like for gRPC) because
-        # we would only be blocking our own event loop.
+        # we would only be blocking our own event loop.  Hoppers that can tell they are on the same
+        # loop as their consumer are free to skip the lock.
         await self.hopper.put(message_dict, synchronous=True)
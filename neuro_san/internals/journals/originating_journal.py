@@ -14,6 +14,7 @@ from typing import Dict
 from typing import List
 
 from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.ai import AIMessageChunk
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.system import SystemMessage
 
@@ -67,6 +68,12 @@ class OriginatingJournal(Journal):
         if origin is not None:
             use_origin = origin
 
+        if isinstance(message, AIMessageChunk):
+            # Streamed pieces of an answer go straight through. They are never part
+            # of the chat history and should not disturb any pending message.
+            await self.wrapped_journal.write_message(message, use_origin)
+            return
+
         if self.chat_history is not None and BaseMessageDictionaryConverter.is_relevant_to_chat_history(message):
             # Different LLM providers handle message types differently when constructing responses:
             #
@@ -15,6 +15,7 @@ from typing import Dict
 from typing import List
 
 from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.ai import AIMessageChunk
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
 from langchain_core.messages.system import SystemMessage
@@ -165,4 +166,7 @@ class BaseMessageDictionaryConverter(DictionaryConverter):
         if isinstance(base_message, (AgentMessage, AgentFrameworkMessage, ToolMessage)):
             # These guys cannot be in chat history as langchain will not recognize them.
             return False
+        if isinstance(base_message, AIMessageChunk):
+            # Streamed pieces of an answer. The full AIMessage is what goes into history.
+            return False
         return True
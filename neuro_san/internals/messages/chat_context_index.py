@@ -0,0 +1,83 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from langchain_core.messages.base import BaseMessage
+
+from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.origination import Origination
+
+
+class ChatContextIndex:
+    """
+    Index of the chat histories within an incoming ChatContext dictionary
+    by the full name of their origin, built once per request and shared by
+    every agent activation looking for its own chat history.
+
+    Chat history dictionaries are only converted to langchain BaseMessages
+    the first time some activation asks for them, and the converted messages
+    are shared from then on.  As with chat_context dictionaries themselves,
+    the messages are not to be modified.
+    """
+
+    def __init__(self, chat_context: Dict[str, Any]):
+        """
+        Constructor
+
+        :param chat_context: A ChatContext dictionary that contains all the state necessary
+                to carry on a previous conversation, possibly from a different server.
+        """
+        self.chat_context: Dict[str, Any] = chat_context
+        self.message_dicts: Dict[str, List[Dict[str, Any]]] = {}
+        self.messages: Dict[str, List[BaseMessage]] = {}
+
+        empty: List[Any] = []
+        chat_histories: List[Dict[str, Any]] = []
+        if chat_context is not None:
+            chat_histories = chat_context.get("chat_histories", empty)
+        for one_chat_history in chat_histories:
+            origin_str: str = Origination.get_full_name_from_origin(one_chat_history.get("origin", empty))
+            # As when searching the list, the first chat history with the origin wins.
+            if origin_str not in self.message_dicts:
+                self.message_dicts[origin_str] = one_chat_history.get("messages", empty)
+
+    def get_chat_context(self) -> Dict[str, Any]:
+        """
+        :return: The ChatContext dictionary that is indexed
+        """
+        return self.chat_context
+
+    def get_chat_history(self, origin: List[Dict[str, Any]]) -> List[BaseMessage]:
+        """
+        :param origin: The origin of the agent looking for its chat history
+        :return: A new list of the BaseMessages in the chat history for the origin,
+                 which the caller is free to add to.  None if the ChatContext
+                 has no messages for the origin.
+        """
+        origin_str: str = Origination.get_full_name_from_origin(origin)
+        messages: List[BaseMessage] = self.messages.get(origin_str)
+        if messages is None:
+            message_dicts: List[Dict[str, Any]] = self.message_dicts.get(origin_str)
+            if not message_dicts:
+                return None
+
+            converter = BaseMessageDictionaryConverter()
+            messages = []
+            for chat_message in message_dicts:
+                base_message: BaseMessage = converter.from_dict(chat_message)
+                if base_message is not None:
+                    messages.append(base_message)
+            self.messages[origin_str] = messages
+
+        return list(messages)
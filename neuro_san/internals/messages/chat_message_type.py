@@ -17,6 +17,7 @@ from typing import Type
 from typing import Union
 
 from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.ai import AIMessageChunk
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
 from langchain_core.messages.system import SystemMessage
@@ -39,6 +40,7 @@ class ChatMessageType(IntEnum):
     AGENT = 100
     AGENT_FRAMEWORK = 101
     AGENT_TOOL_RESULT = 103
+    AI_MESSAGE_CHUNK = 104
 
     # Adding something? Don't forget to update the maps below.
 
@@ -114,6 +116,7 @@ _MESSAGE_TYPE_TO_CHAT_MESSAGE_TYPE: Dict[Type[BaseMessage], ChatMessageType] = {
     AgentMessage: ChatMessageType.AGENT,
     AgentFrameworkMessage: ChatMessageType.AGENT_FRAMEWORK,
     AgentToolResultMessage: ChatMessageType.AGENT_TOOL_RESULT,
+    AIMessageChunk: ChatMessageType.AI_MESSAGE_CHUNK,
 }
 
 _MESSAGE_TYPE_TO_ROLE: Dict[Type[BaseMessage], str] = {
@@ -123,6 +126,7 @@ _MESSAGE_TYPE_TO_ROLE: Dict[Type[BaseMessage], str] = {
     AgentMessage: "agent",
     AgentFrameworkMessage: "agent-framework",
     AgentToolResultMessage: "agent-tool-result",
+    AIMessageChunk: "assistant-chunk",
 }
 
 _CHAT_MESSAGE_TYPE_TO_STRING: Dict[ChatMessageType, str] = {
@@ -136,4 +140,5 @@ _CHAT_MESSAGE_TYPE_TO_STRING: Dict[ChatMessageType, str] = {
     ChatMessageType.AGENT: "AGENT",
     ChatMessageType.AGENT_FRAMEWORK: "AGENT_FRAMEWORK",
     ChatMessageType.AGENT_TOOL_RESULT: "AGENT_TOOL_RESULT",
+    ChatMessageType.AI_MESSAGE_CHUNK: "AI_MESSAGE_CHUNK",
 }
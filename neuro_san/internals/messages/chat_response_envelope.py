@@ -0,0 +1,153 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+import re
+
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.utils.json_codec import JsonCodec
+
+# Matches the way a neuro-san server writes the start of each streamed ChatResponse
+# (with or without whitespace), up to where the origin list begins:
+#   {"response": {"type": "AI", "origin": [...
+PEEKABLE_PREFIX = re.compile(rb'\s*\{\s*"response"\s*:\s*\{\s*"type"\s*:\s*"(\w+)"\s*,\s*"origin"\s*:\s*')
+
+# ChatMessageTypes by the names servers write them with
+MESSAGE_TYPES: Dict[bytes, ChatMessageType] = {
+    name.encode("ascii"): message_type for name, message_type in ChatMessageType.__members__.items()
+}
+
+# Number of bytes after the prefix within which the origin list must end to be peeked at
+ORIGIN_WINDOW: int = 4096
+
+
+class ChatResponseEnvelope:
+    """
+    A single ChatResponse as it was streamed over the wire, whose JSON is only
+    parsed when someone actually needs the whole thing.
+
+    Before that, the type and origin of the ChatMessage inside can be peeked at
+    by looking only at the start of the line, as that is where a neuro-san server
+    puts them.  This lets clients that only care about a few messages of a long
+    stream skip the cost of fully parsing all the others.
+
+    When the start of the line does not look as expected, the peek methods
+    return None and it is up to the caller to get the full response instead.
+    """
+
+    def __init__(self, line: Union[str, bytes] = None, chat_response: Dict[str, Any] = None):
+        """
+        Constructor
+
+        :param line: A single line of JSON text for the ChatResponse, as read off the stream
+        :param chat_response: An already parsed ChatResponse dictionary.
+                    Either this or the line is expected.
+        """
+        self.line: bytes = line
+        if isinstance(line, str):
+            self.line = line.encode("utf-8")
+        self.chat_response: Dict[str, Any] = chat_response
+
+        self.peeked: bool = False
+        self.message_type: ChatMessageType = None
+        self.origin: List[Dict[str, Any]] = None
+
+    def get_line(self) -> bytes:
+        """
+        :return: The raw UTF-8 bytes of the line as read off the stream.
+                Can be None if this instance was created from a dictionary.
+        """
+        return self.line
+
+    def get_chat_response(self) -> Dict[str, Any]:
+        """
+        :return: The fully parsed ChatResponse dictionary.
+                The line is only parsed the first time this is called.
+        """
+        if self.chat_response is None:
+            codec: JsonCodec = JsonCodec.get_shared()
+            self.chat_response = codec.loads(self.line)
+        return self.chat_response
+
+    def peek_message_type(self) -> ChatMessageType:
+        """
+        :return: The ChatMessageType of the response's ChatMessage,
+                or None if that cannot be told without parsing the whole line.
+        """
+        self.peek()
+        return self.message_type
+
+    def peek_origin(self) -> List[Dict[str, Any]]:
+        """
+        :return: The origin list of the response's ChatMessage,
+                or None if that cannot be told without parsing the whole line.
+        """
+        self.peek()
+        return self.origin
+
+    def peek(self):
+        """
+        Finds the message type and origin as cheaply as possible, once.
+        """
+        if self.peeked:
+            return
+        self.peeked = True
+
+        if self.chat_response is not None:
+            # Already parsed, so no need to be clever.
+            message: Dict[str, Any] = self.chat_response.get("response")
+            if isinstance(message, dict):
+                self.message_type = self.safe_message_type(message.get("type"))
+                self.origin = message.get("origin")
+            return
+
+        match = PEEKABLE_PREFIX.match(self.line)
+        if match is None:
+            return
+
+        message_type: ChatMessageType = MESSAGE_TYPES.get(match.group(1))
+        if message_type is None:
+            return
+
+        # The origin list is small and ends at one of the next few closing brackets.
+        # Parse just that much, trying the next bracket should a tool name have one in it.
+        codec: JsonCodec = JsonCodec.get_shared()
+        start: int = match.end()
+        origin: Any = None
+        end: int = self.line.find(b"]", start)
+        while 0 <= end < start + ORIGIN_WINDOW:
+            try:
+                origin = codec.loads(self.line[start:end + 1])
+                break
+            except ValueError:
+                end = self.line.find(b"]", end + 1)
+
+        if not isinstance(origin, list):
+            # Origin is too long or malformed. Leave it to the full parse.
+            return
+
+        self.message_type = message_type
+        self.origin = origin
+
+    @staticmethod
+    def safe_message_type(response_type: Any) -> ChatMessageType:
+        """
+        :param response_type: A message type as it came in the response
+        :return: The corresponding ChatMessageType or None if it is not known.
+        """
+        try:
+            return ChatMessageType.from_response_type(response_type)
+        except ValueError:
+            return None
@@ -0,0 +1,200 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+import sys
+import threading
+
+from functools import lru_cache
+from weakref import WeakValueDictionary
+
+from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
+
+
+class OriginPath(list):
+    """
+    An immutable origin: a List of origin dictionaries indicating the origin of a chat message,
+    with its full name string computed once up front.
+
+    Since this is a list of the very same origin dictionaries as the wire format,
+    it can go anywhere a List[Dict[str, Any]] origin is expected (comparisons, JSON
+    and protobuf conversions), but it cannot be modified.  The origin dictionaries
+    within are shared and are not to be modified either.  Copies (via copy() or deepcopy())
+    are ordinary, mutable lists.
+
+    Paths derived with child() from the root are interned process-wide, so the same path
+    reached by different requests is represented by the same instance.
+    """
+
+    INSTANTIATION_START: int = 1
+    NUM_INSTANTIATION_INDEX_DIGITS: int = 2
+
+    # Weakly interned instances, keyed by the (tool, instantiation_index) tuples of the path
+    interned: WeakValueDictionary = WeakValueDictionary()
+    interned_lock = threading.Lock()
+    root: OriginPath = None
+
+    def __init__(self, origin: Iterable[Dict[str, Any]] = None, raw_name: str = None):
+        """
+        Constructor
+
+        :param origin: An iterable of origin dictionaries.  Default of None is an empty origin.
+        :param raw_name: The already-computed "."-joined name of the origin before
+                external agent cleanup. Default of None computes this from the origin.
+        """
+        if origin is None:
+            origin = []
+        super().__init__(origin)
+
+        self.key: Tuple[Tuple[str, int], ...] = None
+        if raw_name is None:
+            raw_name = ".".join(OriginPath.get_name_component(origin_dict) for origin_dict in self)
+        self.raw_name: str = raw_name
+
+        # Simple replacement of local external agents.
+        # DEF - need better recognition of external agent
+        self.full_name: str = sys.intern(raw_name.replace("./", "/"))
+
+    @staticmethod
+    def get_root() -> OriginPath:
+        """
+        :return: The interned empty origin from which all others are derived
+        """
+        if OriginPath.root is None:
+            with OriginPath.interned_lock:
+                if OriginPath.root is None:
+                    root = OriginPath()
+                    root.key = ()
+                    OriginPath.root = root
+        return OriginPath.root
+
+    @staticmethod
+    def from_origin(origin: List[Dict[str, Any]]) -> OriginPath:
+        """
+        :param origin: A List of origin dictionaries, perhaps already an OriginPath
+        :return: An OriginPath for the origin. None if origin is None.
+        """
+        if origin is None or isinstance(origin, OriginPath):
+            return origin
+        if len(origin) == 0:
+            return OriginPath.get_root()
+        return OriginPath(origin)
+
+    @staticmethod
+    def get_name_component(origin_dict: Dict[str, Any]) -> str:
+        """
+        :param origin_dict: A single origin dictionary with the keys:
+                    "tool"                  The string name of the tool in the spec
+                    "instantiation_index"   An integer indicating which incarnation
+                                            of the tool is being dealt with.
+        :return: The string name for the single origin dictionary
+        """
+        # Get basic fields from the dict
+        instantiation_index: int = origin_dict.get("instantiation_index", OriginPath.INSTANTIATION_START)
+        tool: str = origin_dict.get("tool")
+        if tool is None:
+            # No information of value will be conveyed with no tool set in the dict.
+            raise ValueError("tool name in origin_dict is None")
+
+        return OriginPath.format_name_component(tool, instantiation_index)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_name_component(tool: str, instantiation_index: int) -> str:
+        """
+        Origins arriving over the wire are plain lists that need their names computed,
+        so remember the names of the components we have seen.
+
+        :param tool: The string name of the tool in the spec
+        :param instantiation_index: An integer indicating which incarnation of the tool is being dealt with.
+        :return: The string name for the single origin component
+        """
+        # Figure out how we will deal with the index
+        index_str: str = ""
+        if instantiation_index > OriginPath.INSTANTIATION_START:
+            # zfill() adds leading 0's up to the number of characters provided
+            index_str = f"-{str(instantiation_index).zfill(OriginPath.NUM_INSTANTIATION_INDEX_DIGITS)}"
+
+        safe_tool: str = ExternalAgentParsing.get_safe_agent_name(tool)
+
+        # Figure out the single origin string
+        return f"{safe_tool}{index_str}"
+
+    def child(self, tool: str, instantiation_index: int) -> OriginPath:
+        """
+        :param tool: The string name of the tool in the spec
+        :param instantiation_index: An integer indicating which incarnation of the tool is being dealt with.
+        :return: A new OriginPath with the given tool at the end.
+                Only the name of the new component is computed.
+        """
+        origin_dict: Dict[str, Any] = {
+            "tool": tool,
+            "instantiation_index": instantiation_index
+        }
+        component: str = OriginPath.get_name_component(origin_dict)
+        raw_name: str = component
+        if len(self) > 0:
+            raw_name = f"{self.raw_name}.{component}"
+
+        if self.key is None:
+            # Our own contents came from elsewhere, so do not intern anything derived from it.
+            return OriginPath(list.__add__(self, [origin_dict]), raw_name)
+
+        key: Tuple[Tuple[str, int], ...] = self.key + ((tool, instantiation_index),)
+        with OriginPath.interned_lock:
+            path: OriginPath = OriginPath.interned.get(key)
+            if path is None:
+                path = OriginPath(list.__add__(self, [origin_dict]), raw_name)
+                path.key = key
+                OriginPath.interned[key] = path
+        return path
+
+    def get_full_name(self) -> str:
+        """
+        :return: A single string name for this origin path
+        """
+        return self.full_name
+
+    def __copy__(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Dict[str, Any]]:
+        # Origin dictionaries only contain immutable values, so shallow copies of them suffice.
+        return [dict(origin_dict) for origin_dict in self]
+
+    def __reduce__(self):
+        return (OriginPath, (list(self), self.raw_name))
+
+    def _immutable(self, *args, **kwargs):
+        """
+        Stands in for all methods that would modify the list
+        """
+        raise TypeError("OriginPath is immutable. Make a copy() to get a modifiable list.")
+
+    append = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    clear = _immutable
+    sort = _immutable
+    reverse = _immutable
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
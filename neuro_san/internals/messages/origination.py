@@ -13,9 +13,7 @@ from typing import Any
 from typing import Dict
 from typing import List
 
-from copy import copy
-
-from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
+from neuro_san.internals.messages.origin_path import OriginPath
 
 
 class Origination:
@@ -31,8 +29,8 @@ class Origination:
                                 of the tool is being dealt with.
     """
 
-    INSTANTIATION_START: int = 1
-    NUM_INSTANTIATION_INDEX_DIGITS: int = 2
+    INSTANTIATION_START: int = OriginPath.INSTANTIATION_START
+    NUM_INSTANTIATION_INDEX_DIGITS: int = OriginPath.NUM_INSTANTIATION_INDEX_DIGITS
 
     def __init__(self):
         """
@@ -51,29 +49,19 @@ class Origination:
                     "instantiation_index"   An integer indicating which incarnation
                                             of the tool is being dealt with.
         :param agent_name: The agent name to be added to the list.
-        :return: The new origin with the agent name at the end of the list
+        :return: The new immutable OriginPath with the agent name at the end of the list
         """
-        new_origin: List[Dict[str, Any]] = []
-
         # Add the name from the spec to the origin, if we have it.
         if origin is None or agent_name is None:
-            return new_origin
-
-        # Make a shallow copy of the list, as we are going to modify it
-        # and don't want to muck with the original
-        new_origin = copy(origin)
+            return OriginPath.get_root()
 
         # Find the current instantiation index for the tool
         # and increment it in the map for later use
         instantiation_index: int = self.tool_to_index_map.get(agent_name, Origination.INSTANTIATION_START)
         self.tool_to_index_map[agent_name] = instantiation_index + 1
 
-        # Prepare the origin dictionary to append
-        origin_dict: Dict[str, Any] = {
-            "tool": agent_name,
-            "instantiation_index": instantiation_index
-        }
-        new_origin.append(origin_dict)
+        # Deriving from an OriginPath only needs to compute the name of the new component.
+        new_origin: OriginPath = OriginPath.from_origin(origin).child(agent_name, instantiation_index)
 
         return new_origin
 
@@ -91,36 +79,11 @@ class Origination:
         if origin is None:
             return None
 
-        # Connect all the elements of the origin by the delimiter "."
-        origin_list: List[str] = []
-        for origin_dict in origin:
-
-            # Get basic fields from the dict
-            instantiation_index: int = origin_dict.get("instantiation_index", Origination.INSTANTIATION_START)
-            tool: str = origin_dict.get("tool")
-            if tool is None:
-                # No information of value will be conveyed with no tool set in the dict.
-                raise ValueError("tool name in origin_dict is None")
-
-            # Figure out how we will deal with the index
-            index_str: str = ""
-            if instantiation_index > Origination.INSTANTIATION_START:
-                # zfill() adds leading 0's up to the number of characters provided
-                index_str = f"-{str(instantiation_index).zfill(Origination.NUM_INSTANTIATION_INDEX_DIGITS)}"
-
-            safe_tool: str = ExternalAgentParsing.get_safe_agent_name(tool)
-
-            # Figure out the single origin string
-            origin_str: str = f"{safe_tool}{index_str}"
-            origin_list.append(origin_str)
-
-        full_path: str = ".".join(origin_list)
-
-        # Simple replacement of local external agents.
-        # DEF - need better recognition of external agent
-        full_path = full_path.replace("./", "/")
+        if isinstance(origin, OriginPath):
+            # Already computed
+            return origin.get_full_name()
 
-        return full_path
+        return OriginPath(origin).get_full_name()
 
     def reset(self):
         """
@@ -10,10 +10,10 @@
 #
 # END COPYRIGHT
 
-import re
-from re import Match
+import json
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -28,6 +28,14 @@ class JsonStructureParser(StructureParser):
     JSON implementation for a StructureParser.
     """
 
+    # Pairs of (start, end) delimiters for candidate JSON blocks, in order of preference.
+    DELIMITERS: List[Tuple[str, str]] = [
+        ("```json", "```"),
+        ("```", "```"),
+        ("`{", "}`"),
+        ("{", "}"),
+    ]
+
     def parse_structure(self, content: str) -> Dict[str, Any]:
         """
         Parse the single string content for any signs of structure
@@ -39,19 +47,23 @@ class JsonStructureParser(StructureParser):
         # Reset remainder on each call
         self.remainder = None
 
-        meat: str = content
-        delimiters: Dict[str, str] = {
-            # Start : End
-            "```json": "```",
-            "```": "```",
-            "`{": "}`",
-            "{": "}",
-        }
+        meat: str = None
+        inner: str = None
+        meat, inner, self.remainder = self._extract_delimited_block(content, self.DELIMITERS)
+        if meat is None:
+            # Nothing that looks like structure at all
+            self.remainder = None
+            return None
 
-        meat, self.remainder = self._extract_delimited_block(content, delimiters)
+        # Attempt parsing the structure from the meat.
+        # Most of the time LLMs give us well-formed JSON, so try the cheap strict parse first.
+        structure: Dict[str, Any] = self._strict_loads(inner)
+        if structure is not None:
+            return structure
 
-        # Attempt parsing the structure from the meat
-        structure: Dict[str, Any] = None
+        if "{" not in meat:
+            # Repair has nothing to build a dictionary out of.
+            return None
 
         try:
             structure = loads(meat)
@@ -62,42 +74,70 @@ class JsonStructureParser(StructureParser):
         except JSONDecodeError:
             # Couldn't parse
             self.remainder = None
-        except TypeError:
-            # meat is None
-            self.remainder = None
 
         return structure
 
-    def _extract_delimited_block(self, text: str, delimiters: Dict[str, str]) -> Tuple[Optional[str], str]:
+    @staticmethod
+    def _strict_loads(text: str) -> Dict[str, Any]:
+        """
+        :param text: The text to parse as strict JSON
+        :return: The dictionary parsed from the text, or None if the text is not
+                a well-formed JSON object.
+        """
+        text = text.strip()
+        if not text.startswith("{"):
+            return None
+        try:
+            structure: Any = json.loads(text)
+        except JSONDecodeError:
+            return None
+        if not isinstance(structure, Dict):
+            return None
+        return structure
+
+    def _extract_delimited_block(self, text: str, delimiters: List[Tuple[str, str]]) \
+            -> Tuple[Optional[str], Optional[str], str]:
         """
         Extracts a block of text from the input string "text" that is enclosed between any
-        of the provided delimiter pairs. Returns a tuple of:
+        of the provided delimiter pairs.  The block spans from the first start delimiter
+        to the last end delimiter after it.  Returns a tuple of:
             - The extracted main block with delimiters, or None if no match
+            - The text within the main block that might be JSON, or None if no match
             - The remaining string with the block removed and extra whitespace collapsed
 
+        This only ever does a single forward and a single backward scan of the text
+        per delimiter pair, so it stays linear even for long text with unbalanced delimiters.
+
         :param text: The input string potentially containing a delimited block
-        :param delimiters: A dictionary mapping starting delimiters to ending delimiters
+        :param delimiters: A list of (start, end) delimiter pairs to try in order
 
-        :return: A tuple of (main block content, remainder string)
+        :return: A tuple of (main block content, candidate JSON text, remainder string)
         """
         # Try each delimiter pair in order
-        for start, end in delimiters.items():
-            # Build a regex pattern to find content between start and end delimiters
-            # - re.escape ensures special characters like "{" are treated literally
-            # - (.*) is a greedy match for any characters between the delimiters
-            pattern: str = re.escape(start) + r"(.*)" + re.escape(end)
+        for start, end in delimiters:
+            start_index: int = text.find(start)
+            if start_index < 0:
+                continue
+
+            # The end delimiter cannot overlap the start delimiter.
+            # If there is no end after the first start, there is none after any later start either.
+            end_index: int = text.rfind(end, start_index + len(start))
+            if end_index < 0:
+                continue
+            end_index += len(end)
 
-            # Perform regex search across multiple lines if needed (DOTALL allows "." to match newlines)
-            match: Match[str] = re.search(pattern, text, re.DOTALL)
+            # Extract the matched content (including the delimiters), removing leading/trailing whitespace
+            main: str = text[start_index:end_index].strip()
 
-            if match:
-                # Extract the matched content (including the delimiters), removing leading/trailing whitespace
-                main: str = match.group(0).strip()
+            # Braces are part of the JSON itself, but backticks are not.
+            inner: str = text[start_index + len(start):end_index - len(end)]
+            if start.endswith("{"):
+                inner = "{" + inner + "}"
 
-                # Remove the matched block (including delimiters) from the input string
-                remainder: str = text[:match.start()] + text[match.end():]
+            # Remove the matched block (including delimiters) from the input string
+            remainder: str = text[:start_index] + text[end_index:]
 
-                return main, remainder.strip()
+            return main, inner, remainder.strip()
 
         # If no matching delimiters were found, return None and the full cleaned-up input
-        return None, text.strip()
+        return None, None, text.strip()
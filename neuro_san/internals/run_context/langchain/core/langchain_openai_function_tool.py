@@ -24,8 +24,7 @@ from langchain_core.tools import BaseTool
 
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.langchain.core.langchain_run import LangChainRun
-from neuro_san.internals.run_context.langchain.core.base_model_dictionary_converter \
-    import BaseModelDictionaryConverter
+from neuro_san.internals.run_context.langchain.core.precompiled_agent_cache import PrecompiledAgentCache
 from neuro_san.internals.run_context.langchain.core.pydantic_argument_dictionary_converter \
     import PydanticArgumentDictionaryConverter
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
@@ -155,14 +154,23 @@ It's function_json is described thusly:
         # to satisfy that langchain need.  It's kind of a shame because this is just
         # going to get converted back to an OpenAI function again later on in langchain
         #  agent-land.
+        #
+        # Building that pydantic model is expensive and the parameters are fixed
+        # by the network spec, so the model class is shared between requests.
         if use_function_json != function_json:
-            converter = BaseModelDictionaryConverter("parameters")
-            tool.args_schema = converter.from_dict(use_function_json)
+            tool.args_schema = PrecompiledAgentCache.get_shared().get_args_schema(use_function_json)
 
         tool.tool_caller = tool_caller
 
         return tool
 
+    def get_tool_definition(self) -> Dict[str, Any]:
+        """
+        :return: The OpenAI tool definition that gets bound to an LLM for this tool.
+                This only depends on the function spec, so it is shared between requests.
+        """
+        return PrecompiledAgentCache.get_shared().get_tool_definition(self, self.function_json)
+
     def _run(
         self,
         *args: Any,
@@ -12,7 +12,6 @@
 from typing import Any
 from typing import Dict
 from typing import List
-from typing import Tuple
 from typing import Union
 
 import json
@@ -23,8 +22,6 @@ from copy import copy
 from logging import Logger
 from logging import getLogger
 
-from openai import APIError as OpenAI_APIError
-from anthropic import APIError as Anthropic_APIError
 
 from pydantic_core import ValidationError
 
@@ -41,7 +38,6 @@ from langchain_core.messages.system import SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
-from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
 
 from neuro_san.internals.errors.error_detector import ErrorDetector
 from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
@@ -53,7 +49,7 @@ from neuro_san.internals.journals.originating_journal import OriginatingJournal
 from neuro_san.internals.messages.origination import Origination
 from neuro_san.internals.messages.agent_message import AgentMessage
 from neuro_san.internals.messages.agent_tool_result_message import AgentToolResultMessage
-from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.chat_context_index import ChatContextIndex
 from neuro_san.internals.run_context.interfaces.agent_network_inspector import AgentNetworkInspector
 from neuro_san.internals.run_context.interfaces.run import Run
 from neuro_san.internals.run_context.interfaces.run_context import RunContext
@@ -61,6 +57,7 @@ from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.langchain.core.langchain_openai_function_tool \
     import LangChainOpenAIFunctionTool
 from neuro_san.internals.run_context.langchain.core.langchain_run import LangChainRun
+from neuro_san.internals.run_context.langchain.core.precompiled_agent_cache import PrecompiledAgentCache
 from neuro_san.internals.run_context.langchain.journaling.journaling_callback_handler import JournalingCallbackHandler
 from neuro_san.internals.run_context.langchain.journaling.journaling_tools_agent_output_parser \
     import JournalingToolsAgentOutputParser
@@ -68,6 +65,7 @@ from neuro_san.internals.run_context.langchain.token_counting.langchain_token_co
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
 from neuro_san.internals.run_context.utils.external_tool_adapter import ExternalToolAdapter
+from neuro_san.internals.utils.loaded_classes import LoadedClasses
 
 
 MINUTES: float = 60.0
@@ -106,6 +104,7 @@ class LangChainRunContext(RunContext):
         self.journal: OriginatingJournal = None
         self.llm: BaseLanguageModel = None
         self.agent: Agent = None
+        self.agent_executor: AgentExecutor = None
 
         # This might get modified in create_resources() (for now)
         self.llm_config: Dict[str, Any] = llm_config
@@ -117,6 +116,7 @@ class LangChainRunContext(RunContext):
         self.tool_caller: ToolCaller = tool_caller
         self.invocation_context: InvocationContext = invocation_context
         self.chat_context: Dict[str, Any] = chat_context
+        self.chat_context_index: ChatContextIndex = None
         self.origin: List[Dict[str, Any]] = []
         # Default logger
         self.logger: Logger = getLogger(self.__class__.__name__)
@@ -129,6 +129,8 @@ class LangChainRunContext(RunContext):
                 self.invocation_context = parent_run_context.get_invocation_context()
             if self.chat_context is None:
                 self.chat_context = parent_run_context.get_chat_context()
+            if isinstance(parent_run_context, LangChainRunContext):
+                self.chat_context_index = parent_run_context.get_chat_context_index()
             parent_origin = parent_run_context.get_origin()
 
             # Initialize the origin.
@@ -189,6 +191,7 @@ class LangChainRunContext(RunContext):
         prompt_template: ChatPromptTemplate = await self._create_prompt_template(instructions)
 
         self.agent = self.create_agent_with_fallbacks(prompt_template)
+        self.agent_executor = None
 
     def create_agent_with_fallbacks(self, prompt_template: ChatPromptTemplate) -> Agent:
         """
@@ -243,7 +246,7 @@ class LangChainRunContext(RunContext):
         agent: Agent = None
 
         if len(self.tools) > 0:
-            agent = create_tool_calling_agent(llm, self.tools, prompt_template)
+            agent = create_tool_calling_agent(llm, self.get_tool_definitions(), prompt_template)
 
             # The above call creates a chain in this order:
             #   first:  RunnablePassthrough
@@ -271,6 +274,21 @@ class LangChainRunContext(RunContext):
 
         return agent
 
+    def get_tool_definitions(self) -> List[Union[BaseTool, Dict[str, Any]]]:
+        """
+        :return: The list of tools to bind to the llm.  Where possible these are
+                the precompiled OpenAI tool definitions of our tools, so that the
+                llm does not have to convert the same tool schemas on every activation.
+                Other tools are passed through as-is.
+        """
+        tool_definitions: List[Union[BaseTool, Dict[str, Any]]] = []
+        for tool in self.tools:
+            if isinstance(tool, LangChainOpenAIFunctionTool):
+                tool_definitions.append(tool.get_tool_definition())
+            else:
+                tool_definitions.append(tool)
+        return tool_definitions
+
     async def _create_base_tool(self, name: str) -> BaseTool:
         """
         :param name: The name of the tool to create
@@ -355,24 +373,12 @@ class LangChainRunContext(RunContext):
         """
         Creates a ChatPromptTemplate given the generic instructions
         """
-        # Assemble the prompt message list
-        message_list: List[Tuple[str, str]] = []
-
         system_message = SystemMessage(instructions)
         if not self.chat_history:
             await self.journal.write_message(system_message)
-        message_list.append(("system", instructions))
-
-        # Fill out the rest of the prompt per the docs for create_tooling_agent()
-        # Note we are not write_message()-ing the chat history because that is redundant
-        # Unclear if we should somehow/someplace write_message() the agent_scratchpad at all.
-        message_list.extend([
-            ("placeholder", "{chat_history}"),
-            ("human", "{input}"),
-            ("placeholder", "{agent_scratchpad}"),
-        ])
 
-        prompt: ChatPromptTemplate = ChatPromptTemplate.from_messages(message_list)
+        # The template itself only depends on the instructions, so share it between requests.
+        prompt: ChatPromptTemplate = PrecompiledAgentCache.get_shared().get_prompt_template(instructions)
 
         return prompt
 
@@ -399,6 +405,31 @@ class LangChainRunContext(RunContext):
         run = LangChainRun(self.run_id_base, self.chat_history)
         return run
 
+    def get_agent_executor(self) -> AgentExecutor:
+        """
+        :return: The AgentExecutor for the agent created in create_resources().
+                This is built once and reused for every subsequent wait_on_run() on this instance,
+                as all per-request state is passed in when it is invoked.
+        """
+        if self.agent_executor is not None:
+            return self.agent_executor
+
+        agent_spec: Dict[str, Any] = self.tool_caller.get_agent_tool_spec()
+
+        verbose: Union[bool, str] = agent_spec.get("verbose", False)
+        if isinstance(verbose, str):
+            verbose = bool(verbose.lower() in ("true", "extra", "logging"))
+
+        max_execution_seconds: float = agent_spec.get("max_execution_seconds",
+                                                      2.0 * MINUTES)
+        max_iterations: int = agent_spec.get("max_iterations", 20)
+        self.agent_executor = AgentExecutor(agent=self.agent,
+                                            tools=self.tools,
+                                            max_execution_time=max_execution_seconds,
+                                            max_iterations=max_iterations,
+                                            verbose=verbose)
+        return self.agent_executor
+
     # pylint: disable=too-many-locals
     async def wait_on_run(self, run: Run, journal: Journal = None) -> Run:
         """
@@ -411,22 +442,10 @@ class LangChainRunContext(RunContext):
         :return: An potentially updated run
         """
 
-        # Create an agent executor and invoke it with the most recent human message
+        # Get the agent executor and invoke it with the most recent human message
         # as input.
         agent_spec: Dict[str, Any] = self.tool_caller.get_agent_tool_spec()
-
-        verbose: Union[bool, str] = agent_spec.get("verbose", False)
-        if isinstance(verbose, str):
-            verbose = bool(verbose.lower() in ("true", "extra", "logging"))
-
-        max_execution_seconds: float = agent_spec.get("max_execution_seconds",
-                                                      2.0 * MINUTES)
-        max_iterations: int = agent_spec.get("max_iterations", 20)
-        agent_executor = AgentExecutor(agent=self.agent,
-                                       tools=self.tools,
-                                       max_execution_time=max_execution_seconds,
-                                       max_iterations=max_iterations,
-                                       verbose=verbose)
+        agent_executor: AgentExecutor = self.get_agent_executor()
 
         run: Run = LangChainRun(self.run_id_base, self.chat_history)
 
@@ -443,11 +462,11 @@ class LangChainRunContext(RunContext):
         parent_origin: List[Dict[str, Any]] = self.get_origin()
         base_journal: Journal = self.invocation_context.get_journal()
         origination: Origination = self.invocation_context.get_origination()
+        stream_tokens: bool = bool(agent_spec.get("stream_tokens", False))
         callbacks: List[BaseCallbackHandler] = [
-            JournalingCallbackHandler(self.journal, base_journal, parent_origin, origination)
+            JournalingCallbackHandler(self.journal, base_journal, parent_origin, origination, stream_tokens)
         ]
         # Consult the agent spec for level of verbosity as it pertains to callbacks.
-        agent_spec: Dict[str, Any] = self.tool_caller.get_agent_tool_spec()
         verbose: Union[bool, str] = agent_spec.get("verbose", False)
         if isinstance(verbose, str) and verbose.lower() in ("extra", "logging"):
             # This particular class adds a *lot* of very detailed messages
@@ -486,7 +505,9 @@ class LangChainRunContext(RunContext):
         while return_dict is None and retries > 0:
             try:
                 return_dict: Dict[str, Any] = await agent_executor.ainvoke(inputs, invoke_config)
-            except (OpenAI_APIError, Anthropic_APIError, ChatGoogleGenerativeAIError) as api_error:
+            except LoadedClasses.get("openai.APIError",
+                                     "anthropic.APIError",
+                                     "langchain_google_genai.chat_models.ChatGoogleGenerativeAIError") as api_error:
                 backtrace = traceback.format_exc()
                 message: str = None
                 if not ApiKeyErrorCheck.check_for_internal_error(backtrace):
@@ -647,6 +668,7 @@ class LangChainRunContext(RunContext):
         self.tools = []
         self.chat_history = []
         self.agent = None
+        self.agent_executor = None
         self.recent_human_message = None
         self.llm = None
         self.journal = None
@@ -706,33 +728,21 @@ class LangChainRunContext(RunContext):
         if self.chat_context is None:
             return
 
+        # Index the chat histories once for all the agents sharing the chat context.
+        if self.chat_context_index is None or self.chat_context_index.get_chat_context() is not chat_context:
+            self.chat_context_index = ChatContextIndex(chat_context)
+
         # See if our origin appears in the chat histories.
         # If so, get ours from there.
-        empty: List[Any] = []
-        chat_histories: List[Dict[str, Any]] = self.chat_context.get("chat_histories", empty)
-        our_origin_str: str = Origination.get_full_name_from_origin(self.origin)
-        for one_chat_history in chat_histories:
-
-            # See if the origin matches our own
-            test_origin: List[Dict[str, Any]] = one_chat_history.get("origin", empty)
-            test_origin_str: str = Origination.get_full_name_from_origin(test_origin)
-            if test_origin_str != our_origin_str:
-                continue
-
-            one_messages: List[Dict[str, Any]] = one_chat_history.get("messages", empty)
-            if not one_messages:
-                # Empty list - Nothing to convert. Use default empty list.
-                break
-
-            converter = BaseMessageDictionaryConverter()
-            self.chat_history = []
-            for chat_message in one_messages:
-                base_message: BaseMessage = converter.from_dict(chat_message)
-                if base_message is not None:
-                    self.chat_history.append(base_message)
-
-            # Nothing left to search for
-            break
+        chat_history: List[BaseMessage] = self.chat_context_index.get_chat_history(self.origin)
+        if chat_history is not None:
+            self.chat_history = chat_history
+
+    def get_chat_context_index(self) -> ChatContextIndex:
+        """
+        :return: The ChatContextIndex of the chat context. Can be None.
+        """
+        return self.chat_context_index
 
     def get_journal(self) -> Journal:
         """
@@ -0,0 +1,193 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Type
+
+import json
+import os
+import threading
+
+from collections import OrderedDict
+
+from pydantic import BaseModel
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from neuro_san.internals.run_context.langchain.core.base_model_dictionary_converter \
+    import BaseModelDictionaryConverter
+
+DEFAULT_MAX_ENTRIES: int = 1024
+
+
+class PrecompiledAgentCache:
+    """
+    Process-wide cache of the per-node artifacts that LangChainRunContext
+    needs in order to build an agent, but which are fixed by the agent network
+    spec and do not depend on any per-request state:
+
+        * The ChatPromptTemplate built from an agent's instructions
+        * The pydantic args_schema built from a tool's function parameters
+        * The OpenAI tool definition that gets bound to the LLM for a tool
+
+    Entries are keyed on the content they are built from rather than on
+    any network object identity, so a new version of an agent network
+    naturally gets new entries while the old ones age out of the LRU.
+
+    Per-request state (llms, callbacks, chat history, journals and tool callers)
+    is never stored here.
+    """
+
+    # Lazily created instance shared by everyone in the process
+    shared: "PrecompiledAgentCache" = None
+    shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = None):
+        """
+        Constructor
+
+        :param max_entries: The maximum number of artifacts retained.
+                    Default of None looks at the AGENT_PRECOMPILED_CACHE_SIZE env var,
+                    which itself defaults to 1024.  A value <= 0 disables caching.
+        """
+        if max_entries is None:
+            max_entries = int(os.environ.get("AGENT_PRECOMPILED_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES)))
+        self.max_entries: int = max_entries
+
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Tuple[str, str], Any] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def get_shared() -> "PrecompiledAgentCache":
+        """
+        :return: The PrecompiledAgentCache instance shared across the process
+        """
+        if PrecompiledAgentCache.shared is None:
+            with PrecompiledAgentCache.shared_lock:
+                if PrecompiledAgentCache.shared is None:
+                    PrecompiledAgentCache.shared = PrecompiledAgentCache()
+        return PrecompiledAgentCache.shared
+
+    def get_prompt_template(self, instructions: str) -> ChatPromptTemplate:
+        """
+        :param instructions: The instructions for the agent
+        :return: The ChatPromptTemplate for an agent with the given instructions
+        """
+        return self._get_or_create("prompt", instructions,
+                                   lambda: self.create_prompt_template(instructions))
+
+    @staticmethod
+    def create_prompt_template(instructions: str) -> ChatPromptTemplate:
+        """
+        :param instructions: The instructions for the agent
+        :return: A new ChatPromptTemplate for an agent with the given instructions
+        """
+        # Fill out the rest of the prompt per the docs for create_tooling_agent()
+        # Note we are not write_message()-ing the chat history because that is redundant
+        # Unclear if we should somehow/someplace write_message() the agent_scratchpad at all.
+        message_list: List[Tuple[str, str]] = [
+            ("system", instructions),
+            ("placeholder", "{chat_history}"),
+            ("human", "{input}"),
+            ("placeholder", "{agent_scratchpad}"),
+        ]
+        prompt: ChatPromptTemplate = ChatPromptTemplate.from_messages(message_list)
+        return prompt
+
+    def get_args_schema(self, parameters: Dict[str, Any]) -> Type[BaseModel]:
+        """
+        :param parameters: The "parameters" portion of an OpenAI function spec
+        :return: The pydantic BaseModel class describing the given parameters
+        """
+        converter = BaseModelDictionaryConverter("parameters")
+        return self._get_or_create("args_schema", self._to_key(parameters),
+                                   lambda: converter.from_dict(parameters))
+
+    def get_tool_definition(self, tool: Any, function_json: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param tool: The tool whose OpenAI tool definition we want
+        :param function_json: The function spec the tool was created from
+        :return: The OpenAI tool definition dictionary that is bound to an LLM
+                for the given tool.  Callers are not to modify this.
+        """
+        key: str = self._to_key({
+            "name": tool.name,
+            "description": tool.description,
+            "function": function_json,
+        })
+        return self._get_or_create("tool_definition", key,
+                                   lambda: convert_to_openai_tool(tool))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of cache metrics
+        """
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        """
+        Removes all entries from the cache
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def _get_or_create(self, kind: str, key: str, creator: Callable[[], Any]) -> Any:
+        """
+        :param kind: The kind of artifact being looked up
+        :param key: The content key of the artifact
+        :param creator: A function which creates the artifact when it is not already cached
+        :return: The cached or newly created artifact
+        """
+        if self.max_entries <= 0:
+            return creator()
+
+        cache_key: Tuple[str, str] = (kind, key)
+        with self.lock:
+            value: Any = self.entries.get(cache_key)
+            if value is not None:
+                self.entries.move_to_end(cache_key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        # Create outside the lock so one slow conversion does not hold up others.
+        # Racing creators for the same key produce equivalent values, so last one wins.
+        value = creator()
+
+        with self.lock:
+            self.entries[cache_key] = value
+            self.entries.move_to_end(cache_key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return value
+
+    @staticmethod
+    def _to_key(content: Any) -> str:
+        """
+        :param content: Some JSON-ish content
+        :return: A string key that is stable for equivalent content
+        """
+        return json.dumps(content, sort_keys=True, default=str)
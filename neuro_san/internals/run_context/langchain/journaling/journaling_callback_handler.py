@@ -13,6 +13,10 @@ from collections.abc import Sequence
 from typing import Any
 from typing import Dict
 from typing import List
+from uuid import UUID
+
+import os
+import time
 
 from pydantic import ConfigDict
 
@@ -20,6 +24,7 @@ from langchain_core.agents import AgentAction
 from langchain_core.agents import AgentFinish
 from langchain_core.callbacks.base import AsyncCallbackHandler
 from langchain_core.documents import Document
+from langchain_core.messages.ai import AIMessageChunk
 from langchain_core.messages.base import BaseMessage
 from langchain_core.outputs import LLMResult
 from langchain_core.outputs.chat_generation import ChatGeneration
@@ -31,7 +36,7 @@ from neuro_san.internals.messages.agent_tool_result_message import AgentToolResu
 from neuro_san.internals.messages.origination import Origination
 
 
-# pylint: disable=too-many-ancestors
+# pylint: disable=too-many-ancestors,too-many-instance-attributes
 class JournalingCallbackHandler(AsyncCallbackHandler):
     """
     AsyncCallbackHandler implementation that intercepts agent-level chatter
@@ -39,8 +44,9 @@ class JournalingCallbackHandler(AsyncCallbackHandler):
     We use this guy to intercept agent-level messages like:
         "Thought: Do I need a tool?" and preliminary results from the agent
 
-    We are currently only listening to on_llm_end(), but there are many other
-    callbacks to hook into, most of which are not really productive.
+    We are currently only listening to on_llm_end() and, when token streaming is
+    turned on, on_llm_new_token().  There are many other callbacks to hook into,
+    most of which are not really productive.
     Some are overriden here to explore, others are not.  See the base
     AsyncCallbackHandler to explore more.
 
@@ -57,12 +63,14 @@ class JournalingCallbackHandler(AsyncCallbackHandler):
     # a non-pydantic Journal as a member, we need to do this.
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
             calling_agent_journal: Journal,
             base_journal: Journal,
             parent_origin: List[Dict[str, Any]],
-            origination: Origination
+            origination: Origination,
+            stream_tokens: bool = False
     ):
         """
         Constructor
@@ -74,6 +82,11 @@ class JournalingCallbackHandler(AsyncCallbackHandler):
             This is used to construct the langchain_tool_journal.
         :param origination: The Origination instance carrying state about tool instantation
             during the course of the AgentSession. This is used to construct the langchain_tool_journal.
+        :param stream_tokens: When True, tokens are sent to the calling agent's journal
+            as AIMessageChunks as they are generated by the LLM. Tokens are coalesced into
+            chunks of at least AGENT_TOKEN_STREAMING_MIN_CHARS characters (default 16), unless
+            AGENT_TOKEN_STREAMING_MAX_DELAY_SECONDS (default 0.1) have passed since the first
+            token of the chunk. Default is False.
         """
 
         # The calling-agent journal logs the execution flow from the perspective of the agent invoking the tool
@@ -92,8 +105,60 @@ class JournalingCallbackHandler(AsyncCallbackHandler):
         self.langchain_tool_journal: Journal = None
         self.origin: List[Dict[str, Any]] = None
 
-    async def on_llm_end(self, response: LLMResult,
+        self.stream_tokens: bool = stream_tokens
+        self.min_chunk_chars: int = int(os.environ.get("AGENT_TOKEN_STREAMING_MIN_CHARS", "16"))
+        self.max_chunk_delay_seconds: float = float(os.environ.get("AGENT_TOKEN_STREAMING_MAX_DELAY_SECONDS",
+                                                                   "0.1"))
+        # Maps LLM run id -> (monotonic time of first buffered token, list of buffered tokens)
+        self.token_buffers: Dict[UUID, Any] = {}
+
+    async def on_llm_new_token(self, token: str, *,
+                               run_id: UUID = None,
+                               **kwargs: Any) -> None:
+        """
+        Callback triggered for every new token when the LLM is streaming.
+
+        :param token: The new token
+        :param run_id: The id of the LLM run generating the token
+        """
+        if not self.stream_tokens or not token:
+            return
+
+        buffer = self.token_buffers.get(run_id)
+        if buffer is None:
+            buffer = (time.monotonic(), [])
+            self.token_buffers[run_id] = buffer
+        buffer[1].append(token)
+
+        # Coalesce tokens so as to bound the per-message overhead downstream.
+        if sum(len(one_token) for one_token in buffer[1]) >= self.min_chunk_chars or \
+                time.monotonic() - buffer[0] >= self.max_chunk_delay_seconds:
+            await self.flush_tokens(run_id)
+
+    async def flush_tokens(self, run_id: UUID):
+        """
+        Sends any tokens buffered for the LLM run as a single AIMessageChunk.
+        :param run_id: The id of the LLM run
+        """
+        buffer = self.token_buffers.pop(run_id, None)
+        if buffer is None:
+            return
+        content: str = "".join(buffer[1])
+        if len(content) > 0:
+            await self.calling_agent_journal.write_message(AIMessageChunk(content=content))
+
+    async def on_llm_error(self, error: BaseException, *,
+                           run_id: UUID = None,
+                           **kwargs: Any) -> None:
+        # Whatever was buffered was never going to be part of a full answer.
+        self.token_buffers.pop(run_id, None)
+
+    async def on_llm_end(self, response: LLMResult, *,
+                         run_id: UUID = None,
                          **kwargs: Any) -> None:
+        # Send the tail end of any streamed tokens before anything else.
+        await self.flush_tokens(run_id)
+
         # Empirically we have seen that LLMResults that come in on_llm_end() calls
         # have a generations field which is a list of lists. Inside that inner list,
         # the first object is a ChatGeneration, whose text field tends to have agent
@@ -18,8 +18,6 @@ from typing import Type
 
 import os
 
-from google.auth.exceptions import DefaultCredentialsError
-from openai import OpenAIError
 from pydantic_core import ValidationError
 
 from langchain_core.language_models.base import BaseLanguageModel
@@ -33,6 +31,7 @@ from neuro_san.internals.run_context.langchain.llms.llm_info_restorer import Llm
 from neuro_san.internals.run_context.langchain.llms.standard_langchain_llm_factory import StandardLangChainLlmFactory
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
 from neuro_san.internals.run_context.langchain.util.argument_validator import ArgumentValidator
+from neuro_san.internals.utils.loaded_classes import LoadedClasses
 from neuro_san.internals.utils.resolver_util import ResolverUtil
 
 KEYS_TO_REMOVE_FOR_USER_CLASS: Set[str] = {"class", "verbose"}
@@ -287,7 +286,8 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
 
             # Catch some common wrong or missing API key errors in a single place
             # with some verbose error messaging.
-            except (DefaultCredentialsError, OpenAIError, ValidationError) as exception:
+            except (ValidationError, *LoadedClasses.get("google.auth.exceptions.DefaultCredentialsError",
+                                                        "openai.OpenAIError")) as exception:
                 # Will re-raise but with the right exception text it will
                 # also provide some more helpful failure text.
                 message: str = ApiKeyErrorCheck.check_for_api_key_exception(exception)
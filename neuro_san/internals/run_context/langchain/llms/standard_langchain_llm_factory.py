@@ -13,14 +13,7 @@
 from typing import Any
 from typing import Dict
 
-from langchain_anthropic.chat_models import ChatAnthropic
-from langchain_aws import ChatBedrock
 from langchain_core.language_models.base import BaseLanguageModel
-from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
-from langchain_nvidia_ai_endpoints import ChatNVIDIA
-from langchain_ollama import ChatOllama
-from langchain_openai.chat_models.azure import AzureChatOpenAI
-from langchain_openai.chat_models.base import ChatOpenAI
 
 from neuro_san.internals.run_context.langchain.llms.langchain_llm_factory import LangChainLlmFactory
 
@@ -50,8 +43,12 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
         "max_tokens"                The maximum number of tokens to use in
                                     get_max_prompt_tokens(). By default this comes from
                                     the model description in this class.
+
+    Each provider's langchain package is only imported when a model of that class
+    is first asked for, as each of them takes a good while to import.
     """
 
+    # pylint: disable=import-outside-toplevel,too-many-locals
     def create_base_chat_model(self, config: Dict[str, Any]) -> BaseLanguageModel:
         """
         Create a BaseLanguageModel from the fully-specified llm config.
@@ -73,6 +70,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
         model_name: str = config.get("model_name") or config.get("model") or config.get("model_id")
 
         if chat_class == "openai":
+            from langchain_openai.chat_models.base import ChatOpenAI
             llm = ChatOpenAI(
                 model_name=model_name,
                 temperature=config.get("temperature"),
@@ -118,6 +116,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                 stream_usage=True
             )
         elif chat_class == "azure-openai":
+            from langchain_openai.chat_models.azure import AzureChatOpenAI
             model_kwargs: Dict[str, Any] = {
                 "stream_options": {
                     "include_usage": True
@@ -184,6 +183,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                 model_kwargs=model_kwargs,
             )
         elif chat_class == "anthropic":
+            from langchain_anthropic.chat_models import ChatAnthropic
             llm = ChatAnthropic(
                 model_name=model_name,
                 max_tokens=config.get("max_tokens"),    # This is always for output
@@ -217,6 +217,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                 verbose=False,
             )
         elif chat_class == "ollama":
+            from langchain_ollama import ChatOllama
             # Higher temperature is more random
             llm = ChatOllama(
                 model=model_name,
@@ -255,6 +256,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                 verbose=False,
             )
         elif chat_class == "nvidia":
+            from langchain_nvidia_ai_endpoints import ChatNVIDIA
             # Higher temperature is more random
             llm = ChatNVIDIA(
                 base_url=config.get("base_url"),
@@ -285,6 +287,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                                                       "NVIDIA_BASE_URL"),
             )
         elif chat_class == "gemini":
+            from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
             llm = ChatGoogleGenerativeAI(
                 model=model_name,
                 google_api_key=self.get_value_or_env(config, "google_api_key",
@@ -313,6 +316,7 @@ class StandardLangChainLlmFactory(LangChainLlmFactory):
                 verbose=False,
             )
         elif chat_class == "bedrock":
+            from langchain_aws import ChatBedrock
             llm = ChatBedrock(
                 model=model_name,
                 aws_access_key_id=self.get_value_or_env(config, "aws_access_key_id", "AWS_ACCESS_KEY_ID"),
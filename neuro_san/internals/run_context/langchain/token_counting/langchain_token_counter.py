@@ -13,6 +13,8 @@ from typing import Any
 from typing import Awaitable
 from typing import Dict
 from typing import List
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 from asyncio import Task
@@ -27,8 +29,6 @@ from langchain_community.callbacks.manager import openai_callback_var
 from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_core.callbacks.base import BaseCallbackHandler
 from langchain_core.language_models.base import BaseLanguageModel
-from langchain_openai.chat_models.azure import AzureChatOpenAI
-from langchain_openai.chat_models.base import ChatOpenAI
 
 from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
 
@@ -39,6 +39,7 @@ from neuro_san.internals.messages.origination import Origination
 from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import get_llm_token_callback
 from neuro_san.internals.run_context.langchain.token_counting.get_llm_token_callback import llm_token_callback_var
 from neuro_san.internals.run_context.langchain.token_counting.llm_token_callback_handler import LlmTokenCallbackHandler
+from neuro_san.internals.utils.loaded_classes import LoadedClasses
 
 
 # Keep a ContextVar for the origin info.  We do this because the
@@ -186,6 +187,15 @@ class LangChainTokenCounter:
             agent_message = AgentMessage(structure=token_dict)
             await self.journal.write_message(agent_message)
 
+    @staticmethod
+    def get_openai_chat_classes() -> Tuple[Type, ...]:
+        """
+        :return: The OpenAI chat model classes, without importing langchain_openai
+                when no OpenAI models have been created.
+        """
+        return LoadedClasses.get("langchain_openai.chat_models.base.ChatOpenAI",
+                                 "langchain_openai.chat_models.azure.AzureChatOpenAI")
+
     @staticmethod
     def get_callback_for_llm(llm: BaseLanguageModel) -> Any:
         """
@@ -197,7 +207,7 @@ class LangChainTokenCounter:
                 from "usage_metadata" but give "total_cost" = 0.
         """
 
-        if isinstance(llm, (ChatOpenAI, AzureChatOpenAI)):
+        if isinstance(llm, LangChainTokenCounter.get_openai_chat_classes()):
             # Notes:
             #   * ChatOpenAI needs to have stream_usage=True configured
             #     in order to get good token info back reliably.
@@ -226,7 +236,7 @@ class LangChainTokenCounter:
                 If not an OpenAI or Anthropic model, use llm_token_callback_var.
         """
 
-        if isinstance(llm, (ChatOpenAI, AzureChatOpenAI)):
+        if isinstance(llm, LangChainTokenCounter.get_openai_chat_classes()):
             return openai_callback_var
 
         # Collect tokens for models other than OpenAI
@@ -13,69 +13,33 @@
 import asyncio
 from typing import Any
 from typing import Dict
-from typing import List
 from typing_extensions import override
 
-from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_INPUT_TOKENS
-from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_OUTPUT_TOKENS
 from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_core.messages import AIMessage
 from langchain_core.messages.ai import UsageMetadata
 from langchain_core.outputs import ChatGeneration, LLMResult
 
+from neuro_san.internals.run_context.langchain.token_counting.model_pricing_index import ModelPricingIndex
+
 EMPTY = ""
 
 
 def calculate_anthropic_token_cost(input_tokens: int, output_tokens: int, model_name: str) -> float:
     """
-    Calculate the token cost for an Anthropic Claude model from lookup table MODEL_COST_PER_1K_INPUT_TOKENS
-    and MODEL_COST_PER_1K_OUTPUT_TOKENS.
+    Calculate the token cost for an Anthropic Claude model.
 
     This function allows users to input a partial model name (e.g., 'claude-3-7-sonnet-20250219')
     instead of requiring the full internal model ID (e.g., 'anthropic.claude-3-7-sonnet-20250219-v1:0').
+    See ModelPricingIndex for how model names are looked up.
 
-    Since users often do not know or use the full system-defined model names,
-    we perform a flexible substring match across all known models:
-    - If exactly one match is found, we calculate the cost based on that model.
-    - If multiple matches are found, we return 0.0 and print an error to alert the user.
-    - If no matches are found, we also return 0.0 and print an error.
-
-    :param prompt_tokens: Number of input (prompt) tokens.
-    :param completion_tokens: Number of output (completion) tokens.
+    :param input_tokens: Number of input (prompt) tokens.
+    :param output_tokens: Number of output (completion) tokens.
     :param model_name: A model name (e.g., 'claude-3-7-sonnet-20250219').
 
-    :return: The total cost as a float.
+    :return: The total cost as a float. 0.0 if the model's price is not known.
     """
-
-    if not model_name:
-        print("[Error] model_name must be provided.")
-        return 0.0
-
-    # Check if "model_name" is in any keys of the lookup table.
-    matching_models: List[str] = [
-        model for model in MODEL_COST_PER_1K_INPUT_TOKENS if model_name in model
-    ]
-
-    # Return cost = 0.0 if there are no match or more than one matches.
-    if not matching_models:
-        print(
-            f"[Error] Unknown model: '{model_name}'. No matches found. "
-            "Known models are: " + ", ".join(MODEL_COST_PER_1K_INPUT_TOKENS.keys())
-        )
-        return 0.0
-
-    if len(matching_models) > 1:
-        print(
-            f"[Error] Ambiguous model name '{model_name}'. Matches multiple models: "
-            + ", ".join(matching_models)
-        )
-        return 0.0
-
-    full_model_id: str = matching_models[0]
-
-    input_cost: float = (input_tokens / 1000) * MODEL_COST_PER_1K_INPUT_TOKENS[full_model_id]
-    output_cost: float = (output_tokens / 1000) * MODEL_COST_PER_1K_OUTPUT_TOKENS[full_model_id]
-    return input_cost + output_cost
+    return ModelPricingIndex.get_shared().calculate_cost(model_name, input_tokens, output_tokens)
 
 
 # pylint: disable=too-many-ancestors
@@ -121,10 +85,10 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
         }
 
     Note:
-    This class is intended for use with Ollama models, as OpenAICallbackHandler and
-    BedrockAnthropicTokenUsageCallbackHandler already handle OpenAI and Anthropic models, respectively.
-    Ollama models currently have no associated cost, so total_cost is always set to 0.0 to maintain compatibility
-    with reporting templates.
+    This class is used for all models other than those from OpenAI, which OpenAICallbackHandler handles.
+    Costs come from the process-wide ModelPricingIndex, taking prompt cache reads and writes into account.
+    Models without a known price (including local Ollama models) report a total_cost of 0.0
+    to maintain compatibility with reporting templates.
     """
 
     total_tokens: int = 0
@@ -137,6 +101,7 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
         """Initialize the CallbackHandler."""
         super().__init__()
         self._lock = asyncio.Lock()
+        self.pricing_index: ModelPricingIndex = ModelPricingIndex.get_shared()
 
     @override
     def __repr__(self) -> str:
@@ -186,11 +151,11 @@ class LlmTokenCallbackHandler(AsyncCallbackHandler):
             completion_tokens: int = usage_metadata.get("output_tokens", 0)
             prompt_tokens: int = usage_metadata.get("input_tokens", 0)
 
-            # If it is an anthropic model, calculate the cost.
-            if "claude" in model_name:
-                total_cost: float = calculate_anthropic_token_cost(prompt_tokens, completion_tokens, model_name)
-            else:
-                total_cost = 0.0
+            # Prompt cache reads and writes are part of the input tokens, but are priced differently.
+            input_token_details: Dict[str, int] = usage_metadata.get("input_token_details") or {}
+            total_cost: float = self.pricing_index.calculate_cost(model_name, prompt_tokens, completion_tokens,
+                                                                  input_token_details.get("cache_read", 0),
+                                                                  input_token_details.get("cache_creation", 0))
 
             # update shared state behind lock
             async with self._lock:
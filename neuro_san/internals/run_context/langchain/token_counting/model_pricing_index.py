@@ -0,0 +1,306 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import logging
+import re
+import threading
+
+from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_INPUT_TOKENS
+from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_OUTPUT_TOKENS
+from langchain_community.callbacks.openai_info import MODEL_COST_PER_1K_TOKENS
+
+from neuro_san.internals.run_context.langchain.llms.llm_info_restorer import LlmInfoRestorer
+
+# Anthropic bills reading from the prompt cache at a tenth of the input price
+# and writing to it at a quarter more than the input price.
+# See https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching#pricing
+ANTHROPIC_CACHE_READ_MULTIPLIER: float = 0.1
+ANTHROPIC_CACHE_WRITE_MULTIPLIER: float = 1.25
+
+# Providers from default_llm_info.hocon whose models run locally and cost nothing
+FREE_PROVIDER_CLASSES: List[str] = ["ollama"]
+
+# Characters after which a known model name counts as a prefix of a longer one,
+# as in "gpt-4o" for "gpt-4o-2024-11-20", but not "gpt-4" for "gpt-4o" or "gpt-4.5".
+PREFIX_BOUNDARIES: str = "-:@/"
+
+# Key in the trie nodes for the canonical model name ending at that node
+TRIE_END: str = ""
+
+# Bedrock model ids look like "us.anthropic.claude-3-7-sonnet-20250219-v1:0".
+BEDROCK_REGION_PREFIX = re.compile(r"^(us|eu|apac|global)\.(?=[a-z]+\.)")
+PROVIDER_PREFIX = re.compile(r"^(anthropic|models)[./]")
+DATED_VERSION_SUFFIX = re.compile(r"(-\d{8})-v\d+(:\d+)?$")
+
+
+class ModelPrice:
+    """
+    Prices per 1000 tokens for a single model.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, model_name: str,
+                 input_cost: float,
+                 output_cost: float,
+                 cache_read_cost: float = None,
+                 cache_write_cost: float = None):
+        """
+        Constructor
+
+        :param model_name: The canonical name of the model in the index
+        :param input_cost: The cost per 1000 uncached input tokens
+        :param output_cost: The cost per 1000 output tokens
+        :param cache_read_cost: The cost per 1000 input tokens read from a prompt cache.
+                    Default of None means the same as uncached input tokens.
+        :param cache_write_cost: The cost per 1000 input tokens written to a prompt cache.
+                    Default of None means the same as uncached input tokens.
+        """
+        self.model_name: str = model_name
+        self.input_cost: float = input_cost
+        self.output_cost: float = output_cost
+        self.cache_read_cost: float = input_cost if cache_read_cost is None else cache_read_cost
+        self.cache_write_cost: float = input_cost if cache_write_cost is None else cache_write_cost
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int,
+                       cache_read_tokens: int = 0, cache_write_tokens: int = 0) -> float:
+        """
+        :param input_tokens: The total number of input tokens, including any
+                    cache_read_tokens and cache_write_tokens, as reported by
+                    langchain's usage_metadata.
+        :param output_tokens: The number of output tokens
+        :param cache_read_tokens: The number of input tokens read from a prompt cache
+        :param cache_write_tokens: The number of input tokens written to a prompt cache
+        :return: The cost of the tokens
+        """
+        uncached_tokens: int = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+        cost: float = uncached_tokens * self.input_cost \
+            + cache_read_tokens * self.cache_read_cost \
+            + cache_write_tokens * self.cache_write_cost \
+            + output_tokens * self.output_cost
+        return cost / 1000.0
+
+
+class ModelPricingIndex:
+    """
+    Index of model prices, built once and shared by every token counting
+    callback handler in the process.
+
+    Prices come from the cost tables langchain keeps for the OpenAI and
+    Bedrock Anthropic callback handlers.  Model names from default_llm_info.hocon
+    are indexed as well so that any of its aliases (like "claude-3-7-sonnet"
+    or "azure-gpt-4o") find the price of the model they stand for, and so that
+    local models (like those from ollama) are known to be free.
+
+    A model name reported by an llm is looked up by:
+        1. Exact match on the name or its normalized form,
+           which drops Bedrock region/provider prefixes and version suffixes.
+        2. The longest known model name that is a prefix of it,
+           as in "gpt-4o" for a newer "gpt-4o-2024-11-20".
+        3. Aliases from default_llm_info.hocon, themselves looked up as above.
+
+    Results are remembered per reported name, so after the first call
+    for any given model a lookup is a single dictionary access.
+    """
+
+    # Lazily created instance shared by everyone in the process
+    shared: "ModelPricingIndex" = None
+    shared_lock = threading.Lock()
+
+    def __init__(self, llm_info: Dict[str, Any] = None):
+        """
+        Constructor
+
+        :param llm_info: The llm info dictionary whose model names are to be indexed.
+                    Default of None reads default_llm_info.hocon.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.prices: Dict[str, ModelPrice] = {}
+        self.aliases: Dict[str, str] = {}
+        self.trie: Dict[str, Any] = {}
+        self.lookups: Dict[str, ModelPrice] = {}
+
+        self._add_openai_prices()
+        self._add_anthropic_prices()
+        if llm_info is None:
+            llm_info = LlmInfoRestorer().restore()
+        self._add_llm_info(llm_info)
+
+        for model_name in self.prices:
+            self._add_to_trie(model_name)
+
+    @staticmethod
+    def get_shared() -> "ModelPricingIndex":
+        """
+        :return: The ModelPricingIndex instance shared across the process
+        """
+        if ModelPricingIndex.shared is None:
+            with ModelPricingIndex.shared_lock:
+                if ModelPricingIndex.shared is None:
+                    ModelPricingIndex.shared = ModelPricingIndex()
+        return ModelPricingIndex.shared
+
+    @staticmethod
+    def normalize(model_name: str) -> str:
+        """
+        :param model_name: A model name as reported by an llm
+        :return: The name in the form used for keys in the index
+        """
+        # Hocon parsing can leave quotes around keys like "llama3.1"
+        normalized: str = model_name.strip().strip('"').lower()
+        normalized = BEDROCK_REGION_PREFIX.sub("", normalized)
+        normalized = PROVIDER_PREFIX.sub("", normalized)
+        normalized = DATED_VERSION_SUFFIX.sub(r"\1", normalized)
+        return normalized
+
+    def get_price(self, model_name: str) -> ModelPrice:
+        """
+        :param model_name: A model name as reported by an llm
+        :return: The ModelPrice for the model, or None if its price is not known
+        """
+        if not model_name:
+            return None
+
+        # Fast path for any name we have seen before, whether or not it was found.
+        try:
+            return self.lookups[model_name]
+        except KeyError:
+            pass
+
+        price: ModelPrice = self._find(model_name)
+        if price is None:
+            self.logger.warning("No pricing information for model '%s'. Its cost is reported as 0.0",
+                                model_name)
+        # Races here only ever store the same answer.
+        self.lookups[model_name] = price
+        return price
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def calculate_cost(self, model_name: str, input_tokens: int, output_tokens: int,
+                       cache_read_tokens: int = 0, cache_write_tokens: int = 0) -> float:
+        """
+        :param model_name: A model name as reported by an llm
+        :param input_tokens: The total number of input tokens, including any
+                    cache_read_tokens and cache_write_tokens
+        :param output_tokens: The number of output tokens
+        :param cache_read_tokens: The number of input tokens read from a prompt cache
+        :param cache_write_tokens: The number of input tokens written to a prompt cache
+        :return: The cost of the tokens, or 0.0 if the price of the model is not known
+        """
+        price: ModelPrice = self.get_price(model_name)
+        if price is None:
+            return 0.0
+        return price.calculate_cost(input_tokens, output_tokens, cache_read_tokens, cache_write_tokens)
+
+    def _find(self, model_name: str, follow_aliases: bool = True) -> ModelPrice:
+        """
+        :param model_name: A model name as reported by an llm
+        :param follow_aliases: True if aliases are to be consulted
+        :return: The ModelPrice for the model, or None if its price is not known
+        """
+        price: ModelPrice = self.prices.get(model_name)
+        if price is not None:
+            return price
+
+        normalized: str = self.normalize(model_name)
+        price = self.prices.get(normalized)
+        if price is not None:
+            return price
+
+        prefix: str = self._find_longest_prefix(normalized)
+        if prefix is not None:
+            return self.prices.get(prefix)
+
+        if follow_aliases:
+            alias: str = self.aliases.get(normalized)
+            if alias is not None:
+                return self._find(alias, follow_aliases=False)
+
+        return None
+
+    def _find_longest_prefix(self, name: str) -> str:
+        """
+        :param name: A normalized model name
+        :return: The longest known model name which is a prefix of the given name
+                and ends on a boundary of its components, or None if there is none.
+        """
+        longest: str = None
+        node: Dict[str, Any] = self.trie
+        for character in name:
+            if character in PREFIX_BOUNDARIES and TRIE_END in node:
+                longest = node.get(TRIE_END)
+            node = node.get(character)
+            if node is None:
+                return longest
+        return node.get(TRIE_END, longest)
+
+    def _add_to_trie(self, model_name: str):
+        """
+        :param model_name: A normalized model name with a price
+        """
+        node: Dict[str, Any] = self.trie
+        for character in model_name:
+            node = node.setdefault(character, {})
+        node[TRIE_END] = model_name
+
+    def _add_openai_prices(self):
+        """
+        Adds prices from langchain's OpenAI cost table, which keeps the
+        output and cached input prices under "-completion" and "-cached" suffixed keys.
+        """
+        for key, input_cost in MODEL_COST_PER_1K_TOKENS.items():
+            if key.endswith("-completion") or key.endswith("-cached"):
+                continue
+            output_cost: float = MODEL_COST_PER_1K_TOKENS.get(f"{key}-completion", input_cost)
+            cache_read_cost: float = MODEL_COST_PER_1K_TOKENS.get(f"{key}-cached")
+            self.prices[key] = ModelPrice(key, input_cost, output_cost, cache_read_cost)
+
+    def _add_anthropic_prices(self):
+        """
+        Adds prices from langchain's Bedrock Anthropic cost table.
+        The same models are available directly from Anthropic under the
+        normalized form of the Bedrock ids, so those are what get indexed.
+        """
+        for key, input_cost in MODEL_COST_PER_1K_INPUT_TOKENS.items():
+            model_name: str = self.normalize(key)
+            output_cost: float = MODEL_COST_PER_1K_OUTPUT_TOKENS.get(key, input_cost)
+            self.prices[model_name] = ModelPrice(model_name, input_cost, output_cost,
+                                                 input_cost * ANTHROPIC_CACHE_READ_MULTIPLIER,
+                                                 input_cost * ANTHROPIC_CACHE_WRITE_MULTIPLIER)
+
+    def _add_llm_info(self, llm_info: Dict[str, Any]):
+        """
+        Adds aliases and free models from an llm info dictionary
+        :param llm_info: The llm info dictionary whose model names are to be indexed.
+        """
+        for key, model_info in llm_info.items():
+            if not isinstance(model_info, dict):
+                continue
+            model_class: str = model_info.get("class")
+            use_model_name: str = model_info.get("use_model_name")
+            if model_class is None and use_model_name is None:
+                # Not a model. Probably the "classes" section.
+                continue
+
+            model_name: str = self.normalize(key)
+            if use_model_name is not None and self.normalize(use_model_name) != model_name:
+                self.aliases[model_name] = self.normalize(use_model_name)
+
+            if model_class in FREE_PROVIDER_CLASSES:
+                model_name = self.normalize(use_model_name or key)
+                if model_name not in self.prices:
+                    self.prices[model_name] = ModelPrice(model_name, 0.0, 0.0)
@@ -14,11 +14,14 @@ import os
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Union
 
 import logging
 
-from openai import OpenAI
 from openai import AsyncOpenAI
+from openai import AsyncStream
+from openai import OpenAI
+from openai import Stream
 from openai.types.beta import Assistant
 from openai.types.beta import Thread
 from openai.types.beta.threads import Run
@@ -78,6 +81,24 @@ class OpenAIClient:
                                                             assistant_id=assistant_id)
         return run
 
+    async def create_streaming_run(self, thread_id: str, assistant_id: str) -> Union[Stream, AsyncStream]:
+        """
+        Like create_run(), but the service streams back events as the run makes progress.
+        :param thread_id:
+        :param assistant_id:
+        :return: A stream of AssistantStreamEvents for the new run
+        """
+        # Makes a POST to /threads/{thread_id}/runs
+        if self.is_async():
+            stream: AsyncStream = await self.client.beta.threads.runs.create(thread_id=thread_id,
+                                                                             assistant_id=assistant_id,
+                                                                             stream=True)
+        else:
+            stream: Stream = self.client.beta.threads.runs.create(thread_id=thread_id,
+                                                                  assistant_id=assistant_id,
+                                                                  stream=True)
+        return stream
+
     async def submit_tool_outputs(self, thread_id: str, run_id: str, tool_outputs: List[Any]) -> Run:
         """
         Notes: Used in langchain's OpenAIAssistantRunnable.invoke()
@@ -97,6 +118,28 @@ class OpenAIClient:
                                                                          tool_outputs=tool_outputs)
         return run
 
+    async def submit_tool_outputs_streaming(self, thread_id: str, run_id: str,
+                                            tool_outputs: List[Any]) -> Union[Stream, AsyncStream]:
+        """
+        Like submit_tool_outputs(), but the service streams back events as the run makes progress.
+        :param thread_id:
+        :param run_id:
+        :param tool_outputs: Really a run_submit_tool_outputs_params.ToolOutput
+        :return: A stream of AssistantStreamEvents for the continued run
+        """
+        # Makes a POST to /threads/{thread_id}/runs/{run_id}/submit_tool_outputs
+        if self.is_async():
+            stream: AsyncStream = await self.client.beta.threads.runs.submit_tool_outputs(thread_id=thread_id,
+                                                                                          run_id=run_id,
+                                                                                          tool_outputs=tool_outputs,
+                                                                                          stream=True)
+        else:
+            stream: Stream = self.client.beta.threads.runs.submit_tool_outputs(thread_id=thread_id,
+                                                                               run_id=run_id,
+                                                                               tool_outputs=tool_outputs,
+                                                                               stream=True)
+        return stream
+
     async def retrieve(self, thread_id: str, run_id: str) -> Run:
         """
         Notes: Used in langchain's OpenAIAssistantRunnable.invoke()
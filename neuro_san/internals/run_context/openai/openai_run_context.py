@@ -18,7 +18,11 @@ from typing import Dict
 from typing import List
 
 import asyncio
-import time
+import logging
+
+from httpx import HTTPError
+from openai import APIError
+from openai.types.beta.threads.run import Run as APIRun
 
 from leaf_common.config.dictionary_overlay import DictionaryOverlay
 
@@ -31,6 +35,13 @@ from neuro_san.internals.run_context.interfaces.run_context import RunContext
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.openai.openai_client import OpenAIClient
 from neuro_san.internals.run_context.openai.openai_run import OpenAIRun
+from neuro_san.internals.run_context.openai.openai_run_event_stream import OpenAIRunEventStream
+
+# Polling is only a fallback for when a run's event stream breaks off early.
+# Start out checking often, as the run may well be almost done, then back off.
+INITIAL_POLL_SECONDS: float = 0.05
+MAX_POLL_SECONDS: float = 0.5
+POLL_BACKOFF_FACTOR: float = 2.0
 
 
 # pylint: disable=too-many-instance-attributes
@@ -38,6 +49,10 @@ class OpenAIRunContext(RunContext):
     """
     RunContext implementation supporting the context/lifetime in
     which OpenAI calls are made.
+
+    Runs are created with streaming turned on, so wait_on_run() finds out
+    the run is done as soon as the service says so.  Should a run's event stream
+    end early, the run is polled for instead.
     """
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
@@ -80,6 +95,10 @@ class OpenAIRunContext(RunContext):
         self.invocation_context: InvocationContext = invocation_context
         self.chat_context: Dict[str, Any] = chat_context
         self.journal: Journal = self.invocation_context.get_journal()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # Event streams of runs that have not been waited on yet, keyed by run id
+        self.run_event_streams: Dict[str, OpenAIRunEventStream] = {}
 
     # pylint: disable=too-many-locals
     async def create_resources(self, agent_name: str,
@@ -157,49 +176,78 @@ class OpenAIRunContext(RunContext):
         await self.openai_client.create_message(
             thread_id=self.thread_id, role="user", content=user_message
         )
-        openai_run = await self.openai_client.create_run(
+        stream = await self.openai_client.create_streaming_run(
             thread_id=self.thread_id,
             assistant_id=self.assistant_id,
         )
+        run = await self.start_streaming_run(OpenAIRunEventStream(stream))
+        return run
+
+    async def start_streaming_run(self, event_stream: OpenAIRunEventStream) -> Run:
+        """
+        Reads the first status of a run from its event stream and keeps
+        the stream around for wait_on_run() to pick up from there.
+        :param event_stream: The OpenAIRunEventStream for a newly started run
+        :return: The OpenAI run as of its first event
+        """
+        openai_run: APIRun = await event_stream.next_run()
+        if openai_run is None:
+            await event_stream.close()
+            raise ValueError("OpenAI run event stream ended before telling about the run")
+
         run = OpenAIRun(openai_run)
+        if run.is_running():
+            self.run_event_streams[run.get_id()] = event_stream
+        else:
+            await event_stream.close()
         return run
 
     async def wait_on_run(self, run: Run, journal: Journal = None) -> Run:
         """
-        Loops on the given run's status for OpenAI service-side processing
-        to be done.
+        Waits for OpenAI service-side processing of the given run to be done.
         :param run: The OpenAI run on their servers
         :param journal: The Journal which captures the "thinking" messages.
         :return: An potentially updated Run
         """
-        messages = await self.openai_client.list_messages(thread_id=self.thread_id)
+        event_stream: OpenAIRunEventStream = self.run_event_streams.pop(run.get_id(), None)
+        if event_stream is not None:
+            try:
+                while run.is_running():
+                    openai_run: APIRun = await event_stream.next_run()
+                    if openai_run is None:
+                        self.logger.warning("Event stream for run %s ended early. Polling instead.",
+                                            run.get_id())
+                        break
+                    run = OpenAIRun(openai_run)
+            except (APIError, HTTPError) as exception:
+                self.logger.warning("Event stream for run %s broke off (%s). Polling instead.",
+                                    run.get_id(), str(exception))
+            finally:
+                await event_stream.close()
+
+        run = await self.poll_on_run(run)
+        return run
+
+    async def poll_on_run(self, run: Run) -> Run:
+        """
+        Polls the given run's status until OpenAI service-side processing is done,
+        backing off the longer the run takes.
+        :param run: The OpenAI run on their servers
+        :return: An potentially updated Run
+        """
+        sleep_seconds: float = INITIAL_POLL_SECONDS
         while run.is_running():
             openai_run = await self.openai_client.retrieve(
                 thread_id=self.thread_id,
                 run_id=run.get_id()
             )
-
-            sleep_seconds = 0.5
-            if self.openai_client.is_async():
-                await asyncio.sleep(sleep_seconds)
-            else:
-                time.sleep(sleep_seconds)
-
-            latest_messages = await self.openai_client.list_messages(thread_id=self.thread_id)
-
-            last_message_with_content = self.get_last_message_with_content(messages)
-            latest_message_with_content = self.get_last_message_with_content(latest_messages)
-            if (latest_messages and messages and latest_message_with_content and
-                (len(latest_messages) > len(messages) or
-                    (len(latest_message_with_content.content[0].text.value) >
-                        len(last_message_with_content.content[0].text.value)))):
-                # number_of_new_messages = len(latest_messages) - len(messages)
-                # new_messages = latest_messages[-number_of_new_messages:]
-                # Write to the journal
-                # if journal is not None:
-                messages = latest_messages
-
             run = OpenAIRun(openai_run)
+            if not run.is_running():
+                break
+
+            # Do not block the event loop while waiting, even with a synchronous client
+            await asyncio.sleep(sleep_seconds)
+            sleep_seconds = min(sleep_seconds * POLL_BACKOFF_FACTOR, MAX_POLL_SECONDS)
 
         return run
 
@@ -215,12 +263,12 @@ class OpenAIRunContext(RunContext):
         :param tool_outputs: The tool outputs to submit
         :return: A potentially updated OpenAI Run handle
         """
-        openai_run = await self.openai_client.submit_tool_outputs(
+        stream = await self.openai_client.submit_tool_outputs_streaming(
             thread_id=self.thread_id,
             run_id=run.get_id(),
             tool_outputs=tool_outputs
         )
-        run = OpenAIRun(openai_run)
+        run = await self.start_streaming_run(OpenAIRunEventStream(stream))
         return run
 
     async def delete_resources(self, parent_run_context: RunContext = None):
@@ -229,6 +277,15 @@ class OpenAIRunContext(RunContext):
         :param parent_run_context: A parent RunContext perhaps the same instance,
                         but perhaps not.  Default is None
         """
+        # Release the connections of any runs nobody waited on
+        event_streams: List[OpenAIRunEventStream] = list(self.run_event_streams.values())
+        self.run_event_streams.clear()
+        for event_stream in event_streams:
+            try:
+                await event_stream.close()
+            except (APIError, HTTPError) as exception:
+                self.logger.warning("Could not close leftover run event stream: %s", str(exception))
+
         if parent_run_context is None:
             # No parent run context. Always try to delete the resources
             if self.assistant_id is not None:
@@ -0,0 +1,78 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Iterator
+from typing import Union
+
+import asyncio
+
+from openai import AsyncStream
+from openai import Stream
+from openai.types.beta.threads.run import Run as APIRun
+
+
+class OpenAIRunEventStream:
+    """
+    Wraps the stream of events the OpenAI service sends back for a streaming run
+    so that callers only see the successive snapshots of the run itself.
+
+    Events about run steps and messages also come down the stream,
+    but are skipped over.
+
+    Reading a synchronous stream blocks on the network, so that is done
+    in a worker thread to keep the event loop free for other agents.
+    """
+
+    def __init__(self, stream: Union[Stream, AsyncStream]):
+        """
+        Constructor
+
+        :param stream: The synchronous or asynchronous stream of AssistantStreamEvents
+        """
+        self.stream: Union[Stream, AsyncStream] = stream
+        self.iterator: Iterator[Any] = None
+        if isinstance(stream, Stream):
+            self.iterator = iter(stream)
+
+    async def next_run(self) -> APIRun:
+        """
+        Waits for the next event that tells about a change in the run's status.
+        :return: The snapshot of the run that came with the event,
+                or None if the stream ended before any such event came along.
+        """
+        event: Any = await self._next_event()
+        while event is not None:
+            if isinstance(event.data, APIRun):
+                return event.data
+            event = await self._next_event()
+        return None
+
+    async def close(self):
+        """
+        Releases the connection the stream is reading from.
+        """
+        if self.iterator is not None:
+            await asyncio.to_thread(self.stream.close)
+        else:
+            await self.stream.close()
+
+    async def _next_event(self) -> Any:
+        """
+        :return: The next AssistantStreamEvent from the stream or None if there are no more.
+        """
+        if self.iterator is not None:
+            return await asyncio.to_thread(next, self.iterator, None)
+
+        try:
+            return await anext(self.stream)
+        except StopAsyncIteration:
+            return None
@@ -0,0 +1,174 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import argparse
+import json
+import subprocess
+import sys
+
+DEFAULT_MODULES: List[str] = [
+    "neuro_san.service.main_loop.server_main_loop",
+    "neuro_san.client.agent_cli",
+]
+
+# Packages that are only supposed to be imported once an agent network needs them
+HEAVY_PACKAGES: List[str] = [
+    "anthropic",
+    "boto3",
+    "google.auth",
+    "langchain_anthropic",
+    "langchain_aws",
+    "langchain_google_genai",
+    "langchain_nvidia_ai_endpoints",
+    "langchain_ollama",
+    "langchain_openai",
+    "openai",
+]
+
+# Run in a fresh interpreter so nothing is imported already
+PROBE_CODE: str = """
+import json
+import psutil
+import sys
+import time
+
+start = time.perf_counter()
+for module_name in sys.argv[1].split(","):
+    __import__(module_name)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "import_seconds": elapsed,
+    "rss_mb": psutil.Process().memory_info().rss / (1024.0 * 1024.0),
+    "heavy_packages_loaded": [name for name in sys.argv[2].split(",") if name in sys.modules],
+}))
+"""
+
+
+class ImportTimeReport:
+    """
+    Diagnostic command that reports what importing neuro-san entry points costs:
+    overall import time, resident memory afterwards, the modules that take
+    the longest to import (as per python -X importtime), and which heavyweight
+    LLM provider packages got imported even though no agent network asked for them yet.
+
+    Usage:
+        python -m neuro_san.internals.utils.import_time_report [--modules m1,m2] [--top N] [--json]
+    """
+
+    def __init__(self, modules: List[str] = None):
+        """
+        Constructor
+
+        :param modules: The list of module names to import. Default of None
+                    uses the server and client entry points.
+        """
+        self.modules: List[str] = modules
+        if self.modules is None:
+            self.modules = DEFAULT_MODULES
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Imports the modules in a fresh interpreter.
+        :return: A dictionary describing the results, with keys:
+                    "modules"                   The modules imported
+                    "import_seconds"            Wall time taken to import the modules
+                    "rss_mb"                    Resident memory of the interpreter afterwards
+                    "heavy_packages_loaded"     Which of HEAVY_PACKAGES got imported
+                    "imports"                   A list of dictionaries, one per imported module,
+                                                with "module", "self_us", "cumulative_us" and "depth" keys
+        """
+        args: List[str] = [sys.executable, "-X", "importtime", "-c", PROBE_CODE,
+                           ",".join(self.modules), ",".join(HEAVY_PACKAGES)]
+        completed = subprocess.run(args, capture_output=True, text=True, check=True)
+
+        # The probe's own report is the last line of its output
+        results: Dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+        results["modules"] = self.modules
+        results["imports"] = self.parse_importtime(completed.stderr)
+        return results
+
+    @staticmethod
+    def parse_importtime(output: str) -> List[Dict[str, Any]]:
+        """
+        :param output: The stderr output of python -X importtime
+        :return: A list of dictionaries, one per imported module, in import order
+        """
+        imports: List[Dict[str, Any]] = []
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields: List[str] = line[len("import time:"):].split("|")
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                # Header line
+                continue
+            name: str = fields[2].rstrip()
+            stripped: str = name.lstrip()
+            imports.append({
+                "module": stripped,
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+                # Two spaces of indent per level of nesting
+                "depth": (len(name) - len(stripped) - 1) // 2,
+            })
+        return imports
+
+    @staticmethod
+    def format(results: Dict[str, Any], top: int) -> str:
+        """
+        :param results: The results from run()
+        :param top: The number of slowest imports to list
+        :return: A human-readable version of the results
+        """
+        lines: List[str] = [
+            f"Imported {', '.join(results.get('modules'))}",
+            f"    import time:  {results.get('import_seconds'):.2f} s",
+            f"    RSS:          {results.get('rss_mb'):.0f} MB",
+            f"    heavy packages imported up front: {results.get('heavy_packages_loaded') or 'none'}",
+            f"Top {top} imports by cumulative time (ms):",
+        ]
+        imports: List[Dict[str, Any]] = sorted(results.get("imports"),
+                                               key=lambda one: one.get("cumulative_us"), reverse=True)
+        for one in imports[:top]:
+            lines.append(f"    {one.get('cumulative_us') / 1000.0:9.1f}  {one.get('self_us') / 1000.0:9.1f}  "
+                         f"{one.get('module')}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def main():
+        """
+        Command line entry point
+        """
+        arg_parser = argparse.ArgumentParser(description="Reports what importing neuro-san entry points costs")
+        arg_parser.add_argument("--modules", type=str, default=",".join(DEFAULT_MODULES),
+                                help="Comma-separated list of modules to import")
+        arg_parser.add_argument("--top", type=int, default=25,
+                                help="Number of slowest imports to list")
+        arg_parser.add_argument("--json", default=False, action="store_true",
+                                help="Output the full results as JSON")
+        args = arg_parser.parse_args()
+
+        report = ImportTimeReport(args.modules.split(","))
+        results: Dict[str, Any] = report.run()
+        if args.json:
+            print(json.dumps(results, indent=4))
+        else:
+            print(ImportTimeReport.format(results, args.top))
+
+
+if __name__ == '__main__':
+    ImportTimeReport.main()
@@ -0,0 +1,131 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from types import ModuleType
+from typing import Any
+from typing import Union
+
+import importlib
+import json
+import logging
+import os
+import threading
+
+AUTO: str = "auto"
+ORJSON: str = "orjson"
+STDLIB: str = "json"
+
+
+class JsonCodec:
+    """
+    Serializes and parses the JSON that goes over the wire for streaming chat.
+
+    By default the faster orjson implementation is used whenever it is installed,
+    falling back to the standard library json module when it is not.
+    The choice can be forced with the AGENT_JSON_CODEC env var,
+    whose values can be "auto" (the default), "orjson" or "json".
+
+    Both implementations produce the same JSON values, but the text differs:
+    orjson output is compact and does not escape non-ASCII characters.
+    Anything orjson cannot handle itself (integers beyond 64 bits, non-string
+    dictionary keys, NaN literals on input) is handed to the json module
+    so results and errors are the same as they have always been.
+    """
+
+    # Lazily created instance shared by everyone in the process
+    shared: "JsonCodec" = None
+    shared_lock = threading.Lock()
+
+    def __init__(self, implementation: str = None):
+        """
+        Constructor
+
+        :param implementation: One of "auto", "orjson" or "json".
+                    Default of None reads the AGENT_JSON_CODEC env var.
+        """
+        if implementation is None:
+            implementation = os.environ.get("AGENT_JSON_CODEC", AUTO)
+        implementation = implementation.strip().lower()
+        if implementation not in (AUTO, ORJSON, STDLIB):
+            raise ValueError(f"Unknown JSON codec '{implementation}'. "
+                             f"Expected one of '{AUTO}', '{ORJSON}' or '{STDLIB}'.")
+
+        self.orjson: ModuleType = None
+        if implementation != STDLIB:
+            try:
+                self.orjson = importlib.import_module(ORJSON)
+            except ImportError:
+                if implementation == ORJSON:
+                    logger = logging.getLogger(self.__class__.__name__)
+                    logger.warning("AGENT_JSON_CODEC asks for orjson but it is not installed. "
+                                   "Using the json module instead.")
+
+    @staticmethod
+    def get_shared() -> "JsonCodec":
+        """
+        :return: The JsonCodec instance shared across the process
+        """
+        if JsonCodec.shared is None:
+            with JsonCodec.shared_lock:
+                if JsonCodec.shared is None:
+                    JsonCodec.shared = JsonCodec()
+        return JsonCodec.shared
+
+    def get_implementation_name(self) -> str:
+        """
+        :return: The name of the implementation actually in use
+        """
+        if self.orjson is not None:
+            return ORJSON
+        return STDLIB
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """
+        :param obj: The object to serialize
+        :return: The UTF-8 encoded JSON text for the object
+        """
+        if self.orjson is not None:
+            try:
+                return self.orjson.dumps(obj)
+            except TypeError:
+                # orjson.JSONEncodeError is a TypeError.  Let the json module have a go.
+                pass
+        return json.dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any) -> str:
+        """
+        :param obj: The object to serialize
+        :return: The JSON text for the object
+        """
+        if self.orjson is not None:
+            try:
+                return self.orjson.dumps(obj).decode("utf-8")
+            except TypeError:
+                # orjson.JSONEncodeError is a TypeError.  Let the json module have a go.
+                pass
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """
+        :param data: The JSON text to parse, either as a string or UTF-8 encoded bytes
+        :return: The parsed object
+        """
+        if self.orjson is not None:
+            try:
+                return self.orjson.loads(data)
+            except ValueError:
+                # orjson.JSONDecodeError is a ValueError.  The json module either
+                # accepts what orjson does not (NaN, Infinity) or raises its usual error.
+                pass
+        return json.loads(data)
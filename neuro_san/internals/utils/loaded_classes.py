@@ -0,0 +1,49 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from types import ModuleType
+from typing import Tuple
+from typing import Type
+
+import sys
+
+
+class LoadedClasses:
+    """
+    Looks up classes from optional, heavyweight modules (LLM provider packages and the like)
+    without importing those modules.
+
+    This is meant for isinstance() checks and except clauses:
+    if a module has never been imported, then nothing can be an instance of its classes,
+    so there is no need to pay for importing it just to check.
+    """
+
+    @staticmethod
+    def get(*class_names: str) -> Tuple[Type, ...]:
+        """
+        :param class_names: Fully qualified class names of the form <module>.<ClassName>
+        :return: A tuple of the classes whose modules have already been imported.
+                This can be an empty tuple, which isinstance() and except clauses
+                treat as matching nothing.
+        """
+        classes: Tuple[Type, ...] = ()
+        for class_name in class_names:
+            module_name, _, simple_name = class_name.rpartition(".")
+            module: ModuleType = sys.modules.get(module_name)
+            if module is None:
+                continue
+            found: Type = getattr(module, simple_name, None)
+            if found is not None:
+                classes = classes + (found,)
+        return classes
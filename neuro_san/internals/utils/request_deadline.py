@@ -0,0 +1,119 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import math
+import os
+import time
+
+
+class RequestDeadline:
+    """
+    Keeps track of the point in time by which a single request to an agent network
+    needs to be done.  An instance without a deadline never expires.
+
+    Deadlines come from the client (the gRPC deadline or the HTTP header below)
+    and from the max_request_seconds key of an agent network.  When the agent network
+    does not say, the AGENT_MAX_REQUEST_SECONDS env var is used.
+    A limit <= 0 (the default) means there is no limit.
+
+    Instances are not modified once created, so they can be shared between threads.
+    """
+
+    # HTTP header (and metadata key) a client can use to say how many seconds
+    # it is willing to wait for its request.  It is also how the remaining time
+    # is passed on to external agents on other servers.
+    HEADER: str = "request-timeout-seconds"
+
+    def __init__(self, timeout_seconds: float = None):
+        """
+        Constructor
+
+        :param timeout_seconds: The number of seconds from now the request has to finish.
+                    None means there is no deadline.
+        """
+        self.expires_at: float = None
+        if timeout_seconds is not None:
+            self.expires_at = time.monotonic() + max(0.0, float(timeout_seconds))
+
+    def has_deadline(self) -> bool:
+        """
+        :return: True if there is a deadline at all
+        """
+        return self.expires_at is not None
+
+    def get_remaining_seconds(self) -> float:
+        """
+        :return: The number of seconds left before the deadline, never less than 0.
+                None if there is no deadline.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def is_expired(self) -> bool:
+        """
+        :return: True if the deadline has passed
+        """
+        return self.expires_at is not None and self.expires_at <= time.monotonic()
+
+    def limit(self, timeout_seconds: float) -> "RequestDeadline":
+        """
+        :param timeout_seconds: The number of seconds from now by which the request should
+                    also finish. None or a value <= 0 means no additional limit.
+        :return: A RequestDeadline for whichever of this deadline and the timeout expires first.
+        """
+        if timeout_seconds is None or timeout_seconds <= 0:
+            return self
+
+        other = RequestDeadline(timeout_seconds)
+        if self.expires_at is not None and self.expires_at <= other.expires_at:
+            return self
+        return other
+
+    def limit_for_network(self, config: Dict[str, Any]) -> "RequestDeadline":
+        """
+        :param config: The config dictionary of the agent network. Can be None.
+        :return: A RequestDeadline which also respects the max_request_seconds of the agent network
+        """
+        max_seconds: Any = None
+        if config is not None:
+            max_seconds = config.get("max_request_seconds")
+        if max_seconds is None:
+            max_seconds = os.environ.get("AGENT_MAX_REQUEST_SECONDS", "0")
+        return self.limit(float(max_seconds))
+
+    @staticmethod
+    def parse_seconds(value: str) -> float:
+        """
+        :param value: The string value of a request-timeout-seconds header. Can be None.
+        :return: The number of seconds in the header, or None if there is no valid value
+        """
+        if value is None:
+            return None
+        try:
+            seconds: float = float(value)
+        except ValueError:
+            return None
+        if not math.isfinite(seconds):
+            return None
+        return seconds
+
+    def to_header_value(self) -> str:
+        """
+        :return: The remaining time as a request-timeout-seconds header value.
+                None if there is no deadline.
+        """
+        remaining: float = self.get_remaining_seconds()
+        if remaining is None:
+            return None
+        return f"{remaining:.3f}"
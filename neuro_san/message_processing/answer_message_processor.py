@@ -84,6 +84,17 @@ class AnswerMessageProcessor(MessageProcessor):
         self.structure = None
         self.answer_origin = None
 
+    def may_process_message(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        :param message_type: The ChatMessageType of the message being considered.
+        :param origin: The origin list of the message being considered.
+        :return: False if the message could not possibly hold the final answer. True otherwise.
+        """
+        # Same criteria as the AnswerMessageFilter, minus what needs the whole message
+        if message_type not in (ChatMessageType.AI, ChatMessageType.AGENT_FRAMEWORK):
+            return False
+        return origin is None or len(origin) <= 1
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
         Process the message.
@@ -11,6 +11,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 
 from neuro_san.internals.filters.chat_context_message_filter import ChatContextMessageFilter
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
@@ -51,6 +52,16 @@ class ChatContextMessageProcessor(MessageProcessor):
         self.chat_context = {}
         self.sly_data = None
 
+    def may_process_message(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        :param message_type: The ChatMessageType of the message being considered.
+        :param origin: The origin list of the message being considered.
+        :return: False if the message could not possibly hold the chat_context. True otherwise.
+        """
+        # Same criteria as the ChatContextMessageFilter, minus what needs the whole message
+        _ = origin
+        return message_type == ChatMessageType.AGENT_FRAMEWORK
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
         Process the message.
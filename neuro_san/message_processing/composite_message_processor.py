@@ -71,6 +71,18 @@ class CompositeMessageProcessor(MessageProcessor):
                 return True
         return False
 
+    def may_process_message(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        :param message_type: The ChatMessageType of the message being considered.
+        :param origin: The origin list of the message being considered.
+        :return: True if any of the component MessageProcessors might do anything
+                with a message of this type and origin.  False otherwise.
+        """
+        for message_processor in self.message_processors:
+            if message_processor.may_process_message(message_type, origin):
+                return True
+        return False
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType = None):
         """
         Process the message.
@@ -37,6 +37,19 @@ class MessageProcessor:
         _ = chat_message_dict, message_type
         return False
 
+    def may_process_message(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        A cheap check made before a streamed message is fully parsed, so that
+        messages no processor cares about do not need to be parsed at all.
+
+        :param message_type: The ChatMessageType of the message being considered.
+        :param origin: The origin list of the message being considered.
+        :return: True if process_message() might do anything with a message of
+                this type and origin (the default).  False if it definitely would not.
+        """
+        _ = message_type, origin
+        return True
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
         Process the message.
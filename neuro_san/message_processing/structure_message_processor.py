@@ -58,6 +58,10 @@ class StructureMessageProcessor(MessageProcessor):
         :param chat_message_dict: The ChatMessage dictionary to process.
         :param message_type: The ChatMessageType of the chat_message_dictionary to process.
         """
+        if message_type == ChatMessageType.AI_MESSAGE_CHUNK:
+            # Pieces of text are not going to have any complete structure in them.
+            return
+
         text: str = chat_message_dict.get("text")
         structure: Dict[str, Any] = chat_message_dict.get("structure")
 
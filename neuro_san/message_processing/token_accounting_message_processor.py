@@ -11,6 +11,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 
 from neuro_san.internals.filters.token_accounting_message_filter import TokenAccountingMessageFilter
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
@@ -52,6 +53,17 @@ class TokenAccountingMessageProcessor(MessageProcessor):
         """
         self.token_accounting = None
 
+    def may_process_message(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        :param message_type: The ChatMessageType of the message being considered.
+        :param origin: The origin list of the message being considered.
+        :return: False if the message could not possibly hold the token accounting. True otherwise.
+        """
+        # Same criteria as the TokenAccountingMessageFilter, minus what needs the whole message
+        if message_type != ChatMessageType.AGENT:
+            return False
+        return origin is None or len(origin) <= 1
+
     def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
         """
         Process the message.
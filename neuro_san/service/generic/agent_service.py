@@ -30,10 +30,12 @@ from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextT
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
 from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
 from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
 from neuro_san.service.usage.usage_logger_factory import UsageLoggerFactory
 from neuro_san.service.usage.wrapped_usage_logger import WrappedUsageLogger
+from neuro_san.service.utils.admission_controller import AdmissionController
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.session.direct_agent_session import DirectAgentSession
 from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
@@ -95,12 +97,76 @@ class AgentService:
         self.llm_factory.load()
         self.toolbox_factory.load()
 
+        self.server_admission: AdmissionController = server_context.get_admission_controller()
+        self.network_admission: AdmissionController = \
+            server_context.create_network_admission_controller(config.get("max_concurrent_requests"))
+        self.message_queue_args: Dict[str, Any] = server_context.get_message_queue_args()
+
     def get_request_count(self) -> int:
         """
         :return: The number of currently active requests
         """
         return self.request_counter.get_count()
 
+    def admit_request(self, request_metadata: Dict[str, Any], context: Any = None) -> float:
+        """
+        Waits for a new streaming request to be admitted under both the
+        per-network and the server-wide concurrency limits.
+        Every successful admission must be paired with a call to release_request().
+
+        :param request_metadata: request metadata
+        :param context: a service request context object
+        :return: The number of seconds the request waited in line,
+                 or None if the request was rejected.
+        """
+        network_wait: float = self.network_admission.acquire()
+        if network_wait is None:
+            self.log_rejection("too many requests for agent network", request_metadata, context)
+            return None
+
+        # Both waits together should not take longer than a single queue timeout.
+        remaining: float = None
+        if self.server_admission.get_timeout() is not None:
+            remaining = self.server_admission.get_timeout() - network_wait
+        server_wait: float = self.server_admission.acquire(remaining)
+        if server_wait is None:
+            self.network_admission.release()
+            self.log_rejection("too many requests for server", request_metadata, context)
+            return None
+
+        # The queue wait of admitted requests is logged with the rest of the request
+        # by streaming_chat().
+        wait_seconds: float = network_wait + server_wait
+        return wait_seconds
+
+    def log_rejection(self, reason: str, request_metadata: Dict[str, Any], context: Any):
+        """
+        Logs a rejected streaming request as a request of its own,
+        so that the rejection carries the request metadata.
+
+        :param reason: Why the request was rejected
+        :param request_metadata: request metadata
+        :param context: a service request context object
+        """
+        caller: str = f"{self.agent_name}.StreamingChat"
+        log_marker: str = "rejected request"
+        request_log = self.request_logger.start_request(caller, log_marker, context, request_metadata)
+        request_log.warning("Rejected %s request: %s", caller, reason)
+        self.request_logger.finish_request(caller, log_marker, request_log)
+
+    def release_request(self):
+        """
+        Releases the admission slots of a request previously admitted by admit_request().
+        """
+        self.server_admission.release()
+        self.network_admission.release()
+
+    def get_retry_after_seconds(self) -> int:
+        """
+        :return: The number of seconds a rejected client should wait before retrying
+        """
+        return self.network_admission.get_retry_after_seconds()
+
     def function(self, request_dict: Dict[str, Any],
                  request_metadata: Dict[str, Any],
                  context: Any) \
@@ -185,18 +251,24 @@ class AgentService:
         self.request_counter.decrement()
         return response_dict
 
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
     def streaming_chat(self, request_dict: Dict[str, Any],
                        request_metadata: Dict[str, Any],
-                       context: Any) \
+                       context: Any,
+                       queue_wait_seconds: float = None) \
             -> Iterator[Dict[str, Any]]:
         """
         Initiates or continues the agent chat with the session_id
         context in the request.
 
+        If the context is a grpc.ServicerContext, its deadline applies to the request,
+        and the work still going on for the request is cancelled when the RPC ends early,
+        as when the client goes away.
+
         :param request_dict: a ChatRequest dictionary
         :param request_metadata: request metadata
         :param context: a service request context object
+        :param queue_wait_seconds: the number of seconds the request waited to be admitted, if known
         :return: an iterator for (eventually) returned responses dictionaries
         """
         self.request_counter.increment()
@@ -210,6 +282,8 @@ class AgentService:
             request_log = self.request_logger.start_request(f"{self.agent_name}.StreamingChat",
                                                             log_marker, context,
                                                             service_logging_dict)
+            if queue_wait_seconds is not None:
+                request_log.info("Admitted after a queue wait of %.3f seconds", queue_wait_seconds)
 
         # Get the metadata to forward on to another service
         metadata: Dict[str, str] = copy.copy(service_logging_dict)
@@ -218,14 +292,26 @@ class AgentService:
             metadata["request_id"] = service_logging_dict.get("request_id")
 
         # Prepare
+        timeout_seconds: float = None
+        if hasattr(context, "time_remaining"):
+            timeout_seconds = context.time_remaining()
+        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
+        deadline: RequestDeadline = RequestDeadline(timeout_seconds).limit_for_network(agent_network.get_config())
         factory = ExternalAgentSessionFactory(use_direct=False)
         invocation_context = SessionInvocationContext(
             factory,
             self.async_executor_pool,
             self.llm_factory,
             self.toolbox_factory,
-            metadata)
+            metadata,
+            deadline,
+            self.message_queue_args)
         invocation_context.start()
+        if hasattr(context, "add_callback"):
+            # Called when the RPC ends for any reason.  When it ends early, this cancels
+            # whatever is still running for the request right away.  Otherwise there is
+            # nothing left to cancel by the time this is called.
+            context.add_callback(invocation_context.cancel)
 
         # Set up logging inside async thread
         # Prefer any request_id from the client over what we generated on the server.
@@ -233,7 +319,6 @@ class AgentService:
         _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
 
         # Delegate to Direct*Session
-        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
         session = DirectAgentSession(agent_network=agent_network,
                                      invocation_context=invocation_context,
                                      metadata=metadata,
@@ -246,15 +331,33 @@ class AgentService:
         chat_filter_dict = request_dict.get("chat_filter", chat_filter_dict)
         chat_filter_type: str = chat_filter_dict.get("chat_filter_type", "MINIMAL")
 
-        for response_dict in response_dict_iterator:
-            # Prepare chat message for output:
-            response_dict = ChatMessageConverter().to_dict(response_dict)
-            # Do not return the request when the filter is MINIMAL
-            if chat_filter_type != "MINIMAL":
-                response_dict["request"] = request_dict
-            yield response_dict
+        done: bool = False
+        try:
+            for response_dict in response_dict_iterator:
+                # Prepare chat message for output:
+                response_dict = ChatMessageConverter().to_dict(response_dict)
+                # Do not return the request when the filter is MINIMAL
+                if chat_filter_type != "MINIMAL":
+                    response_dict["request"] = request_dict
+                yield response_dict
+            done = True
+        finally:
+            if not done:
+                # The caller gave up on us before the end, as when the client has
+                # disconnected or timed out.  Closing the context cancels whatever is still
+                # running for the request so its capacity can be used for other requests.
+                try:
+                    invocation_context.close()
+                    if request_log is not None:
+                        request_log.metrics("Cancelled request")
+                        self.request_logger.finish_request(f"{self.agent_name}.StreamingChat",
+                                                           log_marker, request_log)
+                finally:
+                    # Whatever happens closing, the request is no longer active
+                    self.request_counter.decrement()
 
         request_reporting: Dict[str, Any] = invocation_context.get_request_reporting()
+        request_reporting["message_queue"] = invocation_context.get_queue().get_stats()
         invocation_context.close()
 
         # Maybe report token accounting to a UsageLogger
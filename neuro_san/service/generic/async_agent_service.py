@@ -14,6 +14,7 @@ from typing import Any
 from typing import Dict
 from typing import Generator
 
+import asyncio
 import json
 import uuid
 
@@ -28,11 +29,13 @@ from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextT
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
 from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
 from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
 from neuro_san.service.usage.usage_logger_factory import UsageLoggerFactory
 from neuro_san.service.usage.wrapped_usage_logger import WrappedUsageLogger
+from neuro_san.service.utils.admission_controller import AdmissionController
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
 from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
@@ -90,12 +93,71 @@ class AsyncAgentService:
         self.llm_factory.load()
         self.toolbox_factory.load()
 
+        self.server_admission: AdmissionController = server_context.get_admission_controller()
+        self.network_admission: AdmissionController = \
+            server_context.create_network_admission_controller(config.get("max_concurrent_requests"))
+        self.message_queue_args: Dict[str, Any] = server_context.get_message_queue_args()
+
     def get_request_count(self) -> int:
         """
         :return: The number of currently active requests
         """
         return self.request_counter.get_count()
 
+    async def admit_request(self, request_metadata: Dict[str, Any]) -> float:
+        """
+        Waits for a new streaming request to be admitted under both the
+        per-network and the server-wide concurrency limits
+        without blocking the event loop.
+        Every successful admission must be paired with a call to release_request().
+
+        :param request_metadata: request metadata
+        :return: The number of seconds the request waited in line,
+                 or None if the request was rejected.
+        """
+        network_wait: float = await self.network_admission.async_acquire()
+        if network_wait is None:
+            self.request_logger.warning(request_metadata,
+                                        "Rejected %s.StreamingChat request: too many requests for agent network",
+                                        self.agent_name)
+            return None
+
+        # Both waits together should not take longer than a single queue timeout.
+        remaining: float = None
+        if self.server_admission.get_timeout() is not None:
+            remaining = self.server_admission.get_timeout() - network_wait
+        try:
+            server_wait: float = await self.server_admission.async_acquire(remaining)
+        except BaseException:
+            # Most likely the client went away while waiting. Do not leak the network slot.
+            self.network_admission.release()
+            raise
+        if server_wait is None:
+            self.network_admission.release()
+            self.request_logger.warning(request_metadata,
+                                        "Rejected %s.StreamingChat request: too many requests for server",
+                                        self.agent_name)
+            return None
+
+        wait_seconds: float = network_wait + server_wait
+        self.request_logger.info(request_metadata,
+                                 "Admitted %s.StreamingChat request. Queue wait: %.3f seconds",
+                                 self.agent_name, wait_seconds)
+        return wait_seconds
+
+    def release_request(self):
+        """
+        Releases the admission slots of a request previously admitted by admit_request().
+        """
+        self.server_admission.release()
+        self.network_admission.release()
+
+    def get_retry_after_seconds(self) -> int:
+        """
+        :return: The number of seconds a rejected client should wait before retrying
+        """
+        return self.network_admission.get_retry_after_seconds()
+
     async def function(self, request_dict: Dict[str, Any],
                        request_metadata: Dict[str, Any]) \
             -> Dict[str, Any]:
@@ -185,14 +247,20 @@ class AsyncAgentService:
 
     # pylint: disable=too-many-locals
     async def streaming_chat(self, request_dict: Dict[str, Any],
-                             request_metadata: Dict[str, Any]) \
+                             request_metadata: Dict[str, Any],
+                             timeout_seconds: float = None) \
             -> Generator[Dict[str, Any], None, None]:
         """
         Initiates or continues the agent chat with the session_id
         context in the request.
 
+        If the caller stops iterating before the end (as when the client goes away),
+        closing the generator cancels the work still going on for the request.
+
         :param request_dict: a ChatRequest dictionary
         :param request_metadata: request metadata
+        :param timeout_seconds: the number of seconds the client is willing to wait
+                    for the request to finish. None means the client sets no deadline.
         :return: an iterator for (eventually) returned responses dictionaries
         """
         self.request_counter.increment()
@@ -212,13 +280,17 @@ class AsyncAgentService:
                 f"{self.agent_name}.StreamingChat", log_marker)
 
         # Prepare
+        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
+        deadline: RequestDeadline = RequestDeadline(timeout_seconds).limit_for_network(agent_network.get_config())
         factory = ExternalAgentSessionFactory(use_direct=False)
         invocation_context = SessionInvocationContext(
             factory,
             self.async_executor_pool,
             self.llm_factory,
             self.toolbox_factory,
-            metadata)
+            metadata,
+            deadline,
+            self.message_queue_args)
         invocation_context.start()
 
         # Set up logging inside async thread
@@ -227,7 +299,6 @@ class AsyncAgentService:
         _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
 
         # Delegate to Direct*Session
-        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
         session: AsyncDirectAgentSession =\
             AsyncDirectAgentSession(
                 agent_network=agent_network,
@@ -242,16 +313,36 @@ class AsyncAgentService:
         chat_filter_dict = request_dict.get("chat_filter", chat_filter_dict)
         chat_filter_type: str = chat_filter_dict.get("chat_filter_type", "MINIMAL")
 
-        async for response_dict in response_dict_generator:
-            # Prepare chat message for output:
-            response_dict = ChatMessageConverter().to_dict(response_dict)
-            # Do not return the request when the filter is MINIMAL
-            if chat_filter_type != "MINIMAL":
-                response_dict["request"] = request_dict
-            yield response_dict
+        done: bool = False
+        try:
+            async for response_dict in response_dict_generator:
+                # Prepare chat message for output:
+                response_dict = ChatMessageConverter().to_dict(response_dict)
+                # Do not return the request when the filter is MINIMAL
+                if chat_filter_type != "MINIMAL":
+                    response_dict["request"] = request_dict
+                yield response_dict
+            done = True
+        finally:
+            if not done:
+                # The caller gave up on us before the end, as when the client has
+                # disconnected or timed out.  Closing the context cancels whatever is still
+                # running for the request so its capacity can be used for other requests.
+                try:
+                    # Closing waits on the request's executor, so keep that off the event loop
+                    # which is serving all the other requests.
+                    await asyncio.to_thread(invocation_context.close)
+                    if do_log:
+                        self.request_logger.info(
+                            metadata,
+                            "Cancelled %s request for %s",
+                            f"{self.agent_name}.StreamingChat", log_marker)
+                finally:
+                    self.request_counter.decrement()
 
         request_reporting: Dict[str, Any] = invocation_context.get_request_reporting()
-        invocation_context.close()
+        request_reporting["message_queue"] = invocation_context.get_queue().get_stats()
+        await asyncio.to_thread(invocation_context.close)
 
         # Maybe report token accounting to a UsageLogger
         token_dict: Dict[str, Any] = request_reporting.get("token_accounting")
@@ -11,6 +11,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 
 import copy
 
@@ -27,12 +28,46 @@ class ChatMessageConverter(DictionaryConverter):
     def to_dict(self, obj: object) -> Dict[str, object]:
         """
         :param obj: The object (chat response) to be converted into a dictionary
-        :return: chat response dictionary in format expected by clients
+        :return: chat response dictionary in format expected by clients.
+                Only the dictionaries and lists that need to change are copied.
+                Everything else (like sly_data and structure) is shared with obj
+                and is not to be modified.
         """
-        response_dict = copy.deepcopy(obj)
-        self.convert(response_dict)
+        response_dict: Dict[str, Any] = copy.copy(obj)
+        message_dict: Dict[str, Any] = response_dict.get("response", None)
+        if message_dict is not None:
+            response_dict["response"] = self.convert_message_copy(message_dict)
         return response_dict
 
+    def convert_message_copy(self, message_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Like convert_message(), but leaves the given chat message alone.
+        :param message_dict: chat message to process
+        :return: a converted copy of the chat message
+        """
+        message_dict = copy.copy(message_dict)
+
+        # Ensure that we return ChatMessageType as a string in output json
+        response_type = message_dict.get('type', None)
+        if response_type is not None:
+            message_dict['type'] =\
+                ChatMessageType.from_response_type(response_type).name
+
+        chat_context: Dict[str, Any] = message_dict.get('chat_context', None)
+        if chat_context is not None and "chat_histories" in chat_context:
+            chat_context = copy.copy(chat_context)
+            chat_histories: List[Dict[str, Any]] = []
+            for chat_history in chat_context.get("chat_histories"):
+                chat_history = copy.copy(chat_history)
+                if "messages" in chat_history:
+                    chat_history["messages"] = [self.convert_message_copy(chat_message)
+                                                for chat_message in chat_history.get("messages")]
+                chat_histories.append(chat_history)
+            chat_context["chat_histories"] = chat_histories
+            message_dict['chat_context'] = chat_context
+
+        return message_dict
+
     def convert(self, response_dict: Dict[str, Any]):
         """
         Convert chat response message to a format expected by external clients:
@@ -0,0 +1,171 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+import asyncio
+import os
+
+from concurrent import futures
+
+import grpc
+
+from grpc_health.v1 import health
+from grpc_health.v1 import health_pb2
+
+from leaf_server_common.server.server_lifetime import ONE_MINUTE_IN_SECONDS
+from leaf_server_common.server.server_lifetime import ServerLifetime
+
+from neuro_san.service.utils.event_loop_factory import EventLoopFactory
+
+DEFAULT_MIGRATION_WORKERS: int = 4
+
+
+class AioServerLifetime(ServerLifetime):
+    """
+    A ServerLifetime whose gRPC server is a grpc.aio server running on
+    a single asyncio event loop instead of a thread per concurrent request.
+
+    Coroutine handlers are run right on the event loop.  The few remaining
+    synchronous handlers (health checking, reflection and the concierge)
+    run on a small migration thread pool whose size is set by the
+    AGENT_GRPC_AIO_SYNC_WORKERS env var.
+
+    Everything else about the lifetime of the server (health reporting,
+    request limits, draining of requests before shutting down) stays the same.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor. See ServerLifetime for arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.loop: asyncio.AbstractEventLoop = None
+
+    def create_server(self):
+        """
+        Called by client code to create the GRPC server instance.
+        :return: A grpc.aio.Server instance with health checking set up.
+        """
+        # pylint: disable=consider-using-with
+        health_thread_pool = futures.ThreadPoolExecutor(max_workers=1)
+        self.health = health.HealthServicer(
+                        experimental_non_blocking=True,
+                        experimental_thread_pool=health_thread_pool)
+
+        # pylint: disable=no-member
+        self.health.set(self.server_name,
+                        health_pb2.HealthCheckResponse.ServingStatus.NOT_SERVING)
+
+        max_message_length = -1     # No limit to message length
+        migration_workers: int = int(os.environ.get("AGENT_GRPC_AIO_SYNC_WORKERS",
+                                                    str(DEFAULT_MIGRATION_WORKERS)))
+        # pylint: disable=consider-using-with
+        migration_thread_pool = futures.ThreadPoolExecutor(max_workers=migration_workers)
+
+        # A grpc.aio server is bound to the event loop that is current when it is created,
+        # so create the loop that run() will use now.
+        self.loop = EventLoopFactory().set_new_event_loop()
+        self.server = grpc.aio.server(
+            migration_thread_pool=migration_thread_pool,
+            maximum_concurrent_rpcs=self.max_concurrent_rpcs,
+            options=[('grpc.max_send_message_length', max_message_length),
+                     ('grpc.max_receive_message_length', max_message_length)])
+
+        return self.server
+
+    def run(self):
+        """
+        Called by client code after the service is all connected up.
+        Runs the event loop for the server until it is done serving.
+        """
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.async_run())
+        finally:
+            self.loop.close()
+
+    async def async_run(self):
+        """
+        Coroutine version of run() that runs on the event loop of the server.
+        """
+        self._set_up_health()
+        self._set_up_ports()
+        await self.server.start()
+
+        # pylint: disable=no-member
+        self.health.set(self.server_name,
+                        health_pb2.HealthCheckResponse.ServingStatus.SERVING)
+        self.logger.info("%s started on asyncio event loop.", str(self.server_name_for_logs))
+
+        await self._async_poll_until_request_limit()
+        await self._async_drain_last_requests()
+
+        self.server_loop_callbacks.shutdown_callback()
+
+        # Finally stop the service
+        await self.server.stop(None)
+
+    def count_request(self, caller: str) -> bool:
+        """
+        Called by coroutine request handlers to mark the beginning of a request
+        which is not to go through start_request(), as that method can only abort
+        synchronous contexts.
+
+        :param caller: A String representing the method called
+        :return: True if the request can go ahead. False if the server is shutting down
+                and the caller should abort the request with UNAVAILABLE.
+        """
+        with self.lock:
+            if not self._is_still_serving():
+                return False
+
+            self.stats['Total'] = self.stats.get('Total', 0) + 1
+            self.stats['NumProcessing'] = self.stats.get('NumProcessing', 0) + 1
+            self.stats[caller] = self.stats.get(caller, 0) + 1
+            if not self._keep_going():
+                self._stop_serving()
+        return True
+
+    def uncount_request(self):
+        """
+        Called by coroutine request handlers to mark the end of a request
+        previously marked by count_request().
+        """
+        with self.lock:
+            self.stats['NumProcessing'] = self.stats.get('NumProcessing', 0) - 1
+
+    async def _async_poll_until_request_limit(self):
+        """
+        Poll every so often to see if the service should keep going
+        without blocking the event loop.
+        """
+        try:
+            while self._is_still_serving():
+                server_active: bool = bool(self.server_loop_callbacks.loop_callback())
+                sleep_seconds: float = self.active_sleep_seconds
+                if not server_active:
+                    sleep_seconds = self.loop_sleep_seconds
+                await asyncio.sleep(sleep_seconds)
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+
+    async def _async_drain_last_requests(self):
+        """
+        Wait for requests in progress to finish before stopping,
+        but not forever.
+        """
+        num_minutes_wait = 15
+        while self._get_num_processing() > 0 \
+                and num_minutes_wait > 0:
+            await asyncio.sleep(ONE_MINUTE_IN_SECONDS)
+            num_minutes_wait = num_minutes_wait - 1
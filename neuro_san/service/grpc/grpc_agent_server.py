@@ -10,6 +10,7 @@
 #
 # END COPYRIGHT
 
+from typing import Any
 from typing import Dict
 from typing import List
 
@@ -30,6 +31,7 @@ from neuro_san.service.grpc.concierge_service import ConciergeService
 from neuro_san.service.grpc.dynamic_agent_router import DynamicAgentRouter
 from neuro_san.service.grpc.grpc_agent_service import GrpcAgentService
 from neuro_san.service.interfaces.agent_server import AgentServer
+from neuro_san.service.utils.admission_controller import DEFAULT_MAX_QUEUED_REQUESTS
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.service.utils.server_status import ServerStatus
 from neuro_san.session.agent_service_stub import AgentServiceStub
@@ -57,6 +59,7 @@ class GrpcAgentServer(AgentServer, AgentStateListener):
                  server_name: str = DEFAULT_SERVER_NAME,
                  server_name_for_logs: str = DEFAULT_SERVER_NAME_FOR_LOGS,
                  max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+                 max_queued_requests: int = DEFAULT_MAX_QUEUED_REQUESTS,
                  request_limit: int = DEFAULT_REQUEST_LIMIT,
                  forwarded_request_metadata: str = AgentServer.DEFAULT_FORWARDED_REQUEST_METADATA):
         """
@@ -69,6 +72,8 @@ class GrpcAgentServer(AgentServer, AgentStateListener):
         :param server_name: The name of the service
         :param server_name_for_logs: The name of the service for log files
         :param max_concurrent_requests: The maximum number of requests to handle at a time.
+        :param max_queued_requests: The maximum number of requests waiting to be handled
+                        before new requests are rejected. A value < 0 means no limit.
         :param request_limit: The number of requests to service before shutting down.
                         This is useful to be sure production environments can handle
                         a service occasionally going down.
@@ -87,6 +92,7 @@ class GrpcAgentServer(AgentServer, AgentStateListener):
         self.server_name: str = server_name
         self.server_name_for_logs: str = server_name_for_logs
         self.max_concurrent_requests: int = max_concurrent_requests
+        self.max_queued_requests: int = max_queued_requests
         self.request_limit: int = request_limit
         self.server_context: ServerContext = server_context
 
@@ -101,24 +107,44 @@ class GrpcAgentServer(AgentServer, AgentStateListener):
         """
         return self.services
 
+    def get_agent_service(self, agent_name: str) -> Any:
+        """
+        :param agent_name: name of an agent
+        :return: The transport-agnostic service serving the agent, created if need be.
+                 None if the agent is not served by this instance.
+        """
+        # Later services for the same agent name replace earlier ones in the router.
+        for service in reversed(self.services):
+            if service.service_provider.agent_name == agent_name:
+                return service.service_provider.get_service()
+        return None
+
     def agent_added(self, agent_name: str, source: AgentStorageSource):
         """
         Agent is being added to the service.
         :param agent_name: name of an agent
         :param source: The AgentStorageSource source of the message
         """
-        service = GrpcAgentService(self.server_lifetime,
-                                   self.security_cfg,
-                                   agent_name,
-                                   source.get_agent_network_provider(agent_name),
-                                   self.server_logging,
-                                   self.server_context)
+        service = self.create_agent_service(agent_name, source)
         self.services.append(service)
         servicer_to_server = AgentServicerToServer(service)
         agent_rpc_handlers = servicer_to_server.build_rpc_handlers()
         agent_service_name: str = AgentServiceStub.prepare_service_name(agent_name)
         self.service_router.add_service(agent_service_name, agent_rpc_handlers)
 
+    def create_agent_service(self, agent_name: str, source: AgentStorageSource) -> GrpcAgentService:
+        """
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the agent
+        :return: A new gRPC servicer for the agent
+        """
+        return GrpcAgentService(self.server_lifetime,
+                                self.security_cfg,
+                                agent_name,
+                                source.get_agent_network_provider(agent_name),
+                                self.server_logging,
+                                self.server_context)
+
     def agent_modified(self, agent_name: str, source: AgentStorageSource):
         """
         Agent is being modified in the service scope.
@@ -138,23 +164,40 @@ class GrpcAgentServer(AgentServer, AgentStateListener):
         agent_service_name: str = AgentServiceStub.prepare_service_name(agent_name)
         self.service_router.remove_service(agent_service_name)
 
-    def prepare_for_serving(self):
+    def create_server_lifetime(self) -> ServerLifetime:
         """
-        Prepare server for running.
+        :return: The ServerLifetime which creates and runs the gRPC server
         """
         values = agent_pb2.DESCRIPTOR.services_by_name.values()
-        self.server_lifetime = ServerLifetime(
+
+        # Requests waiting for admission each hold onto a worker thread,
+        # so size the thread pool to hold the queue as well.  Anything beyond that
+        # gets rejected by gRPC itself with RESOURCE_EXHAUSTED instead of piling up
+        # in gRPC's own unbounded queue.
+        max_workers: int = self.max_concurrent_requests
+        max_concurrent_rpcs: int = None
+        if self.max_queued_requests >= 0:
+            max_workers += self.max_queued_requests
+            max_concurrent_rpcs = max_workers
+
+        return ServerLifetime(
             self.server_name,
             self.server_name_for_logs,
             self.port, self.logger,
             request_limit=self.request_limit,
-            max_workers=self.max_concurrent_requests,
-            max_concurrent_rpcs=None,
+            max_workers=max_workers,
+            max_concurrent_rpcs=max_concurrent_rpcs,
             # Used for health checking. Probably needs agent-specific love.
             protocol_services_by_name_values=values,
             loop_sleep_seconds=5.0,
             server_loop_callbacks=self.server_loop_callbacks)
 
+    def prepare_for_serving(self):
+        """
+        Prepare server for running.
+        """
+        self.server_lifetime = self.create_server_lifetime()
+
         server = self.server_lifetime.create_server()
 
         # New-style service
@@ -150,15 +150,27 @@ class GrpcAgentService(agent_pb2_grpc.AgentServiceServicer):
         # Get our args in order to pass to grpc-free session level
         request_dict: Dict[str, Any] = MessageToDict(request)
         service: AgentService = self.service_provider.get_service()
-        response_dict_iterator: Iterator[Dict[str, Any]] =\
-            service.streaming_chat(request_dict, request_metadata, context)
-        for response_dict in response_dict_iterator:
-            # Convert the response dictionary to a grpc message
-            response_string = json.dumps(response_dict)
-            response = service_messages.ChatResponse()
-            Parse(response_string, response)
-            # Yield-ing a single response allows one response to be returned
-            # over the connection while keeping it open to wait for more.
-            # Grpc client code handling response streaming knows to construct an
-            # iterator on its side to do said waiting over there.
-            yield response
+
+        # Fail fast when the server is overloaded instead of letting requests pile up.
+        queue_wait_seconds: float = service.admit_request(request_metadata, context)
+        if queue_wait_seconds is None:
+            retry_after: str = str(service.get_retry_after_seconds())
+            context.set_trailing_metadata((("retry-after", retry_after),))
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                          f"Too many concurrent requests. Retry after {retry_after} seconds.")
+
+        try:
+            response_dict_iterator: Iterator[Dict[str, Any]] =\
+                service.streaming_chat(request_dict, request_metadata, context, queue_wait_seconds)
+            for response_dict in response_dict_iterator:
+                # Convert the response dictionary to a grpc message
+                response_string = json.dumps(response_dict)
+                response = service_messages.ChatResponse()
+                Parse(response_string, response)
+                # Yield-ing a single response allows one response to be returned
+                # over the connection while keeping it open to wait for more.
+                # Grpc client code handling response streaming knows to construct an
+                # iterator on its side to do said waiting over there.
+                yield response
+        finally:
+            service.release_request()
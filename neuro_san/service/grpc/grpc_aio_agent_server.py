@@ -0,0 +1,71 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from leaf_server_common.server.server_lifetime import ServerLifetime
+
+from neuro_san.api.grpc import agent_pb2
+
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.service.grpc.aio_server_lifetime import AioServerLifetime
+from neuro_san.service.grpc.grpc_agent_server import GrpcAgentServer
+from neuro_san.service.grpc.grpc_aio_agent_service import GrpcAioAgentService
+from neuro_san.service.grpc.grpc_aio_logger import GrpcAioLogger
+from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
+
+
+class GrpcAioAgentServer(GrpcAgentServer):
+    """
+    Server implementation for the Agent gRPC Service which serves
+    requests as coroutines of a grpc.aio server on a single event loop.
+
+    Unlike GrpcAgentServer, there is no server thread per concurrent request, so
+    requests waiting for admission do not hold threads and the number of open
+    streaming chats is not limited by a server thread pool size.
+    Each admitted request still runs its agent network on an AsyncioExecutor
+    thread of its own, so the admission limits (max_concurrent_requests and
+    max_queued_requests) are what bound the number of threads.
+    """
+
+    def create_agent_service(self, agent_name: str, source: AgentStorageSource) -> GrpcAioAgentService:
+        """
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the agent
+        :return: A new grpc.aio servicer for the agent
+        """
+        request_logger: EventLoopLogger = GrpcAioLogger(self.server_name_for_logs)
+        return GrpcAioAgentService(self.server_lifetime,
+                                   request_logger,
+                                   self.security_cfg,
+                                   agent_name,
+                                   source.get_agent_network_provider(agent_name),
+                                   self.server_logging,
+                                   self.server_context)
+
+    def create_server_lifetime(self) -> ServerLifetime:
+        """
+        :return: The AioServerLifetime which creates and runs the grpc.aio server
+        """
+        values = agent_pb2.DESCRIPTOR.services_by_name.values()
+
+        # No limit on concurrent rpcs from gRPC itself.
+        # Waiting requests do not hold threads, and the AdmissionController
+        # rejects requests once its queue is full.
+        return AioServerLifetime(
+            self.server_name,
+            self.server_name_for_logs,
+            self.port, self.logger,
+            request_limit=self.request_limit,
+            max_concurrent_rpcs=None,
+            # Used for health checking. Probably needs agent-specific love.
+            protocol_services_by_name_values=values,
+            loop_sleep_seconds=5.0,
+            server_loop_callbacks=self.server_loop_callbacks)
@@ -0,0 +1,212 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+
+import json
+import grpc
+
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.json_format import Parse
+
+from leaf_server_common.server.grpc_metadata_forwarder import GrpcMetadataForwarder
+
+from neuro_san.api.grpc import agent_pb2 as service_messages
+from neuro_san.api.grpc import agent_pb2_grpc
+from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
+from neuro_san.service.generic.agent_server_logging import AgentServerLogging
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
+from neuro_san.service.grpc.aio_server_lifetime import AioServerLifetime
+from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
+from neuro_san.service.utils.server_context import ServerContext
+
+
+class GrpcAioAgentService(agent_pb2_grpc.AgentServiceServicer):
+    """
+    A grpc.aio implementation of the Neuro-San Agent Service.
+
+    Requests are handled as coroutines on the event loop of the grpc.aio server
+    and go straight to the AsyncAgentService, so a streaming chat does not
+    need a server thread of its own while it waits for admission or for
+    responses from its agent network.  Once admitted, its agent network
+    still runs on an AsyncioExecutor thread of its own.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 server_lifetime: AioServerLifetime,
+                 request_logger: EventLoopLogger,
+                 security_cfg: Dict[str, Any],
+                 agent_name: str,
+                 agent_network_provider: AgentNetworkProvider,
+                 server_logging: AgentServerLogging,
+                 server_context: ServerContext):
+        """
+        :param server_lifetime: The AioServerLifetime that keeps track of request stats
+        :param request_logger: The instance of the EventLoopLogger that helps
+                        log information from running event loop
+        :param security_cfg: A dictionary of parameters used to
+                        secure the TLS and the authentication of the gRPC
+                        connection.  Supplying this implies use of a secure
+                        GRPC Channel.  If None, uses insecure channel.
+        :param agent_name: The agent name for the service
+        :param agent_network_provider: The AgentNetworkProvider to use for the service.
+        :param server_logging: An AgentServerLogging instance initialized so that
+                        spawned asyncrhonous threads can also properly initialize
+                        their logging.
+        :param server_context: The ServerContext object containing global-ish state
+        """
+        self.server_lifetime: AioServerLifetime = server_lifetime
+        self.agent_name: str = agent_name
+        self.forwarder: GrpcMetadataForwarder = server_logging.get_forwarder()
+        self.service_provider: AsyncAgentServiceProvider =\
+            AsyncAgentServiceProvider(
+                request_logger,
+                security_cfg,
+                agent_name,
+                agent_network_provider,
+                server_logging,
+                server_context)
+
+    def get_request_count(self) -> int:
+        """
+        :return: The number of currently active requests
+        """
+        if not self.service_provider.service_created():
+            # Service is not yet instantiated - it has no requests
+            return 0
+        service: AsyncAgentService = self.service_provider.get_service()
+        return service.get_request_count()
+
+    async def _start_request(self, method_name: str, context: grpc.aio.ServicerContext):
+        """
+        Accounts for the start of a request with the server lifetime.
+        Aborts the request if the server is shutting down.
+
+        :param method_name: The name of the method being called
+        :param context: a grpc.aio.ServicerContext
+        """
+        if self.server_lifetime is not None and \
+                not self.server_lifetime.count_request(f"{self.agent_name}.{method_name}"):
+            await context.abort(grpc.StatusCode.UNAVAILABLE,
+                                f"Service refusing {self.agent_name}.{method_name} request to shut down cleanly")
+
+    def _finish_request(self):
+        """
+        Accounts for the end of a request started with _start_request().
+        """
+        if self.server_lifetime is not None:
+            self.server_lifetime.uncount_request()
+
+    # pylint: disable=no-member,invalid-overridden-method
+    async def Function(self, request: service_messages.FunctionRequest,
+                       context: grpc.aio.ServicerContext) \
+            -> service_messages.FunctionResponse:
+        """
+        Allows a client to get the outward-facing function for the agent
+        served by this service.
+
+        :param request: a FunctionRequest
+        :param context: a grpc.aio.ServicerContext
+        :return: a FunctionResponse
+        """
+        await self._start_request("Function", context)
+        try:
+            request_metadata: Dict[str, Any] = self.forwarder.forward(context)
+
+            # Get our args in order to pass to grpc-free session level
+            request_dict: Dict[str, Any] = MessageToDict(request)
+            service: AsyncAgentService = self.service_provider.get_service()
+            response_dict: Dict[str, Any] = await service.function(request_dict, request_metadata)
+        finally:
+            self._finish_request()
+
+        # Convert the response dictionary to a grpc message
+        response_string = json.dumps(response_dict)
+        response = service_messages.FunctionResponse()
+        Parse(response_string, response)
+        return response
+
+    # pylint: disable=no-member,invalid-overridden-method
+    async def Connectivity(self, request: service_messages.ConnectivityRequest,
+                           context: grpc.aio.ServicerContext) \
+            -> service_messages.ConnectivityResponse:
+        """
+        Allows a client to get connectivity information for the agent
+        served by this service.
+
+        :param request: a ConnectivityRequest
+        :param context: a grpc.aio.ServicerContext
+        :return: a ConnectivityResponse
+        """
+        await self._start_request("Connectivity", context)
+        try:
+            request_metadata: Dict[str, Any] = self.forwarder.forward(context)
+
+            # Get our args in order to pass to grpc-free session level
+            request_dict: Dict[str, Any] = MessageToDict(request)
+            service: AsyncAgentService = self.service_provider.get_service()
+            response_dict: Dict[str, Any] = await service.connectivity(request_dict, request_metadata)
+        finally:
+            self._finish_request()
+
+        # Convert the response dictionary to a grpc message
+        response_string = json.dumps(response_dict)
+        response = service_messages.ConnectivityResponse()
+        Parse(response_string, response)
+        return response
+
+    # pylint: disable=invalid-overridden-method
+    async def StreamingChat(self, request: service_messages.ChatRequest,
+                            context: grpc.aio.ServicerContext) \
+            -> AsyncIterator[service_messages.ChatResponse]:
+        """
+        Initiates or continues the agent chat with the session_id
+        context in the request.
+
+        :param request: a ChatRequest
+        :param context: a grpc.aio.ServicerContext
+        :return: an async iterator for (eventually) returned ChatResponses
+        """
+        request_metadata: Dict[str, Any] = self.forwarder.forward(context)
+
+        # Get our args in order to pass to grpc-free session level
+        request_dict: Dict[str, Any] = MessageToDict(request)
+        service: AsyncAgentService = self.service_provider.get_service()
+
+        # Fail fast when the server is overloaded instead of letting requests pile up.
+        # Waiting in line here only holds onto a coroutine, not a thread.
+        if await service.admit_request(request_metadata) is None:
+            retry_after: str = str(service.get_retry_after_seconds())
+            context.set_trailing_metadata((("retry-after", retry_after),))
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                                f"Too many concurrent requests. Retry after {retry_after} seconds.")
+
+        try:
+            await self._start_request("StreamingChat", context)
+            try:
+                # When the client cancels or its deadline passes, grpc cancels this coroutine,
+                # which closes the generator below and with it the work for the request.
+                async for response_dict in service.streaming_chat(request_dict, request_metadata,
+                                                                  context.time_remaining()):
+                    # Convert the response dictionary to a grpc message
+                    response_string = json.dumps(response_dict)
+                    response = service_messages.ChatResponse()
+                    Parse(response_string, response)
+                    yield response
+            finally:
+                self._finish_request()
+        finally:
+            service.release_request()
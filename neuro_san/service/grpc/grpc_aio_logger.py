@@ -0,0 +1,68 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+
+import logging
+
+from leaf_server_common.logging.logging_setup import setup_extra_logging_fields
+
+from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
+
+
+class GrpcAioLogger(EventLoopLogger):
+    """
+    EventLoopLogger for the grpc.aio server.
+
+    All requests share the thread of the event loop, so the structured
+    logging fields for a request are set up right before each message
+    is logged on its behalf.
+    """
+
+    def __init__(self, logger_name: str):
+        """
+        Constructor
+
+        :param logger_name: The name of the underlying standard Logger
+        """
+        self.logger = logging.getLogger(logger_name)
+
+    def info(self, metadata: Dict[str, Any], msg: str, *args):
+        """
+        "Info" logging method.
+        """
+        setup_extra_logging_fields(metadata_dict=metadata)
+        self.logger.info(msg, *args)
+
+    def warning(self, metadata: Dict[str, Any], msg: str, *args):
+        """
+        "Warning" logging method.
+        """
+        setup_extra_logging_fields(metadata_dict=metadata)
+        self.logger.warning(msg, *args)
+
+    def debug(self, metadata: Dict[str, Any], msg: str, *args):
+        """
+        "Debug" logging method.
+        """
+        setup_extra_logging_fields(metadata_dict=metadata)
+        self.logger.debug(msg, *args)
+
+    def error(self, metadata: Dict[str, Any], msg: str, *args):
+        """
+        "Error" logging method.
+        """
+        setup_extra_logging_fields(metadata_dict=metadata)
+        self.logger.error(msg, *args)
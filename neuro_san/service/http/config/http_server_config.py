@@ -12,6 +12,9 @@
 """
 See class comment for details
 """
+from typing import Dict
+
+import tempfile
 
 DEFAULT_HTTP_CONNECTIONS_BACKLOG: int = 128
 DEFAULT_HTTP_IDLE_CONNECTIONS_TIMEOUT_SECONDS: int = 3600
@@ -23,6 +26,7 @@ class HttpServerConfig:
     """
     Class aggregating Tornado http server run-time configuration parameters.
     """
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
         self.http_connections_backlog: int = DEFAULT_HTTP_CONNECTIONS_BACKLOG
@@ -30,3 +34,9 @@ class HttpServerConfig:
         self.http_server_instances: int = DEFAULT_HTTP_SERVER_INSTANCES
         self.http_port: int = 80
         self.http_server_monitor_interval_seconds: int = DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
+        # Sharding of agent networks across http server instances
+        self.http_sharding: bool = False
+        self.http_shard_weights: Dict[str, float] = {}
+        self.http_shard_socket_dir: str = tempfile.gettempdir()
+        # Token admin requests have to present. None disables admin endpoints.
+        self.admin_token: str = None
@@ -24,6 +24,7 @@ import asyncio
 import tornado
 from tornado.web import RequestHandler
 
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
@@ -71,7 +72,7 @@ class BaseRequestHandler(RequestHandler):
         if os.environ.get("AGENT_ALLOW_CORS_HEADERS") is not None:
             self.set_header("Access-Control-Allow-Origin", "*")
             self.set_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-            headers: str = "Content-Type, Transfer-Encoding"
+            headers: str = f"Content-Type, Transfer-Encoding, {RequestDeadline.HEADER}"
             metadata_headers: str = ", ".join(forwarded_request_metadata)
             if len(metadata_headers) > 0:
                 headers += f", {metadata_headers}"
@@ -0,0 +1,165 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import hmac
+import http
+
+from tornado.ioloop import IOLoop
+from tornado.web import MissingArgumentError
+from tornado.web import RequestHandler
+
+from neuro_san.internals.utils.json_codec import JsonCodec
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.utils.memory_profiler import MemoryProfiler
+
+
+class MemoryProfileHandler(RequestHandler):
+    """
+    Handler class for the admin-only memory profiling API endpoints.
+    Every request must carry an "Authorization: Bearer <admin token>" header.
+
+    Endpoints ("op"s) are:
+        "status"    GET: memory use of this process and what is being profiled.
+                    POST: change what is being profiled with a JSON body with any of
+                          "tracing" (bool), "frames" (int) and "request_sample_rate" (float) keys.
+        "snapshots" POST: take a tracemalloc snapshot named by the "name" key of the JSON body.
+        "top"       GET: top allocators of currently allocated memory.
+                    Query arguments: "limit" and "group_by" ("lineno", "filename" or "traceback").
+        "diff"      GET: top changes in allocated memory since the snapshot named by the "snapshot"
+                    query argument. Also takes "limit" and "group_by".
+        "objects"   GET: counts of live objects of the classes given in the comma-separated "types"
+                    query argument.
+        "requests"  GET: peak allocation of sampled requests per agent network.
+    """
+
+    # pylint: disable=attribute-defined-outside-init
+    def initialize(self,
+                   forwarded_request_metadata: List[str],
+                   admin_token: str,
+                   op: str):
+        """
+        This method is called by Tornado framework to allow
+        injecting service-specific data into local handler context.
+        :param forwarded_request_metadata: list of client metadata keys;
+        :param admin_token: the token admin requests have to present;
+        :param op: requested memory profiling operation
+        """
+        self.logger = HttpLogger(forwarded_request_metadata)
+        self.admin_token: str = admin_token
+        self.op: str = op
+        self.profiler: MemoryProfiler = MemoryProfiler.get_shared()
+
+    def prepare(self):
+        authorization: str = self.request.headers.get("Authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode("utf-8"),
+                                                                 self.admin_token.encode("utf-8")):
+            self.logger.warning({}, "Refused unauthorized %s %s", self.request.method, self.request.path)
+            self.set_status(http.HTTPStatus.UNAUTHORIZED)
+            self.set_header("WWW-Authenticate", "Bearer")
+            self.write({"error": "Unauthorized"})
+            self.finish()
+
+    async def get(self):
+        """
+        Implementation of GET request handler for memory profiling API calls.
+        """
+        if self.op == "status":
+            await self.respond(self.profiler.get_status)
+        elif self.op == "top":
+            await self.respond(lambda: self.profiler.get_top_allocators(self.get_limit(),
+                                                                        self.get_argument("group_by", "lineno")))
+        elif self.op == "diff":
+            await self.respond(lambda: self.profiler.compare_to_snapshot(self.get_argument("snapshot"),
+                                                                         self.get_limit(),
+                                                                         self.get_argument("group_by", "lineno")))
+        elif self.op == "objects":
+            type_names: List[str] = None
+            types_arg: str = self.get_argument("types", None)
+            if types_arg:
+                type_names = [type_name.strip() for type_name in types_arg.split(",") if type_name.strip()]
+            await self.respond(lambda: MemoryProfiler.count_objects(type_names))
+        elif self.op == "requests":
+            await self.respond(self.profiler.get_request_samples)
+        else:
+            self.set_status(http.HTTPStatus.METHOD_NOT_ALLOWED)
+            self.finish()
+
+    async def post(self):
+        """
+        Implementation of POST request handler for memory profiling API calls.
+        """
+        try:
+            data: Dict[str, Any] = JsonCodec.get_shared().loads(self.request.body or b"{}")
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object")
+        except ValueError:
+            self.set_status(http.HTTPStatus.BAD_REQUEST)
+            self.write({"error": "Invalid JSON format"})
+            self.finish()
+            return
+
+        if self.op == "status":
+            def configure() -> Dict[str, Any]:
+                self.profiler.configure(tracing=data.get("tracing"),
+                                        frames=data.get("frames"),
+                                        request_sample_rate=data.get("request_sample_rate"))
+                self.logger.info({}, "Memory profiling is now %s", self.profiler.get_status())
+                return self.profiler.get_status()
+            await self.respond(configure)
+        elif self.op == "snapshots":
+            await self.respond(lambda: self.profiler.take_snapshot(str(data.get("name", "baseline"))))
+        else:
+            self.set_status(http.HTTPStatus.METHOD_NOT_ALLOWED)
+            self.finish()
+
+    async def respond(self, operation: Callable[[], Any]):
+        """
+        Runs a profiling operation off the event loop, as some of them take a while,
+        and writes its result as the JSON response.
+        :param operation: The profiling operation to run
+        """
+        try:
+            result: Any = await IOLoop.current().run_in_executor(None, operation)
+            self.set_header("Content-Type", "application/json")
+            self.write(JsonCodec.get_shared().dumps_bytes(result))
+        except KeyError as exception:
+            self.set_status(http.HTTPStatus.NOT_FOUND)
+            self.write({"error": str(exception.args[0])})
+        except (ValueError, TypeError) as exception:
+            self.set_status(http.HTTPStatus.BAD_REQUEST)
+            self.write({"error": str(exception)})
+        except MissingArgumentError as exception:
+            self.set_status(http.HTTPStatus.BAD_REQUEST)
+            self.write({"error": exception.log_message % exception.args})
+        finally:
+            self.finish()
+
+    def get_limit(self) -> int:
+        """
+        :return: The "limit" query argument
+        """
+        return int(self.get_argument("limit", "20"))
+
+    def data_received(self, chunk):
+        """
+        Method overrides abstract method of RequestHandler
+        with no-op implementation.
+        """
+        return
@@ -0,0 +1,115 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import Set
+
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from tornado.iostream import StreamClosedError
+
+from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.http.server.http_shard_router import FORWARDED_FROM_SHARD_HEADER
+from neuro_san.service.http.server.http_shard_router import HttpShardRouter
+
+# Headers which describe a single connection and are not to be passed along
+HOP_BY_HOP_HEADERS: Set[str] = {
+    "connection",
+    "content-length",
+    "host",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class ShardForwardingHandler(BaseRequestHandler):
+    """
+    Handler class which forwards requests for an agent network to the HTTP server
+    worker process which owns the agent network, streaming the response back as it comes.
+    """
+
+    # pylint: disable=attribute-defined-outside-init,arguments-differ
+    def initialize(self, shard_router: HttpShardRouter, **kwargs):
+        """
+        This method is called by Tornado framework to allow
+        injecting service-specific data into local handler context.
+        :param shard_router: The HttpShardRouter knowing who owns which agent network
+        :param kwargs: The arguments for the BaseRequestHandler
+        """
+        super().initialize(**kwargs)
+        self.shard_router: HttpShardRouter = shard_router
+
+    async def get(self, agent_name: str):
+        """
+        Forwards a GET request
+        """
+        await self.forward(agent_name)
+
+    async def post(self, agent_name: str):
+        """
+        Forwards a POST request
+        """
+        await self.forward(agent_name)
+
+    async def forward(self, agent_name: str):
+        """
+        Forwards the request to the worker owning the agent network
+        :param agent_name: The name of the agent network
+        """
+        metadata: Dict[str, Any] = self.get_metadata()
+        owner: int = self.shard_router.get_owner(agent_name)
+        caller: str = f"{agent_name}/forwarded"
+
+        headers: Dict[str, str] = {}
+        for name, value in self.request.headers.get_all():
+            if name.lower() not in HOP_BY_HOP_HEADERS:
+                headers[name] = value
+        headers[FORWARDED_FROM_SHARD_HEADER] = str(self.shard_router.get_shard_index())
+
+        self.application.start_client_request(metadata, caller)
+        try:
+            client_session: ClientSession = self.shard_router.get_client_session(owner)
+            # The host part does not matter for a unix domain socket.
+            url: str = f"http://shard-{owner}{self.request.uri}"
+            async with client_session.request(self.request.method, url,
+                                              headers=headers, data=self.request.body) as response:
+                self.set_status(response.status, response.reason)
+                for name, value in response.headers.items():
+                    if name.lower() not in HOP_BY_HOP_HEADERS:
+                        self.set_header(name, value)
+
+                async for chunk in response.content.iter_any():
+                    self.write(chunk)
+                    await self.flush()
+
+        except StreamClosedError:
+            self.logger.warning(metadata, "Forward: client closed connection unexpectedly.")
+        except (ClientError, OSError) as exception:
+            self.logger.error(metadata, "Could not forward %s to shard %d: %s",
+                              self.request.path, owner, str(exception))
+            if not self._headers_written:
+                # The owning worker is most likely being restarted by the supervisor.
+                self.clear()
+                self.set_status(503)
+                self.set_header("Retry-After", "1")
+                self.write({"error": "Service Unavailable"})
+        finally:
+            self.do_finish()
+            self.application.finish_client_request(metadata, caller)
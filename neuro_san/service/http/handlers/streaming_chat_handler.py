@@ -16,17 +16,36 @@ from typing import Any
 from typing import Dict
 from typing import Generator
 
-import json
+import asyncio
 
+from neuro_san.internals.utils.json_codec import JsonCodec
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.utils.memory_profiler import MemoryProfiler
 
 
 class StreamingChatHandler(BaseRequestHandler):
     """
     Handler class for neuro-san streaming chat API call.
+
+    Clients can limit how long they are willing to wait with a
+    request-timeout-seconds header.  When the client goes away before
+    the response is done, the work still going on for it is cancelled.
     """
 
+    # pylint: disable=attribute-defined-outside-init
+    def on_connection_close(self):
+        """
+        Called by Tornado when the client closes the connection while we are still
+        working on the request, even when nothing is being written to it at the moment.
+        """
+        stream_task: asyncio.Task = getattr(self, "stream_task", None)
+        if stream_task is not None and not stream_task.done():
+            self.client_gone = True
+            stream_task.cancel()
+        super().on_connection_close()
+
     async def stream_out(self,
                          generator: Generator[Dict[str, Any], None, None]) -> int:
         """
@@ -42,14 +61,19 @@ class StreamingChatHandler(BaseRequestHandler):
         if not flush_ok:
             return 0
 
+        codec: JsonCodec = JsonCodec.get_shared()
         sent_out: int = 0
-        async for result_dict in generator:
-            result_str: str = json.dumps(result_dict) + "\n"
-            self.write(result_str)
-            flush_ok = await self.do_flush()
-            if not flush_ok:
-                return sent_out
-            sent_out += 1
+        try:
+            async for result_dict in generator:
+                result_bytes: bytes = codec.dumps_bytes(result_dict) + b"\n"
+                self.write(result_bytes)
+                flush_ok = await self.do_flush()
+                if not flush_ok:
+                    return sent_out
+                sent_out += 1
+        finally:
+            # Do not leave the rest of the request running when we stop early.
+            await generator.aclose()
         return sent_out
 
     async def post(self, agent_name: str):
@@ -62,16 +86,41 @@ class StreamingChatHandler(BaseRequestHandler):
         if service is None:
             return
 
+        # Fail fast when the server is overloaded instead of letting requests pile up.
+        if await service.admit_request(metadata) is None:
+            self.set_status(429)
+            self.set_header("Retry-After", str(service.get_retry_after_seconds()))
+            self.write({"error": "Too many requests"})
+            self.do_finish()
+            return
+
         self.application.start_client_request(metadata, f"{agent_name}/streaming_chat")
+        memory_profiler: MemoryProfiler = MemoryProfiler.get_shared()
+        sample_start_bytes: int = memory_profiler.start_request_sample()
+        self.client_gone: bool = False
+        self.stream_task: asyncio.Task = None
         try:
             # Parse JSON body
-            data = json.loads(self.request.body)
-            result_generator = service.streaming_chat(data, metadata)
-            await self.stream_out(result_generator)
+            data = JsonCodec.get_shared().loads(self.request.body)
+            # Do not hold on to the raw request for the rest of the stream,
+            # as it can carry large sly_data.
+            self.request.body = b""
+            timeout_seconds: float = RequestDeadline.parse_seconds(self.request.headers.get(RequestDeadline.HEADER))
+            result_generator = service.streaming_chat(data, metadata, timeout_seconds)
+            # Run the streaming in its own task, so it can be cancelled when the client goes away.
+            self.stream_task = asyncio.create_task(self.stream_out(result_generator))
+            await self.stream_task
+
+        except asyncio.CancelledError:
+            if not self.client_gone:
+                raise
+            self.logger.warning(metadata, "Client closed connection, cancelled the request.")
 
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self.process_exception(exc)
         finally:
+            memory_profiler.finish_request_sample(agent_name, sample_start_bytes)
+            service.release_request()
             # We are done with response stream:
             self.do_finish()
             self.application.finish_client_request(metadata, f"{agent_name}/streaming_chat", get_stats=True)
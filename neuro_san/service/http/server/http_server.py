@@ -20,25 +20,37 @@ from typing import List
 import random
 import threading
 
+import os
+
 import tornado
+import tornado.netutil
+import tornado.process
 
 from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
 from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
 from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.utils.json_codec import JsonCodec
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
 from neuro_san.service.http.handlers.health_check_handler import HealthCheckHandler
 from neuro_san.service.http.handlers.connectivity_handler import ConnectivityHandler
 from neuro_san.service.http.handlers.function_handler import FunctionHandler
+from neuro_san.service.http.handlers.memory_profile_handler import MemoryProfileHandler
 from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
 from neuro_san.service.http.handlers.concierge_handler import ConciergeHandler
 from neuro_san.service.http.handlers.openapi_publish_handler import OpenApiPublishHandler
+from neuro_san.service.http.handlers.shard_forwarding_handler import ShardForwardingHandler
 from neuro_san.service.http.interfaces.agent_authorizer import AgentAuthorizer
 from neuro_san.service.http.logging.http_logger import HttpLogger
 from neuro_san.service.http.server.http_server_app import HttpServerApp
+from neuro_san.service.http.server.http_shard_router import HttpShardRouter
+from neuro_san.service.http.server.network_shard_map import NetworkShardMap
+from neuro_san.service.http.server.remote_shard_matcher import RemoteShardMatcher
 from neuro_san.service.interfaces.agent_server import AgentServer
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
+from neuro_san.service.utils.event_loop_factory import EventLoopFactory
 from neuro_san.service.utils.server_status import ServerStatus
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.service.http.config.http_server_config import HttpServerConfig
@@ -91,6 +103,7 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
         self.logger = HttpLogger(self.forwarded_request_metadata)
         self.allowed_agents: Dict[str, AsyncAgentServiceProvider] = {}
         self.lock = threading.Lock()
+        self.shard_router: HttpShardRouter = None
 
         # Add listener to handle adding per-agent http service
         # (services map is defined by self.allowed_agents dictionary)
@@ -103,6 +116,16 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
         Method to be called by a thread running tornado HTTP server
         to actually start serving requests.
         """
+        num_instances: int = self.server_config.http_server_instances
+        if num_instances <= 0:
+            num_instances = os.cpu_count()
+        if self.server_config.http_sharding and num_instances > 1:
+            # Each agent network is served by a single instance,
+            # other instances forward requests for it over local sockets.
+            shard_map = NetworkShardMap(num_instances, self.server_config.http_shard_weights)
+            self.shard_router = HttpShardRouter(shard_map, self.http_port,
+                                                self.server_config.http_shard_socket_dir)
+
         app = self.make_app(self.requests_limit, self.logger)
 
         self.logger.debug({}, "Serving agents: %s", repr(self.allowed_agents.keys()))
@@ -116,15 +139,34 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
         # Bind the socket with a custom backlog
         server.bind(self.http_port, backlog=self.server_config.http_connections_backlog)
 
-        # Start N child processes (0 = one per CPU core)
-        server.start(self.server_config.http_server_instances)
+        # Start N child processes (0 = one per CPU core).
+        # This is what server.start(N) would do, but the event loop for this thread
+        # can only be created once any forking is over and done with.
+        # The parent process stays behind to restart any instance which exits abnormally,
+        # with the same task id it had before.
+        task_id: int = None
+        if num_instances != 1:
+            task_id = tornado.process.fork_processes(num_instances)
+        event_loop_factory = EventLoopFactory()
+        event_loop_factory.set_new_event_loop()
+        server.start(1)
+
+        if self.shard_router is not None:
+            self.shard_router.set_shard_index(task_id)
+            socket_path: str = self.shard_router.get_socket_path(task_id)
+            # bind_unix_socket() removes any socket left behind by a crashed predecessor.
+            server.add_socket(tornado.netutil.bind_unix_socket(socket_path))
+            self.logger.info({}, "HTTP server instance %d also listens on %s", task_id, socket_path)
 
         server_status: ServerStatus = self.server_context.get_server_status()
         server_status.http_service.set_status(True)
         self.logger.info({}, "HTTP server is running %d instances on port %d with backlog %d",
-                         self.server_config.http_server_instances,
+                         num_instances,
                          self.http_port,
                          self.server_config.http_connections_backlog)
+        self.logger.info({}, "HTTP server is using the %s event loop and the %s JSON codec",
+                         event_loop_factory.get_implementation_name(),
+                         JsonCodec.get_shared().get_implementation_name())
         self.logger.info({}, "HTTP server idle connections timeout: %d seconds",
                          self.server_config.http_idle_connection_timeout_seconds)
         self.logger.info({}, "HTTP server is shutting down after %d requests", self.requests_limit)
@@ -151,6 +193,12 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
         conn = ServiceResources.active_tcp_on_port(self.http_port)
         self.logger.info({}, "Used: file descriptors %d (%d, %d) connections: %d",
                          fds, soft_limit, hard_limit, conn)
+        admission_stats: Dict[str, Any] = self.server_context.get_admission_controller().get_stats()
+        self.logger.info({}, "Admission: active %d queued %d admitted %d rejected %d "
+                             "average wait %.3f seconds max wait %.3f seconds",
+                         admission_stats.get("active"), admission_stats.get("queued"),
+                         admission_stats.get("admitted"), admission_stats.get("rejected"),
+                         admission_stats.get("average_wait_seconds"), admission_stats.get("max_wait_seconds"))
 
     def make_app(self, requests_limit: int, logger: EventLoopLogger):
         """
@@ -168,6 +216,12 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
             "op": "ready"
         }
         handlers = []
+        if self.shard_router is not None:
+            # Requests for agent networks owned by another instance are forwarded there.
+            forwarding_request_initialize_data: Dict[str, Any] = dict(request_initialize_data)
+            forwarding_request_initialize_data["shard_router"] = self.shard_router
+            handlers.append((RemoteShardMatcher(self.shard_router), ShardForwardingHandler,
+                             forwarding_request_initialize_data))
         handlers.append(("/", HealthCheckHandler, ready_request_initialize_data))
         handlers.append(("/healthz", HealthCheckHandler, ready_request_initialize_data))
         handlers.append(("/readyz", HealthCheckHandler, ready_request_initialize_data))
@@ -175,6 +229,19 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
         handlers.append(("/api/v1/list", ConciergeHandler, request_initialize_data))
         handlers.append(("/api/v1/docs", OpenApiPublishHandler, request_initialize_data))
 
+        if self.server_config.admin_token:
+            # Admin-only endpoints for finding out where memory goes:
+            for op in ("status", "snapshots", "top", "diff", "objects", "requests"):
+                memory_request_initialize_data: Dict[str, Any] = {
+                    "forwarded_request_metadata": self.forwarded_request_metadata,
+                    "admin_token": self.server_config.admin_token,
+                    "op": op
+                }
+                path: str = "/api/v1/admin/memory"
+                if op != "status":
+                    path = f"{path}/{op}"
+                handlers.append((path, MemoryProfileHandler, memory_request_initialize_data))
+
         # Register templated request paths for agent API methods:
         # regexp format used here is that of Python Re standard library.
         handlers.append((r"/api/v1/([^/]+)/function", FunctionHandler, request_initialize_data))
@@ -186,6 +253,17 @@ class HttpServer(AgentAuthorizer, AgentStateListener):
     def allow(self, agent_name) -> AsyncAgentServiceProvider:
         return self.allowed_agents.get(agent_name)
 
+    def get_agent_service(self, agent_name: str) -> AsyncAgentService:
+        """
+        :param agent_name: name of an agent
+        :return: The AsyncAgentService serving the agent, created if need be.
+                 None if the agent is not served by this instance.
+        """
+        agent_service_provider: AsyncAgentServiceProvider = self.allow(agent_name)
+        if agent_service_provider is None:
+            return None
+        return agent_service_provider.get_service()
+
     def agent_added(self, agent_name: str, source: AgentStorageSource):
         """
         Add agent to the map of known agents
@@ -0,0 +1,107 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+
+import os
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import UnixConnector
+
+from neuro_san.service.http.server.network_shard_map import NetworkShardMap
+
+# Request header marking a request as already forwarded by another shard.
+# Such requests are always served locally so that they can never bounce around.
+FORWARDED_FROM_SHARD_HEADER: str = "X-Neuro-San-Forwarded-From-Shard"
+
+
+class HttpShardRouter:
+    """
+    Knows which HTTP server worker process owns which agent network
+    and how to reach the other workers.
+
+    Every worker accepts connections on the shared public listen socket,
+    and additionally on a unix domain socket of its own.  Requests for
+    agent networks owned by another worker are forwarded to that
+    worker's unix domain socket.
+    """
+
+    def __init__(self, shard_map: NetworkShardMap, http_port: int, socket_dir: str):
+        """
+        Constructor
+
+        :param shard_map: The NetworkShardMap assigning agent networks to workers
+        :param http_port: The public port of the HTTP server, used to tell apart
+                    the sockets of different servers on the same host
+        :param socket_dir: The directory in which the unix domain sockets of the workers live
+        """
+        self.shard_map: NetworkShardMap = shard_map
+        self.http_port: int = http_port
+        self.socket_dir: str = socket_dir
+        self.shard_index: int = None
+        self.client_sessions: Dict[int, ClientSession] = {}
+
+    def set_shard_index(self, shard_index: int):
+        """
+        :param shard_index: The index of the shard of the worker process we are in.
+                    Only known once worker processes have been forked.
+        """
+        self.shard_index = shard_index
+
+    def get_shard_index(self) -> int:
+        """
+        :return: The index of the shard of the worker process we are in.
+                 None if not yet known.
+        """
+        return self.shard_index
+
+    def get_owner(self, agent_name: str) -> int:
+        """
+        :param agent_name: The name of an agent network
+        :return: The index of the shard owning the agent network
+        """
+        return self.shard_map.get_shard(agent_name)
+
+    def is_local(self, agent_name: str) -> bool:
+        """
+        :param agent_name: The name of an agent network
+        :return: True if requests for the agent network are to be served by this process
+        """
+        if self.shard_index is None:
+            return True
+        return self.get_owner(agent_name) == self.shard_index
+
+    def get_socket_path(self, shard_index: int) -> str:
+        """
+        :param shard_index: The index of a shard
+        :return: The path to the unix domain socket the shard's worker listens on
+        """
+        return os.path.join(self.socket_dir, f"neuro-san-http-{self.http_port}-shard-{shard_index}.sock")
+
+    def get_client_session(self, shard_index: int) -> ClientSession:
+        """
+        Must be called from the event loop of the worker process.
+
+        :param shard_index: The index of a shard
+        :return: A ClientSession which keeps connections open to the worker of the shard
+        """
+        client_session: ClientSession = self.client_sessions.get(shard_index)
+        if client_session is None or client_session.closed:
+            # Streaming chats can take as long as they take.
+            timeout = ClientTimeout(total=None, sock_connect=10)
+            client_session = ClientSession(connector=UnixConnector(path=self.get_socket_path(shard_index)),
+                                           timeout=timeout, auto_decompress=False)
+            self.client_sessions[shard_index] = client_session
+        return client_session
@@ -0,0 +1,123 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import bisect
+import hashlib
+
+# Number of points each shard gets on the consistent hash ring.
+# More points make for a more even spread of networks over shards.
+VIRTUAL_NODES_PER_SHARD: int = 64
+
+
+class NetworkShardMap:
+    """
+    Deterministically assigns agent networks to one of a number of shards
+    (worker processes), so that every worker comes up with the same assignment
+    all on its own, without having to talk to the others.
+
+    Networks which are given a weight are spread over the shards first, heaviest first,
+    each one going to the shard with the least total weight so far.
+
+    All other networks are placed with a consistent hash of their name, so that any
+    network that comes along later lands on the same shard in every worker, and changing
+    the number of shards only moves about 1/N of those networks to a different shard.
+    """
+
+    def __init__(self, num_shards: int, weights: Dict[str, float] = None):
+        """
+        Constructor
+
+        :param num_shards: The number of shards to spread agent networks over
+        :param weights: An optional dictionary of agent network name to a relative weight
+                    describing how much of a worker's capacity the network is expected to use.
+        """
+        if num_shards < 1:
+            raise ValueError(f"Number of shards must be at least 1. Got {num_shards}")
+        self.num_shards: int = num_shards
+
+        # Prepare the consistent hash ring
+        self.ring: List[Tuple[int, int]] = []
+        for shard in range(num_shards):
+            for virtual_node in range(VIRTUAL_NODES_PER_SHARD):
+                self.ring.append((self.hash_key(f"{shard}-{virtual_node}"), shard))
+        self.ring.sort()
+        self.ring_keys: List[int] = [point for point, _ in self.ring]
+
+        # Spread the weighted networks
+        self.weighted_shards: Dict[str, int] = {}
+        shard_loads: List[float] = [0.0] * num_shards
+        if weights is None:
+            weights = {}
+        for agent_name, weight in sorted(weights.items(), key=lambda item: (-item[1], item[0])):
+            shard: int = shard_loads.index(min(shard_loads))
+            self.weighted_shards[agent_name] = shard
+            shard_loads[shard] += weight
+
+    def get_shard(self, agent_name: str) -> int:
+        """
+        :param agent_name: The name of the agent network
+        :return: The index of the shard which owns the agent network
+        """
+        shard: int = self.weighted_shards.get(agent_name)
+        if shard is not None:
+            return shard
+
+        index: int = bisect.bisect(self.ring_keys, self.hash_key(agent_name))
+        if index == len(self.ring):
+            # Wrap around the ring
+            index = 0
+        return self.ring[index][1]
+
+    def get_num_shards(self) -> int:
+        """
+        :return: The number of shards
+        """
+        return self.num_shards
+
+    @staticmethod
+    def hash_key(key: str) -> int:
+        """
+        :param key: The string to hash
+        :return: A hash of the key which is the same in every process.
+                (Python's own hash() of strings is randomized per process.)
+        """
+        digest: bytes = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    @staticmethod
+    def parse_weights(weights_spec: str) -> Dict[str, float]:
+        """
+        :param weights_spec: A space-delimited list of <agent_network>:<weight> pairs,
+                    for example: "music_nerd_pro:4 hello_world:1"
+        :return: A dictionary of agent network name to weight
+        """
+        weights: Dict[str, float] = {}
+        if weights_spec is None:
+            return weights
+
+        for one_weight in weights_spec.split():
+            agent_name, _, weight = one_weight.rpartition(":")
+            try:
+                weights[agent_name] = float(weight)
+            except ValueError as exception:
+                raise ValueError(f"Shard weight '{one_weight}' is not of the form <agent_network>:<weight>") \
+                    from exception
+            if len(agent_name) == 0 or weights[agent_name] < 0.0:
+                raise ValueError(f"Shard weight '{one_weight}' is not of the form <agent_network>:<weight>")
+
+        return weights
@@ -0,0 +1,81 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import re
+import socket
+
+from urllib.parse import unquote_to_bytes
+
+from tornado.httputil import HTTPServerRequest
+from tornado.routing import Matcher
+
+from neuro_san.service.http.server.http_shard_router import FORWARDED_FROM_SHARD_HEADER
+from neuro_san.service.http.server.http_shard_router import HttpShardRouter
+
+AGENT_REQUEST_PATH = re.compile(r"/api/v1/([^/]+)/(function|connectivity|streaming_chat)$")
+
+
+class RemoteShardMatcher(Matcher):
+    """
+    Tornado Matcher for requests to agent networks which are owned by another
+    HTTP server worker process, so that they can be forwarded there.
+    """
+
+    def __init__(self, shard_router: HttpShardRouter):
+        """
+        Constructor
+
+        :param shard_router: The HttpShardRouter knowing who owns which agent network
+        """
+        self.shard_router: HttpShardRouter = shard_router
+
+    def match(self, request: HTTPServerRequest) -> Optional[Dict[str, Any]]:
+        """
+        :param request: The incoming request
+        :return: Handler arguments if the request is to be forwarded to another shard,
+                 None if the request is to be served by this process.
+        """
+        if FORWARDED_FROM_SHARD_HEADER in request.headers:
+            if self.is_from_shard(request):
+                return None
+            # Only other workers talking over our unix domain socket get to say
+            # a request was forwarded.  Anyone else could use that to get around sharding.
+            del request.headers[FORWARDED_FROM_SHARD_HEADER]
+
+        path_match = AGENT_REQUEST_PATH.match(request.path)
+        if path_match is None:
+            return None
+
+        agent_name: bytes = unquote_to_bytes(path_match.group(1))
+        if self.shard_router.is_local(agent_name.decode("utf-8", errors="replace")):
+            return None
+
+        return {
+            "path_args": [agent_name],
+            "path_kwargs": {}
+        }
+
+    @staticmethod
+    def is_from_shard(request: HTTPServerRequest) -> bool:
+        """
+        :param request: The incoming request
+        :return: True if the request came in on a unix domain socket,
+                 which only the other worker processes connect to.
+        """
+        context: Any = getattr(request.connection, "context", None)
+        return getattr(context, "address_family", None) == socket.AF_UNIX
@@ -14,14 +14,17 @@ from typing import Dict
 from typing import List
 
 import os
+import tempfile
 import threading
 
 from argparse import ArgumentParser
+from concurrent.futures import Future
 
 from leaf_server_common.server.server_loop_callbacks import ServerLoopCallbacks
 from leaf_server_common.logging.logging_setup import setup_logging
 
 from neuro_san.interfaces.agent_session import AgentSession
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
@@ -35,9 +38,15 @@ from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_IDLE_C
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_INSTANCES
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
 from neuro_san.service.http.config.http_server_config import HttpServerConfig
+from neuro_san.service.http.server.network_shard_map import NetworkShardMap
 from neuro_san.service.grpc.grpc_agent_server import GrpcAgentServer
+from neuro_san.service.grpc.grpc_aio_agent_server import GrpcAioAgentServer
 from neuro_san.service.grpc.grpc_agent_service import GrpcAgentService
 from neuro_san.service.http.server.http_server import HttpServer
+from neuro_san.service.utils.admission_controller import AdmissionController
+from neuro_san.service.utils.admission_controller import DEFAULT_MAX_QUEUED_REQUESTS
+from neuro_san.service.utils.admission_controller import DEFAULT_QUEUE_TIMEOUT_SECONDS
+from neuro_san.service.utils.network_warmer import NetworkWarmer
 from neuro_san.service.watcher.main_loop.storage_watcher import StorageWatcher
 from neuro_san.service.utils.server_status import ServerStatus
 from neuro_san.service.utils.server_context import ServerContext
@@ -54,6 +63,7 @@ class ServerMainLoop(ServerLoopCallbacks):
         Constructor
         """
         self.grpc_port: int = 0
+        self.grpc_server_mode: str = "sync"
         self.http_port: int = 0
 
         self.agent_networks: Dict[str, AgentNetwork] = {}
@@ -61,6 +71,7 @@ class ServerMainLoop(ServerLoopCallbacks):
         self.server_name: str = DEFAULT_SERVER_NAME
         self.server_name_for_logs: str = DEFAULT_SERVER_NAME_FOR_LOGS
         self.max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
+        self.max_queued_requests: int = DEFAULT_MAX_QUEUED_REQUESTS
         self.request_limit: int = DEFAULT_REQUEST_LIMIT
         self.forwarded_request_metadata: str = GrpcAgentServer.DEFAULT_FORWARDED_REQUEST_METADATA
         self.usage_logger_metadata: str = ""
@@ -70,6 +81,7 @@ class ServerMainLoop(ServerLoopCallbacks):
         self.server_context = ServerContext()
         self.http_server_config = HttpServerConfig()
         self.watcher_config: Dict[str, Any] = {}
+        self.warm_up_networks: bool = False
 
     def prepare_args(self) -> ArgumentParser:
         """
@@ -81,6 +93,11 @@ class ServerMainLoop(ServerLoopCallbacks):
         arg_parser.add_argument("--port", type=int,
                                 default=int(os.environ.get("AGENT_PORT", AgentSession.DEFAULT_PORT)),
                                 help="Port number for the grpc service")
+        arg_parser.add_argument("--grpc_server_mode", type=str, choices=["sync", "aio"],
+                                default=os.environ.get("AGENT_GRPC_SERVER_MODE", "sync"),
+                                help="How the grpc service handles requests: "
+                                     "'sync' uses a thread per concurrent request, "
+                                     "'aio' uses coroutines on an asyncio event loop")
         arg_parser.add_argument("--http_port", type=int,
                                 default=int(os.environ.get("AGENT_HTTP_PORT", AgentSession.DEFAULT_HTTP_PORT)),
                                 help="Port number for http service endpoint")
@@ -94,6 +111,34 @@ class ServerMainLoop(ServerLoopCallbacks):
                                 default=int(os.environ.get("AGENT_MAX_CONCURRENT_REQUESTS",
                                                            self.max_concurrent_requests)),
                                 help="Maximum number of requests that can be served at the same time")
+        arg_parser.add_argument("--max_concurrent_requests_per_network", type=int,
+                                default=int(os.environ.get("AGENT_MAX_CONCURRENT_REQUESTS_PER_NETWORK", "0")),
+                                help="Default maximum number of requests that can be served at the same time "
+                                     "by any single agent network. Value <= 0 means no per-network limit.")
+        arg_parser.add_argument("--max_queued_requests", type=int,
+                                default=int(os.environ.get("AGENT_MAX_QUEUED_REQUESTS",
+                                                           self.max_queued_requests)),
+                                help="Maximum number of requests that can wait for a chance to be served "
+                                     "before new requests are rejected. Value < 0 means no limit.")
+        arg_parser.add_argument("--queued_request_timeout_seconds", type=float,
+                                default=float(os.environ.get("AGENT_QUEUED_REQUEST_TIMEOUT_SECONDS",
+                                                             DEFAULT_QUEUE_TIMEOUT_SECONDS)),
+                                help="Maximum number of seconds a request can wait for a chance to be served "
+                                     "before it is rejected. Value <= 0 means wait forever.")
+        arg_parser.add_argument("--max_queued_messages", type=int,
+                                default=int(os.environ.get("AGENT_MAX_QUEUED_MESSAGES", "0")),
+                                help="Maximum number of messages buffered per request for a client "
+                                     "that is slow to read them. Value of 0 means no limit.")
+        arg_parser.add_argument("--queued_messages_overflow_policy", type=str,
+                                choices=sorted(AsyncCollatingQueue.OVERFLOW_POLICIES),
+                                default=os.environ.get("AGENT_QUEUED_MESSAGES_OVERFLOW_POLICY",
+                                                       AsyncCollatingQueue.BLOCK),
+                                help="What happens when the messages buffered for a request "
+                                     "reach max_queued_messages")
+        arg_parser.add_argument("--batch_queued_messages", type=str, choices=["true", "false"],
+                                default=os.environ.get("AGENT_BATCH_QUEUED_MESSAGES", "false").lower(),
+                                help="When 'true', messages produced within the same tick of an "
+                                     "agent network's event loop are queued with a single operation")
         arg_parser.add_argument("--request_limit", type=int,
                                 default=int(os.environ.get("AGENT_REQUEST_LIMIT", self.request_limit)),
                                 help="Number of requests served before the server shuts down in an orderly fashion")
@@ -133,6 +178,24 @@ class ServerMainLoop(ServerLoopCallbacks):
                                                            DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS)),
                                 help="Http server resources monitoring/logging interval in seconds "
                                      "0 means no logging")
+        arg_parser.add_argument("--http_sharding", type=str, choices=["true", "false"],
+                                default=os.environ.get("AGENT_HTTP_SHARDING", "false").lower(),
+                                help="When 'true' and there is more than one http server instance, "
+                                     "each agent network is served by a single instance and "
+                                     "the other instances forward requests for it there")
+        arg_parser.add_argument("--http_shard_weights", type=str,
+                                default=os.environ.get("AGENT_HTTP_SHARD_WEIGHTS", ""),
+                                help="Space-delimited list of <agent_name>:<weight> pairs used to "
+                                     "spread the given agent networks evenly across http server instances. "
+                                     "Other agent networks are spread by consistent hashing.")
+        arg_parser.add_argument("--http_shard_socket_dir", type=str,
+                                default=os.environ.get("AGENT_HTTP_SHARD_SOCKET_DIR", tempfile.gettempdir()),
+                                help="Directory for the unix domain sockets http server instances "
+                                     "use to forward requests to each other")
+        arg_parser.add_argument("--warm_up_networks", type=str, choices=["true", "false"],
+                                default=os.environ.get("AGENT_WARM_UP_NETWORKS", "false").lower(),
+                                help="When 'true', prepare all registered agent networks for their first "
+                                     "request before the server reports itself as ready")
         return arg_parser
 
     def parse_args(self):
@@ -153,12 +216,22 @@ class ServerMainLoop(ServerLoopCallbacks):
         self.grpc_port = args.port
         if self.grpc_port == 0:
             server_status.grpc_service.set_requested(False)
+        self.grpc_server_mode = args.grpc_server_mode
         self.http_port = args.http_port
         if self.http_port == 0:
             server_status.http_service.set_requested(False)
 
         self.server_name_for_logs = args.server_name_for_logs
         self.max_concurrent_requests = args.max_concurrent_requests
+        self.max_queued_requests = args.max_queued_requests
+        admission_controller = AdmissionController(max_concurrent=self.max_concurrent_requests,
+                                                   max_queued=self.max_queued_requests,
+                                                   queue_timeout_seconds=args.queued_request_timeout_seconds)
+        self.server_context.set_admission_controller(admission_controller)
+        self.server_context.set_network_request_limit(args.max_concurrent_requests_per_network)
+        self.server_context.set_message_queue_args(args.max_queued_messages,
+                                                   args.queued_messages_overflow_policy,
+                                                   args.batch_queued_messages == "true")
         self.request_limit = args.request_limit
         self.forwarded_request_metadata = args.forwarded_request_metadata
         if not self.forwarded_request_metadata:
@@ -170,12 +243,20 @@ class ServerMainLoop(ServerLoopCallbacks):
         if args.manifest_update_period_seconds <= 0:
             # StorageWatcher is disabled:
             server_status.updater.set_requested(False)
+        self.warm_up_networks = args.warm_up_networks == "true"
+        if not self.warm_up_networks:
+            server_status.warmup.set_requested(False)
 
         self.http_server_config.http_connections_backlog = args.http_connections_backlog
         self.http_server_config.http_idle_connection_timeout_seconds = args.http_idle_connections_timeout
         self.http_server_config.http_server_instances = args.http_server_instances
         self.http_server_config.http_server_monitor_interval_seconds = args.http_resources_monitor_interval_seconds
         self.http_server_config.http_port = args.http_port
+        self.http_server_config.http_sharding = args.http_sharding == "true"
+        self.http_server_config.http_shard_weights = NetworkShardMap.parse_weights(args.http_shard_weights)
+        self.http_server_config.http_shard_socket_dir = args.http_shard_socket_dir
+        # Secrets do not belong on command lines, where anyone can see them.
+        self.http_server_config.admin_token = os.environ.get("AGENT_ADMIN_TOKEN")
 
         manifest_restorer = RegistryManifestRestorer()
         manifest_agent_networks: Dict[str, AgentNetwork] = manifest_restorer.restore()
@@ -217,13 +298,17 @@ class ServerMainLoop(ServerLoopCallbacks):
         server_status: ServerStatus = self.server_context.get_server_status()
 
         if server_status.grpc_service.is_requested():
-            self.grpc_server = GrpcAgentServer(
+            grpc_server_class = GrpcAgentServer
+            if self.grpc_server_mode == "aio":
+                grpc_server_class = GrpcAioAgentServer
+            self.grpc_server = grpc_server_class(
                 self.grpc_port,
                 server_loop_callbacks=self,
                 server_context=self.server_context,
                 server_name=self.server_name,
                 server_name_for_logs=self.server_name_for_logs,
                 max_concurrent_requests=self.max_concurrent_requests,
+                max_queued_requests=self.max_queued_requests,
                 request_limit=self.request_limit,
                 forwarded_request_metadata=metadata_str)
             self.grpc_server.prepare_for_serving()
@@ -253,6 +338,9 @@ class ServerMainLoop(ServerLoopCallbacks):
         public_storage: AgentNetworkStorage = network_storage_dict.get("public")
         public_storage.setup_agent_networks(self.agent_networks)
 
+        if self.warm_up_networks:
+            self.warm_up(public_storage)
+
         # Start all services:
         http_server_thread = None
         if server_status.http_service.is_requested():
@@ -265,6 +353,23 @@ class ServerMainLoop(ServerLoopCallbacks):
         if http_server_thread is not None:
             http_server_thread.join()
 
+    def warm_up(self, public_storage: AgentNetworkStorage):
+        """
+        Starts warming up the agent networks.
+        Services are up and serving while networks warm up,
+        but the server does not report itself as ready until that is done.
+        :param public_storage: The AgentNetworkStorage with the agent networks to warm up
+        """
+        warmer = NetworkWarmer(self.server_context.get_server_status())
+        if self.http_server is not None:
+            warmer.add_service_lookup(self.http_server.get_agent_service)
+        if self.grpc_server is not None:
+            warmer.add_service_lookup(self.grpc_server.get_agent_service)
+        warm_up: Future = warmer.start(public_storage)
+        if self.http_server_config.http_server_instances != 1:
+            # Forked http server instances only inherit what is already warm.
+            warm_up.result()
+
     def loop_callback(self) -> bool:
         """
         Periodically called by the main server loop of ServerLifetime.
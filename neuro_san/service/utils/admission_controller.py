@@ -0,0 +1,305 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Deque
+from typing import Dict
+
+import asyncio
+import math
+import threading
+import time
+
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from collections import deque
+
+DEFAULT_MAX_QUEUED_REQUESTS: int = 10
+DEFAULT_QUEUE_TIMEOUT_SECONDS: float = 30.0
+
+
+class AdmissionWaiter:
+    """
+    Bookkeeping for a single request waiting in line for admission.
+    A waiter is either synchronous (waits on a threading.Event)
+    or asynchronous (waits on an asyncio Future bound to a particular event loop).
+    """
+
+    def __init__(self, loop: AbstractEventLoop = None):
+        """
+        Constructor
+
+        :param loop: The event loop an asynchronous waiter is waiting on.
+                    None implies a synchronous waiter.
+        """
+        self.granted: bool = False
+        self.loop: AbstractEventLoop = loop
+        self.event: threading.Event = None
+        self.future: Future = None
+        if loop is None:
+            self.event = threading.Event()
+        else:
+            self.future = loop.create_future()
+
+    def grant(self) -> bool:
+        """
+        Wake up the waiter, handing it the slot being released.
+        Must be called while holding the AdmissionController's lock.
+
+        :return: True if the waiter could be woken up. False otherwise.
+        """
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+            return True
+
+        try:
+            self.loop.call_soon_threadsafe(self._resolve_future)
+        except RuntimeError:
+            # Event loop is already closed. Nobody will ever pick up the slot.
+            self.granted = False
+            return False
+        return True
+
+    def _resolve_future(self):
+        """
+        Called on the waiter's event loop to resolve its future.
+        """
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+# pylint: disable=too-many-instance-attributes
+class AdmissionController:
+    """
+    Limits the number of requests that can be in flight at the same time.
+
+    Requests beyond the concurrency limit wait in a bounded FIFO queue
+    for at most a given number of seconds. Requests that find the queue full
+    or that time out waiting are rejected right away so that the caller can
+    tell its client to back off (gRPC RESOURCE_EXHAUSTED / HTTP 429)
+    instead of piling up buffers and threads on the server.
+
+    Both threads and asyncio coroutines can wait on the same instance,
+    so a single server-wide limit can be shared across the gRPC and
+    http transports.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, max_concurrent: int = 0,
+                 max_queued: int = DEFAULT_MAX_QUEUED_REQUESTS,
+                 queue_timeout_seconds: float = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+                 retry_after_seconds: int = None):
+        """
+        Constructor
+
+        :param max_concurrent: The maximum number of requests admitted at the same time.
+                    A value <= 0 means there is no limit.
+        :param max_queued: The maximum number of requests allowed to wait for admission.
+                    A value < 0 means there is no limit to the queue length.
+        :param queue_timeout_seconds: The maximum number of seconds a request can wait
+                    in the queue before being rejected. A value <= 0 means wait forever.
+        :param retry_after_seconds: The number of seconds rejected clients are told
+                    to wait before retrying.  Default of None is derived from the
+                    queue timeout.
+        """
+        self.max_concurrent: int = max_concurrent
+        self.max_queued: int = max_queued
+        self.queue_timeout_seconds: float = queue_timeout_seconds
+        if retry_after_seconds is None:
+            retry_after_seconds = 1
+            if queue_timeout_seconds is not None and queue_timeout_seconds > 0:
+                retry_after_seconds = max(1, math.ceil(queue_timeout_seconds))
+        self.retry_after_seconds: int = retry_after_seconds
+
+        self.lock = threading.Lock()
+        self.waiters: Deque[AdmissionWaiter] = deque()
+        self.active: int = 0
+
+        # Metrics
+        self.admitted: int = 0
+        self.rejected: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+
+    def get_timeout(self) -> float:
+        """
+        :return: The timeout in seconds to wait in the queue, or None if there is none.
+        """
+        if self.queue_timeout_seconds is None or self.queue_timeout_seconds <= 0:
+            return None
+        return self.queue_timeout_seconds
+
+    def get_wait_timeout(self, max_wait_seconds: float = None) -> float:
+        """
+        :param max_wait_seconds: An upper bound on the number of seconds to wait in the queue,
+                    for instance what is left of a wait already spent elsewhere.
+                    None means only the queue timeout applies.
+        :return: The number of seconds to wait in the queue, or None if there is no limit.
+        """
+        timeout: float = self.get_timeout()
+        if max_wait_seconds is None:
+            return timeout
+        max_wait_seconds = max(0.0, max_wait_seconds)
+        if timeout is None:
+            return max_wait_seconds
+        return min(timeout, max_wait_seconds)
+
+    def get_retry_after_seconds(self) -> int:
+        """
+        :return: The number of seconds rejected clients should wait before retrying
+        """
+        return self.retry_after_seconds
+
+    def acquire(self, max_wait_seconds: float = None) -> float:
+        """
+        Synchronously waits for admission of a single request.
+        Every successful acquire() must be paired with a release().
+
+        :param max_wait_seconds: An upper bound on the number of seconds to wait in the queue.
+                    Default of None means only the queue timeout applies.
+        :return: The number of seconds spent waiting in the queue for admission,
+                or None if the request was rejected.
+        """
+        start_time: float = time.monotonic()
+        waiter: AdmissionWaiter = None
+        with self.lock:
+            if self._try_admit():
+                return self._record_admission(start_time)
+            if self._queue_is_full():
+                self.rejected += 1
+                return None
+            waiter = AdmissionWaiter()
+            self.waiters.append(waiter)
+
+        if not waiter.event.wait(self.get_wait_timeout(max_wait_seconds)):
+            with self.lock:
+                if not waiter.granted:
+                    self.waiters.remove(waiter)
+                    self.rejected += 1
+                    return None
+            # Otherwise we got the slot just as the timeout expired.
+
+        with self.lock:
+            return self._record_admission(start_time)
+
+    async def async_acquire(self, max_wait_seconds: float = None) -> float:
+        """
+        Asynchronously waits for admission of a single request
+        without blocking the event loop.
+        Every successful async_acquire() must be paired with a release().
+
+        :param max_wait_seconds: An upper bound on the number of seconds to wait in the queue.
+                    Default of None means only the queue timeout applies.
+        :return: The number of seconds spent waiting in the queue for admission,
+                or None if the request was rejected.
+        """
+        start_time: float = time.monotonic()
+        waiter: AdmissionWaiter = None
+        with self.lock:
+            if self._try_admit():
+                return self._record_admission(start_time)
+            if self._queue_is_full():
+                self.rejected += 1
+                return None
+            waiter = AdmissionWaiter(asyncio.get_running_loop())
+            self.waiters.append(waiter)
+
+        try:
+            # Shield so a timeout does not cancel a future that could be racing to be granted.
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.get_wait_timeout(max_wait_seconds))
+        except asyncio.TimeoutError:
+            with self.lock:
+                if not waiter.granted:
+                    self.waiters.remove(waiter)
+                    self.rejected += 1
+                    return None
+            # Otherwise we got the slot just as the timeout expired.
+        except asyncio.CancelledError:
+            # The caller went away while waiting.  Do not leak any slot we might have been given.
+            with self.lock:
+                if waiter.granted:
+                    self._release()
+                else:
+                    self.waiters.remove(waiter)
+            raise
+
+        with self.lock:
+            return self._record_admission(start_time)
+
+    def release(self):
+        """
+        Releases the slot of a previously admitted request,
+        handing it to the next request in line, if any.
+        """
+        with self.lock:
+            self._release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of admission metrics
+        """
+        with self.lock:
+            average_wait: float = 0.0
+            if self.admitted > 0:
+                average_wait = self.total_wait_seconds / self.admitted
+            return {
+                "active": self.active,
+                "queued": len(self.waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "average_wait_seconds": average_wait,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+    def _try_admit(self) -> bool:
+        """
+        Must be called while holding the lock.
+        :return: True if a new request could be admitted without waiting.
+        """
+        # Being fair: do not jump the line if others are already waiting.
+        if self.max_concurrent <= 0 or \
+                (self.active < self.max_concurrent and len(self.waiters) == 0):
+            self.active += 1
+            return True
+        return False
+
+    def _queue_is_full(self) -> bool:
+        """
+        Must be called while holding the lock.
+        :return: True if no more requests can wait in line
+        """
+        return 0 <= self.max_queued <= len(self.waiters)
+
+    def _release(self):
+        """
+        Must be called while holding the lock.
+        """
+        while len(self.waiters) > 0:
+            waiter: AdmissionWaiter = self.waiters.popleft()
+            if waiter.grant():
+                # The slot is handed over as-is, so the active count does not change.
+                return
+        self.active = max(0, self.active - 1)
+
+    def _record_admission(self, start_time: float) -> float:
+        """
+        Must be called while holding the lock.
+        :param start_time: The monotonic time at which the request started waiting
+        :return: The number of seconds the request waited for admission
+        """
+        wait_seconds: float = time.monotonic() - start_time
+        self.admitted += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        return wait_seconds
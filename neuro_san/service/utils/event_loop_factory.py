@@ -0,0 +1,89 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from asyncio import AbstractEventLoop
+from types import ModuleType
+
+import asyncio
+import importlib
+import logging
+import os
+
+AUTO: str = "auto"
+UVLOOP: str = "uvloop"
+ASYNCIO: str = "asyncio"
+
+
+class EventLoopFactory:
+    """
+    Creates the asyncio event loops that the servers run on.
+
+    By default the faster uvloop implementation is used whenever it is installed,
+    falling back to the standard asyncio event loop when it is not.
+    The choice can be forced with the AGENT_EVENT_LOOP env var,
+    whose values can be "auto" (the default), "uvloop" or "asyncio".
+
+    Loops are created one at a time for the thread that is to run them,
+    rather than by installing a process-wide event loop policy,
+    so nothing else in the process is affected.
+    """
+
+    def __init__(self, implementation: str = None):
+        """
+        Constructor
+
+        :param implementation: One of "auto", "uvloop" or "asyncio".
+                    Default of None reads the AGENT_EVENT_LOOP env var.
+        """
+        if implementation is None:
+            implementation = os.environ.get("AGENT_EVENT_LOOP", AUTO)
+        implementation = implementation.strip().lower()
+        if implementation not in (AUTO, UVLOOP, ASYNCIO):
+            raise ValueError(f"Unknown event loop implementation '{implementation}'. "
+                             f"Expected one of '{AUTO}', '{UVLOOP}' or '{ASYNCIO}'.")
+
+        self.uvloop: ModuleType = None
+        if implementation != ASYNCIO:
+            try:
+                self.uvloop = importlib.import_module(UVLOOP)
+            except ImportError:
+                if implementation == UVLOOP:
+                    logger = logging.getLogger(self.__class__.__name__)
+                    logger.warning("AGENT_EVENT_LOOP asks for uvloop but it is not installed. "
+                                   "Using the asyncio event loop instead.")
+
+    def get_implementation_name(self) -> str:
+        """
+        :return: The name of the implementation actually in use
+        """
+        if self.uvloop is not None:
+            return UVLOOP
+        return ASYNCIO
+
+    def new_event_loop(self) -> AbstractEventLoop:
+        """
+        :return: A new event loop that is not yet set for any thread
+        """
+        if self.uvloop is not None:
+            return self.uvloop.new_event_loop()
+        return asyncio.new_event_loop()
+
+    def set_new_event_loop(self) -> AbstractEventLoop:
+        """
+        Creates a new event loop and sets it as the current one for the calling thread.
+        :return: The new event loop
+        """
+        loop: AbstractEventLoop = self.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
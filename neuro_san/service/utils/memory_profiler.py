@@ -0,0 +1,327 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+import gc
+import os
+import threading
+import tracemalloc
+
+from collections import OrderedDict
+
+import psutil
+
+# Class names whose live instances are counted when no others are asked for.
+# Names match any class of the same name in an object's class hierarchy,
+# so subclasses are counted too, without having to import anything.
+DEFAULT_COUNTED_TYPES: List[str] = [
+    "DataDrivenChatSession",
+    "AsyncCollatingQueue",
+    "AgentExecutor",
+    "BaseMessage",
+]
+
+# Snapshots can be large, so only so many are kept around
+MAX_SNAPSHOTS: int = 8
+
+GROUP_BY_CHOICES: List[str] = ["lineno", "filename", "traceback"]
+
+# Allocations made by the machinery itself are not interesting
+IGNORED_FILE_PATTERNS: List[str] = [
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+]
+
+
+class MemoryProfiler:
+    """
+    Process-wide switchboard for finding out where server memory goes:
+
+        * tracemalloc tracing, turned on and off at run time
+        * named tracemalloc snapshots, and the differences between them and now
+        * top allocators by file and line
+        * counts of live objects of given classes
+        * per-request peak allocation, sampled for some fraction of requests
+
+    When tracing is off (the default) nothing here costs more than checking a flag.
+    """
+
+    # Lazily created instance shared by everyone in the process
+    shared: "MemoryProfiler" = None
+    shared_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+        self.sample_every: int = 0
+        self.num_requests: int = 0
+        self.num_sampling: int = 0
+        self.request_samples: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def get_shared() -> "MemoryProfiler":
+        """
+        :return: The MemoryProfiler instance shared across the process
+        """
+        if MemoryProfiler.shared is None:
+            with MemoryProfiler.shared_lock:
+                if MemoryProfiler.shared is None:
+                    MemoryProfiler.shared = MemoryProfiler()
+        return MemoryProfiler.shared
+
+    def configure(self, tracing: bool = None, frames: int = None, request_sample_rate: float = None):
+        """
+        Changes what is being profiled. Arguments left as None are left as they are.
+
+        :param tracing: True to start tracing allocations, False to stop.
+                    Stopping drops all snapshots and request samples.
+        :param frames: The number of stack frames to keep for each traced allocation.
+                    Changing this restarts tracing, as tracemalloc cannot change it on the fly.
+        :param request_sample_rate: The fraction of requests between 0.0 and 1.0 to sample
+                    the peak allocation for while tracing. 0.0 turns sampling off.
+        """
+        if frames is not None and frames < 1:
+            raise ValueError(f"Number of frames must be at least 1. Got {frames}")
+        if request_sample_rate is not None and not 0.0 <= request_sample_rate <= 1.0:
+            raise ValueError(f"Request sample rate must be between 0.0 and 1.0. Got {request_sample_rate}")
+
+        with self.lock:
+            if request_sample_rate is not None:
+                self.sample_every = 0
+                if request_sample_rate > 0.0:
+                    self.sample_every = max(1, round(1.0 / request_sample_rate))
+
+            if tracing is None:
+                tracing = tracemalloc.is_tracing()
+            restart: bool = frames is not None and tracemalloc.is_tracing() and \
+                frames != tracemalloc.get_traceback_limit()
+
+            if restart or (not tracing and tracemalloc.is_tracing()):
+                tracemalloc.stop()
+                self.snapshots.clear()
+                self.request_samples.clear()
+                self.num_sampling = 0
+
+            if tracing and not tracemalloc.is_tracing():
+                tracemalloc.start(frames or 1)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary describing the memory use of the process
+                 and what is being profiled
+        """
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        request_sample_rate: float = 0.0
+        if self.sample_every > 0:
+            request_sample_rate = 1.0 / self.sample_every
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": psutil.Process().memory_info().rss,
+            "tracing": tracemalloc.is_tracing(),
+            "frames": tracemalloc.get_traceback_limit(),
+            "traced_bytes": current_bytes,
+            "traced_peak_bytes": peak_bytes,
+            "tracing_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "request_sample_rate": request_sample_rate,
+            "snapshots": list(self.snapshots.keys()),
+        }
+
+    def take_snapshot(self, name: str) -> Dict[str, Any]:
+        """
+        Takes a snapshot of all traced allocations to later compare against.
+        The oldest snapshot is dropped when there are too many.
+
+        :param name: The name to keep the snapshot under. Any previous snapshot
+                    of the same name is replaced.
+        :return: A dictionary describing the snapshot
+        """
+        snapshot: tracemalloc.Snapshot = self.get_current_snapshot()
+        with self.lock:
+            self.snapshots.pop(name, None)
+            self.snapshots[name] = snapshot
+            while len(self.snapshots) > MAX_SNAPSHOTS:
+                self.snapshots.popitem(last=False)
+
+        return {
+            "name": name,
+            "traced_bytes": sum(trace.size for trace in snapshot.traces),
+            "num_traces": len(snapshot.traces),
+        }
+
+    def get_top_allocators(self, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        :param limit: The maximum number of allocators to report
+        :param group_by: How to group allocations: "lineno", "filename" or "traceback"
+        :return: A list of dictionaries describing where the most memory
+                 currently allocated was allocated, biggest first.
+        """
+        self.check_group_by(group_by)
+        snapshot: tracemalloc.Snapshot = self.get_current_snapshot()
+        statistics: List[tracemalloc.Statistic] = snapshot.statistics(group_by)
+        return [self.describe_statistic(statistic) for statistic in statistics[:limit]]
+
+    def compare_to_snapshot(self, name: str, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        :param name: The name of a snapshot taken earlier
+        :param limit: The maximum number of allocators to report
+        :param group_by: How to group allocations: "lineno", "filename" or "traceback"
+        :return: A list of dictionaries describing where allocated memory
+                 has changed the most since the snapshot, biggest change first.
+        """
+        self.check_group_by(group_by)
+        old_snapshot: tracemalloc.Snapshot = self.snapshots.get(name)
+        if old_snapshot is None:
+            raise KeyError(f"No snapshot named '{name}'")
+        snapshot: tracemalloc.Snapshot = self.get_current_snapshot()
+        differences: List[tracemalloc.StatisticDiff] = snapshot.compare_to(old_snapshot, group_by)
+        return [self.describe_statistic(difference) for difference in differences[:limit]]
+
+    @staticmethod
+    def count_objects(type_names: Sequence[str] = None) -> Dict[str, int]:
+        """
+        Counts live objects after a garbage collection.
+        This walks every object the garbage collector knows about, so it takes a while on big heaps.
+
+        :param type_names: The class names to count instances of, including instances of subclasses.
+                    Default of None counts DEFAULT_COUNTED_TYPES.
+        :return: A dictionary of class name to number of live instances
+        """
+        if type_names is None:
+            type_names = DEFAULT_COUNTED_TYPES
+        counts: Dict[str, int] = {type_name: 0 for type_name in type_names}
+
+        gc.collect()
+        matches_by_type: Dict[type, List[str]] = {}
+        for obj in gc.get_objects():
+            obj_type: type = type(obj)
+            matches: List[str] = matches_by_type.get(obj_type)
+            if matches is None:
+                matches = [one_class.__name__ for one_class in obj_type.__mro__ if one_class.__name__ in counts]
+                matches_by_type[obj_type] = matches
+            for match in matches:
+                counts[match] += 1
+
+        return counts
+
+    def start_request_sample(self) -> int:
+        """
+        Called when a request starts.
+
+        :return: The number of bytes traced when the request started if the request
+                 is to be sampled, None otherwise. To be handed to finish_request_sample().
+        """
+        if self.sample_every <= 0 or not tracemalloc.is_tracing():
+            return None
+
+        with self.lock:
+            self.num_requests += 1
+            if self.num_requests % self.sample_every != 0:
+                return None
+            if self.num_sampling == 0:
+                tracemalloc.reset_peak()
+            self.num_sampling += 1
+            current_bytes, _ = tracemalloc.get_traced_memory()
+        return current_bytes
+
+    def finish_request_sample(self, key: str, start_bytes: int):
+        """
+        Called when a request finishes.
+
+        Requests which run at the same time share the same peak,
+        so the peak recorded for any one of them is an upper bound.
+
+        :param key: What to file the sample under, usually the agent network name
+        :param start_bytes: The value returned from start_request_sample()
+        """
+        if start_bytes is None:
+            return
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        with self.lock:
+            self.num_sampling = max(0, self.num_sampling - 1)
+            if not tracemalloc.is_tracing():
+                return
+
+            peak_bytes = max(0, peak_bytes - start_bytes)
+            samples: Dict[str, Any] = self.request_samples.setdefault(key, {
+                "num_samples": 0,
+                "max_peak_bytes": 0,
+                "total_peak_bytes": 0,
+            })
+            samples["num_samples"] += 1
+            samples["max_peak_bytes"] = max(samples["max_peak_bytes"], peak_bytes)
+            samples["total_peak_bytes"] += peak_bytes
+            samples["last_peak_bytes"] = peak_bytes
+            samples["last_retained_bytes"] = current_bytes - start_bytes
+
+    def get_request_samples(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: A dictionary of key to statistics about the peak allocation
+                 of sampled requests filed under that key.
+        """
+        with self.lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for key, samples in self.request_samples.items():
+                result[key] = dict(samples)
+                result[key]["average_peak_bytes"] = samples["total_peak_bytes"] // samples["num_samples"]
+        return result
+
+    @staticmethod
+    def get_current_snapshot() -> tracemalloc.Snapshot:
+        """
+        :return: A snapshot of what is currently allocated, leaving out allocations of no interest.
+        """
+        if not tracemalloc.is_tracing():
+            raise ValueError("Memory tracing is off")
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, pattern) for pattern in IGNORED_FILE_PATTERNS])
+
+    @staticmethod
+    def check_group_by(group_by: str):
+        """
+        :param group_by: The grouping asked for
+        """
+        if group_by not in GROUP_BY_CHOICES:
+            raise ValueError(f"Unknown grouping '{group_by}'. Expected one of {GROUP_BY_CHOICES}")
+
+    @staticmethod
+    def describe_statistic(statistic: Any) -> Dict[str, Any]:
+        """
+        :param statistic: A tracemalloc Statistic or StatisticDiff
+        :return: A dictionary describing the statistic
+        """
+        # Frames go from the oldest to the one doing the allocating
+        frame: tracemalloc.Frame = statistic.traceback[-1]
+        description: Dict[str, Any] = {
+            "file": frame.filename,
+            "line": frame.lineno,
+            "size_bytes": statistic.size,
+            "count": statistic.count,
+        }
+        if isinstance(statistic, tracemalloc.StatisticDiff):
+            description["size_diff_bytes"] = statistic.size_diff
+            description["count_diff"] = statistic.count_diff
+        if len(statistic.traceback) > 1:
+            description["traceback"] = [f"{one_frame.filename}:{one_frame.lineno}"
+                                        for one_frame in statistic.traceback]
+        return description
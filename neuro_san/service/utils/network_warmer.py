@@ -0,0 +1,273 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import logging
+import threading
+import time
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from neuro_san.internals.graph.activations.abstract_class_activation import AbstractClassActivation
+from neuro_san.internals.graph.activations.calling_activation import CallingActivation
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.graph.registry.agent_tool_registry import AgentToolRegistry
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
+from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
+from neuro_san.internals.run_context.factory.master_toolbox_factory import MasterToolboxFactory
+from neuro_san.internals.run_context.langchain.core.langchain_openai_function_tool \
+    import LangChainOpenAIFunctionTool
+from neuro_san.internals.run_context.langchain.core.precompiled_agent_cache import PrecompiledAgentCache
+from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
+from neuro_san.service.utils.server_status import ServerStatus
+
+
+class NetworkWarmer(AgentStateListener):
+    """
+    Builds the artifacts that the first request to an agent network would
+    otherwise have to pay for, without calling any LLM:
+
+        * The per-network service along with its loaded llm and toolbox factories
+        * The classes of the network's CodedTools and toolbox tools
+        * An LLM client for every llm_config (and fallback) in the network
+        * The prompt templates and tool schemas shared between requests
+
+    All registered networks are warmed up once at server start, after which
+    the server status reports the server as ready.  As an AgentStateListener,
+    networks that are added or modified later on by manifest reloads
+    are warmed up again in the background as they arrive.
+
+    Warming up is a best-effort affair.  Anything that fails is logged
+    and left for the first request to run into properly.
+    """
+
+    def __init__(self, server_status: ServerStatus = None):
+        """
+        Constructor
+
+        :param server_status: The ServerStatus whose warmup status is to be set
+                    once the initial warm-up is done. Can be None.
+        """
+        self.server_status: ServerStatus = server_status
+        self.service_lookups: List[Callable[[str], Any]] = []
+        self.warm_up_seconds: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # One thread is enough. Warming up is about getting things done
+        # before requests arrive, not about competing with them.
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NetworkWarmer")
+
+    def add_service_lookup(self, service_lookup: Callable[[str], Any]):
+        """
+        :param service_lookup: A function which takes an agent name and returns
+                    the service that will handle requests for that agent,
+                    or None if there is no such service.  The service is expected to
+                    have llm_factory and toolbox_factory members.
+        """
+        self.service_lookups.append(service_lookup)
+
+    def start(self, storage: AgentNetworkStorage) -> Future:
+        """
+        Starts warming up all networks in the storage in the background
+        and keeps warming up networks that get added to it later on.
+
+        :param storage: The AgentNetworkStorage whose networks are to be warmed up
+        :return: A Future whose result is the dictionary returned by warm_up()
+        """
+        storage.add_listener(self)
+        return self.executor.submit(self.warm_up, storage)
+
+    def warm_up(self, storage: AgentNetworkStorage) -> Dict[str, float]:
+        """
+        Warms up all networks in the storage, and then
+        reports the warm-up as done to the server status.
+
+        :param storage: The AgentNetworkStorage whose networks are to be warmed up
+        :return: A dictionary of agent network name to the seconds it took to warm it up
+        """
+        start_time: float = time.monotonic()
+        for agent_name in storage.get_agent_names():
+            self.warm_up_network(agent_name, storage)
+
+        if self.server_status is not None:
+            self.server_status.warmup.set_status(True)
+        self.logger.info("Warmed up %d agent networks in %.3f seconds",
+                         len(self.warm_up_seconds), time.monotonic() - start_time)
+        return self.get_warm_up_seconds()
+
+    def warm_up_network(self, agent_name: str, source: AgentStorageSource) -> float:
+        """
+        :param agent_name: The name of the agent network to warm up
+        :param source: The AgentStorageSource the agent network comes from
+        :return: The number of seconds it took to warm up the agent network
+        """
+        start_time: float = time.monotonic()
+        try:
+            agent_network: AgentNetwork = source.get_agent_network_provider(agent_name).get_agent_network()
+            if agent_network is None:
+                # Removed in the meantime
+                return 0.0
+            for llm_factory, toolbox_factory in self.get_factories(agent_name, agent_network):
+                self.warm_up_agents(agent_network, llm_factory, toolbox_factory)
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            self.logger.warning("Could not warm up agent network %s: %s", agent_name, exception)
+
+        seconds: float = time.monotonic() - start_time
+        with self.lock:
+            self.warm_up_seconds[agent_name] = seconds
+        self.logger.info("Warmed up agent network %s in %.3f seconds", agent_name, seconds)
+        return seconds
+
+    def get_factories(self, agent_name: str, agent_network: AgentNetwork) \
+            -> List[Tuple[ContextTypeLlmFactory, ContextTypeToolboxFactory]]:
+        """
+        :param agent_name: The name of the agent network
+        :param agent_network: The AgentNetwork itself
+        :return: A list of (llm_factory, toolbox_factory) pairs that requests
+                to the agent network will use. Getting these from the services
+                creates the services (and loads their factories) as a side effect.
+        """
+        factories: List[Tuple[ContextTypeLlmFactory, ContextTypeToolboxFactory]] = []
+        for service_lookup in self.service_lookups:
+            service: Any = service_lookup(agent_name)
+            if service is not None:
+                factories.append((service.llm_factory, service.toolbox_factory))
+
+        if len(factories) == 0:
+            # No server to ask. Warm up what is shared across the process with our own factories.
+            config: Dict[str, Any] = agent_network.get_config()
+            llm_factory: ContextTypeLlmFactory = MasterLlmFactory.create_llm_factory(config)
+            toolbox_factory: ContextTypeToolboxFactory = MasterToolboxFactory.create_toolbox_factory(config)
+            if llm_factory is not None:
+                llm_factory.load()
+            if toolbox_factory is not None:
+                toolbox_factory.load()
+            factories.append((llm_factory, toolbox_factory))
+
+        return factories
+
+    def warm_up_agents(self, agent_network: AgentNetwork,
+                       llm_factory: ContextTypeLlmFactory,
+                       toolbox_factory: ContextTypeToolboxFactory):
+        """
+        Warms up every agent in an agent network.
+
+        :param agent_network: The AgentNetwork to warm up
+        :param llm_factory: The ContextTypeLlmFactory requests will use to create llms. Can be None.
+        :param toolbox_factory: The ContextTypeToolboxFactory requests will use to create tools. Can be None.
+        """
+        registry = AgentToolRegistry(agent_network)
+        agent_tool_path: str = registry.get_agent_tool_path()
+        config: Dict[str, Any] = agent_network.get_config()
+
+        for agent_spec in config.get("tools", []):
+            agent_name: str = agent_network.get_name_from_spec(agent_spec)
+            try:
+                self.warm_up_agent(agent_name, agent_spec, config, agent_tool_path, llm_factory, toolbox_factory)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.logger.warning("Could not warm up agent %s of agent network %s: %s",
+                                    agent_name, agent_network.get_network_name(), exception)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @staticmethod
+    def warm_up_agent(agent_name: str, agent_spec: Dict[str, Any], config: Dict[str, Any],
+                      agent_tool_path: str,
+                      llm_factory: ContextTypeLlmFactory,
+                      toolbox_factory: ContextTypeToolboxFactory):
+        """
+        Warms up a single agent the way a request would build it, short of calling anything.
+
+        :param agent_name: The name of the agent
+        :param agent_spec: The agent's spec from the agent network
+        :param config: The config of the entire agent network
+        :param agent_tool_path: The agent tool path of the agent network
+        :param llm_factory: The ContextTypeLlmFactory requests will use to create llms. Can be None.
+        :param toolbox_factory: The ContextTypeToolboxFactory requests will use to create tools. Can be None.
+        """
+        if ExternalAgentParsing.is_external_agent(agent_name):
+            # Would need to call another server
+            return
+
+        function_json: Dict[str, Any] = agent_spec.get("function")
+        class_name: str = agent_spec.get("class")
+        toolbox: str = agent_spec.get("toolbox")
+        if toolbox and toolbox_factory is not None:
+            tool: Any = toolbox_factory.create_tool_from_toolbox(toolbox, agent_spec.get("args"), agent_name)
+            if isinstance(tool, Dict):
+                # A shared CodedTool whose function spec lives in the toolbox
+                function_json = tool
+                class_name = toolbox_factory.get_shared_coded_tool_class(toolbox)
+
+        if class_name:
+            AbstractClassActivation.resolve_class(class_name, agent_tool_path)
+
+        if function_json:
+            # Runtime sets the name on the function spec itself. Do that on a copy here.
+            function_json = dict(function_json)
+            function_json["name"] = agent_name
+            function_tool = LangChainOpenAIFunctionTool.from_function_json(function_json, None)
+            function_tool.get_tool_definition()
+
+        instructions: str = agent_spec.get("instructions")
+        if instructions and llm_factory is not None:
+            PrecompiledAgentCache.get_shared().get_prompt_template(instructions)
+
+            run_context_config: Dict[str, Any] = \
+                CallingActivation.prepare_run_context_config(config, agent_spec.get("llm_config"))
+            llm_config: Dict[str, Any] = run_context_config.get("llm_config")
+            for fallback in llm_config.get("fallbacks", [llm_config]):
+                llm_factory.create_llm(fallback)
+
+    def get_warm_up_seconds(self) -> Dict[str, float]:
+        """
+        :return: A dictionary of agent network name to the seconds it most recently took to warm it up
+        """
+        with self.lock:
+            return dict(self.warm_up_seconds)
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.executor.submit(self.warm_up_network, agent_name, source)
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.executor.submit(self.warm_up_network, agent_name, source)
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        with self.lock:
+            self.warm_up_seconds.pop(agent_name, None)
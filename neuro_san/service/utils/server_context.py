@@ -10,11 +10,14 @@
 #
 # END COPYRIGHT
 
+from typing import Any
 from typing import Dict
 
 from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
 
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.utils.admission_controller import AdmissionController
 from neuro_san.service.utils.server_status import ServerStatus
 
 
@@ -30,6 +33,15 @@ class ServerContext:
         self.server_status: ServerStatus = None
         self.executor_pool = AsyncioExecutorPool(reuse_mode=True)
 
+        # Server-wide admission control shared by all transports.
+        # By default there is no limit.
+        self.admission_controller = AdmissionController()
+        self.network_request_limit: int = 0
+
+        # Keyword arguments for the AsyncCollatingQueue of each request.
+        # By default, the queue is unbounded.
+        self.message_queue_args: Dict[str, Any] = {}
+
         # Dictionary is string key (describing scope) to AgentNetworkStorage grouping.
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = {
             "public": AgentNetworkStorage()
@@ -53,6 +65,68 @@ class ServerContext:
         """
         return self.server_status
 
+    def set_admission_controller(self, admission_controller: AdmissionController):
+        """
+        Sets the server-wide AdmissionController
+        """
+        self.admission_controller = admission_controller
+
+    def get_admission_controller(self) -> AdmissionController:
+        """
+        :return: The server-wide AdmissionController
+        """
+        return self.admission_controller
+
+    def set_network_request_limit(self, network_request_limit: int):
+        """
+        Sets the default maximum number of concurrent requests for any single agent network.
+        A value <= 0 means there is no per-network limit.
+        """
+        self.network_request_limit = network_request_limit
+
+    def create_network_admission_controller(self, max_concurrent: int = None) -> AdmissionController:
+        """
+        Creates an AdmissionController for a single agent network which
+        shares its queueing policy with the server-wide AdmissionController.
+
+        :param max_concurrent: An agent-network-specific concurrency limit.
+                    Default of None uses the server's per-network default.
+        :return: A new AdmissionController
+        """
+        if max_concurrent is None:
+            max_concurrent = self.network_request_limit
+        server: AdmissionController = self.admission_controller
+        return AdmissionController(max_concurrent=max_concurrent,
+                                   max_queued=server.max_queued,
+                                   queue_timeout_seconds=server.queue_timeout_seconds,
+                                   retry_after_seconds=server.get_retry_after_seconds())
+
+    def set_message_queue_args(self, max_size: int, overflow_policy: str, batch_messages: bool):
+        """
+        Sets how the messages of each request are queued for its client.
+
+        :param max_size: The maximum number of messages buffered per request.
+                    A value of 0 means no limit.
+        :param overflow_policy: What happens when the queue is full.
+                    One of AsyncCollatingQueue.OVERFLOW_POLICIES.
+        :param batch_messages: When True, messages produced within the same tick of the
+                    event loop are queued with a single operation.
+        """
+        if overflow_policy not in AsyncCollatingQueue.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow_policy {overflow_policy}. "
+                             f"Expected one of {sorted(AsyncCollatingQueue.OVERFLOW_POLICIES)}")
+        self.message_queue_args = {
+            "max_size": max_size,
+            "overflow_policy": overflow_policy,
+            "batch_messages": batch_messages
+        }
+
+    def get_message_queue_args(self) -> Dict[str, Any]:
+        """
+        :return: The keyword arguments for the AsyncCollatingQueue of each request
+        """
+        return self.message_queue_args
+
     def get_network_storage_dict(self) -> Dict[str, AgentNetworkStorage]:
         """
         :return: The Network Storage dictionary
@@ -27,6 +27,7 @@ class ServerStatus:
         self.grpc_service: ServiceStatus = ServiceStatus("gRPC")
         self.http_service: ServiceStatus = ServiceStatus("http")
         self.updater: ServiceStatus = ServiceStatus("updater")
+        self.warmup: ServiceStatus = ServiceStatus("warmup")
 
     def is_server_live(self) -> bool:
         """
@@ -42,7 +43,8 @@ class ServerStatus:
         return \
             (not self.grpc_service.is_requested() or self.grpc_service.is_ready()) and \
             (not self.http_service.is_requested() or self.http_service.is_ready()) and \
-            (not self.updater.is_requested() or self.updater.is_ready())
+            (not self.updater.is_requested() or self.updater.is_ready()) and \
+            (not self.warmup.is_requested() or self.warmup.is_ready())
 
     def get_server_name(self) -> str:
         """
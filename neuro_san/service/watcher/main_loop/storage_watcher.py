@@ -87,21 +87,27 @@ class StorageWatcher(Startable):
         for storage_updater in self.storage_updaters:
             storage_updater.start()
 
+        # Starting can change how updaters want to be called,
+        # for instance when one needs to fall back to polling.
+        self.update_period_in_seconds = self.compute_update_period_in_seconds(self.storage_updaters)
+
         self.updater_thread.start()
 
     def _run(self):
         """
         Function runs manifest file update cycle.
         """
+        server_status: ServerStatus = self.server_context.get_server_status()
+        server_status.updater.set_status(True)
+
         if self.update_period_in_seconds <= 0:
-            # We should not run at all.
+            # Nobody needs periodic calls. Any updating is event driven.
             return
 
         # Initial value entering the loop
         sleep_for_seconds: float = self.update_period_in_seconds
         while self.keep_running:
 
-            server_status: ServerStatus = self.server_context.get_server_status()
             server_status.updater.set_status(True)
 
             sleep(sleep_for_seconds)
@@ -0,0 +1,139 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+import logging
+import threading
+import time
+
+
+# pylint: disable=too-many-instance-attributes
+class ChangeDebouncer:
+    """
+    Coalesces bursts of change notifications into a single call of a callback.
+
+    The callback is called once things have been quiet for a short while after
+    the last notification, so that a burst of file system events (like an editor's
+    save-and-rename sequence or a git checkout) results in a single reload.
+    So that a steady stream of changes cannot put off the callback forever,
+    it is also called once the first notification of a burst gets too old.
+    """
+
+    def __init__(self, callback: Callable[[], Any],
+                 quiet_seconds: float,
+                 max_delay_seconds: float = None):
+        """
+        Constructor
+
+        :param callback: The no-args callable to call once per burst of notifications
+        :param quiet_seconds: The number of seconds without any notification
+                    after which the callback is called.
+        :param max_delay_seconds: The maximum number of seconds between the first
+                    notification of a burst and the callback being called.
+                    Default of None means there is no maximum.
+        """
+        self.callback: Callable[[], Any] = callback
+        self.quiet_seconds: float = quiet_seconds
+        self.max_delay_seconds: float = max_delay_seconds
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.condition = threading.Condition()
+        self.first_notification: float = None
+        self.last_notification: float = None
+        self.keep_running: bool = True
+        self.thread: threading.Thread = None
+
+        # Metrics
+        self.notification_count: int = 0
+        self.callback_count: int = 0
+
+    def start(self):
+        """
+        Start waiting for notifications
+        """
+        self.thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop waiting for notifications. Any burst in progress does not get its callback.
+        """
+        with self.condition:
+            self.keep_running = False
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def notify(self):
+        """
+        Notify of a single change. Returns right away.
+        """
+        now: float = time.monotonic()
+        with self.condition:
+            self.notification_count += 1
+            if self.first_notification is None:
+                self.first_notification = now
+            self.last_notification = now
+            self.condition.notify()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: A dictionary of debouncing metrics
+        """
+        with self.condition:
+            return {
+                "notifications": self.notification_count,
+                "callbacks": self.callback_count,
+            }
+
+    def _get_deadline(self) -> float:
+        """
+        Must be called while holding the condition.
+        :return: The monotonic time at which the callback for the current burst is due
+        """
+        deadline: float = self.last_notification + self.quiet_seconds
+        if self.max_delay_seconds is not None:
+            deadline = min(deadline, self.first_notification + self.max_delay_seconds)
+        return deadline
+
+    def _run(self):
+        """
+        Main loop of the debouncing thread
+        """
+        while True:
+            with self.condition:
+                # Wait for a burst to be due
+                while self.keep_running:
+                    if self.first_notification is None:
+                        self.condition.wait()
+                        continue
+                    wait_seconds: float = self._get_deadline() - time.monotonic()
+                    if wait_seconds <= 0:
+                        break
+                    self.condition.wait(wait_seconds)
+
+                if not self.keep_running:
+                    return
+
+                self.first_notification = None
+                self.last_notification = None
+                self.callback_count += 1
+
+            # Call outside the lock so notifications can keep coming while we work
+            try:
+                self.callback()
+            except Exception:       # pylint: disable=broad-exception-caught
+                self.logger.exception("Error handling changes")
@@ -10,6 +10,8 @@
 #
 # END COPYRIGHT
 
+from typing import Any
+from typing import Callable
 from typing import Tuple
 
 import logging
@@ -27,22 +29,39 @@ class EventRegistryObserver(RegistryObserver):
     Observer class for manifest file and its directory.
     """
 
-    def __init__(self, manifest_path: str):
+    def __init__(self, manifest_path: str, on_change: Callable[[], Any] = None):
+        """
+        Constructor
+
+        :param manifest_path: The path to the manifest file whose directory is observed
+        :param on_change: An optional no-args callable which is called from
+                    the observer's thread every time a relevant change is seen.
+        """
         self.manifest_path: str = str(Path(manifest_path).resolve())
         self.registry_path: str = str(Path(self.manifest_path).parent)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.observer: Observer = Observer()
-        self.event_handler: RegistryChangeHandler = RegistryChangeHandler()
+        self.event_handler: RegistryChangeHandler = RegistryChangeHandler(on_change)
 
     def start(self):
         """
-        Start running observer
+        Start running observer.
+        Can raise OSError when the native file system notification facility
+        is not available or is out of resources (for instance inotify watch limits).
         """
         self.observer.schedule(self.event_handler, path=self.registry_path, recursive=False)
         self.observer.start()
         self.logger.info("Registry watchdog started on: %s for manifest %s",
                          self.registry_path, self.manifest_path)
 
+    def stop(self):
+        """
+        Stop running observer
+        """
+        if self.observer.is_alive():
+            self.observer.stop()
+            self.observer.join()
+
     def reset_event_counters(self) -> Tuple[int, int, int]:
         """
         Reset event counters and return current counters.
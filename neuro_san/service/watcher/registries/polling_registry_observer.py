@@ -44,6 +44,14 @@ class PollingRegistryObserver(RegistryObserver):
         self.logger.info("Registry polling watchdog started on: %s for manifest %s with polling every %d sec",
                          self.registry_path, self.manifest_path, self.poll_seconds)
 
+    def stop(self):
+        """
+        Stop running observer
+        """
+        if self.observer.is_alive():
+            self.observer.stop()
+            self.observer.join()
+
     def reset_event_counters(self) -> Tuple[int, int, int]:
         """
         Reset event counters and return current counters.
@@ -10,6 +10,8 @@
 #
 # END COPYRIGHT
 
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Tuple
 
@@ -28,10 +30,15 @@ class RegistryChangeHandler(FileSystemEventHandler):
     CREATED = "created"
     DELETED = "deleted"
 
-    def __init__(self):
+    def __init__(self, on_change: Callable[[], Any] = None):
         """
         Constructor.
+
+        :param on_change: An optional no-args callable which is called
+                    every time a relevant event has been counted.
+                    This allows for reacting to changes without polling the counters.
         """
+        self.on_change: Callable[[], Any] = on_change
         self.logger = logging.getLogger(self.__class__.__name__)
         self.lock: Lock = Lock()
         self.event_counters: Dict[str, int] =\
@@ -57,6 +64,16 @@ class RegistryChangeHandler(FileSystemEventHandler):
         """
         self.handle_event(RegistryChangeHandler.DELETED, event.src_path)
 
+    def on_moved(self, event):
+        """
+        Handler for moved registry files.
+        Editors often save by writing a temporary file and renaming it
+        over the original, so a move counts as a deletion of its source
+        and a creation of its destination.
+        """
+        self.handle_event(RegistryChangeHandler.DELETED, event.src_path)
+        self.handle_event(RegistryChangeHandler.CREATED, event.dest_path)
+
     def handle_event(self, event_name: str, src_path: str):
         """
         Handle general watchdog event.
@@ -66,6 +83,8 @@ class RegistryChangeHandler(FileSystemEventHandler):
         with self.lock:
             self.event_counters[event_name] += 1
         self.logger.info("🔔 File %s: %s", event_name, src_path)
+        if self.on_change is not None:
+            self.on_change()
 
     def reset_event_counters(self) -> Tuple[int, int, int]:
         """
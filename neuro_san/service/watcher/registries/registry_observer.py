@@ -26,6 +26,12 @@ class RegistryObserver(Startable):
         """
         raise NotImplementedError
 
+    def stop(self):
+        """
+        Stop running observer
+        """
+        raise NotImplementedError
+
     def reset_event_counters(self) -> Tuple[int, int, int]:
         """
         Reset event counters and return current counters.
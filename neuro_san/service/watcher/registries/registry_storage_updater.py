@@ -15,10 +15,13 @@ from typing import Dict
 from logging import getLogger
 from logging import Logger
 
+import os
+
 from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.watcher.interfaces.abstract_storage_updater import AbstractStorageUpdater
+from neuro_san.service.watcher.registries.change_debouncer import ChangeDebouncer
 from neuro_san.service.watcher.registries.event_registry_observer import EventRegistryObserver
 from neuro_san.service.watcher.registries.polling_registry_observer import PollingRegistryObserver
 from neuro_san.service.watcher.registries.registry_observer import RegistryObserver
@@ -28,9 +31,14 @@ class RegistryStorageUpdater(AbstractStorageUpdater):
     """
     Implementation of the StorageUpdater interface that updates registries
     from changes in the file system.
+
+    By default, changes are picked up from native file system notifications
+    (inotify on Linux) as they happen, and bursts of them are coalesced into
+    a single reload of the manifest.  Polling of the registry directory is used
+    when asked for, or when native notifications are not available.
     """
 
-    use_polling: bool = True
+    use_polling: bool = False
 
     def __init__(self, network_storage_dict: Dict[str, AgentNetworkStorage],
                  watcher_config: Dict[str, Any]):
@@ -48,35 +56,93 @@ class RegistryStorageUpdater(AbstractStorageUpdater):
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = network_storage_dict
         self.manifest_path: str = watcher_config.get("manifest_path")
 
+        use_polling: bool = self.use_polling or \
+            os.environ.get("AGENT_MANIFEST_UPDATE_USE_POLLING", "false").lower() == "true"
+
+        self.debouncer: ChangeDebouncer = None
         self.observer: RegistryObserver = None
-        if self.use_polling:
-            poll_interval: int = self.compute_polling_interval()
-            self.observer = PollingRegistryObserver(self.manifest_path, poll_interval)
+        if use_polling:
+            self.observer = self.create_polling_observer()
         else:
-            self.observer = EventRegistryObserver(self.manifest_path)
+            quiet_seconds: float = float(os.environ.get("AGENT_MANIFEST_UPDATE_DEBOUNCE_SECONDS", "1.0"))
+            max_delay_seconds: float = None
+            if self.update_period_in_seconds is not None and self.update_period_in_seconds > 0:
+                # Never wait longer than we would have when polling
+                max_delay_seconds = float(self.update_period_in_seconds)
+            self.debouncer = ChangeDebouncer(self.update_storage, quiet_seconds, max_delay_seconds)
+            self.observer = EventRegistryObserver(self.manifest_path, self.debouncer.notify)
+
+    def create_polling_observer(self) -> RegistryObserver:
+        """
+        :return: A new RegistryObserver that polls the registry directory
+        """
+        poll_interval: int = self.compute_polling_interval()
+        return PollingRegistryObserver(self.manifest_path, poll_interval)
 
     def compute_polling_interval(self) -> int:
         """
         :return: Polling interval for polling observer given requested manifest update period
         """
-        update_period_seconds: int = self.get_update_period_in_seconds()
+        update_period_seconds: int = self.update_period_in_seconds
         if update_period_seconds <= 5:
             return 1
         return int(round(update_period_seconds / 4))
 
+    def is_event_driven(self) -> bool:
+        """
+        :return: True if updates happen as soon as changes are observed.
+                 False if updates happen periodically via update_storage() calls
+                 from the StorageWatcher.
+        """
+        return self.debouncer is not None
+
+    def get_update_period_in_seconds(self) -> int:
+        """
+        :return: An int describing how long this instance ideally wants to go between
+                calls to update_storage().  When event driven, this is 0, as updates
+                do not need any periodic calls at all.
+        """
+        if self.is_event_driven():
+            return 0
+        return super().get_update_period_in_seconds()
+
     def start(self):
         """
         Perform start up.
         """
         self.logger.info("Starting RegistryStorageUpdater for %s with %d seconds period",
                          self.manifest_path, self.update_period_in_seconds)
-        self.observer.start()
+        if not self.is_event_driven():
+            self.observer.start()
+            return
+
+        self.debouncer.start()
+        try:
+            self.observer.start()
+        except OSError as exception:
+            # Typically this is from running out of inotify watches or instances.
+            self.logger.warning("Native file system notifications unavailable (%s). "
+                                "Falling back to polling.", str(exception))
+            self.debouncer.stop()
+            self.debouncer = None
+            self.observer = self.create_polling_observer()
+            self.observer.start()
+
+    def stop(self):
+        """
+        Perform steps to stop/shut-down
+        """
+        self.observer.stop()
+        if self.debouncer is not None:
+            self.debouncer.stop()
 
     def update_storage(self):
         """
         Perform an update.
         Take a look at the file system observer and perform any updates
         to relevant AgentNetworkStorage from changes there.
+        When event driven, this is called from the debouncer's thread
+        once a burst of changes has settled down.
         """
         # Check events that may have been triggered in target registry:
         modified, added, deleted = self.observer.reset_event_counters()
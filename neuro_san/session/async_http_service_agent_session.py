@@ -11,17 +11,19 @@
 # END COPYRIGHT
 
 from typing import Any
+from typing import AsyncGenerator
 from typing import Dict
 from typing import Generator
 
 import asyncio
-import json
 
 from aiohttp import ClientOSError
 from aiohttp import ClientSession
 from aiohttp import ClientTimeout
 
 from neuro_san.interfaces.async_agent_session import AsyncAgentSession
+from neuro_san.internals.messages.chat_response_envelope import ChatResponseEnvelope
+from neuro_san.internals.utils.json_codec import JsonCodec
 from neuro_san.session.abstract_http_service_agent_session import AbstractHttpServiceAgentSession
 
 
@@ -95,6 +97,20 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
             Note that responses to the chat input might be numerous and will come as they
             are produced until the system decides there are no more messages to be sent.
         """
+        async for envelope in self.streaming_chat_envelopes(request_dict):
+            yield envelope.get_chat_response()
+
+    async def streaming_chat_envelopes(self, request_dict: Dict[str, Any]) \
+            -> AsyncGenerator[ChatResponseEnvelope, None]:
+        """
+        Like streaming_chat(), but each ChatResponse is only parsed when the caller
+        asks its ChatResponseEnvelope for it.  Callers that only care about a few
+        of the messages can peek at the type and origin of the others and move on.
+
+        :param request_dict: A dictionary version of the ChatRequest
+                    protobufs structure.  See streaming_chat() for details.
+        :return: An iterator of ChatResponseEnvelopes, one per line of the stream.
+        """
         path: str = self.get_request_path("streaming_chat")
         try:
             timeout: ClientTimeout = None
@@ -103,16 +119,18 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
             async with ClientSession(headers=self.get_headers(),
                                      timeout=timeout
                                      ) as session:
-                async with session.post(path, json=request_dict) as response:
+                # Serialize straight to bytes, as the request can carry large sly_data.
+                # Nothing here holds on to them for the rest of the stream.
+                async with session.post(path, data=JsonCodec.get_shared().dumps_bytes(request_dict),
+                                        headers={"Content-Type": "application/json"}) as response:
                     # Check for successful response status
                     response.raise_for_status()
 
-                    # Iterate over the content stream line by line
+                    # Iterate over the content stream line by line.
+                    # Parsing is left to whoever needs what is in the line.
                     async for line in response.content:
-                        unicode_line = line.decode('utf-8')
-                        if unicode_line.strip():    # Skip empty lines
-                            result_dict = json.loads(unicode_line)
-                            yield result_dict
+                        if line.strip():    # Skip empty lines
+                            yield ChatResponseEnvelope(line)
 
         except (asyncio.TimeoutError, ClientOSError) as exc:
             # Pass on a couple of asserts that are known to represent
@@ -13,6 +13,8 @@ from typing import Dict
 
 import logging
 
+from copy import copy
+
 from neuro_san.interfaces.async_agent_session import AsyncAgentSession
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
@@ -20,6 +22,7 @@ from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkPr
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
 from neuro_san.session.async_http_service_agent_session import AsyncHttpServiceAgentSession
 
@@ -90,16 +93,25 @@ class ExternalAgentSessionFactory(AsyncAgentSessionFactory):
             session = AsyncDirectAgentSession(agent_network, invocation_context, metadata=metadata)
 
         if session is None:
-            # When creating a session for external agents, specifically use None for the
-            # streaming timeout.  This implies an infinite amount of time to let the
-            # external agent get its job done.  The rationale here is that:
+            # When creating a session for external agents, use None for the streaming timeout
+            # unless the request has a deadline.  This implies an infinite amount of time to let
+            # the external agent get its job done.  The rationale here is that:
             #   a)  We do not know how long any given external agent is really going to take
             #       to do its job.
             #   b)  We figure that the regular connection aspects to the server in question
             #       have already been sorted out in the obligitory call to function() that
             #       precedes any streaming_chat() call.
-            session = AsyncHttpServiceAgentSession(host, port, agent_name=agent_name,
-                                                   metadata=metadata, streaming_timeout_in_seconds=None)
+            # When there is a deadline, the external agent is told how much time is left
+            # so it can stop working on our behalf by then, and we stop waiting on it.
+            streaming_timeout_in_seconds: float = None
+            if invocation_context is not None:
+                deadline: RequestDeadline = invocation_context.get_deadline()
+                streaming_timeout_in_seconds = deadline.get_remaining_seconds()
+                if streaming_timeout_in_seconds is not None:
+                    metadata = copy(metadata) if metadata is not None else {}
+                    metadata[RequestDeadline.HEADER] = deadline.to_header_value()
+            session = AsyncHttpServiceAgentSession(host, port, agent_name=agent_name, metadata=metadata,
+                                                   streaming_timeout_in_seconds=streaming_timeout_in_seconds)
 
         # Quiet any logging from leaf-common grpc stuff.
         quiet_please = logging.getLogger("leaf_common.session.grpc_client_retry")
@@ -12,6 +12,8 @@
 from typing import Any
 from typing import Dict
 
+import threading
+
 from asyncio import Future
 
 from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
@@ -26,6 +28,7 @@ from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.message_journal import MessageJournal
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.utils.request_deadline import RequestDeadline
 
 
 # pylint: disable=too-many-instance-attributes
@@ -42,7 +45,9 @@ class SessionInvocationContext(InvocationContext):
                  async_executors_pool: AsyncioExecutorPool,
                  llm_factory: ContextTypeLlmFactory,
                  toolbox_factory: ContextTypeToolboxFactory = None,
-                 metadata: Dict[str, str] = None):
+                 metadata: Dict[str, str] = None,
+                 deadline: RequestDeadline = None,
+                 message_queue_args: Dict[str, Any] = None):
         """
         Constructor
 
@@ -55,6 +60,11 @@ class SessionInvocationContext(InvocationContext):
         :param metadata: A grpc metadata of key/value pairs to be inserted into
                          the header. Default is None. Preferred format is a
                          dictionary of string keys to string values.
+        :param deadline: The RequestDeadline by which the invocation needs to be done.
+                         Default is None, meaning there is no deadline.
+        :param message_queue_args: Keyword arguments for the AsyncCollatingQueue
+                         via which messages are streamed.  Default is None,
+                         meaning an unbounded queue.
         """
 
         self.async_session_factory: AsyncAgentSessionFactory = async_session_factory
@@ -62,12 +72,20 @@ class SessionInvocationContext(InvocationContext):
         # Get an async executor to run all tasks for this session instance:
         self.asyncio_executor: AsyncioExecutor = self.async_executors_pool.get_executor()
         self.origination: Origination = Origination()
-        self.queue: AsyncCollatingQueue = AsyncCollatingQueue()
+        # Bound the number of messages buffered for slow clients, if so configured.
+        if message_queue_args is None:
+            message_queue_args = {}
+        self.queue: AsyncCollatingQueue = AsyncCollatingQueue(**message_queue_args)
         self.journal: Journal = MessageJournal(self.queue)
         self.metadata: Dict[str, str] = metadata
         self.request_reporting: Dict[str, Any] = {}
         self.llm_factory: ContextTypeLlmFactory = llm_factory
         self.toolbox_factory: ContextTypeToolboxFactory = toolbox_factory
+        self.deadline: RequestDeadline = deadline
+        if self.deadline is None:
+            self.deadline = RequestDeadline()
+        # Guards the executor between close() and cancel() being called from different threads
+        self.executor_lock = threading.Lock()
 
     def start(self):
         """
@@ -127,12 +145,24 @@ class SessionInvocationContext(InvocationContext):
         """
         Release resources owned by this context
         """
-        if self.asyncio_executor is not None:
-            self.async_executors_pool.return_executor(self.asyncio_executor)
+        with self.executor_lock:
+            executor: AsyncioExecutor = self.asyncio_executor
             self.asyncio_executor = None
+            if executor is not None:
+                self.async_executors_pool.return_executor(executor)
         if self.queue is not None:
             self.queue.close()
 
+    def cancel(self):
+        """
+        Cancels whatever is still running for this context, as when the client
+        has gone away.  This can be called from any thread.
+        Resources are still released by close().
+        """
+        with self.executor_lock:
+            if self.asyncio_executor is not None:
+                self.asyncio_executor.cancel_current_tasks()
+
     def get_request_reporting(self) -> Dict[str, Any]:
         """
         :return: The request reporting dictionary
@@ -151,6 +181,12 @@ class SessionInvocationContext(InvocationContext):
         """
         return self.toolbox_factory
 
+    def get_deadline(self) -> RequestDeadline:
+        """
+        :return: The RequestDeadline by which the invocation needs to be done
+        """
+        return self.deadline
+
     def reset(self):
         """
         Resets the instance for a subsequent use for another exchange with the agent network.
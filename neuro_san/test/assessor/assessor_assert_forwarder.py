@@ -13,6 +13,8 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+from threading import Lock
+
 from neuro_san.test.interfaces.null_assert_forwarder import NullAssertForwarder
 
 
@@ -30,6 +32,8 @@ class AssessorAssertForwarder(NullAssertForwarder):
         """
         self.num_total: int = 0
         self.fail: List[Dict[str, Any]] = []
+        # Test iterations can run in parallel
+        self.lock = Lock()
 
     def get_num_total(self) -> int:
         """
@@ -78,13 +82,14 @@ class AssessorAssertForwarder(NullAssertForwarder):
         :param text_sample: The value appearing in the test sample
         :param sense: Whether the test was supposed to be true or false.
         """
-        self.num_total += 1
-        if is_passing == sense:
-            return
+        with self.lock:
+            self.num_total += 1
+            if is_passing == sense:
+                return
 
-        components: Dict[str, Any] = {
-            "acceptance_criteria": acceptance_criteria,
-            "text_sample": text_sample,
-            "sense": sense
-        }
-        self.fail.append(components)
+            components: Dict[str, Any] = {
+                "acceptance_criteria": acceptance_criteria,
+                "text_sample": text_sample,
+                "sense": sense
+            }
+            self.fail.append(components)
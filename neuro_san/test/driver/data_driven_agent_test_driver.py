@@ -16,10 +16,15 @@ from typing import Generator
 from typing import List
 from typing import Union
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from copy import copy
 from datetime import datetime
 from os import environ
 
+import time
+
 from leaf_common.parsers.dictionary_extractor import DictionaryExtractor
 from leaf_common.persistence.easy.easy_hocon_persistence import EasyHoconPersistence
 from leaf_common.time.timeout import Timeout
@@ -44,23 +49,74 @@ class DataDrivenAgentTestDriver:
 
     TEST_KEYS: List[str] = ["text", "structure", "sly_data"]
 
-    def __init__(self, asserts: AssertForwarder, fixtures: FileOfClass = None):
+    def __init__(self, asserts: AssertForwarder, fixtures: FileOfClass = None,
+                 max_parallel_iterations: int = None):
         """
         Constructor
         :param asserts: The AssertForwarder instance to use to integrate failures
                         back into the test system.
         :param fixtures: Optional path to the fixtures root.
+        :param max_parallel_iterations: Optional maximum number of iterations of a single
+                        test case to run at the same time.  Default of None defers
+                        to the test case's own max_parallel_iterations value, then to the
+                        AGENT_TEST_MAX_PARALLEL_ITERATIONS env var, then to 1 (sequential).
         """
         self.asserts_basis: AssertForwarder = asserts
         self.fixtures: FileOfClass = fixtures
+        self.max_parallel_iterations: int = max_parallel_iterations
 
-    # pylint: disable=too-many-locals
-    def one_test(self, hocon_file: str):
+    def many_tests(self, hocon_files: List[str], max_parallel_tests: int = 1) -> List[Dict[str, Any]]:
+        """
+        Runs many hocon test cases, optionally in parallel, collecting results
+        for each instead of failing on the first failing test case.
+
+        :param hocon_files: A list of hocon test case files.
+        :param max_parallel_tests: The maximum number of test cases to run at the same time.
+        :return: A list of result dictionaries, one per hocon file in the same order.
+                See one_test() for keys.  Failing test cases additionally have
+                their AssertionError in an "error" key.
+        """
+        results: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel_tests)) as executor:
+            futures: List[Future] = [executor.submit(self._one_test_result, hocon_file)
+                                     for hocon_file in hocon_files]
+            for future in futures:
+                results.append(future.result())
+        return results
+
+    def _one_test_result(self, hocon_file: str) -> Dict[str, Any]:
+        """
+        :param hocon_file: The name of the hocon from the fixtures directory.
+        :return: The result dictionary from one_test(), with any failure captured.
+        """
+        result: Dict[str, Any] = {}
+        try:
+            result = self.one_test(hocon_file)
+        except AssertionError as exception:
+            result = {
+                "hocon_file": hocon_file,
+                "passed": False,
+                "error": exception
+            }
+        return result
+
+    # pylint: disable=too-many-locals,too-many-statements
+    def one_test(self, hocon_file: str) -> Dict[str, Any]:
         """
         Use a single hocon file in the fixtures as a test case"
 
         :param hocon_file: The name of the hocon from the fixtures directory.
+        :return: A result dictionary with the following keys:
+                    "hocon_file"            The hocon_file passed in
+                    "passed"                True if the success ratio was met
+                    "num_successful"        The number of successful iterations
+                    "num_attempted"         The number of iterations actually run
+                    "num_need_success"      The number of successful iterations needed
+                    "num_iterations"        The maximum number of iterations
+                    "elapsed_seconds"       Wall-clock time taken by the test
+                 A failing test raises an AssertionError instead.
         """
+        start_time: float = time.monotonic()
         test_case: Dict[str, Any] = self.parse_hocon_test_case(hocon_file)
 
         agent: str = test_case.get("agent")
@@ -87,37 +143,53 @@ class DataDrivenAgentTestDriver:
         num_iterations = max(1, num_iterations)
         num_need_success = min(num_need_success, num_iterations)
 
+        max_parallel: int = self.get_max_parallel_iterations(test_case)
+
         # Capture asserts for each iteration
         iteration_asserts: List[AssertCapture] = []
 
         # Loop through each iteration, capturing any asserts.
         num_successful: int = 0
-        for index in range(num_iterations):
-
-            _ = index
-
-            # Capture the asserts for this iteration and add it to the list for later
-            assert_capture = AssertCapture(self.asserts_basis)
-            iteration_asserts.append(assert_capture)
-
-            # Perform a single iteration of the test.
-            self.one_iteration(test_case, assert_capture, timeouts)
-
-            # Update our counter if this iteration is successful
-            asserts: List[AssertionError] = assert_capture.get_asserts()
-            if len(asserts) > 0:
-                # Not successful
-                continue
-
-            num_successful += 1
-            if num_successful == num_need_success:
-                # Don't do more tests than we actually need to
-                break
+        if max_parallel <= 1:
+            for index in range(num_iterations):
+
+                _ = index
+
+                # Capture the asserts for this iteration and add it to the list for later
+                assert_capture = AssertCapture(self.asserts_basis)
+                iteration_asserts.append(assert_capture)
+
+                # Perform a single iteration of the test.
+                self.one_iteration(test_case, assert_capture, timeouts)
+
+                # Update our counter if this iteration is successful
+                asserts: List[AssertionError] = assert_capture.get_asserts()
+                if len(asserts) > 0:
+                    # Not successful
+                    continue
+
+                num_successful += 1
+                if num_successful == num_need_success:
+                    # Don't do more tests than we actually need to
+                    break
+        else:
+            num_successful = self.parallel_iterations(test_case, timeouts, num_iterations,
+                                                      num_need_success, max_parallel, iteration_asserts)
+
+        result: Dict[str, Any] = {
+            "hocon_file": hocon_file,
+            "passed": num_successful >= num_need_success,
+            "num_successful": num_successful,
+            "num_attempted": len(iteration_asserts),
+            "num_need_success": num_need_success,
+            "num_iterations": num_iterations,
+            "elapsed_seconds": time.monotonic() - start_time
+        }
 
         # Don't bother reporting any asserts if we have met our success ratio.
         # Return early to pass this test.
         if num_successful >= num_need_success:
-            return
+            return result
 
         # Find the first assert that fails and use it to fail this test
         for assert_capture in iteration_asserts:
@@ -130,6 +202,84 @@ Need at least {num_need_success} to consider {hocon_file} test to be successful.
 """
                 raise AssertionError(message) from one_assert
 
+        return result
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def parallel_iterations(self, test_case: Dict[str, Any], timeouts: List[Timeout],
+                            num_iterations: int, num_need_success: int, max_parallel: int,
+                            iteration_asserts: List[AssertCapture]) -> int:
+        """
+        Runs the iterations of a single test case in parallel.
+        Each iteration gets its own session.
+        Iterations that have not yet started when enough iterations
+        have succeeded are not run at all.
+
+        :param test_case: The dictionary describing the data-driven test case
+        :param timeouts: A list of timeout objects to check
+        :param num_iterations: The maximum number of iterations to run
+        :param num_need_success: The number of successful iterations needed
+        :param max_parallel: The maximum number of iterations to run at once
+        :param iteration_asserts: A list to be filled in with the AssertCapture of
+                    each iteration that was actually run, in iteration order.
+        :return: The number of successful iterations
+        """
+        num_successful: int = 0
+        captures: Dict[Future, AssertCapture] = {}
+        with ThreadPoolExecutor(max_workers=min(max_parallel, num_iterations)) as executor:
+            for _ in range(num_iterations):
+                assert_capture = AssertCapture(self.asserts_basis)
+                future: Future = executor.submit(self.one_iteration, test_case, assert_capture, timeouts)
+                captures[future] = assert_capture
+
+            for future in as_completed(captures.keys()):
+                if future.cancelled():
+                    continue
+                # Re-raise anything that is not an assert, like timeouts
+                future.result()
+                if len(captures[future].get_asserts()) == 0:
+                    num_successful += 1
+                if num_successful >= num_need_success:
+                    # Don't do more tests than we actually need to
+                    for other in captures:
+                        other.cancel()
+
+        for future, assert_capture in captures.items():
+            if not future.cancelled():
+                iteration_asserts.append(assert_capture)
+
+        return num_successful
+
+    def get_max_parallel_iterations(self, test_case: Dict[str, Any]) -> int:
+        """
+        :param test_case: The dictionary describing the data-driven test case
+        :return: The maximum number of iterations of the test case to run at the same time
+        """
+        max_parallel: int = self.max_parallel_iterations
+        if max_parallel is None:
+            max_parallel = test_case.get("max_parallel_iterations")
+        if max_parallel is None:
+            max_parallel = int(environ.get("AGENT_TEST_MAX_PARALLEL_ITERATIONS", "1"))
+        return max(1, int(max_parallel))
+
+    def create_session(self, connection: str, agent: str, use_direct: bool,
+                       metadata: Dict[str, Any], timeout_in_seconds: float) -> AgentSession:
+        """
+        Creates a new session for a single iteration of a test case.
+        :param connection: The type of connection to make
+        :param agent: The name of the agent to connect to
+        :param use_direct: When True, external agents are called via library
+        :param metadata: The request metadata to use with the session
+        :param timeout_in_seconds: The connection timeout
+        :return: A new AgentSession
+        """
+        session: AgentSession = AgentSessionFactory().create_session(
+                connection,
+                agent,
+                use_direct=use_direct,
+                metadata=metadata,
+                connect_timeout_in_seconds=timeout_in_seconds)
+        return session
+
     # pylint: disable=too-many-locals
     def one_iteration(self, test_case: Dict[str, Any], asserts: AssertForwarder, timeouts: List[Timeout]):
         """
@@ -172,12 +322,8 @@ Need at least {num_need_success} to consider {hocon_file} test to be successful.
 
         for connection in connections:
 
-            session: AgentSession = AgentSessionFactory().create_session(
-                    connection,
-                    agent,
-                    use_direct=use_direct,
-                    metadata=metadata,
-                    connect_timeout_in_seconds=timeout_in_seconds)
+            session: AgentSession = self.create_session(connection, agent, use_direct,
+                                                        metadata, timeout_in_seconds)
             chat_context: Dict[str, Any] = None
             for interaction in interactions:
 
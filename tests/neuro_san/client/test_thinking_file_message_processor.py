@@ -0,0 +1,213 @@
+
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import os
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+from unittest import TestCase
+
+from neuro_san.client.buffered_file_writer import BufferedFileWriter
+from neuro_san.client.thinking_file_message_processor import ThinkingFileMessageProcessor
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+NUM_MESSAGES: int = 50000
+NUM_AGENTS: int = 100
+
+
+class PreviousThinkingFileMessageProcessor(ThinkingFileMessageProcessor):
+    """
+    Writes thinking files synchronously, opening and closing the file for every message, as before.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _write_to_file(self, origin_filename: str, origin_str: str,
+                       message_type_str: str, use_origin: str, text: str):
+        filename = Path(self.thinking_dir, origin_filename)
+        how_to_open_file: str = "a"
+        if not filename.exists():
+            how_to_open_file = "w"
+        with filename.open(mode=how_to_open_file, encoding="utf-8") as thinking:
+            if how_to_open_file == "w":
+                thinking.write(f"Agent: {origin_str}\n")
+            thinking.write(f"\n[{message_type_str}{use_origin}]:\n")
+            thinking.write(text)
+            thinking.write("\n")
+
+
+class SlowBackgroundLock:
+    """
+    Lock which holds up a given thread for a while before it gets to acquire it.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.slow_thread: threading.Thread = None
+        self.slowed_down = threading.Event()
+
+    def __enter__(self):
+        if threading.current_thread() is self.slow_thread:
+            self.slowed_down.set()
+            time.sleep(0.3)
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        return self.lock.__exit__(*args)
+
+
+def make_messages() -> List[Dict[str, Any]]:
+    """
+    :return: A stream of messages from many agents
+    """
+    messages: List[Dict[str, Any]] = []
+    for index in range(NUM_MESSAGES):
+        message: Dict[str, Any] = {
+            "type": ChatMessageType.AGENT,
+            "origin": [{"tool": "front_man", "instantiation_index": 1},
+                       {"tool": f"agent_{index % NUM_AGENTS}", "instantiation_index": 1}],
+            "text": f"Progress message number {index} with a bit of detail to it."
+        }
+        if index % 1000 == 0:
+            message["structure"] = {"index": index}
+        messages.append(message)
+    return messages
+
+
+def read_files(directory: str) -> Dict[str, str]:
+    """
+    :return: A dictionary of file name to file contents for all files in the directory
+    """
+    contents: Dict[str, str] = {}
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name), encoding="utf-8") as one_file:
+            contents[name] = one_file.read()
+    return contents
+
+
+class TestThinkingFileMessageProcessor(TestCase):
+    """
+    Tests for the ThinkingFileMessageProcessor and its BufferedFileWriter.
+    """
+
+    def setUp(self):
+        # Prefer tmpfs where there is one, so we are measuring our own overhead
+        base_dir: str = None
+        if os.path.isdir("/dev/shm"):
+            base_dir = "/dev/shm"
+        # pylint: disable=consider-using-with
+        self.temp_dir = tempfile.TemporaryDirectory(dir=base_dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def stream(self, processor: ThinkingFileMessageProcessor, messages: List[Dict[str, Any]]) -> float:
+        """
+        :return: The number of seconds the message stream was held up by processing
+        """
+        start_time: float = time.monotonic()
+        for message in messages:
+            processor.process_message(message, message.get("type"))
+        return time.monotonic() - start_time
+
+    def test_benchmark(self):
+        """
+        Compares streaming 50k messages across 100 agents with and without buffering,
+        and checks that both produce the very same files.
+        """
+        messages: List[Dict[str, Any]] = make_messages()
+
+        previous_dir: str = os.path.join(self.temp_dir.name, "previous")
+        os.makedirs(previous_dir)
+        previous = PreviousThinkingFileMessageProcessor(None, previous_dir)
+        previous_seconds: float = self.stream(previous, messages)
+
+        buffered_dir: str = os.path.join(self.temp_dir.name, "buffered")
+        os.makedirs(buffered_dir)
+        buffered = ThinkingFileMessageProcessor(None, buffered_dir)
+        streaming_seconds: float = self.stream(buffered, messages)
+        start_time: float = time.monotonic()
+        buffered.close()
+        flush_seconds: float = time.monotonic() - start_time
+
+        print(f"{NUM_MESSAGES} messages across {NUM_AGENTS} agents: previous {previous_seconds:.3f}s, "
+              f"buffered {streaming_seconds:.3f}s streaming + {flush_seconds:.3f}s final flush")
+
+        previous_files: Dict[str, str] = read_files(previous_dir)
+        self.assertEqual(NUM_AGENTS, len(previous_files))
+        self.assertEqual(previous_files, read_files(buffered_dir))
+        self.assertLess(streaming_seconds * 2.0, previous_seconds)
+
+    def test_open_file_limit(self):
+        """
+        Tests that only a bounded number of files are ever held open.
+        """
+        writer = BufferedFileWriter(max_open_files=3, flush_interval_seconds=60.0)
+        for round_index in range(3):
+            for index in range(10):
+                writer.write(Path(self.temp_dir.name, f"file_{index}"), f"{round_index}\n", header="header\n")
+            writer.flush()
+            self.assertEqual(3, len(writer.open_files))
+        writer.close()
+        self.assertEqual(0, len(writer.open_files))
+
+        for index in range(10):
+            with open(os.path.join(self.temp_dir.name, f"file_{index}"), encoding="utf-8") as one_file:
+                self.assertEqual("header\n0\n1\n2\n", one_file.read())
+
+        with self.assertRaises(ValueError):
+            writer.write(Path(self.temp_dir.name, "file_0"), "too late")
+
+    def test_flush_waits_for_background(self):
+        """
+        Tests that a flush racing the background thread still writes everything in order.
+        """
+        path = Path(self.temp_dir.name, "raced")
+        writer = BufferedFileWriter(flush_interval_seconds=0.01)
+        slow_lock = SlowBackgroundLock()
+        writer.io_lock = slow_lock
+        writer.write(path, "A\n", header="header\n")
+        # The background thread now might have "A" in hand, but has not written it yet
+        slow_lock.slow_thread = writer.thread
+        self.assertTrue(slow_lock.slowed_down.wait(5.0))
+
+        writer.write(path, "B\n")
+        writer.flush()
+        with open(path, encoding="utf-8") as raced_file:
+            self.assertEqual("header\nA\nB\n", raced_file.read())
+        writer.close()
+
+    def test_filename_too_long(self):
+        """
+        Tests that deep origins which make for file names that are too long go to a uuid file instead.
+        """
+        processor = ThinkingFileMessageProcessor(None, self.temp_dir.name)
+        origin: List[Dict[str, Any]] = [{"tool": f"agent_with_a_long_name_{index}"} for index in range(20)]
+        processor.process_message({"type": ChatMessageType.AGENT, "origin": origin, "text": "first"},
+                                  ChatMessageType.AGENT)
+        processor.process_message({"type": ChatMessageType.AGENT, "origin": origin, "text": "second"},
+                                  ChatMessageType.AGENT)
+        processor.close()
+
+        files: Dict[str, str] = read_files(self.temp_dir.name)
+        self.assertEqual(1, len(files))
+        contents: str = list(files.values())[0]
+        self.assertIn("first", contents)
+        self.assertIn("second", contents)
@@ -0,0 +1,222 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Dict
+from typing import List
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import TextSplitter
+
+from neuro_san.coded_tools.rag import Rag
+from neuro_san.coded_tools.rag_index_cache import RagIndexCache
+
+DIMENSIONS: int = 64
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Deterministic bag-of-words embeddings that count how many texts were embedded.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.model: str = "fake-embeddings"
+        self.num_embedded: int = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.num_embedded += len(texts)
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        vector: List[float] = [0.0] * DIMENSIONS
+        for word in text.lower().split():
+            index: int = int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16) % DIMENSIONS
+            vector[index] += 1.0
+        return vector
+
+
+class LocalRag(Rag):
+    """
+    Rag whose "urls" are local files
+    """
+
+    def __init__(self, embeddings: FakeEmbeddings):
+        """
+        Constructor
+
+        :param embeddings: The FakeEmbeddings to use
+        """
+        self.embeddings: FakeEmbeddings = embeddings
+        self.num_loaded: int = 0
+
+    def create_embeddings(self) -> Embeddings:
+        return self.embeddings
+
+    def create_text_splitter(self) -> TextSplitter:
+        return RecursiveCharacterTextSplitter(chunk_size=60, chunk_overlap=0)
+
+    async def load_documents(self, urls: List[str]) -> List[Document]:
+        docs: List[Document] = []
+        for url in urls:
+            self.num_loaded += 1
+            with open(url, "r", encoding="utf-8") as doc_file:
+                docs.append(Document(page_content=doc_file.read(), metadata={"source": url}))
+        return docs
+
+
+class TestRag(TestCase):
+    """
+    Tests the index caching of the Rag CodedTool
+    """
+
+    def setUp(self):
+        """
+        Creates local document fixtures and a fresh cache
+        """
+        self.temp_dir: str = tempfile.mkdtemp()
+        self.docs: Dict[str, str] = {
+            "cats.txt": "Cats are small furry animals.\nCats like to sleep in the sun all day long.",
+            "boats.txt": "Boats float on water.\nA sailboat uses the wind to move across the lake.",
+        }
+        for name, content in self.docs.items():
+            self.write_doc(name, content)
+        self.urls: List[str] = [os.path.join(self.temp_dir, name) for name in self.docs]
+        Rag.index_cache = RagIndexCache(cache_dir=os.path.join(self.temp_dir, "cache"), max_age_seconds=0)
+
+    def tearDown(self):
+        Rag.index_cache = None
+        shutil.rmtree(self.temp_dir)
+
+    def write_doc(self, name: str, content: str):
+        """
+        :param name: The file name of the document
+        :param content: The content of the document
+        """
+        with open(os.path.join(self.temp_dir, name), "w", encoding="utf-8") as doc_file:
+            doc_file.write(content)
+
+    def invoke(self, rag: Rag, query: str) -> str:
+        """
+        :param rag: The Rag instance to invoke
+        :param query: The query
+        :return: The result of the query
+        """
+        return asyncio.run(rag.async_invoke({"urls": self.urls, "query": query}, {}))
+
+    def test_shared_cache(self):
+        """
+        Tests that a second call does not re-fetch or re-embed anything
+        """
+        embeddings = FakeEmbeddings()
+        result: str = self.invoke(LocalRag(embeddings), "where do cats sleep")
+        self.assertIn("sleep in the sun", result.split("\n\n")[0])
+        num_embedded: int = embeddings.num_embedded
+        self.assertGreater(num_embedded, 0)
+
+        rag = LocalRag(embeddings)
+        result = self.invoke(rag, "how does a sailboat move")
+        self.assertIn("sailboat", result.split("\n\n")[0])
+        self.assertEqual(0, rag.num_loaded)
+        self.assertEqual(num_embedded, embeddings.num_embedded)
+
+    def test_persistent_incremental(self):
+        """
+        Tests that a new cache instance picks up the persisted index
+        and only re-embeds documents that changed
+        """
+        embeddings = FakeEmbeddings()
+        self.invoke(LocalRag(embeddings), "where do cats sleep")
+        first_embedded: int = embeddings.num_embedded
+
+        # A new cache over the same directory, where every entry needs a re-fetch
+        cache_dir: str = Rag.index_cache.cache_dir
+        Rag.index_cache = RagIndexCache(cache_dir=cache_dir, max_age_seconds=0.000001)
+        self.write_doc("boats.txt", "Boats float on water.\nA rowboat uses oars to move.")
+
+        embeddings = FakeEmbeddings()
+        rag = LocalRag(embeddings)
+        result: str = self.invoke(rag, "how does a rowboat move")
+        self.assertIn("rowboat", result.split("\n\n")[0])
+        self.assertEqual(2, rag.num_loaded)
+
+        # Only the changed boats document got re-embedded
+        self.assertGreater(embeddings.num_embedded, 0)
+        self.assertLess(embeddings.num_embedded, first_embedded)
+
+        result = self.invoke(LocalRag(embeddings), "where do cats sleep")
+        self.assertIn("sleep in the sun", result.split("\n\n")[0])
+
+    def test_bounded_entries(self):
+        """
+        Tests that the in-memory entries are bounded and reloaded from disk when dropped
+        """
+        cache = RagIndexCache(cache_dir=os.path.join(self.temp_dir, "cache"), max_age_seconds=0, max_entries=1)
+        cache.put("a", "model", "hash_a", ["a"], [{}], [[1.0, 0.0]])
+        cache.put("b", "model", "hash_b", ["b"], [{}], [[0.0, 1.0]])
+        self.assertEqual(1, len(cache.entries))
+
+        entry = cache.get("a", "model")
+        self.assertEqual(["a"], entry.get("texts"))
+        self.assertEqual(1, len(cache.entries))
+
+    def test_mismatched_pair(self):
+        """
+        Tests that an entry whose vectors do not go with its texts is not used
+        """
+        cache_dir: str = os.path.join(self.temp_dir, "cache")
+        cache = RagIndexCache(cache_dir=cache_dir, max_age_seconds=0)
+        cache.put("a", "model", "hash_a", ["one", "two"], [{}, {}], [[1.0, 0.0], [0.0, 1.0]])
+
+        # Replace the vectors with ones for a different number of chunks
+        entry = cache.get("a", "model")
+        other = RagIndexCache(cache_dir=cache_dir, max_age_seconds=0)
+        other.put("b", "model", "hash_b", ["three"], [{}], [[1.0, 1.0]])
+        shutil.copyfile(os.path.join(cache_dir, other.get("b", "model").get("vectors_file")),
+                        os.path.join(cache_dir, entry.get("vectors_file")))
+
+        self.assertIsNone(RagIndexCache(cache_dir=cache_dir, max_age_seconds=0).get("a", "model"))
+
+    def test_untrusted_cache_dir(self):
+        """
+        Tests that a cache directory others can write to is neither read from nor written to
+        """
+        cache_dir: str = os.path.join(self.temp_dir, "cache")
+        cache = RagIndexCache(cache_dir=cache_dir, max_age_seconds=0)
+        cache.put("a", "model", "hash_a", ["a"], [{}], [[1.0, 0.0]])
+        self.assertEqual(0o700, os.stat(cache_dir).st_mode & 0o777)
+
+        # Once others can write to it, what is there might have been planted
+        os.chmod(cache_dir, 0o777)
+        self.assertIsNone(RagIndexCache(cache_dir=cache_dir, max_age_seconds=0).get("a", "model"))
+
+        # New entries are only kept in memory
+        untrusted = RagIndexCache(cache_dir=cache_dir, max_age_seconds=0)
+        entry = untrusted.put("b", "model", "hash_b", ["b"], [{}], [[0.0, 1.0]])
+        self.assertEqual(["b"], untrusted.get("b", "model").get("texts"))
+        self.assertFalse(os.path.exists(os.path.join(cache_dir, entry.get("vectors_file"))))
+
+    def test_default_cache_dir(self):
+        """
+        Tests that the default cache directory is not shared with other users
+        """
+        self.assertIn(str(os.getuid()), os.path.basename(RagIndexCache.get_default_cache_dir()))
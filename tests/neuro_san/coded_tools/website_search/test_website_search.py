@@ -0,0 +1,96 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import List
+
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+
+from neuro_san.coded_tools.async_duckduckgo_search import AsyncDuckDuckGoSearch
+from neuro_san.coded_tools.website_search.website_search import WebsiteSearch
+
+LATENCY_SECONDS: float = 0.3
+
+
+class SlowSearch(AsyncDuckDuckGoSearch):
+    """
+    Stand-in for the blocking ddgs search which takes a while to answer.
+    """
+
+    def __init__(self, cache_ttl_seconds: float, max_concurrent: int):
+        """
+        Constructor
+
+        :param cache_ttl_seconds: The number of seconds a result stays in the cache.
+        :param max_concurrent: The maximum number of searches in flight per event loop.
+        """
+        super().__init__(cache_ttl_seconds=cache_ttl_seconds, max_concurrent=max_concurrent)
+        self.num_requests: int = 0
+        self.count_lock = threading.Lock()
+
+    def search_sync(self, query: str, num_results: int) -> List[str]:
+        with self.count_lock:
+            self.num_requests += 1
+        # Blocks, just like the real thing
+        time.sleep(LATENCY_SECONDS)
+        return ["https://one.example.com/a", "https://two.example.com/b"][:num_results]
+
+
+class TestWebsiteSearch(TestCase):
+    """
+    Tests the WebsiteSearch CodedTool against a stand-in for the blocking search client
+    """
+
+    def tearDown(self):
+        AsyncDuckDuckGoSearch.shared = None
+
+    def run_searches(self, queries: List[str], max_concurrent: int) -> List[str]:
+        """
+        :param queries: The search terms for each concurrent activation
+        :param max_concurrent: The maximum number of concurrent searches
+        :return: The results of each activation
+        """
+        async def gather_searches() -> List[str]:
+            return await asyncio.gather(*[
+                WebsiteSearch().async_invoke({"url": "example.com", "search_terms": query}, {})
+                for query in queries])
+
+        AsyncDuckDuckGoSearch.shared = SlowSearch(cache_ttl_seconds=60, max_concurrent=max_concurrent)
+        return asyncio.run(gather_searches())
+
+    def test_concurrent_searches(self):
+        """
+        Tests that concurrent activations on the same loop are not serialized
+        """
+        start: float = time.monotonic()
+        results: List[str] = self.run_searches([f"query {index}" for index in range(5)], 5)
+        elapsed: float = time.monotonic() - start
+
+        self.assertLess(elapsed, 3 * LATENCY_SECONDS)
+        self.assertEqual(5, AsyncDuckDuckGoSearch.get_shared().num_requests)
+        for result in results:
+            self.assertEqual("1. https://one.example.com/a ; 2. https://two.example.com/b ; ", result)
+
+    def test_concurrency_limit_and_cache(self):
+        """
+        Tests that the concurrency limit holds searches back
+        and that repeated searches come from the cache
+        """
+        start: float = time.monotonic()
+        results: List[str] = self.run_searches(["one", "two", "one", "two"], 1)
+        elapsed: float = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 2 * LATENCY_SECONDS)
+        self.assertEqual(2, AsyncDuckDuckGoSearch.get_shared().num_requests)
+        self.assertEqual(1, len(set(results)))
@@ -0,0 +1,151 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import threading
+import tracemalloc
+
+from unittest import TestCase
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+NUM_AGENTS: int = 5
+NUM_MESSAGES: int = 2000
+MESSAGE_TEXT: str = "x" * 2048
+
+
+def make_message(index: int, message_type: ChatMessageType = ChatMessageType.AGENT) -> Dict[str, Any]:
+    """
+    :param index: The index of the message
+    :param message_type: The type of the message
+    :return: A chat message dictionary like the MessageJournal would produce
+    """
+    return {
+        "type": message_type,
+        "origin": [{"tool": "front_man", "instantiation_index": 1},
+                   {"tool": f"agent_{index % NUM_AGENTS}", "instantiation_index": 1}],
+        "text": f"{index} {MESSAGE_TEXT}"
+    }
+
+
+def produce(queue: AsyncCollatingQueue):
+    """
+    Chatty producer, putting messages from its own event loop on its own thread,
+    just like the journal does for a request.
+    """
+    async def chatter():
+        for index in range(NUM_MESSAGES):
+            await queue.put(make_message(index), synchronous=True)
+        await queue.put(make_message(NUM_MESSAGES, ChatMessageType.AI), synchronous=True)
+        await queue.put_final_item(synchronous=True)
+
+    asyncio.run(chatter())
+
+
+def slow_consume(queue: AsyncCollatingQueue) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Slow consumer of the queue measuring peak memory while the producer runs.
+    :return: A tuple of the messages received and the peak traced memory in bytes
+    """
+    async def consume() -> List[Dict[str, Any]]:
+        received: List[Dict[str, Any]] = []
+        async for message in queue:
+            received.append(message)
+            if len(received) % 100 == 0:
+                # Give the producer plenty of time to get ahead of us
+                await asyncio.sleep(0.005)
+        return received
+
+    tracemalloc.start()
+    producer = threading.Thread(target=produce, args=(queue,), daemon=True)
+    producer.start()
+    messages: List[Dict[str, Any]] = asyncio.run(consume())
+    producer.join(timeout=30.0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    queue.close()
+    return messages, peak
+
+
+class TestAsyncCollatingQueue(TestCase):
+    """
+    Unit tests for AsyncCollatingQueue class.
+    """
+
+    def test_assumptions(self):
+        """
+        Can we construct?
+        """
+        queue = AsyncCollatingQueue()
+        self.assertIsNotNone(queue)
+
+        with self.assertRaises(ValueError):
+            AsyncCollatingQueue(max_size=10, overflow_policy="bogus")
+
+    def test_unbounded(self):
+        """
+        Tests that the default queue keeps everything.
+        """
+        queue = AsyncCollatingQueue()
+        messages, _ = slow_consume(queue)
+        self.assertEqual(NUM_MESSAGES + 1, len(messages))
+
+    def test_block(self):
+        """
+        Tests that a blocking queue keeps everything, but never holds more than its capacity.
+        """
+        queue = AsyncCollatingQueue(max_size=50, overflow_policy=AsyncCollatingQueue.BLOCK)
+        messages, _ = slow_consume(queue)
+        self.assertEqual(NUM_MESSAGES + 1, len(messages))
+        self.assertLessEqual(queue.get_stats().get("max_depth"), 50)
+
+    def test_drop(self):
+        """
+        Tests that a dropping queue sheds low-priority messages, keeps the important ones
+        and uses less memory than an unbounded queue.
+        """
+        _, unbounded_peak = slow_consume(AsyncCollatingQueue())
+
+        queue = AsyncCollatingQueue(max_size=50, overflow_policy=AsyncCollatingQueue.DROP)
+        messages, bounded_peak = slow_consume(queue)
+
+        stats: Dict[str, Any] = queue.get_stats()
+        self.assertGreater(stats.get("dropped"), 0)
+        self.assertEqual(NUM_MESSAGES + 1, len(messages) + stats.get("dropped"))
+        # Only the AI message and the end marker can go beyond capacity
+        self.assertLessEqual(stats.get("max_depth"), 52)
+        self.assertEqual(ChatMessageType.AI, messages[-1].get("type"))
+        self.assertLess(bounded_peak, unbounded_peak)
+
+    def test_coalesce(self):
+        """
+        Tests that a coalescing queue keeps order and the latest message per origin.
+        """
+        queue = AsyncCollatingQueue(max_size=50, overflow_policy=AsyncCollatingQueue.COALESCE)
+        messages, _ = slow_consume(queue)
+
+        stats: Dict[str, Any] = queue.get_stats()
+        self.assertGreater(stats.get("coalesced"), 0)
+        self.assertEqual(NUM_MESSAGES + 1, len(messages) + stats.get("coalesced"))
+        self.assertEqual(0, stats.get("held"))
+        self.assertEqual(ChatMessageType.AI, messages[-1].get("type"))
+
+        # Messages still arrive in the order they were produced,
+        # and the last progress from every agent made it through.
+        indexes: List[int] = [int(message.get("text").split(" ")[0]) for message in messages]
+        self.assertEqual(sorted(indexes), indexes)
+        for agent in range(NUM_AGENTS):
+            self.assertIn(NUM_MESSAGES - NUM_AGENTS + agent, indexes)
@@ -0,0 +1,219 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import time
+
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from neuro_san.interfaces.chat_history_summarizer import ChatHistorySummarizer
+from neuro_san.internals.chat.chat_history_message_processor import ChatHistoryMessageProcessor
+from neuro_san.internals.chat.token_length_estimator import TokenLengthEstimator
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+
+def legacy_escape(text: str) -> str:
+    """
+    :param text: The text to escape
+    :return: The text escaped the way it always has been
+    """
+    text = text.replace("{{", "{")
+    text = text.replace("}}", "}")
+    text = text.replace("{", "{{")
+    text = text.replace("}", "}}")
+    return text
+
+
+def make_conversation(num_turns: int, huge_every: int = 0, huge_size: int = 40000) -> List[Dict[str, Any]]:
+    """
+    :param num_turns: The number of human/AI exchanges in the conversation
+    :param huge_every: Every how many turns the AI answers with a huge message. 0 means never.
+    :param huge_size: The number of characters in a huge message
+    :return: A synthetic chat history with the instructions first
+    """
+    history: List[Dict[str, Any]] = [{"type": ChatMessageType.SYSTEM, "text": "You are a {helpful} agent."}]
+    for turn in range(num_turns):
+        history.append({"type": ChatMessageType.HUMAN, "text": f"Question {turn}: what about {{x}}?"})
+        answer: str = f"Answer {turn}: it depends. " * 10
+        if huge_every > 0 and turn % huge_every == 0:
+            answer = f"Answer {turn}: " + "{\"data\": [1, 2, 3]} " * (huge_size // 20)
+        history.append({"type": ChatMessageType.AI, "text": answer})
+        history.append({"type": ChatMessageType.AGENT, "text": "Not re-ingestable"})
+    return history
+
+
+class FirstWordsSummarizer(ChatHistorySummarizer):
+    """
+    ChatHistorySummarizer that keeps the first word of each dropped message.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.calls: int = 0
+
+    async def summarize(self, dropped_messages: List[Dict[str, Any]]) -> str:
+        """
+        :param dropped_messages: The messages being dropped
+        :return: The summary
+        """
+        self.calls += 1
+        return "Earlier: " + " ".join(message.get("text").split()[0] for message in dropped_messages)
+
+
+class TestChatHistoryMessageProcessor(TestCase):
+    """
+    Unit tests for ChatHistoryMessageProcessor class.
+    """
+
+    @parameterized.expand([
+        ("plain", "no braces at all"),
+        ("open", "{"),
+        ("close", "}"),
+        ("pair", "{x}"),
+        ("escaped", "{{x}}"),
+        ("triple", "{{{x}}}"),
+        ("mixed", "a {b} c {{d}} e {{{f}}} g }{ h"),
+        ("json", '{"key": {"nested": [1, 2]}}'),
+    ])
+    def test_escape_like_before(self, _name: str, text: str):
+        """
+        Tests that escaping gives the same results as always, and that it is idempotent
+        """
+        escaped: str = ChatHistoryMessageProcessor.escape_text(text)
+        self.assertEqual(legacy_escape(text), escaped)
+        self.assertEqual(escaped, ChatHistoryMessageProcessor.escape_text(escaped))
+
+        processor = ChatHistoryMessageProcessor()
+        processor.process_messages([{"type": ChatMessageType.SYSTEM, "text": text},
+                                    {"type": ChatMessageType.HUMAN, "text": text}])
+        self.assertEqual(escaped, processor.get_message_history()[-1].get("text"))
+
+    def test_no_limits(self):
+        """
+        Tests that without limits only non-re-ingestable messages are dropped
+        """
+        history: List[Dict[str, Any]] = make_conversation(10)
+        processor = ChatHistoryMessageProcessor()
+        processor.process_messages(history)
+
+        result: List[Dict[str, Any]] = processor.get_message_history()
+        self.assertEqual(21, len(result))
+        self.assertEqual("<redacted>", result[0].get("text"))
+        self.assertEqual("Question 0: what about {{x}}?", result[1].get("text"))
+
+    def test_max_message_history(self):
+        """
+        Tests that the message count limit works as it always has
+        """
+        history: List[Dict[str, Any]] = make_conversation(10)
+        processor = ChatHistoryMessageProcessor(max_message_history=4)
+        processor.process_messages(history)
+
+        result: List[Dict[str, Any]] = processor.get_message_history()
+        self.assertEqual(5, len(result))
+        self.assertEqual("<redacted>", result[0].get("text"))
+        self.assertEqual("Question 8: what about {{x}}?", result[1].get("text"))
+
+        # Historically a max of 1 means no maximum
+        processor = ChatHistoryMessageProcessor(max_message_history=1)
+        processor.process_messages(history)
+        self.assertEqual(21, len(processor.get_message_history()))
+
+    def test_max_history_tokens(self):
+        """
+        Tests that the history is trimmed to the token budget
+        """
+        history: List[Dict[str, Any]] = make_conversation(20, huge_every=7)
+        estimator = TokenLengthEstimator()
+        budget: int = 1000
+
+        processor = ChatHistoryMessageProcessor(max_history_tokens=budget)
+        processor.process_messages(history)
+        result: List[Dict[str, Any]] = processor.get_message_history()
+
+        self.assertEqual("<redacted>", result[0].get("text"))
+        self.assertEqual(result[-1].get("text"), ChatHistoryMessageProcessor.escape_text(history[-2].get("text")))
+        # Estimates are made on the text before escaping
+        ingestable: List[Dict[str, Any]] = [message for message in history[1:]
+                                            if message.get("type") != ChatMessageType.AGENT]
+        kept: List[Dict[str, Any]] = ingestable[-(len(result) - 1):]
+        tokens: int = sum(estimator.estimate_message(message.get("text")) for message in kept)
+        self.assertEqual(tokens, processor.get_history_tokens())
+        self.assertLessEqual(tokens, budget)
+
+        # The budget is filled as far as the next older message allows
+        older: Dict[str, Any] = processor.dropped_messages[-1]
+        self.assertGreater(tokens + estimator.estimate_message(older.get("text")), budget)
+
+    def test_huge_last_message(self):
+        """
+        Tests that the most recent message is kept even when it alone is over budget
+        """
+        history: List[Dict[str, Any]] = make_conversation(3, huge_every=1)
+        processor = ChatHistoryMessageProcessor(max_history_tokens=100)
+        processor.process_messages(history)
+
+        result: List[Dict[str, Any]] = processor.get_message_history()
+        self.assertEqual(2, len(result))
+        self.assertTrue(result[-1].get("text").startswith("Answer 2: "))
+
+    def test_summarizer(self):
+        """
+        Tests that dropped messages are replaced by a summary when going asynchronous
+        """
+        history: List[Dict[str, Any]] = make_conversation(10)
+        summarizer = FirstWordsSummarizer()
+        processor = ChatHistoryMessageProcessor(max_message_history=4, summarizer=summarizer)
+        asyncio.run(processor.async_process_messages(history))
+
+        result: List[Dict[str, Any]] = processor.get_message_history()
+        self.assertEqual(1, summarizer.calls)
+        self.assertEqual(6, len(result))
+        self.assertEqual(ChatMessageType.AI, result[1].get("type"))
+        self.assertEqual("Earlier: " + " ".join(["Question", "Answer"] * 8), result[1].get("text"))
+        self.assertEqual(len(processor.message_tokens), len(result))
+
+        # Nothing dropped means nothing summarized
+        summarizer = FirstWordsSummarizer()
+        processor = ChatHistoryMessageProcessor(max_history_tokens=1000000, summarizer=summarizer)
+        asyncio.run(processor.async_process_messages(history))
+        self.assertEqual(0, summarizer.calls)
+        self.assertEqual(21, len(processor.get_message_history()))
+
+    def test_benchmark(self):
+        """
+        Compares input tokens and processing time of the retained history
+        for long synthetic conversations with occasional huge messages.
+        """
+        history: List[Dict[str, Any]] = make_conversation(2000, huge_every=50)
+        estimator = TokenLengthEstimator()
+
+        for name, kwargs in (("unlimited", {}),
+                             ("max_message_history=20", {"max_message_history": 20}),
+                             ("max_history_tokens=8000", {"max_history_tokens": 8000})):
+            start_time: float = time.perf_counter()
+            processor = ChatHistoryMessageProcessor(**kwargs)
+            processor.process_messages(history)
+            result: List[Dict[str, Any]] = processor.get_message_history()
+            elapsed: float = time.perf_counter() - start_time
+
+            tokens: int = sum(estimator.estimate_message(message.get("text")) for message in result[1:])
+            print(f"\n{name}: {len(result) - 1} messages, ~{tokens} input tokens, {elapsed * 1000.0:.1f} ms")
+            if "max_history_tokens" in kwargs:
+                self.assertLessEqual(tokens, kwargs.get("max_history_tokens") * 1.1)
@@ -0,0 +1,75 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import sys
+
+from neuro_san.internals.graph.activations.sly_data_size_limiter import SlyDataSizeLimiter
+
+
+class TestSlyDataSizeLimiter(TestCase):
+    """
+    Unit tests for SlyDataSizeLimiter class.
+    """
+
+    def test_no_limit(self):
+        """
+        Tests that nothing is limited by default
+        """
+        with patch.dict("os.environ", {}, clear=True):
+            limiter = SlyDataSizeLimiter(None)
+        self.assertEqual(0, limiter.get_max_bytes())
+        limiter.check({"big": "x" * 1000000}, "sent by the client")
+
+    def test_limits(self):
+        """
+        Tests where the limit comes from and what happens when it is exceeded
+        """
+        with patch.dict("os.environ", {"AGENT_MAX_SLY_DATA_BYTES": "1000"}):
+            self.assertEqual(1000, SlyDataSizeLimiter({}).get_max_bytes())
+            limiter = SlyDataSizeLimiter({"max_sly_data_bytes": 100000})
+        self.assertEqual(100000, limiter.get_max_bytes())
+
+        limiter.check(None, "sent by the client")
+        limiter.check({"small": "x" * 1000}, "sent by the client")
+        with self.assertRaises(ValueError) as context:
+            big: List[str] = [f"{index}" + "y" * 1000 for index in range(200)]
+            limiter.check({"small": "x" * 1000, "big": big}, "returned by /other_network")
+        self.assertIn("returned by /other_network", str(context.exception))
+        self.assertIn("100000", str(context.exception))
+
+    def test_estimate_size(self):
+        """
+        Tests size estimates
+        """
+        document: str = "x" * 10000
+        self.assertEqual(sys.getsizeof(document), SlyDataSizeLimiter.estimate_size(document))
+
+        # The same document referred to by different keys is only counted once
+        sly_data: Dict[str, Any] = {"one": document, "two": [document, document]}
+        size: int = SlyDataSizeLimiter.estimate_size(sly_data)
+        self.assertGreater(size, sys.getsizeof(document))
+        self.assertLess(size, 2 * sys.getsizeof(document))
+
+        # Cycles are fine
+        sly_data["self"] = sly_data
+        self.assertGreater(SlyDataSizeLimiter.estimate_size(sly_data), size)
+
+        # Counting can stop early
+        table: Dict[str, Any] = {"rows": [{"id": row} for row in range(10000)]}
+        self.assertLess(SlyDataSizeLimiter.estimate_size(table, stop_after=1000),
+                        SlyDataSizeLimiter.estimate_size(table))
@@ -172,3 +172,29 @@ class TestSlyDataRedactor(TestCase):
         self.assertIsNone(redacted.get("not_mentioned"))
         self.assertIsNotNone(redacted.get("affirmative"))
         self.assertIsNotNone(redacted.get("negative"))
+
+    def test_values_not_copied(self):
+        """
+        Tests that redaction shares values instead of copying them
+        """
+        agent_spec = {
+            "allow": {
+                "sly_data": {
+                    "table": True,
+                    "document": "renamed",
+                }
+            }
+        }
+        redactor = SlyDataRedactor(agent_spec, config_keys=["allow.sly_data"])
+
+        sly_data = {
+            "table": [{"row": 1}, {"row": 2}],
+            "document": {"pages": ["one", "two"]},
+            "secret": "shh",
+        }
+
+        redacted: Dict[str, Any] = redactor.filter_config(sly_data)
+
+        self.assertIs(sly_data["table"], redacted.get("table"))
+        self.assertIs(sly_data["document"], redacted.get("renamed"))
+        self.assertIsNone(redacted.get("secret"))
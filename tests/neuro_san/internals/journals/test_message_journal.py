@@ -0,0 +1,147 @@
+
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import threading
+
+from unittest import TestCase
+
+from langchain_core.messages.ai import AIMessage
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.journals.message_journal import MessageJournal
+from neuro_san.internals.messages.agent_message import AgentMessage
+from neuro_san.internals.messages.origination import Origination
+
+NUM_MESSAGES: int = 10000
+NUM_AGENTS: int = 10
+
+
+class PreviousAsyncCollatingQueue(AsyncCollatingQueue):
+    """
+    Queue which always crosses the sync/async boundary on synchronous puts, as before.
+    """
+
+    def is_consumer_loop(self) -> bool:
+        return False
+
+
+async def produce(journal: MessageJournal, queue: AsyncCollatingQueue):
+    """
+    Writes a chatty agent network's worth of messages to the journal.
+    Agents yield to the event loop every now and then, like they would for I/O.
+    """
+    origination = Origination()
+    front_man: List[Dict[str, Any]] = origination.add_spec_name_to_origin([], "front_man")
+    origins: List[List[Dict[str, Any]]] = [origination.add_spec_name_to_origin(front_man, f"agent_{index}")
+                                           for index in range(NUM_AGENTS)]
+    for index in range(NUM_MESSAGES):
+        await journal.write_message(AgentMessage(content=f"progress {index}"), origins[index % NUM_AGENTS])
+        if index % 10 == 0:
+            await asyncio.sleep(0)
+    await journal.write_message(AIMessage(content="answer"), front_man)
+    await queue.put_final_item(synchronous=True)
+
+
+async def consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+    """
+    :return: All the messages from the queue
+    """
+    received: List[Dict[str, Any]] = []
+    async for message in queue:
+        received.append(message)
+    return received
+
+
+def run_same_loop(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+    """
+    Runs producer and consumer on the same event loop, like a DirectAgentSession does.
+    :return: The messages received by the consumer
+    """
+    async def both() -> List[Dict[str, Any]]:
+        consumer: asyncio.Task = asyncio.create_task(consume(queue))
+        # Let the consumer start waiting first
+        await asyncio.sleep(0)
+        await produce(MessageJournal(queue), queue)
+        return await consumer
+
+    return asyncio.run(both())
+
+
+def run_separate_loops(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+    """
+    Runs producer and consumer on separate event loops in separate threads,
+    like the http server does.
+    :return: The messages received by the consumer
+    """
+    def producer_thread():
+        asyncio.run(produce(MessageJournal(queue), queue))
+
+    async def consume_after_start() -> List[Dict[str, Any]]:
+        # The consumer is waiting on the queue before the producer starts
+        consumer: asyncio.Task = asyncio.create_task(consume(queue))
+        await asyncio.sleep(0)
+        producer = threading.Thread(target=producer_thread, daemon=True)
+        producer.start()
+        received: List[Dict[str, Any]] = await consumer
+        producer.join(timeout=30.0)
+        return received
+
+    return asyncio.run(consume_after_start())
+
+
+class TestMessageJournal(TestCase):
+    """
+    Tests MessageJournal delivery into an AsyncCollatingQueue.
+    """
+
+    def assert_all_messages(self, messages: List[Dict[str, Any]]):
+        """
+        Asserts that every message arrived intact and in order.
+        """
+        self.assertEqual(NUM_MESSAGES + 1, len(messages))
+        for index, message in enumerate(messages[:-1]):
+            self.assertEqual(f"progress {index}", message.get("text"))
+            self.assertEqual(f"front_man.agent_{index % NUM_AGENTS}",
+                             Origination.get_full_name_from_origin(message.get("origin")))
+        self.assertEqual("answer", messages[-1].get("text"))
+
+    def test_same_loop(self):
+        """
+        Tests that the previous, the async-native and the batched puts deliver
+        the same messages when producer and consumer share a loop.
+        """
+        previous: List[Dict[str, Any]] = run_same_loop(PreviousAsyncCollatingQueue())
+        native: List[Dict[str, Any]] = run_same_loop(AsyncCollatingQueue())
+        batched: List[Dict[str, Any]] = run_same_loop(AsyncCollatingQueue(batch_messages=True))
+
+        self.assert_all_messages(previous)
+        self.assertEqual(previous, native)
+        self.assertEqual(previous, batched)
+
+    def test_separate_loops(self):
+        """
+        Tests that batched and unbatched puts deliver the same messages
+        when producer and consumer are on different loops.
+        """
+        unbatched: List[Dict[str, Any]] = run_separate_loops(AsyncCollatingQueue())
+
+        batched_queue = AsyncCollatingQueue(batch_messages=True)
+        batched: List[Dict[str, Any]] = run_separate_loops(batched_queue)
+
+        self.assert_all_messages(unbatched)
+        self.assertEqual(unbatched, batched)
+        self.assertEqual(NUM_MESSAGES + 2, batched_queue.get_stats().get("put"))
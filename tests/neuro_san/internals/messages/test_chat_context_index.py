@@ -0,0 +1,234 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from contextlib import ExitStack
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import time
+
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.human import HumanMessage
+
+from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.chat_context_index import ChatContextIndex
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.run_context.langchain.core.langchain_run_context import LangChainRunContext
+
+NUM_AGENTS: int = 20
+NUM_TURNS: int = 100
+ACTIVATIONS_PER_AGENT: int = 5
+NUM_REQUESTS: int = 5
+
+
+class NamedToolCaller:
+    """
+    Just enough of a ToolCaller to give a LangChainRunContext its origin.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: The name of the agent
+        """
+        self.name: str = name
+
+    def get_name(self) -> str:
+        """
+        :return: The name of the agent
+        """
+        return self.name
+
+    def get_agent_tool_spec(self) -> Dict[str, Any]:
+        """
+        :return: An empty agent spec
+        """
+        return {}
+
+
+def scan_chat_context(chat_context: Dict[str, Any], origin: List[Dict[str, Any]]) -> List[BaseMessage]:
+    """
+    How chat histories used to be found: a scan of every chat history for every agent,
+    converting the messages of the one found every time.
+
+    :param chat_context: The ChatContext dictionary
+    :param origin: The origin of the agent
+    :return: The chat history of the agent
+    """
+    chat_history: List[BaseMessage] = []
+    our_origin_str: str = Origination.get_full_name_from_origin(origin)
+    for one_chat_history in chat_context.get("chat_histories", []):
+        test_origin_str: str = Origination.get_full_name_from_origin(one_chat_history.get("origin", []))
+        if test_origin_str != our_origin_str:
+            continue
+        converter = BaseMessageDictionaryConverter()
+        for chat_message in one_chat_history.get("messages", []):
+            base_message: BaseMessage = converter.from_dict(chat_message)
+            if base_message is not None:
+                chat_history.append(base_message)
+        break
+    return chat_history
+
+
+class TestChatContextIndex(TestCase):
+    """
+    Tests for ChatContextIndex and how LangChainRunContext uses it.
+    """
+
+    @staticmethod
+    def get_agent_origins() -> List[List[Dict[str, Any]]]:
+        """
+        :return: The origins of the first activation of each agent in a network whose
+                front man calls all the others
+        """
+        origination = Origination()
+        front_man_origin: List[Dict[str, Any]] = origination.add_spec_name_to_origin([], "front_man")
+        origins: List[List[Dict[str, Any]]] = [front_man_origin]
+        for agent_index in range(1, NUM_AGENTS):
+            origins.append(origination.add_spec_name_to_origin(front_man_origin, f"agent_{agent_index}"))
+        return origins
+
+    def make_chat_context(self) -> Dict[str, Any]:
+        """
+        :return: A ChatContext dictionary, fresh off the wire, with a long chat history for each agent
+        """
+        chat_histories: List[Dict[str, Any]] = []
+        for origin in self.get_agent_origins():
+            name: str = Origination.get_full_name_from_origin(origin)
+            messages: List[Dict[str, Any]] = []
+            for turn in range(NUM_TURNS):
+                messages.append({"type": ChatMessageType.HUMAN, "text": f"Question {turn} for {name}"})
+                messages.append({"type": ChatMessageType.AI, "text": f"Answer {turn} from {name}"})
+                messages.append({"type": ChatMessageType.AGENT, "text": "Not for chat history"})
+            # Plain dictionaries, as they would be when parsed from a request
+            chat_histories.append({"origin": [dict(origin_dict) for origin_dict in origin],
+                                   "messages": messages})
+        return {"chat_histories": chat_histories}
+
+    @staticmethod
+    def run_request(chat_context: Dict[str, Any]) -> List[LangChainRunContext]:
+        """
+        Creates the run contexts of one request to the network, in which every agent is activated
+        several times. Only the first activation of each agent has a chat history in the chat context.
+
+        :param chat_context: The ChatContext dictionary of the request
+        :return: The run contexts created
+        """
+        invocation_context = MagicMock()
+        invocation_context.get_origination.return_value = Origination()
+
+        session_run_context = LangChainRunContext({}, None, None, invocation_context, chat_context)
+        front_man = LangChainRunContext({}, session_run_context, NamedToolCaller("front_man"), None, None)
+        run_contexts: List[LangChainRunContext] = [front_man]
+        for _ in range(ACTIVATIONS_PER_AGENT):
+            for agent_index in range(1, NUM_AGENTS):
+                run_contexts.append(LangChainRunContext({}, front_man,
+                                                        NamedToolCaller(f"agent_{agent_index}"), None, None))
+        return run_contexts
+
+    def test_same_histories(self):
+        """
+        Tests that every agent gets the same chat history as scanning would give it
+        """
+        chat_context: Dict[str, Any] = self.make_chat_context()
+        run_contexts: List[LangChainRunContext] = self.run_request(chat_context)
+
+        index: ChatContextIndex = run_contexts[0].get_chat_context_index()
+        num_with_history: int = 0
+        for run_context in run_contexts:
+            # One index for the whole request
+            self.assertIs(index, run_context.get_chat_context_index())
+
+            expected: List[BaseMessage] = scan_chat_context(chat_context, run_context.get_origin())
+            self.assertEqual(expected, run_context.chat_history)
+            if expected:
+                num_with_history += 1
+                self.assertEqual(2 * NUM_TURNS, len(run_context.chat_history))
+                self.assertIsInstance(run_context.chat_history[0], HumanMessage)
+                self.assertIsInstance(run_context.chat_history[1], AIMessage)
+        self.assertEqual(NUM_AGENTS, num_with_history)
+
+    def test_shared_messages(self):
+        """
+        Tests that messages are converted once and shared, but lists are not
+        """
+        chat_context: Dict[str, Any] = self.make_chat_context()
+        origin: List[Dict[str, Any]] = self.get_agent_origins()[3]
+        index = ChatContextIndex(chat_context)
+        self.assertIs(chat_context, index.get_chat_context())
+
+        one: List[BaseMessage] = index.get_chat_history(origin)
+        other: List[BaseMessage] = index.get_chat_history(origin)
+        self.assertIsNot(one, other)
+        self.assertIs(one[0], other[0])
+
+        one.append(HumanMessage(content="Only in one"))
+        self.assertEqual(2 * NUM_TURNS, len(index.get_chat_history(origin)))
+
+        self.assertIsNone(index.get_chat_history([{"tool": "nobody", "instantiation_index": 1}]))
+        self.assertIsNone(ChatContextIndex({}).get_chat_history(origin))
+        self.assertIsNone(ChatContextIndex(None).get_chat_history(origin))
+
+    def test_benchmark(self):
+        """
+        Compares requests to a 20-agent network with a 100-turn chat history for every agent
+        in the chat context, with chat histories found by scanning and by the index.
+        """
+        def scan_update_from_chat_context(run_context: LangChainRunContext, chat_context: Dict[str, Any]):
+            run_context.chat_context = chat_context
+            if chat_context is not None:
+                chat_history: List[BaseMessage] = scan_chat_context(chat_context, run_context.get_origin())
+                if chat_history:
+                    run_context.chat_history = chat_history
+
+        # Get imports and caches out of the way
+        self.run_request(self.make_chat_context())
+
+        converter_seconds: Dict[str, float] = {}
+        conversions: Dict[str, int] = {"indexed": 0, "scanning": 0}
+        current: List[str] = [""]
+        real_from_dict = BaseMessageDictionaryConverter.from_dict
+
+        def counting_from_dict(converter: BaseMessageDictionaryConverter, obj_dict: Dict[str, Any]) -> BaseMessage:
+            conversions[current[0]] += 1
+            return real_from_dict(converter, obj_dict)
+
+        for name in ("indexed", "scanning"):
+            current[0] = name
+            with ExitStack() as stack:
+                stack.enter_context(patch.object(BaseMessageDictionaryConverter, "from_dict", counting_from_dict))
+                if name == "scanning":
+                    stack.enter_context(patch.object(LangChainRunContext, "update_from_chat_context",
+                                                     scan_update_from_chat_context))
+                seconds: float = 0.0
+                for _ in range(NUM_REQUESTS):
+                    chat_context: Dict[str, Any] = self.make_chat_context()
+                    start: float = time.perf_counter()
+                    self.run_request(chat_context)
+                    seconds += time.perf_counter() - start
+            converter_seconds[name] = seconds
+
+        print(f"\n{NUM_REQUESTS} requests x {NUM_AGENTS} agents x {ACTIVATIONS_PER_AGENT} activations, "
+              f"{NUM_TURNS} turns: scanning {converter_seconds['scanning']:.3f}s, "
+              f"indexed {converter_seconds['indexed']:.3f}s")
+
+        # Only the messages of agents with a chat history get converted, once each.
+        self.assertEqual(NUM_REQUESTS * NUM_AGENTS * NUM_TURNS * 3, conversions["indexed"])
+        self.assertEqual(conversions["scanning"], conversions["indexed"])
+        # Conversion dominates either way, so the index is mostly about not getting slower
+        # as activations and chat histories grow.
+        self.assertLess(converter_seconds["indexed"], converter_seconds["scanning"] * 1.5)
@@ -0,0 +1,237 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+import json
+import time
+
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.chat_response_envelope import ChatResponseEnvelope
+from neuro_san.internals.utils.json_codec import JsonCodec
+from neuro_san.message_processing.basic_message_processor import BasicMessageProcessor
+from neuro_san.message_processing.message_processor import MessageProcessor
+from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
+
+NUM_INTERMEDIATE: int = 1000
+NUM_CALLS: int = 20
+
+FRONT_MAN: List[Dict[str, Any]] = [{"tool": "front_man", "instantiation_index": 1}]
+
+
+def make_line(message: Dict[str, Any], codec: JsonCodec) -> bytes:
+    """
+    :param message: A ChatMessage dictionary
+    :param codec: The JsonCodec to write the line with
+    :return: The line as a neuro-san server would stream it
+    """
+    chat_response: Dict[str, Any] = ChatMessageConverter().to_dict({"response": message})
+    return codec.dumps_bytes(chat_response) + b"\n"
+
+
+def make_stream(codec: JsonCodec) -> List[bytes]:
+    """
+    :param codec: The JsonCodec to write the lines with
+    :return: The lines of a streaming_chat() response from a downstream network
+            whose front man calls agents that emit a lot of intermediate messages.
+    """
+    lines: List[bytes] = []
+    for index in range(NUM_INTERMEDIATE):
+        origin: List[Dict[str, Any]] = FRONT_MAN + [{"tool": "researcher", "instantiation_index": 1},
+                                                    {"tool": f"searcher_{index % 7}", "instantiation_index": 1}]
+        if index % 3 == 0:
+            message = {"type": ChatMessageType.AI, "origin": origin,
+                       "text": f"Finding number {index}. " * 40}
+        elif index % 3 == 1:
+            rows: List[Dict[str, Any]] = [{"key": row, "value": f"value {row}"} for row in range(30)]
+            message = {"type": ChatMessageType.AGENT, "origin": origin, "text": "Received arguments:",
+                       "structure": {"tool_start": True, "tool_args": {"rows": rows}}}
+        else:
+            message = {"type": ChatMessageType.AI_MESSAGE_CHUNK, "origin": origin, "text": f"token{index} "}
+        lines.append(make_line(message, codec))
+
+    lines.append(make_line({"type": ChatMessageType.AI, "origin": FRONT_MAN, "text": "The answer"}, codec))
+    lines.append(make_line({"type": ChatMessageType.AGENT, "origin": FRONT_MAN, "text": "Token accounting",
+                            "structure": {"total_tokens": 1234}}, codec))
+    lines.append(make_line({"type": ChatMessageType.AGENT_FRAMEWORK, "origin": FRONT_MAN,
+                            "chat_context": {"chat_histories": []}, "sly_data": {"secret": 42}}, codec))
+    return lines
+
+
+class RecordingMessageProcessor(MessageProcessor):
+    """
+    Stands in for something that wants to see every message, like reporting to the journal does.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.count: int = 0
+
+    def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
+        """
+        :param chat_message_dict: The ChatMessage dictionary to process.
+        :param message_type: The ChatMessageType of the chat_message_dictionary to process.
+        """
+        self.count += 1
+
+
+async def process_all(lines: List[bytes], processor: BasicMessageProcessor):
+    """
+    How responses used to be processed: every line fully parsed and processed.
+
+    :param lines: The lines of the stream
+    :param processor: The BasicMessageProcessor to process with
+    """
+    codec: JsonCodec = JsonCodec.get_shared()
+    for line in lines:
+        chat_response: Dict[str, Any] = codec.loads(line)
+        await processor.async_process_message(chat_response.get("response", {}))
+
+
+async def process_envelopes(lines: List[bytes], processor: BasicMessageProcessor) -> int:
+    """
+    How ExternalActivation processes responses now.
+
+    :param lines: The lines of the stream
+    :param processor: The BasicMessageProcessor to process with
+    :return: The number of lines that were fully parsed
+    """
+    parsed: int = 0
+    for line in lines:
+        envelope = ChatResponseEnvelope(line)
+        message_type: ChatMessageType = envelope.peek_message_type()
+        origin: List[Dict[str, Any]] = envelope.peek_origin()
+        if message_type is not None and origin is not None \
+                and not processor.may_process_message(message_type, origin):
+            continue
+        parsed += 1
+        await processor.async_process_message(envelope.get_chat_response().get("response", {}))
+    return parsed
+
+
+class TestChatResponseEnvelope(TestCase):
+    """
+    Tests for ChatResponseEnvelope and how it lets intermediate messages go unparsed.
+    """
+
+    def test_peek(self):
+        """
+        Tests peeking at lines written by either JSON implementation.
+        """
+        origin: List[Dict[str, Any]] = FRONT_MAN + [{"tool": "helper [1]", "instantiation_index": 2}]
+        message: Dict[str, Any] = {"type": ChatMessageType.AI, "origin": origin, "text": "Café ]}"}
+        for implementation in ("orjson", "json"):
+            line: bytes = make_line(message, JsonCodec(implementation))
+            envelope = ChatResponseEnvelope(line)
+            self.assertEqual(ChatMessageType.AI, envelope.peek_message_type())
+            self.assertEqual(origin, envelope.peek_origin())
+            self.assertIsNone(envelope.chat_response)
+            self.assertEqual("Café ]}", envelope.get_chat_response()["response"]["text"])
+
+    def test_cannot_peek(self):
+        """
+        Tests lines whose type and origin cannot be told from their start.
+        """
+        long_origin: List[Dict[str, Any]] = [{"tool": "x" * 100, "instantiation_index": 1}] * 100
+        lines: List[str] = [
+            # No origin
+            '{"response": {"type": "AI", "text": "hello"}}',
+            # Origin after the text
+            '{"response": {"type": "AI", "text": "hello", "origin": []}}',
+            # Not a type we know
+            '{"response": {"type": "NOT_A_TYPE", "origin": []}}',
+            # Origin too long for the window
+            json.dumps({"response": {"type": "AI", "origin": long_origin}}),
+            # Not a response at all
+            '{"error": "oops"}',
+        ]
+        for line in lines:
+            envelope = ChatResponseEnvelope(line)
+            self.assertTrue(envelope.peek_message_type() is None or envelope.peek_origin() is None)
+            self.assertEqual(json.loads(line), envelope.get_chat_response())
+
+    def test_parsed(self):
+        """
+        Tests envelopes around responses that were parsed already.
+        """
+        chat_response: Dict[str, Any] = {"response": {"type": "AGENT", "origin": FRONT_MAN}}
+        envelope = ChatResponseEnvelope(chat_response=chat_response)
+        self.assertEqual(ChatMessageType.AGENT, envelope.peek_message_type())
+        self.assertEqual(FRONT_MAN, envelope.peek_origin())
+        self.assertIs(chat_response, envelope.get_chat_response())
+        self.assertIsNone(envelope.get_line())
+
+    def test_may_process_message(self):
+        """
+        Tests which messages the basic processing could want.
+        """
+        processor = BasicMessageProcessor()
+        deep: List[Dict[str, Any]] = FRONT_MAN + FRONT_MAN
+        self.assertTrue(processor.may_process_message(ChatMessageType.AI, FRONT_MAN))
+        self.assertTrue(processor.may_process_message(ChatMessageType.AGENT, FRONT_MAN))
+        self.assertTrue(processor.may_process_message(ChatMessageType.AGENT_FRAMEWORK, deep))
+        self.assertFalse(processor.may_process_message(ChatMessageType.AI, deep))
+        self.assertFalse(processor.may_process_message(ChatMessageType.AGENT, deep))
+        self.assertFalse(processor.may_process_message(ChatMessageType.AI_MESSAGE_CHUNK, FRONT_MAN))
+
+        # Anything else that wants to see every message turns skipping off.
+        processor.add_processor(RecordingMessageProcessor())
+        self.assertTrue(processor.may_process_message(ChatMessageType.AI_MESSAGE_CHUNK, deep))
+
+    def test_benchmark(self):
+        """
+        Compares CPU time processing the stream from a downstream network that emits
+        NUM_INTERMEDIATE intermediate messages per call with and without envelopes.
+        """
+        lines: List[bytes] = make_stream(JsonCodec.get_shared())
+
+        everything = BasicMessageProcessor()
+        asyncio.run(process_all(lines, everything))
+        skipping = BasicMessageProcessor()
+        parsed: int = asyncio.run(process_envelopes(lines, skipping))
+
+        # Same results with only the front man's messages parsed
+        self.assertEqual(3, parsed)
+        self.assertEqual("The answer", skipping.get_answer())
+        self.assertEqual(everything.get_answer(), skipping.get_answer())
+        self.assertEqual(everything.get_chat_context(), skipping.get_chat_context())
+        self.assertEqual(everything.get_sly_data(), skipping.get_sly_data())
+        self.assertEqual(everything.get_token_accounting(), skipping.get_token_accounting())
+
+        # Nothing is skipped when something wants to see everything
+        recording = RecordingMessageProcessor()
+        reporting = BasicMessageProcessor([recording])
+        parsed = asyncio.run(process_envelopes(lines, reporting))
+        self.assertEqual(len(lines), parsed)
+        self.assertEqual(len(lines), recording.count)
+
+        start: float = time.process_time()
+        for _ in range(NUM_CALLS):
+            asyncio.run(process_all(lines, BasicMessageProcessor()))
+        all_seconds: float = (time.process_time() - start) / NUM_CALLS
+
+        start = time.process_time()
+        for _ in range(NUM_CALLS):
+            asyncio.run(process_envelopes(lines, BasicMessageProcessor()))
+        envelope_seconds: float = (time.process_time() - start) / NUM_CALLS
+
+        print(f"\nCPU per call with {NUM_INTERMEDIATE} intermediate messages "
+              f"({JsonCodec.get_shared().get_implementation_name()}): "
+              f"parse everything {all_seconds * 1000:.2f} ms, "
+              f"envelopes {envelope_seconds * 1000:.2f} ms")
+        self.assertLess(envelope_seconds, all_seconds)
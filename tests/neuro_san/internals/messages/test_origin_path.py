@@ -0,0 +1,149 @@
+
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import pickle
+import time
+
+from copy import copy
+from copy import deepcopy
+from unittest import TestCase
+
+from neuro_san.internals.messages.origin_path import OriginPath
+from neuro_san.internals.messages.origination import Origination
+
+DEPTH: int = 8
+WIDTH: int = 20
+NUM_LOOKUPS: int = 20
+
+
+def previous_full_name(origin: List[Dict[str, Any]]) -> str:
+    """
+    :param origin: The origin list
+    :return: The full name as computed from scratch
+    """
+    return ".".join(OriginPath.get_name_component(origin_dict) for origin_dict in origin).replace("./", "/")
+
+
+class TestOriginPath(TestCase):
+    """
+    Tests for the OriginPath class and how Origination uses it.
+    """
+
+    def test_wire_format(self):
+        """
+        Tests that an OriginPath is interchangeable with the list-of-dicts origin.
+        """
+        origination = Origination()
+        front: List[Dict[str, Any]] = origination.add_spec_name_to_origin([], "front")
+        agent: List[Dict[str, Any]] = origination.add_spec_name_to_origin(front, "agent")
+        again: List[Dict[str, Any]] = origination.add_spec_name_to_origin(front, "agent")
+
+        expected: List[Dict[str, Any]] = [
+            {"tool": "front", "instantiation_index": 1},
+            {"tool": "agent", "instantiation_index": 2},
+        ]
+        self.assertIsInstance(again, OriginPath)
+        self.assertEqual(expected, again)
+        self.assertEqual(json.dumps(expected), json.dumps(again))
+        self.assertEqual("front.agent", Origination.get_full_name_from_origin(agent))
+        self.assertEqual("front.agent-02", Origination.get_full_name_from_origin(again))
+        self.assertEqual("front.agent-02", Origination.get_full_name_from_origin(expected))
+
+        unpickled: OriginPath = pickle.loads(pickle.dumps(again))
+        self.assertEqual(again, unpickled)
+        self.assertEqual("front.agent-02", unpickled.get_full_name())
+
+    def test_immutable(self):
+        """
+        Tests that an OriginPath cannot be changed, but its copies can.
+        """
+        path: OriginPath = OriginPath.get_root().child("front", 1)
+        with self.assertRaises(TypeError):
+            path.append({"tool": "other"})
+        with self.assertRaises(TypeError):
+            path[0] = {"tool": "other"}
+        with self.assertRaises(TypeError):
+            path += [{"tool": "other"}]
+
+        copied: List[Dict[str, Any]] = copy(path)
+        copied.append({"tool": "other"})
+        self.assertEqual(1, len(path))
+
+        deep: List[Dict[str, Any]] = deepcopy(path)
+        deep[0]["tool"] = "changed"
+        self.assertEqual("front", path[0].get("tool"))
+
+    def test_interning(self):
+        """
+        Tests that the same path reached by different requests is the same instance.
+        """
+        first = Origination()
+        second = Origination()
+        first_path: OriginPath = first.add_spec_name_to_origin(first.add_spec_name_to_origin([], "front"), "agent")
+        second_path: OriginPath = second.add_spec_name_to_origin(second.add_spec_name_to_origin([], "front"), "agent")
+        self.assertIs(first_path, second_path)
+
+        # Paths derived from origins that came from elsewhere are not interned
+        external: OriginPath = OriginPath.from_origin([{"tool": "front"}]).child("agent", 1)
+        self.assertIsNot(first_path, external)
+        self.assertEqual("front.agent", external.get_full_name())
+
+    def test_external_names(self):
+        """
+        Tests that the incremental names match names computed from scratch.
+        """
+        path: OriginPath = OriginPath.get_root().child("front", 1).child("/remote_agent", 3).child("tool", 12)
+        self.assertEqual(previous_full_name(path), path.get_full_name())
+        self.assertEqual(previous_full_name(path), OriginPath(list(path)).get_full_name())
+
+    def test_benchmark(self):
+        """
+        Compares full name lookups for every node of a deep and wide network
+        with and without precomputed names.
+        """
+        paths: List[OriginPath] = []
+        origination = Origination()
+        parents: List[List[Dict[str, Any]]] = [origination.add_spec_name_to_origin([], "front")]
+        for depth in range(DEPTH):
+            parent: List[Dict[str, Any]] = parents[-1]
+            for width in range(WIDTH):
+                paths.append(origination.add_spec_name_to_origin(parent, f"agent_{depth}_{width}"))
+            parents.append(paths[-1])
+        plain_paths: List[List[Dict[str, Any]]] = [list(path) for path in paths]
+
+        start_time: float = time.monotonic()
+        for _ in range(NUM_LOOKUPS):
+            for plain_path in plain_paths:
+                previous_full_name(plain_path)
+            for plain_path in plain_paths:
+                deepcopy(plain_path)
+        previous_seconds: float = time.monotonic() - start_time
+
+        start_time = time.monotonic()
+        for _ in range(NUM_LOOKUPS):
+            for path in paths:
+                Origination.get_full_name_from_origin(path)
+            for path in paths:
+                deepcopy(path)
+        new_seconds: float = time.monotonic() - start_time
+
+        for path, plain_path in zip(paths, plain_paths):
+            self.assertEqual(previous_full_name(plain_path), path.get_full_name())
+
+        print(f"{len(paths)} origins of depth up to {DEPTH + 1}: "
+              f"computed {previous_seconds:.4f}s, precomputed {new_seconds:.4f}s")
+        self.assertLess(new_seconds * 3.0, previous_seconds)
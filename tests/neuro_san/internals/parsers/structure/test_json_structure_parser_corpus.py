@@ -0,0 +1,159 @@
+
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import re
+import time
+
+from json.decoder import JSONDecodeError
+from unittest import TestCase
+
+import pytest
+from json_repair import loads
+
+from neuro_san.internals.parsers.structure.json_structure_parser import JsonStructureParser
+
+LONG_PROSE: str = " ".join(f"Sentence number {index} of a long answer without any structure." for index in range(400))
+
+CORPUS: List[str] = [
+    "",
+    "This has no structure in it",
+    "```json\n{\n    \"key\": \"value\"\n}\n```",
+    "Here is some JSON:\n```json\n{\"key\": \"value\"}\n```\nThis has minimal structure in it.",
+    "Before\n```\n{\"key\": [1, 2, 3], \"nested\": {\"a\": true}}\n```\nAfter",
+    "Inline `{\"key\": \"value\"}` structure",
+    "{\"key\": \"value\"}",
+    "Prefix {\"key\": \"value\"} suffix",
+    "Prefix {\"key\": \"value\",} trailing comma",
+    "Prefix {key: 'value'} unquoted",
+    "{\"truncated\": \"value",
+    "Unbalanced { brace with no end",
+    "Unbalanced } brace with no start",
+    "```\nprint('not json')\n```",
+    "```python\nx = {'a': 1}\n```",
+    "```json\n[1, 2, 3]\n```",
+    "```json\n\"key\": \"value\"\n```",
+    "Two blocks ```json\n{\"a\": 1}\n``` and ```json\n{\"b\": 2}\n``` here",
+    "Two braces {\"a\": 1} and {\"b\": 2} here",
+    "Set notation {a, b} in math",
+    "```json\n{\"key\": \"value\"}\n",
+    "``` just fences ```",
+    "{}",
+    "```json\n{}\n```",
+    "{\"key\": \"}\"}",
+    "{\"unicode\": \"caf\\u00e9 ☃\"}",
+    "Text\n```JSON\n{\"key\": \"upper\"}\n```",
+    "`{\"a\": 1}` then {\"b\": 2}",
+    "{\"a\": {\"b\": {\"c\": [1, {\"d\": null}]}}}",
+    "Json with comments ```json\n{\"a\": 1 // one\n}\n```",
+    LONG_PROSE,
+    LONG_PROSE + "\n```json\n{\"key\": \"value\"}\n```\n" + LONG_PROSE,
+    LONG_PROSE + " {\"key\": \"value\"} " + LONG_PROSE,
+]
+
+# Text that is expensive for the previous parser
+SLOW_CORPUS: List[str] = [
+    "{ " * 3000 + "never closed",
+    "`{ " * 2000 + "never closed",
+    "``` " * 2000,
+    LONG_PROSE * 4,
+    LONG_PROSE + "\n```json\n{\"key\": \"value\", \"list\": [" +
+    ", ".join(str(index) for index in range(3000)) + "]}\n```",
+]
+
+
+class PreviousJsonStructureParser:
+    """
+    The regex-based JsonStructureParser implementation from before the single-pass scanner,
+    kept here as a reference for equivalence and benchmark purposes.
+    """
+
+    def __init__(self):
+        self.remainder: str = None
+
+    def parse_structure(self, content: str) -> Dict[str, Any]:
+        """
+        :param content: The string to parse for structure
+        :return: The dictionary structure embedded in the content, if any.
+        """
+        self.remainder = None
+        delimiters: Dict[str, str] = {
+            "```json": "```",
+            "```": "```",
+            "`{": "}`",
+            "{": "}",
+        }
+        meat, self.remainder = self._extract_delimited_block(content, delimiters)
+        structure: Dict[str, Any] = None
+        try:
+            structure = loads(meat)
+            if not isinstance(structure, Dict):
+                structure = None
+        except JSONDecodeError:
+            self.remainder = None
+        except TypeError:
+            self.remainder = None
+        return structure
+
+    def _extract_delimited_block(self, text: str, delimiters: Dict[str, str]) -> Tuple[Optional[str], str]:
+        """
+        :return: A tuple of (main block content, remainder string)
+        """
+        for start, end in delimiters.items():
+            pattern: str = re.escape(start) + r"(.*)" + re.escape(end)
+            match = re.search(pattern, text, re.DOTALL)
+            if match:
+                main: str = match.group(0).strip()
+                remainder: str = text[:match.start()] + text[match.end():]
+                return main, remainder.strip()
+        return None, text.strip()
+
+
+class TestJsonStructureParserCorpus(TestCase):
+    """
+    Compares JsonStructureParser against its previous implementation over a corpus of LLM-ish answers.
+    """
+
+    def test_equivalence(self):
+        """
+        Tests that the structure and remainder are the same as they were before.
+        """
+        for content in CORPUS + SLOW_CORPUS:
+            previous = PreviousJsonStructureParser()
+            parser = JsonStructureParser()
+            with self.subTest(content=content[:60]):
+                self.assertEqual(previous.parse_structure(content), parser.parse_structure(content))
+                self.assertEqual(previous.remainder, parser.get_remainder())
+
+    @pytest.mark.integration
+    def test_benchmark(self):
+        """
+        Tests that the new parser is substantially faster over the corpus.
+        """
+        corpus: List[str] = CORPUS + SLOW_CORPUS
+
+        start_time: float = time.monotonic()
+        for content in corpus:
+            PreviousJsonStructureParser().parse_structure(content)
+        previous_seconds: float = time.monotonic() - start_time
+
+        start_time = time.monotonic()
+        for content in corpus:
+            JsonStructureParser().parse_structure(content)
+        new_seconds: float = time.monotonic() - start_time
+
+        self.assertLess(new_seconds * 5.0, previous_seconds)
@@ -0,0 +1,234 @@
+
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+import time
+
+from unittest import TestCase
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.base import BaseMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatResult
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.run_context.langchain.core.langchain_openai_function_tool \
+    import LangChainOpenAIFunctionTool
+from neuro_san.internals.run_context.langchain.core.langchain_run_context import LangChainRunContext
+from neuro_san.internals.run_context.langchain.core.precompiled_agent_cache import PrecompiledAgentCache
+
+NUM_AGENTS: int = 10
+NUM_TOOLS_PER_AGENT: int = 3
+NUM_REQUESTS: int = 20
+
+
+class FakeToolCallingChatModel(BaseChatModel):
+    """
+    Chat model which binds tools the way real chat models do, but never gets called.
+    """
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-calling"
+
+    def _generate(self, messages: List[BaseMessage], stop: List[str] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="done"))])
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        formatted_tools: List[Dict[str, Any]] = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, **kwargs)
+
+
+class FakeToolCaller:
+    """
+    Just enough of a ToolCaller to build an AgentExecutor.
+    """
+
+    def get_agent_tool_spec(self) -> Dict[str, Any]:
+        """
+        :return: An empty agent spec, so defaults are used
+        """
+        return {}
+
+
+class NullJournal(Journal):
+    """
+    Journal which drops everything written to it.
+    """
+
+    async def write_message(self, message: BaseMessage, origin: List[Dict[str, Any]]):
+        """
+        :param message: The message to drop
+        :param origin: The origin of the message
+        """
+
+
+def get_function_json(agent_index: int, tool_index: int) -> Dict[str, Any]:
+    """
+    :return: The function spec for one of the tools of one of the agents in the network
+    """
+    return {
+        "name": f"tool_{agent_index}_{tool_index}",
+        "description": f"Tool number {tool_index} for agent number {agent_index}",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "inquiry": {
+                    "type": "string",
+                    "description": "The inquiry"
+                },
+                "mode": {
+                    "type": "string",
+                    "description": "How to answer"
+                },
+                "details": {
+                    "type": "object",
+                    "description": "Extra details",
+                    "properties": {
+                        "limit": {
+                            "type": "int",
+                            "description": "Maximum number of results"
+                        },
+                        "tags": {
+                            "type": "array",
+                            "description": "Tags to apply",
+                            "items": {"type": "string"}
+                        }
+                    }
+                }
+            },
+            "required": ["inquiry"]
+        }
+    }
+
+
+class TestPrecompiledAgentCache(TestCase):
+    """
+    Tests for the PrecompiledAgentCache and how LangChainRunContext uses it.
+    """
+
+    def setUp(self):
+        self.previous_shared: PrecompiledAgentCache = PrecompiledAgentCache.shared
+
+    def tearDown(self):
+        PrecompiledAgentCache.shared = self.previous_shared
+
+    def test_cache_hits(self):
+        """
+        Tests that equivalent content gets the same artifacts back.
+        """
+        cache = PrecompiledAgentCache(max_entries=10)
+
+        prompt: ChatPromptTemplate = cache.get_prompt_template("Be helpful.")
+        self.assertIs(prompt, cache.get_prompt_template("Be helpful."))
+        self.assertIsNot(prompt, cache.get_prompt_template("Be terse."))
+        self.assertEqual(4, len(prompt.messages))
+
+        parameters: Dict[str, Any] = get_function_json(0, 0).get("parameters")
+        copied: Dict[str, Any] = get_function_json(0, 0).get("parameters")
+        self.assertIs(cache.get_args_schema(parameters), cache.get_args_schema(copied))
+
+        stats: Dict[str, Any] = cache.get_stats()
+        self.assertEqual(2, stats.get("hits"))
+        self.assertEqual(3, stats.get("misses"))
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used artifacts are evicted first.
+        """
+        cache = PrecompiledAgentCache(max_entries=2)
+        first: ChatPromptTemplate = cache.get_prompt_template("first")
+        cache.get_prompt_template("second")
+        cache.get_prompt_template("first")
+        cache.get_prompt_template("third")
+
+        self.assertIs(first, cache.get_prompt_template("first"))
+        self.assertEqual(2, cache.get_stats().get("entries"))
+
+        # "second" was evicted, so this is a miss.
+        misses: int = cache.get_stats().get("misses")
+        cache.get_prompt_template("second")
+        self.assertEqual(misses + 1, cache.get_stats().get("misses"))
+
+    def test_disabled(self):
+        """
+        Tests that a cache size of 0 disables caching.
+        """
+        cache = PrecompiledAgentCache(max_entries=0)
+        self.assertIsNot(cache.get_prompt_template("same"), cache.get_prompt_template("same"))
+        self.assertEqual(0, cache.get_stats().get("entries"))
+
+    def test_tool_definitions(self):
+        """
+        Tests that precompiled tool definitions bind to the llm just like the tools themselves.
+        """
+        PrecompiledAgentCache.shared = PrecompiledAgentCache()
+        tool_caller = FakeToolCaller()
+        tools: List[LangChainOpenAIFunctionTool] = [
+            LangChainOpenAIFunctionTool.from_function_json(get_function_json(0, index), tool_caller)
+            for index in range(NUM_TOOLS_PER_AGENT)
+        ]
+        llm = FakeToolCallingChatModel()
+        expected: Dict[str, Any] = llm.bind_tools(tools).kwargs
+
+        run_context = LangChainRunContext({}, None, tool_caller, None, None)
+        run_context.tools = tools
+        self.assertEqual(expected, llm.bind_tools(run_context.get_tool_definitions()).kwargs)
+
+    def test_activation_setup_benchmark(self):
+        """
+        Compares per-activation setup cost of a 10-agent network with and without
+        precompiled artifacts.
+        """
+        PrecompiledAgentCache.shared = PrecompiledAgentCache(max_entries=0)
+        uncached_seconds: float = self.time_activations()
+
+        PrecompiledAgentCache.shared = PrecompiledAgentCache()
+        # Warm up, as the first request of a network version always pays full price.
+        self.time_activations(num_requests=1)
+        cached_seconds: float = self.time_activations()
+
+        print(f"{NUM_REQUESTS} requests x {NUM_AGENTS} agents: "
+              f"uncached {uncached_seconds:.3f}s, precompiled {cached_seconds:.3f}s")
+        self.assertLess(cached_seconds * 2.0, uncached_seconds)
+
+    def time_activations(self, num_requests: int = NUM_REQUESTS) -> float:
+        """
+        :param num_requests: The number of requests to simulate
+        :return: The number of seconds it took to set up every agent of every request
+        """
+        start_time: float = time.monotonic()
+        for _ in range(num_requests):
+            for agent_index in range(NUM_AGENTS):
+                # Per-request state is created anew, as it is in real life.
+                tool_caller = FakeToolCaller()
+                run_context = LangChainRunContext({}, None, tool_caller, None, None)
+                run_context.journal = NullJournal()
+                run_context.tools = [
+                    LangChainOpenAIFunctionTool.from_function_json(get_function_json(agent_index, tool_index),
+                                                                   tool_caller)
+                    for tool_index in range(NUM_TOOLS_PER_AGENT)
+                ]
+                prompt: ChatPromptTemplate = \
+                    PrecompiledAgentCache.get_shared().get_prompt_template(f"You are agent {agent_index}.")
+                run_context.agent = run_context.create_agent(prompt, FakeToolCallingChatModel())
+                self.assertIsNotNone(run_context.get_agent_executor())
+        return time.monotonic() - start_time
@@ -0,0 +1,181 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import re
+import time
+
+from unittest import TestCase
+
+from langchain_core.callbacks.manager import AsyncCallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.ai import AIMessageChunk
+from langchain_core.messages.base import BaseMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.outputs import ChatResult
+from langchain_core.prompts import ChatPromptTemplate
+
+from neuro_san.internals.filters.maximal_message_filter import MaximalMessageFilter
+from neuro_san.internals.filters.minimal_message_filter import MinimalMessageFilter
+from neuro_san.internals.interfaces.async_hopper import AsyncHopper
+from neuro_san.internals.journals.message_journal import MessageJournal
+from neuro_san.internals.journals.originating_journal import OriginatingJournal
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.messages.origination import Origination
+from neuro_san.internals.run_context.langchain.journaling.journaling_callback_handler \
+    import JournalingCallbackHandler
+
+ANSWER: str = " ".join(f"word{index}" for index in range(40))
+TOKEN_DELAY_SECONDS: float = 0.01
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    """
+    Chat model that takes a while to generate each token of its answer.
+    """
+
+    answer: str = ANSWER
+    token_delay_seconds: float = TOKEN_DELAY_SECONDS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def _generate(self, messages: List[BaseMessage], stop: List[str] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.token_delay_seconds * len(self.get_tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.answer))])
+
+    async def _astream(self, messages: List[BaseMessage], stop: List[str] = None,
+                       run_manager: AsyncCallbackManagerForLLMRun = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        for token in self.get_tokens():
+            await asyncio.sleep(self.token_delay_seconds)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    def get_tokens(self) -> List[str]:
+        """
+        :return: The answer split into tokens
+        """
+        return [token for token in re.split(r"(\s)", self.answer) if token]
+
+
+class TimedHopper(AsyncHopper):
+    """
+    AsyncHopper that records when each item arrived
+    and how many items were put synchronously
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.items: List[Tuple[float, Dict[str, Any]]] = []
+        self.num_synchronous: int = 0
+
+    async def put(self, item: Dict[str, Any], synchronous: bool = False):
+        self.items.append((time.monotonic(), item))
+        if synchronous:
+            self.num_synchronous += 1
+
+
+class TestJournalingCallbackHandler(TestCase):
+    """
+    Tests token streaming in the JournalingCallbackHandler
+    """
+
+    async def run_agent(self, stream_tokens: bool) -> Tuple[float, TimedHopper, List[BaseMessage]]:
+        """
+        Runs an LLM turn the way the LangChainRunContext does, through the journals.
+        :param stream_tokens: Whether or not to stream tokens
+        :return: A tuple of the start time, the hopper with the results and the chat history
+        """
+        hopper = TimedHopper()
+        origin: List[Dict[str, Any]] = [{"tool": "front_man", "instantiation_index": 1}]
+        chat_history: List[BaseMessage] = []
+        journal = OriginatingJournal(MessageJournal(hopper), origin, chat_history)
+        handler = JournalingCallbackHandler(journal, journal, origin, Origination(), stream_tokens)
+
+        chain = ChatPromptTemplate.from_messages([("human", "{input}")]) | FakeStreamingChatModel()
+        start: float = time.monotonic()
+        result: AIMessageChunk = None
+        async for chunk in chain.astream({"input": "Say a lot"}, config={"callbacks": [handler]}):
+            result = chunk if result is None else result + chunk
+        await journal.write_message(AIMessage(content=result.content))
+        return start, hopper, chat_history
+
+    def test_time_to_first_token(self):
+        """
+        Tests that streamed chunks arrive well before the full answer,
+        and that they add up to the full answer.
+        """
+        start, hopper, chat_history = asyncio.run(self.run_agent(stream_tokens=True))
+        chunks: List[Tuple[float, Dict[str, Any]]] = [
+            (arrival, item) for arrival, item in hopper.items
+            if item.get("type") == ChatMessageType.AI_MESSAGE_CHUNK]
+        final_arrival: float = [arrival for arrival, item in hopper.items
+                                if item.get("type") == ChatMessageType.AI][-1]
+
+        self.assertGreater(len(chunks), 1)
+        first_token_seconds: float = chunks[0][0] - start
+        full_answer_seconds: float = final_arrival - start
+        self.assertLess(first_token_seconds, 0.3 * full_answer_seconds)
+
+        # Journaled chunks are handed to the hopper right away
+        self.assertEqual(len(hopper.items), hopper.num_synchronous)
+
+        # Chunks are coalesced from many more tokens
+        num_tokens: int = len(FakeStreamingChatModel().get_tokens())
+        self.assertLess(len(chunks), num_tokens / 2)
+        self.assertEqual(ANSWER, "".join(item.get("text") for _, item in chunks))
+
+        # Chunks do not end up in the chat history
+        self.assertEqual(1, len(chat_history))
+        self.assertEqual(ANSWER, chat_history[0].content)
+
+    def test_no_streaming_by_default(self):
+        """
+        Tests that without opting in, nothing is sent before the LLM is done
+        """
+        _, hopper, _ = asyncio.run(self.run_agent(stream_tokens=False))
+        types: List[ChatMessageType] = [item.get("type") for _, item in hopper.items]
+        self.assertNotIn(ChatMessageType.AI_MESSAGE_CHUNK, types)
+
+    def test_filters(self):
+        """
+        Tests which clients receive chunks
+        """
+        front_man_chunk: Dict[str, Any] = {
+            "type": ChatMessageType.AI_MESSAGE_CHUNK,
+            "origin": [{"tool": "front_man", "instantiation_index": 1}],
+            "text": "Hello"
+        }
+        nested_chunk: Dict[str, Any] = {
+            "type": ChatMessageType.AI_MESSAGE_CHUNK,
+            "origin": [{"tool": "front_man", "instantiation_index": 1},
+                       {"tool": "helper", "instantiation_index": 1}],
+            "text": "Hello"
+        }
+        self.assertTrue(MinimalMessageFilter().allow(front_man_chunk))
+        self.assertFalse(MinimalMessageFilter().allow(nested_chunk))
+        self.assertTrue(MaximalMessageFilter().allow(front_man_chunk))
+        self.assertTrue(MaximalMessageFilter().allow(nested_chunk))
@@ -0,0 +1,174 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import List
+
+import asyncio
+import time
+
+from unittest import TestCase
+
+import pytest
+from parameterized import parameterized
+
+from langchain_community.callbacks.bedrock_anthropic_callback import MODEL_COST_PER_1K_INPUT_TOKENS
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import LLMResult
+
+from neuro_san.internals.run_context.langchain.token_counting.llm_token_callback_handler \
+    import LlmTokenCallbackHandler
+from neuro_san.internals.run_context.langchain.token_counting.model_pricing_index import ModelPrice
+from neuro_san.internals.run_context.langchain.token_counting.model_pricing_index import ModelPricingIndex
+
+
+def legacy_find_anthropic_model(model_name: str) -> str:
+    """
+    The linear substring scan that used to happen on every llm end event.
+    :param model_name: The model name to look for
+    :return: The single matching key from the cost table, or None
+    """
+    matching_models: List[str] = [
+        model for model in MODEL_COST_PER_1K_INPUT_TOKENS if model_name in model
+    ]
+    if len(matching_models) != 1:
+        return None
+    return matching_models[0]
+
+
+class TestModelPricingIndex(TestCase):
+    """
+    Unit tests for ModelPricingIndex class.
+    """
+
+    @parameterized.expand([
+        # Exact matches
+        ("openai_exact", "gpt-4o", "gpt-4o"),
+        ("openai_dated", "gpt-4o-mini-2024-07-18", "gpt-4o-mini-2024-07-18"),
+        ("anthropic_exact", "claude-3-7-sonnet-20250219", "claude-3-7-sonnet-20250219"),
+        ("anthropic_case", "Claude-3-5-Haiku-20241022", "claude-3-5-haiku-20241022"),
+        # Normalized bedrock ids
+        ("bedrock_id", "anthropic.claude-3-7-sonnet-20250219-v1:0", "claude-3-7-sonnet-20250219"),
+        ("bedrock_region", "us.anthropic.claude-sonnet-4-20250514-v1:0", "claude-sonnet-4-20250514"),
+        ("bedrock_undated", "anthropic.claude-v2:1", "claude-v2:1"),
+        # Longest prefix
+        ("openai_newer_date", "gpt-4o-2099-01-01", "gpt-4o"),
+        ("openai_mini_newer_date", "gpt-4o-mini-2099-01-01", "gpt-4o-mini"),
+        ("ollama_tag", "llama3.1:8b", "llama3.1"),
+        # Aliases from default_llm_info.hocon
+        ("anthropic_alias", "claude-3-5-sonnet", "claude-3-5-sonnet-20241022"),
+        ("anthropic_alias_version", "claude-sonnet-4-0", "claude-sonnet-4-20250514"),
+        ("azure_alias", "azure-gpt-4o", "gpt-4o-2024-08-06"),
+        ("ollama_quoted_key", "qwen3:8b", "qwen3:8b"),
+        # Not known
+        ("unknown", "some-model-nobody-heard-of", None),
+        ("no_boundary", "gpt-4z", None),
+        ("empty", "", None),
+    ])
+    def test_get_price(self, _test_name: str, model_name: str, expected: str):
+        """
+        Tests model name resolution.
+        """
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        price: ModelPrice = index.get_price(model_name)
+        if expected is None:
+            self.assertIsNone(price)
+        else:
+            self.assertIsNotNone(price)
+            self.assertEqual(expected, price.model_name)
+
+    def test_agrees_with_legacy_lookup(self):
+        """
+        Tests that every Anthropic model name the old substring scan priced
+        gets the same price from the index.  Names the old scan found ambiguous
+        (like "anthropic.claude-v2", which is also in "anthropic.claude-v2:1")
+        now get a price too.
+        """
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        for full_model_id, input_cost in MODEL_COST_PER_1K_INPUT_TOKENS.items():
+            for model_name in (full_model_id, ModelPricingIndex.normalize(full_model_id)):
+                self.assertIn(legacy_find_anthropic_model(model_name), (full_model_id, None))
+                price: ModelPrice = index.get_price(model_name)
+                self.assertIsNotNone(price, model_name)
+                self.assertEqual(input_cost, price.input_cost)
+
+    def test_ollama_is_free(self):
+        """
+        Tests that local models cost nothing.
+        """
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        self.assertEqual(0.0, index.calculate_cost("llama3.1", 1000, 1000))
+
+    def test_cache_aware_cost(self):
+        """
+        Tests that prompt cache reads and writes are priced separately from other input tokens.
+        """
+        price = ModelPrice("test", input_cost=1.0, output_cost=2.0,
+                           cache_read_cost=0.1, cache_write_cost=1.25)
+        # 1000 input tokens of which 600 are cache reads and 200 are cache writes
+        cost: float = price.calculate_cost(1000, 500, cache_read_tokens=600, cache_write_tokens=200)
+        expected: float = (200 * 1.0 + 600 * 0.1 + 200 * 1.25 + 500 * 2.0) / 1000.0
+        self.assertAlmostEqual(expected, cost)
+
+        # Without any cache information, cache prices default to the input price
+        price = ModelPrice("test", input_cost=1.0, output_cost=2.0)
+        self.assertAlmostEqual(price.calculate_cost(1000, 0), price.calculate_cost(1000, 0, 600, 200))
+
+        # Anthropic cache reads are cheaper than regular input
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        uncached: float = index.calculate_cost("claude-3-7-sonnet-20250219", 10000, 100)
+        cached: float = index.calculate_cost("claude-3-7-sonnet-20250219", 10000, 100, cache_read_tokens=9000)
+        self.assertLess(cached, uncached)
+
+    def test_callback_handler(self):
+        """
+        Tests that the callback handler accumulates cache-aware costs.
+        """
+        message = AIMessage(content="hi",
+                            response_metadata={"model_name": "claude-3-7-sonnet-20250219"},
+                            usage_metadata={"input_tokens": 1000, "output_tokens": 100, "total_tokens": 1100,
+                                            "input_token_details": {"cache_read": 800}})
+        result = LLMResult(generations=[[ChatGeneration(message=message)]])
+
+        handler = LlmTokenCallbackHandler()
+        asyncio.run(handler.on_llm_end(result))
+        asyncio.run(handler.on_llm_end(result))
+
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        expected: float = 2 * index.calculate_cost("claude-3-7-sonnet-20250219", 1000, 100, 800)
+        self.assertEqual(2200, handler.total_tokens)
+        self.assertEqual(2, handler.successful_requests)
+        self.assertAlmostEqual(expected, handler.total_cost)
+        self.assertGreater(handler.total_cost, 0.0)
+
+    @pytest.mark.integration
+    def test_lookup_speed(self):
+        """
+        Microbenchmark of repeated lookups against the old linear scan.
+        """
+        index: ModelPricingIndex = ModelPricingIndex.get_shared()
+        model_names: List[str] = ["claude-3-7-sonnet-20250219", "claude-3-5-haiku-20241022",
+                                  "claude-sonnet-4-20250514", "claude-3-haiku-20240307"]
+        rounds: int = 20000
+
+        start: float = time.perf_counter()
+        for _ in range(rounds):
+            for model_name in model_names:
+                legacy_find_anthropic_model(model_name)
+        legacy_seconds: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for model_name in model_names:
+                index.get_price(model_name)
+        index_seconds: float = time.perf_counter() - start
+
+        self.assertLess(index_seconds, legacy_seconds)
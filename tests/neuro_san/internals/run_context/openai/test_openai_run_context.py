@@ -0,0 +1,341 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import asyncio
+import json
+import time
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import httpx
+
+from openai import AsyncOpenAI
+from openai import OpenAI
+
+from neuro_san.internals.run_context.interfaces.run import Run
+from neuro_san.internals.run_context.openai.openai_client import OpenAIClient
+from neuro_san.internals.run_context.openai.openai_run_context import OpenAIRunContext
+
+THREAD_ID: str = "thread_1"
+
+
+class FakeAssistantsService:
+    """
+    Local stand-in for the OpenAI assistants endpoints used by OpenAIRunContext.
+    Each run goes through a scripted list of (delay in seconds, status) steps,
+    whether it is followed by streamed events or by polling.
+    """
+
+    def __init__(self, script: List[Tuple[float, str]], stream_breaks_off: bool = False):
+        """
+        Constructor
+
+        :param script: The (delay, status) steps every run goes through after being queued
+        :param stream_breaks_off: When True, event streams end right after the run is queued
+        """
+        self.script: List[Tuple[float, str]] = script
+        self.stream_breaks_off: bool = stream_breaks_off
+        self.run_start_times: Dict[str, float] = {}
+        self.retrieves: int = 0
+
+    def create_client(self) -> AsyncOpenAI:
+        """
+        :return: An AsyncOpenAI client that talks to this stand-in
+        """
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+        return AsyncOpenAI(api_key="fake", base_url="http://fake.openai/v1", http_client=http_client)
+
+    def create_sync_client(self) -> OpenAI:
+        """
+        :return: A synchronous OpenAI client that talks to this stand-in
+        """
+        http_client = httpx.Client(transport=httpx.MockTransport(self.handle_sync))
+        return OpenAI(api_key="fake", base_url="http://fake.openai/v1", http_client=http_client)
+
+    def get_status(self, run_id: str) -> str:
+        """
+        :param run_id: The id of the run
+        :return: The status of the run according to the script and the time spent so far
+        """
+        elapsed: float = time.monotonic() - self.run_start_times.get(run_id)
+        status: str = "queued"
+        total_delay: float = 0.0
+        for delay, step_status in self.script:
+            total_delay += delay
+            if elapsed >= total_delay:
+                status = step_status
+        return status
+
+    @staticmethod
+    def make_run(run_id: str, status: str) -> Dict[str, Any]:
+        """
+        :param run_id: The id of the run
+        :param status: The status of the run
+        :return: A run as the assistants API would return it
+        """
+        run: Dict[str, Any] = {
+            "id": run_id,
+            "object": "thread.run",
+            "status": status,
+            "thread_id": THREAD_ID,
+            "assistant_id": "asst_1",
+            "created_at": 0,
+            "model": "gpt-4o",
+            "instructions": "",
+            "tools": [],
+            "parallel_tool_calls": True,
+        }
+        if status == "requires_action":
+            run["required_action"] = {
+                "type": "submit_tool_outputs",
+                "submit_tool_outputs": {
+                    "tool_calls": [{"id": "call_1", "type": "function",
+                                    "function": {"name": "lookup", "arguments": "{}"}}]
+                }
+            }
+        return run
+
+    async def stream_events(self, run_id: str) -> AsyncIterator[bytes]:
+        """
+        :param run_id: The id of the run
+        :return: The server-sent events for the run, sent out as the script says
+        """
+        yield self.make_event("thread.run.created", self.make_run(run_id, "queued"))
+        if self.stream_breaks_off:
+            return
+        for delay, status in self.script:
+            await asyncio.sleep(delay)
+            yield self.make_event("thread.run.step.created",
+                                  {"id": "step_1", "object": "thread.run.step", "run_id": run_id})
+            yield self.make_event(f"thread.run.{status}", self.make_run(run_id, status))
+        yield b"event: done\ndata: [DONE]\n\n"
+
+    def sync_stream_events(self, run_id: str) -> Iterator[bytes]:
+        """
+        :param run_id: The id of the run
+        :return: The same events as stream_events(), for a synchronous client
+        """
+        yield self.make_event("thread.run.created", self.make_run(run_id, "queued"))
+        if self.stream_breaks_off:
+            return
+        for delay, status in self.script:
+            time.sleep(delay)
+            yield self.make_event("thread.run.step.created",
+                                  {"id": "step_1", "object": "thread.run.step", "run_id": run_id})
+            yield self.make_event(f"thread.run.{status}", self.make_run(run_id, status))
+        yield b"event: done\ndata: [DONE]\n\n"
+
+    @staticmethod
+    def make_event(event: str, data: Dict[str, Any]) -> bytes:
+        """
+        :param event: The name of the event
+        :param data: The data of the event
+        :return: The bytes of a server-sent event
+        """
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        :param request: A request to one of the assistants endpoints
+        :return: The response to the request
+        """
+        return self.respond(request, self.stream_events)
+
+    def handle_sync(self, request: httpx.Request) -> httpx.Response:
+        """
+        :param request: A request to one of the assistants endpoints from a synchronous client
+        :return: The response to the request
+        """
+        return self.respond(request, self.sync_stream_events)
+
+    def respond(self, request: httpx.Request, stream_events: Callable[[str], Any]) -> httpx.Response:
+        """
+        :param request: A request to one of the assistants endpoints
+        :param stream_events: The method giving the server-sent events for a run
+        :return: The response to the request
+        """
+        path: str = request.url.path
+        body: Dict[str, Any] = {}
+        if request.content:
+            body = json.loads(request.content)
+
+        if path.endswith("/messages"):
+            return httpx.Response(200, json={"id": "msg_1", "object": "thread.message", "role": "user",
+                                             "thread_id": THREAD_ID, "content": [], "created_at": 0})
+
+        if request.method == "GET":
+            self.retrieves += 1
+            run_id: str = path.split("/")[-1]
+            return httpx.Response(200, json=self.make_run(run_id, self.get_status(run_id)))
+
+        # Creating a run or submitting tool outputs starts the script over
+        run_id: str = f"run_{len(self.run_start_times)}"
+        if path.endswith("/submit_tool_outputs"):
+            run_id = path.split("/")[-2]
+        self.run_start_times[run_id] = time.monotonic()
+
+        if body.get("stream"):
+            return httpx.Response(200, headers={"content-type": "text/event-stream"},
+                                  content=stream_events(run_id))
+        return httpx.Response(200, json=self.make_run(run_id, "queued"))
+
+
+class TestOpenAIRunContext(TestCase):
+    """
+    Tests for how OpenAIRunContext waits on runs, against a local stand-in
+    for the assistants endpoints.
+    """
+
+    @staticmethod
+    def create_run_context(service: FakeAssistantsService) -> OpenAIRunContext:
+        """
+        :param service: The stand-in service to talk to
+        :return: An OpenAIRunContext whose resources are already set up
+        """
+        run_context = OpenAIRunContext(llm_config={}, parent_run_context=None, tool_caller=None,
+                                       invocation_context=MagicMock(), chat_context=None)
+        run_context.openai_client = OpenAIClient(client=service.create_client())
+        run_context.thread_id = THREAD_ID
+        run_context.assistant_id = "asst_1"
+        return run_context
+
+    @staticmethod
+    async def time_one_step(run_context: OpenAIRunContext, service: FakeAssistantsService) -> Tuple[Run, float]:
+        """
+        :param run_context: The OpenAIRunContext to use
+        :param service: The stand-in service the OpenAIRunContext talks to
+        :return: A tuple of the finished run and the seconds between the run being done
+                on the service side and wait_on_run() returning
+        """
+        run: Run = await run_context.submit_message("hello")
+        run = await run_context.wait_on_run(run)
+        end_time: float = time.monotonic()
+        scripted_delay: float = sum(delay for delay, _ in service.script)
+        return run, end_time - service.run_start_times.get(run.get_id()) - scripted_delay
+
+    def test_streamed_completion(self):
+        """
+        Tests that streamed events end the wait as soon as the run is done
+        """
+        service = FakeAssistantsService([(0.05, "in_progress"), (0.25, "completed")])
+        run_context = self.create_run_context(service)
+
+        async def steps() -> List[float]:
+            added_latencies: List[float] = []
+            for _ in range(3):
+                run, added_latency = await self.time_one_step(run_context, service)
+                self.assertEqual("completed", run.openai_run.status)
+                added_latencies.append(added_latency)
+            return added_latencies
+
+        added_latencies: List[float] = asyncio.run(steps())
+        print(f"\nAdded latency per step with events: {max(added_latencies) * 1000.0:.1f} ms")
+        self.assertLess(max(added_latencies), 0.1)
+        self.assertEqual(0, service.retrieves)
+        self.assertEqual({}, run_context.run_event_streams)
+
+    def test_streamed_tool_outputs(self):
+        """
+        Tests that runs continued by submitting tool outputs are also followed by events
+        """
+        service = FakeAssistantsService([(0.05, "requires_action")])
+        run_context = self.create_run_context(service)
+
+        async def steps() -> Run:
+            run, _ = await self.time_one_step(run_context, service)
+            self.assertTrue(run.requires_action())
+            self.assertEqual("call_1", run.get_tool_calls()[0].get_id())
+
+            service.script = [(0.1, "completed")]
+            run = await run_context.submit_tool_outputs(run, [{"tool_call_id": "call_1", "output": "42"}])
+            return await run_context.wait_on_run(run)
+
+        run: Run = asyncio.run(steps())
+        self.assertEqual("completed", run.openai_run.status)
+        self.assertEqual(0, service.retrieves)
+
+    def test_polling_fallback(self):
+        """
+        Tests that a run whose event stream breaks off is polled with back-off
+        """
+        service = FakeAssistantsService([(0.3, "completed")], stream_breaks_off=True)
+        run_context = self.create_run_context(service)
+
+        run, added_latency = asyncio.run(self.time_one_step(run_context, service))
+        print(f"\nAdded latency per step when polling: {added_latency * 1000.0:.1f} ms")
+        self.assertEqual("completed", run.openai_run.status)
+        # Never worse than the fixed half second sleep this replaces
+        self.assertLess(added_latency, 0.25)
+        # Back-off keeps the number of polls down
+        self.assertLess(service.retrieves, 8)
+
+    def test_delete_leftover_streams(self):
+        """
+        Tests that deleting resources closes the event streams of runs nobody waited on
+        """
+        service = FakeAssistantsService([(0.3, "completed")])
+        run_context = self.create_run_context(service)
+
+        async def abandon() -> List[Any]:
+            await run_context.submit_message("hello")
+            event_streams: List[Any] = list(run_context.run_event_streams.values())
+            # Service-side resources are not what this is about
+            run_context.thread_id = None
+            run_context.assistant_id = None
+            await run_context.delete_resources()
+            return event_streams
+
+        event_streams: List[Any] = asyncio.run(abandon())
+        self.assertEqual(1, len(event_streams))
+        self.assertTrue(event_streams[0].stream.response.is_closed)
+        self.assertEqual({}, run_context.run_event_streams)
+
+    def test_sync_client_leaves_loop_free(self):
+        """
+        Tests that following a run with a synchronous client, by events or by polling,
+        does not block the event loop other agents run on.
+        """
+        async def step_with_ticker(run_context: OpenAIRunContext,
+                                   service: FakeAssistantsService) -> Tuple[Run, int]:
+            ticks: List[int] = [0]
+
+            async def tick():
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks[0] += 1
+
+            ticker: asyncio.Task = asyncio.create_task(tick())
+            try:
+                run, _ = await self.time_one_step(run_context, service)
+            finally:
+                ticker.cancel()
+            return run, ticks[0]
+
+        for stream_breaks_off in (False, True):
+            service = FakeAssistantsService([(0.1, "in_progress"), (0.2, "completed")],
+                                            stream_breaks_off=stream_breaks_off)
+            run_context = self.create_run_context(service)
+            run_context.openai_client = OpenAIClient(client=service.create_sync_client())
+
+            with self.subTest(stream_breaks_off=stream_breaks_off):
+                run, ticks = asyncio.run(step_with_ticker(run_context, service))
+                self.assertEqual("completed", run.openai_run.status)
+                # About 30 ticks fit in the 0.3 seconds the run takes
+                self.assertGreater(ticks, 10)
@@ -0,0 +1,79 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+
+from unittest import TestCase
+
+from langchain_core.language_models.base import BaseLanguageModel
+
+from neuro_san.internals.run_context.langchain.llms.standard_langchain_llm_factory import StandardLangChainLlmFactory
+from neuro_san.internals.run_context.langchain.token_counting.langchain_token_counter import LangChainTokenCounter
+from neuro_san.internals.utils.import_time_report import ImportTimeReport
+from neuro_san.internals.utils.loaded_classes import LoadedClasses
+
+
+class TestImportTimeReport(TestCase):
+    """
+    Tests for startup cost of the neuro-san entry points.
+    """
+
+    def test_startup_benchmark(self):
+        """
+        Tracks time to import the server and client entry points and the memory used afterwards,
+        and makes sure no LLM provider package gets imported before a network needs it.
+        """
+        for module in ("neuro_san.service.main_loop.server_main_loop", "neuro_san.client.agent_cli"):
+            results: Dict[str, Any] = ImportTimeReport([module]).run()
+            print(f"\n{module}: {results.get('import_seconds'):.2f} s to import, "
+                  f"{results.get('rss_mb'):.0f} MB RSS")
+
+            self.assertEqual([], results.get("heavy_packages_loaded"))
+            imported: List[str] = [one.get("module") for one in results.get("imports")]
+            self.assertIn(module, imported)
+
+    def test_parse_importtime(self):
+        """
+        Tests parsing of python -X importtime output
+        """
+        output: str = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     json.decoder",
+            "import time:       200 |        300 |   json",
+        ])
+        imports: List[Dict[str, Any]] = ImportTimeReport.parse_importtime(output)
+        self.assertEqual([{"module": "json.decoder", "self_us": 100, "cumulative_us": 100, "depth": 2},
+                          {"module": "json", "self_us": 200, "cumulative_us": 300, "depth": 1}],
+                         imports)
+
+    def test_loaded_classes(self):
+        """
+        Tests that only classes from modules already imported are found
+        """
+        found = LoadedClasses.get("json.JSONDecoder", "not_a_real_package.Thing", "json.NotAClass")
+        self.assertEqual((json.JSONDecoder,), found)
+        self.assertEqual((), LoadedClasses.get("not_a_real_package.Thing"))
+
+    def test_lazy_provider(self):
+        """
+        Tests that a provider's chat model is still created once asked for
+        """
+        factory = StandardLangChainLlmFactory()
+        llm: BaseLanguageModel = factory.create_base_chat_model({
+            "class": "openai",
+            "model_name": "gpt-4o",
+            "openai_api_key": "fake",
+        })
+        self.assertIsInstance(llm, LangChainTokenCounter.get_openai_chat_classes())
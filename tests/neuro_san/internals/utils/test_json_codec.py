@@ -0,0 +1,175 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+import time
+
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from neuro_san.internals.utils.json_codec import JsonCodec
+from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
+
+
+def make_chat_response(index: int) -> Dict[str, Any]:
+    """
+    :param index: The index of the message in the stream
+    :return: A dictionary shaped like a typical streaming ChatResponse
+    """
+    return {
+        "response": {
+            "type": "AGENT",
+            "text": f"Message {index}: the café’s answer is 42 — naïve but \"quoted\".\n",
+            "origin": [
+                {"tool": "front_man", "instantiation_index": 1},
+                {"tool": "helper", "instantiation_index": index % 3},
+            ],
+            "structure": {"score": 0.125 * index, "tags": ["a", "b"], "done": index % 2 == 0, "none": None},
+            "sly_data": {"count": index, "big": 2 ** 62},
+        }
+    }
+
+
+class FakeStreamingChatHandler(StreamingChatHandler):
+    """
+    StreamingChatHandler whose connection just collects what is written to it.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.chunks: List[bytes] = []
+
+    def set_header(self, name: str, value: Any):
+        """
+        :param name: Ignored
+        :param value: Ignored
+        """
+
+    def write(self, chunk: Any):
+        """
+        :param chunk: The chunk to collect
+        """
+        self.chunks.append(chunk)
+
+    async def do_flush(self) -> bool:
+        """
+        :return: Always True
+        """
+        return True
+
+
+class TestJsonCodec(TestCase):
+    """
+    Unit tests for JsonCodec class.
+    """
+
+    def tearDown(self):
+        """
+        Do not leave a specific codec around for other tests.
+        """
+        JsonCodec.shared = None
+
+    @parameterized.expand([
+        ("orjson", "orjson"),
+        ("json", "json"),
+        ("auto", "orjson"),
+        ("  JSON ", "json"),
+    ])
+    def test_implementation(self, implementation: str, expected: str):
+        """
+        Tests selection of the implementation
+        """
+        codec = JsonCodec(implementation)
+        self.assertEqual(expected, codec.get_implementation_name())
+
+    def test_unknown_implementation(self):
+        """
+        Tests that a typo in the configuration is caught
+        """
+        with self.assertRaises(ValueError):
+            JsonCodec("simdjson")
+
+    @parameterized.expand([
+        ("chat_response", make_chat_response(7)),
+        ("unicode", {"text": "日本語 and emoji \U0001F600", "escapes": "tab\tnewline\nnul\u0000"}),
+        ("empty", {}),
+        ("list", [1, 2.5, -3, True, False, None, "x"]),
+        # These are handed over to the json module by the orjson variant
+        ("huge_int", {"big": 2 ** 70}),
+        ("int_keys", {1: "one", 2: "two"}),
+    ])
+    def test_same_values(self, _name: str, obj: Any):
+        """
+        Tests that both implementations produce the same JSON values as the json module
+        """
+        expected: Any = json.loads(json.dumps(obj))
+        for implementation in ("orjson", "json"):
+            codec = JsonCodec(implementation)
+            self.assertEqual(expected, json.loads(codec.dumps(obj)))
+            self.assertEqual(expected, json.loads(codec.dumps_bytes(obj)))
+            self.assertEqual(expected, codec.loads(json.dumps(obj)))
+            self.assertEqual(expected, codec.loads(json.dumps(obj).encode("utf-8")))
+
+    def test_loads_nan(self):
+        """
+        Tests that what the json module has always accepted is still accepted
+        """
+        codec = JsonCodec("orjson")
+        result: Dict[str, Any] = codec.loads('{"value": Infinity}')
+        self.assertEqual(float("inf"), result.get("value"))
+
+    def test_loads_invalid(self):
+        """
+        Tests that invalid input still raises the usual error
+        """
+        for implementation in ("orjson", "json"):
+            codec = JsonCodec(implementation)
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads(b'{"unterminated": ')
+
+    def test_streaming_benchmark(self):
+        """
+        Compares messages per second through the server-side streaming path
+        and the client-side parsing of each line for both implementations.
+        """
+        num_messages: int = 20000
+        messages: List[Dict[str, Any]] = [make_chat_response(index) for index in range(num_messages)]
+
+        async def generate():
+            for message in messages:
+                yield message
+
+        rates: Dict[str, float] = {}
+        for implementation in ("json", "orjson"):
+            JsonCodec.shared = JsonCodec(implementation)
+            handler = FakeStreamingChatHandler()
+
+            start_time: float = time.perf_counter()
+            sent_out: int = asyncio.run(handler.stream_out(generate()))
+            received: List[Dict[str, Any]] = [JsonCodec.shared.loads(line) for line in handler.chunks]
+            elapsed: float = time.perf_counter() - start_time
+
+            self.assertEqual(num_messages, sent_out)
+            self.assertEqual(messages, received)
+            for line in handler.chunks:
+                self.assertTrue(line.endswith(b"\n"))
+            rates[implementation] = num_messages / elapsed
+
+        print(f"\nStreaming messages/second: json {rates.get('json'):.0f}, orjson {rates.get('orjson'):.0f}")
@@ -0,0 +1,135 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import time
+
+from neuro_san.internals.utils.request_deadline import RequestDeadline
+from neuro_san.session.async_http_service_agent_session import AsyncHttpServiceAgentSession
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+
+
+class FakeInvocationContext:
+    """
+    Stands in for an InvocationContext with only what the session factory needs
+    """
+
+    def __init__(self, deadline: RequestDeadline):
+        self.deadline: RequestDeadline = deadline
+        self.metadata: Dict[str, Any] = {"request_id": "abc"}
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        :return: The request metadata
+        """
+        return self.metadata
+
+    def get_deadline(self) -> RequestDeadline:
+        """
+        :return: The deadline of the request
+        """
+        return self.deadline
+
+
+class TestRequestDeadline(TestCase):
+    """
+    Unit tests for RequestDeadline class.
+    """
+
+    def test_no_deadline(self):
+        """
+        Tests that a deadline of None never expires
+        """
+        deadline = RequestDeadline()
+        self.assertFalse(deadline.has_deadline())
+        self.assertIsNone(deadline.get_remaining_seconds())
+        self.assertFalse(deadline.is_expired())
+        self.assertIsNone(deadline.to_header_value())
+
+    def test_deadline(self):
+        """
+        Tests counting down to a deadline
+        """
+        deadline = RequestDeadline(0.2)
+        self.assertTrue(deadline.has_deadline())
+        self.assertFalse(deadline.is_expired())
+        self.assertLessEqual(deadline.get_remaining_seconds(), 0.2)
+        self.assertGreater(float(deadline.to_header_value()), 0.0)
+
+        time.sleep(0.3)
+        self.assertTrue(deadline.is_expired())
+        self.assertEqual(0.0, deadline.get_remaining_seconds())
+
+        # An expired client deadline is expired right away
+        self.assertTrue(RequestDeadline(-1.0).is_expired())
+
+    def test_limit(self):
+        """
+        Tests that the earliest deadline wins
+        """
+        deadline = RequestDeadline(10.0)
+        self.assertIs(deadline, deadline.limit(None))
+        self.assertIs(deadline, deadline.limit(0))
+        self.assertIs(deadline, deadline.limit(20.0))
+        self.assertLessEqual(deadline.limit(1.0).get_remaining_seconds(), 1.0)
+        self.assertLessEqual(RequestDeadline().limit(1.0).get_remaining_seconds(), 1.0)
+
+    def test_limit_for_network(self):
+        """
+        Tests the per-network limit and its env var default
+        """
+        deadline = RequestDeadline()
+        with patch.dict("os.environ", {"AGENT_MAX_REQUEST_SECONDS": "0"}):
+            self.assertFalse(deadline.limit_for_network(None).has_deadline())
+            self.assertFalse(deadline.limit_for_network({}).has_deadline())
+            limited: RequestDeadline = deadline.limit_for_network({"max_request_seconds": 5})
+            self.assertLessEqual(limited.get_remaining_seconds(), 5.0)
+
+        with patch.dict("os.environ", {"AGENT_MAX_REQUEST_SECONDS": "3"}):
+            self.assertLessEqual(deadline.limit_for_network({}).get_remaining_seconds(), 3.0)
+            # The network can turn off the server-wide limit
+            self.assertFalse(deadline.limit_for_network({"max_request_seconds": 0}).has_deadline())
+
+    def test_parse_seconds(self):
+        """
+        Tests parsing header values
+        """
+        self.assertEqual(2.5, RequestDeadline.parse_seconds("2.5"))
+        self.assertIsNone(RequestDeadline.parse_seconds(None))
+        self.assertIsNone(RequestDeadline.parse_seconds("soon"))
+        self.assertIsNone(RequestDeadline.parse_seconds("nan"))
+        self.assertIsNone(RequestDeadline.parse_seconds("inf"))
+
+    def test_external_session(self):
+        """
+        Tests that the time left is passed on to external agents
+        """
+        factory = ExternalAgentSessionFactory(use_direct=False)
+
+        invocation_context = FakeInvocationContext(RequestDeadline())
+        session: AsyncHttpServiceAgentSession = factory.create_session("http://localhost:8080/other",
+                                                                       invocation_context)
+        self.assertIsNone(session.streaming_timeout_in_seconds)
+        self.assertNotIn(RequestDeadline.HEADER, session.get_headers())
+
+        invocation_context = FakeInvocationContext(RequestDeadline(30.0))
+        session = factory.create_session("http://localhost:8080/other", invocation_context)
+        self.assertLessEqual(session.streaming_timeout_in_seconds, 30.0)
+        headers: Dict[str, Any] = session.get_headers()
+        self.assertLessEqual(float(headers.get(RequestDeadline.HEADER)), 30.0)
+        self.assertEqual("abc", headers.get("request_id"))
+        # The metadata of the request itself is left alone
+        self.assertNotIn(RequestDeadline.HEADER, invocation_context.get_metadata())
@@ -0,0 +1,323 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import time
+
+from langchain_core.messages.ai import AIMessage
+
+from neuro_san.internals.chat.data_driven_chat_session import DataDrivenChatSession
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.invocation_context import InvocationContext
+from neuro_san.internals.journals.journal import Journal
+from neuro_san.internals.messages.agent_message import AgentMessage
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.generic.agent_server_logging import AgentServerLogging
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.utils.admission_controller import AdmissionController
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.session.session_invocation_context import SessionInvocationContext
+
+NETWORK_NAME: str = "slow_network"
+
+# How long the fake tools would take if left alone
+SLOW_TOOL_SECONDS: float = 60.0
+
+# How soon after cancellation the capacity of a request should be back
+RECLAIM_SECONDS: float = 2.0
+
+
+class SlowFrontMan:
+    """
+    Stands in for a FrontManActivation which calls a slow CodedTool
+    and a slow external agent in parallel, as a CallingActivation would.
+    Records when each of the tools gets cancelled.
+    """
+
+    def __init__(self, invocation_context: InvocationContext, tool_seconds: float,
+                 cancelled: Dict[str, float]):
+        self.invocation_context: InvocationContext = invocation_context
+        self.tool_seconds: float = tool_seconds
+        self.cancelled: Dict[str, float] = cancelled
+
+    async def create_any_resources(self):
+        """
+        Nothing to create
+        """
+
+    async def delete_any_resources(self):
+        """
+        Nothing to delete
+        """
+
+    def update_invocation_context(self, invocation_context: InvocationContext):
+        """
+        :param invocation_context: The new invocation context
+        """
+        self.invocation_context = invocation_context
+
+    def get_origin(self) -> List[Dict[str, Any]]:
+        """
+        :return: The origin of the front man
+        """
+        return [{"tool": "front_man", "instantiation_index": 1}]
+
+    def get_agent_tool_spec(self) -> Dict[str, Any]:
+        """
+        :return: The spec of the front man
+        """
+        return {"name": "front_man"}
+
+    async def submit_message(self, user_input: str) -> List[Any]:
+        """
+        Calls the slow tools and answers
+        """
+        journal: Journal = self.invocation_context.get_journal()
+        await journal.write_message(AgentMessage(content="Calling tools"), self.get_origin())
+        await asyncio.gather(self.slow_tool("coded_tool"), self.slow_tool("external_agent"))
+        return [AIMessage(content=f"Done with {user_input}")]
+
+    async def slow_tool(self, name: str):
+        """
+        :param name: The name of the tool
+        """
+        try:
+            await asyncio.sleep(self.tool_seconds)
+        except asyncio.CancelledError:
+            self.cancelled[name] = time.monotonic()
+            raise
+
+
+class FakeAgentNetworkProvider:
+    """
+    Stands in for an AgentNetworkProvider
+    """
+
+    def __init__(self, agent_network: AgentNetwork):
+        self.agent_network: AgentNetwork = agent_network
+
+    def get_agent_network(self) -> AgentNetwork:
+        """
+        :return: The agent network
+        """
+        return self.agent_network
+
+
+class TestAsyncAgentService(TestCase):
+    """
+    Tests that requests whose client goes away or runs out of time are cancelled
+    all the way down to their tools, and that their capacity is reclaimed soon after.
+    """
+
+    def setUp(self):
+        self.tool_seconds: float = SLOW_TOOL_SECONDS
+        self.cancelled: Dict[str, float] = {}
+        log_json: str = FileOfClass(__file__, "../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        self.env_patch = patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json,
+                                                   "AGENT_MAX_REQUEST_SECONDS": "0"})
+        self.env_patch.start()
+
+        test: TestAsyncAgentService = self
+
+        async def set_up(session: DataDrivenChatSession, invocation_context: InvocationContext,
+                         chat_context: Dict[str, Any] = None):
+            _ = chat_context
+            session.front_man = SlowFrontMan(invocation_context, test.tool_seconds, test.cancelled)
+
+        self.set_up_patch = patch.object(DataDrivenChatSession, "set_up", set_up)
+        self.set_up_patch.start()
+
+    def tearDown(self):
+        self.set_up_patch.stop()
+        self.env_patch.stop()
+
+    @staticmethod
+    def create_service(config: Dict[str, Any] = None) -> AsyncAgentService:
+        """
+        :param config: Any extra top-level keys for the agent network
+        :return: An AsyncAgentService for an agent network whose front man is slow
+        """
+        network_config: Dict[str, Any] = {
+            "tools": [
+                {
+                    "name": "front_man",
+                    "function": {"description": "Answers slowly"},
+                    "instructions": "Answer slowly",
+                }
+            ]
+        }
+        network_config.update(config or {})
+        provider = FakeAgentNetworkProvider(AgentNetwork(network_config, NETWORK_NAME))
+        return AsyncAgentService(HttpLogger(["user_id", "request_id"]), None, NETWORK_NAME, provider,
+                                 AgentServerLogging("test", "request_id user_id"), ServerContext())
+
+    @staticmethod
+    def create_request() -> Dict[str, Any]:
+        """
+        :return: A ChatRequest dictionary asking for all messages
+        """
+        return {
+            "user_message": {"text": "hello"},
+            "chat_filter": {"chat_filter_type": "MAXIMAL"},
+        }
+
+    def assert_tools_cancelled(self, since: float):
+        """
+        :param since: The monotonic time of the cancellation
+        """
+        self.assertEqual({"coded_tool", "external_agent"}, set(self.cancelled.keys()))
+        for name, cancelled_at in self.cancelled.items():
+            self.assertLess(cancelled_at - since, RECLAIM_SECONDS, name)
+
+    def test_client_gone(self):
+        """
+        Tests that a client going away cancels its tools and frees up the request
+        """
+        service: AsyncAgentService = self.create_service()
+
+        async def run_test() -> float:
+            generator: AsyncIterator[Dict[str, Any]] = service.streaming_chat(self.create_request(), {})
+            first: Dict[str, Any] = await generator.__anext__()
+            self.assertEqual("Calling tools", first.get("response").get("text"))
+            self.assertEqual(1, service.get_request_count())
+
+            # This is what the transports do when the client goes away
+            gone_at: float = time.monotonic()
+            await generator.aclose()
+            return gone_at
+
+        gone_at: float = asyncio.run(run_test())
+        self.assert_tools_cancelled(gone_at)
+        self.assertEqual(0, service.get_request_count())
+
+        # The next request gets the capacity back and runs to the end
+        self.tool_seconds = 0.01
+        self.cancelled.clear()
+        responses: List[Dict[str, Any]] = asyncio.run(self.collect(service, self.create_request()))
+        self.assertEqual("Done with hello", responses[-1].get("response").get("text"))
+        self.assertEqual({}, self.cancelled)
+
+    def test_slow_failing_close(self):
+        """
+        Tests that closing a cancelled request neither holds up the event loop
+        nor leaks the request count when the close fails.
+        """
+        service: AsyncAgentService = self.create_service()
+        original_close = SessionInvocationContext.close
+
+        def slow_failing_close(invocation_context: SessionInvocationContext):
+            original_close(invocation_context)
+            time.sleep(0.5)
+            raise RuntimeError("Executor would not go away")
+
+        async def ticker(ticks: List[float]):
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run_test() -> List[float]:
+            ticks: List[float] = []
+            generator: AsyncIterator[Dict[str, Any]] = service.streaming_chat(self.create_request(), {})
+            await generator.__anext__()
+            ticking = asyncio.create_task(ticker(ticks))
+            with patch.object(SessionInvocationContext, "close", slow_failing_close):
+                with self.assertRaises(RuntimeError):
+                    await generator.aclose()
+            ticking.cancel()
+            return ticks
+
+        ticks: List[float] = asyncio.run(run_test())
+        self.assertEqual(0, service.get_request_count())
+        # The loop kept going while the close took its time
+        self.assertGreater(len(ticks), 10)
+
+    def test_client_gone_while_queued(self):
+        """
+        Tests that a client going away while waiting for a server slot
+        does not leak the network slot it already has, and that both waits
+        together take no longer than a single queue timeout.
+        """
+        service: AsyncAgentService = self.create_service()
+        service.server_admission = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=0.5)
+        service.network_admission = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=0.5)
+
+        async def run_test() -> float:
+            # Somebody else has the only server slot
+            await service.server_admission.async_acquire()
+
+            task = asyncio.create_task(service.admit_request({}))
+            await asyncio.sleep(0.05)
+            self.assertEqual(1, service.network_admission.get_stats().get("active"))
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(0, service.network_admission.get_stats().get("active"))
+
+            # Wait part of the time for the network slot, and time out waiting for the server slot
+            await service.network_admission.async_acquire()
+            asyncio.get_running_loop().call_later(0.3, service.network_admission.release)
+            start: float = time.monotonic()
+            self.assertIsNone(await service.admit_request({}))
+            return time.monotonic() - start
+
+        elapsed: float = asyncio.run(run_test())
+        # Not the 0.3 + 0.5 seconds of two full waits
+        self.assertLess(elapsed, 0.7)
+        self.assertEqual(0, service.network_admission.get_stats().get("active"))
+
+    def test_client_deadline(self):
+        """
+        Tests that a request running past the deadline of its client is cancelled
+        """
+        service: AsyncAgentService = self.create_service()
+        self.check_deadline(service, timeout_seconds=0.5)
+
+    def test_network_deadline(self):
+        """
+        Tests that a request running past the max_request_seconds of its network is cancelled
+        """
+        service: AsyncAgentService = self.create_service({"max_request_seconds": 0.5})
+        self.check_deadline(service, timeout_seconds=None)
+
+    def check_deadline(self, service: AsyncAgentService, timeout_seconds: float):
+        """
+        :param service: The service to send a request to
+        :param timeout_seconds: The deadline of the client
+        """
+        start: float = time.monotonic()
+        responses: List[Dict[str, Any]] = asyncio.run(self.collect(service, self.create_request(),
+                                                                   timeout_seconds))
+        elapsed: float = time.monotonic() - start
+
+        self.assertIn("ran out of time", responses[-1].get("response").get("text"))
+        self.assertLess(elapsed, 0.5 + RECLAIM_SECONDS)
+        self.assert_tools_cancelled(start + 0.5)
+        self.assertEqual(0, service.get_request_count())
+
+    @staticmethod
+    async def collect(service: AsyncAgentService, request_dict: Dict[str, Any],
+                      timeout_seconds: float = None) -> List[Dict[str, Any]]:
+        """
+        :param service: The service to send the request to
+        :param request_dict: The ChatRequest dictionary
+        :param timeout_seconds: The deadline of the client
+        :return: All the responses
+        """
+        return [response async for response in service.streaming_chat(request_dict, {}, timeout_seconds)]
@@ -0,0 +1,223 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from copy import deepcopy
+from unittest import TestCase
+
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from neuro_san.internals.graph.activations.sly_data_size_limiter import SlyDataSizeLimiter
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.internals.utils.json_codec import JsonCodec
+from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
+
+PAYLOAD_BYTES: int = 50 * 1000 * 1000
+NUM_LEVELS: int = 3
+
+
+def make_sly_data(payload_bytes: int) -> Dict[str, Any]:
+    """
+    :param payload_bytes: About how many bytes the sly_data should take up
+    :return: sly_data holding a table, like a CodedTool might stash there.
+    """
+    # Each row takes about 330 bytes
+    table: List[Dict[str, Any]] = [{"id": row, "name": f"item number {row}", "score": row * 0.5}
+                                   for row in range(payload_bytes // 330)]
+    return {"table": table, "bearer_token": "abc"}
+
+
+def make_final_response(sly_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    :param sly_data: The sly_data to return
+    :return: The last ChatResponse of a streaming_chat(), as a server has it before conversion
+    """
+    chat_context: Dict[str, Any] = {
+        "chat_histories": [
+            {
+                "origin": [{"tool": "front_man", "instantiation_index": 1}],
+                "messages": [
+                    {"type": ChatMessageType.HUMAN, "text": "Crunch the table"},
+                    {"type": ChatMessageType.AI, "text": "Done"},
+                ]
+            }
+        ]
+    }
+    return {
+        "response": {
+            "type": ChatMessageType.AGENT_FRAMEWORK,
+            "text": "Done",
+            "chat_context": chat_context,
+            "sly_data": sly_data,
+        }
+    }
+
+
+def old_to_dict(chat_response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    :param chat_response: The ChatResponse dictionary to convert
+    :return: How ChatMessageConverter.to_dict() used to convert: a deepcopy converted in place
+    """
+    converted: Dict[str, Any] = deepcopy(chat_response)
+    ChatMessageConverter().convert(converted)
+    return converted
+
+
+class ThreeLevelNetwork:
+    """
+    Passes sly_data through a chain of agent networks on different servers
+    the way requests and responses go over http, letting every hop through.
+    Only the JSON and the sly_data are modeled, not the agents.
+    """
+
+    def __init__(self, old: bool):
+        """
+        Constructor
+
+        :param old: True to model how hops used to be handled. False for how they are now.
+        """
+        self.old: bool = old
+        self.codec: JsonCodec = JsonCodec.get_shared()
+
+    def call(self, sly_data: Dict[str, Any], level: int) -> Dict[str, Any]:
+        """
+        Client side of a hop.
+        :param sly_data: The sly_data to send
+        :param level: The level of the server to call
+        :return: The sly_data returned by the server
+        """
+        request: Dict[str, Any] = {"user_message": {"type": "HUMAN", "text": "go"}, "sly_data": sly_data}
+        if self.old:
+            # What aiohttp does with json=
+            body = {"body": json.dumps(request).encode("utf-8")}
+        else:
+            body = {"body": self.codec.dumps_bytes(request)}
+        line: bytes = self.serve(body, level)
+        return self.codec.loads(line)["response"]["sly_data"]
+
+    def serve(self, body: Dict[str, bytes], level: int) -> bytes:
+        """
+        Server side of a hop.
+        :param body: Holds the body of the request, like the http request does
+        :param level: The level of this server
+        :return: The last line of the response stream
+        """
+        request: Dict[str, Any] = self.codec.loads(body["body"])
+        if not self.old:
+            body["body"] = b""
+
+        sly_data: Dict[str, Any] = request.get("sly_data")
+        if level < NUM_LEVELS:
+            sly_data = self.call(sly_data, level + 1)
+
+        chat_response: Dict[str, Any] = make_final_response(sly_data)
+        if self.old:
+            chat_response = old_to_dict(chat_response)
+        else:
+            chat_response = ChatMessageConverter().to_dict(chat_response)
+        return self.codec.dumps_bytes(chat_response) + b"\n"
+
+
+class TestChatMessageConverter(TestCase):
+    """
+    Tests for ChatMessageConverter
+    """
+
+    def test_to_dict(self):
+        """
+        Tests that conversion gives the same as it always has without touching the original
+        """
+        sly_data: Dict[str, Any] = {"table": [{"id": 1}]}
+        chat_response: Dict[str, Any] = make_final_response(sly_data)
+        chat_response["request"] = {"user_message": {"type": "HUMAN", "text": "go"}}
+        original: Dict[str, Any] = deepcopy(chat_response)
+
+        converted: Dict[str, Any] = ChatMessageConverter().to_dict(chat_response)
+
+        self.assertEqual(old_to_dict(original), converted)
+        self.assertEqual(original, chat_response)
+        self.assertEqual("AGENT_FRAMEWORK", converted["response"]["type"])
+        messages: List[Dict[str, Any]] = converted["response"]["chat_context"]["chat_histories"][0]["messages"]
+        self.assertEqual(["HUMAN", "AI"], [message["type"] for message in messages])
+
+        # Values that do not need converting are shared, not copied
+        self.assertIs(sly_data, converted["response"]["sly_data"])
+
+    def test_conversion_memory(self):
+        """
+        Tests that converting a response no longer copies the sly_data in it
+        """
+        chat_response: Dict[str, Any] = make_final_response(make_sly_data(5 * 1000 * 1000))
+
+        peaks: Dict[str, int] = {}
+        tracemalloc.start()
+        try:
+            for name, convert in (("old", old_to_dict), ("new", ChatMessageConverter().to_dict)):
+                tracemalloc.reset_peak()
+                start_bytes: int = tracemalloc.get_traced_memory()[0]
+                converted: Dict[str, Any] = convert(chat_response)
+                peaks[name] = tracemalloc.get_traced_memory()[1] - start_bytes
+                del converted
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peaks["new"] * 100, peaks["old"])
+
+    @pytest.mark.integration
+    def test_benchmark(self):
+        """
+        Compares peak memory passing a PAYLOAD_BYTES sly_data payload
+        through NUM_LEVELS levels of agent networks and back.
+        """
+        sly_data: Dict[str, Any] = make_sly_data(PAYLOAD_BYTES)
+        payload_bytes: int = SlyDataSizeLimiter.estimate_size(sly_data)
+
+        hop_peaks: Dict[str, int] = {}
+        peaks: Dict[str, int] = {}
+        seconds: Dict[str, float] = {}
+        tracemalloc.start()
+        try:
+            for name, old in (("old", True), ("new", False)):
+                # What converting the last response of one hop takes
+                convert = old_to_dict if old else ChatMessageConverter().to_dict
+                tracemalloc.reset_peak()
+                start_bytes: int = tracemalloc.get_traced_memory()[0]
+                converted: Dict[str, Any] = convert(make_final_response(sly_data))
+                hop_peaks[name] = tracemalloc.get_traced_memory()[1] - start_bytes
+                del converted
+
+                # What the whole trip takes
+                network = ThreeLevelNetwork(old)
+                tracemalloc.reset_peak()
+                start_bytes = tracemalloc.get_traced_memory()[0]
+                start: float = time.perf_counter()
+                returned: Dict[str, Any] = network.call(sly_data, 1)
+                seconds[name] = time.perf_counter() - start
+                self.assertEqual(len(sly_data["table"]), len(returned["table"]))
+                del returned
+                peaks[name] = tracemalloc.get_traced_memory()[1] - start_bytes
+        finally:
+            tracemalloc.stop()
+
+        print(f"\nPassing {payload_bytes / 1e6:.0f} MB of sly_data through {NUM_LEVELS} levels "
+              f"({JsonCodec.get_shared().get_implementation_name()}):")
+        for name in ("old", "new"):
+            print(f"    {name}: response conversion peak {hop_peaks[name] / 1e6:.1f} MB per hop, "
+                  f"whole trip peak {peaks[name] / 1e6:.0f} MB in {seconds[name]:.1f}s")
+        self.assertLess(hop_peaks["new"] * 100, hop_peaks["old"])
+        self.assertLess(peaks["new"], peaks["old"])
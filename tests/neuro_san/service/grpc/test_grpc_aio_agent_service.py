@@ -0,0 +1,390 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import asyncio
+import logging
+import threading
+import time
+
+from concurrent import futures
+from unittest import TestCase
+from unittest.mock import patch
+
+import grpc
+import pytest
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatResult
+from leaf_server_common.logging.request_logger_adapter import RequestLoggerAdapter
+from leaf_server_common.server.request_logger import RequestLogger
+
+from neuro_san.api.grpc import agent_pb2
+from neuro_san.api.grpc import chat_pb2
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.generic.agent_server_logging import AgentServerLogging
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.grpc.agent_servicer_to_server import AgentServicerToServer
+from neuro_san.service.grpc.dynamic_agent_router import DynamicAgentRouter
+from neuro_san.service.grpc.grpc_agent_service import GrpcAgentService
+from neuro_san.service.grpc.grpc_aio_agent_service import GrpcAioAgentService
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.utils.admission_controller import AdmissionController
+from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.session.agent_service_stub import AgentServiceStub
+
+AGENT_NAME: str = "fake_agent"
+FAKE_ANSWER: str = "answer"
+
+
+class FakeSlowChatModel(BaseChatModel):
+    """
+    A chat model that gives the same answer to everything after a short wait,
+    so a real agent network can be run without a real llm.
+    """
+
+    llm_seconds: float = 0.05
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-slow"
+
+    def _generate(self, messages: List[Any], stop: List[str] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        _ = messages, stop, run_manager, kwargs
+        time.sleep(self.llm_seconds)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=FAKE_ANSWER))])
+
+    async def _agenerate(self, messages: List[Any], stop: List[str] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        _ = messages, stop, run_manager, kwargs
+        await asyncio.sleep(self.llm_seconds)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=FAKE_ANSWER))])
+
+    def bind_tools(self, tools: List[Any], **kwargs: Any) -> "FakeSlowChatModel":
+        """
+        The fake llm never calls tools
+        """
+        _ = tools, kwargs
+        return self
+
+
+class FakeAgentNetworkProvider:
+    """
+    Stands in for an AgentNetworkProvider of a single agent answering with the fake llm
+    """
+
+    def get_agent_network(self) -> AgentNetwork:
+        """
+        :return: The agent network
+        """
+        config: Dict[str, Any] = {
+            "llm_config": {
+                "class": f"{__name__}.FakeSlowChatModel"
+            },
+            "tools": [
+                {
+                    "name": "front_man",
+                    "function": {
+                        "description": "Answers anything"
+                    },
+                    "instructions": "Answer the question."
+                }
+            ]
+        }
+        return AgentNetwork(config, AGENT_NAME)
+
+
+class FakeRequestLogger(RequestLogger):
+    """
+    A RequestLogger for the sync service that just logs
+    """
+
+    def start_request(self, caller, requestor_id, context,
+                      service_logging_dict: Dict[str, str] = None):
+        """
+        :return: A RequestLoggerAdapter for the request
+        """
+        _ = caller, requestor_id, context, service_logging_dict
+        return RequestLoggerAdapter(logging.getLogger(__name__), {})
+
+    def finish_request(self, caller, requestor_id, request_log):
+        """
+        Nothing to do
+        """
+        _ = caller, requestor_id, request_log
+
+
+class FakeAsyncAgentService:
+    """
+    Stands in for an AsyncAgentService whose agent network streams
+    a few messages from a fake llm that takes a while to respond.
+    """
+
+    def __init__(self, admission: AdmissionController, num_messages: int, llm_seconds: float):
+        self.admission: AdmissionController = admission
+        self.num_messages: int = num_messages
+        self.llm_seconds: float = llm_seconds
+        self.active: int = 0
+
+    def get_request_count(self) -> int:
+        """
+        :return: The number of active streaming chats
+        """
+        return self.active
+
+    async def admit_request(self, request_metadata: Dict[str, Any]) -> float:
+        """
+        Waits for admission like the real thing
+        """
+        _ = request_metadata
+        return await self.admission.async_acquire()
+
+    def release_request(self):
+        """
+        Releases an admission slot
+        """
+        self.admission.release()
+
+    def get_retry_after_seconds(self) -> int:
+        """
+        :return: The number of seconds rejected clients should wait
+        """
+        return self.admission.get_retry_after_seconds()
+
+    async def streaming_chat(self, request_dict: Dict[str, Any],
+                             request_metadata: Dict[str, Any],
+                             timeout_seconds: float = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams a few messages, each after waiting on the fake llm
+        """
+        _ = request_metadata, timeout_seconds
+        self.active += 1
+        try:
+            user_text: str = request_dict.get("user_message", {}).get("text", "")
+            for index in range(self.num_messages):
+                await asyncio.sleep(self.llm_seconds)
+                yield {"response": {"type": "AI", "text": f"{user_text} {index}"}}
+        finally:
+            self.active -= 1
+
+
+class FakeServiceProvider:
+    """
+    Stands in for an AsyncAgentServiceProvider
+    """
+
+    def __init__(self, service: FakeAsyncAgentService):
+        self.service: FakeAsyncAgentService = service
+
+    def get_service(self) -> FakeAsyncAgentService:
+        """
+        :return: The fake service
+        """
+        return self.service
+
+    def service_created(self) -> bool:
+        """
+        :return: True always
+        """
+        return True
+
+
+class TestGrpcAioAgentService(TestCase):
+    """
+    Tests for GrpcAioAgentService served by a grpc.aio server.
+    """
+
+    @staticmethod
+    def create_servicer(service: FakeAsyncAgentService) -> GrpcAioAgentService:
+        """
+        :param service: The fake service to serve
+        :return: A GrpcAioAgentService serving the fake service
+        """
+        servicer = GrpcAioAgentService(None, None, None, AGENT_NAME, None,
+                                       AgentServerLogging("test", "request_id user_id"),
+                                       ServerContext())
+        servicer.service_provider = FakeServiceProvider(service)
+        return servicer
+
+    @staticmethod
+    async def start_server(servicer: GrpcAioAgentService):
+        """
+        :param servicer: The GrpcAioAgentService to serve
+        :return: A tuple of the started grpc.aio server and its port
+        """
+        router = DynamicAgentRouter()
+        router.add_service(AgentServiceStub.prepare_service_name(AGENT_NAME),
+                           AgentServicerToServer(servicer).build_rpc_handlers())
+        server = grpc.aio.server()
+        server.add_generic_rpc_handlers((router,))
+        port: int = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        return server, port
+
+    @staticmethod
+    def create_streaming_chat(channel: grpc.aio.Channel):
+        """
+        :param channel: The channel to the server
+        :return: A callable for the StreamingChat method of the fake agent
+        """
+        service_name: str = AgentServiceStub.prepare_service_name(AGENT_NAME)
+        # pylint: disable=no-member
+        return channel.unary_stream(f"/{service_name}/StreamingChat",
+                                    request_serializer=agent_pb2.ChatRequest.SerializeToString,
+                                    response_deserializer=agent_pb2.ChatResponse.FromString)
+
+    @pytest.mark.integration
+    def test_many_concurrent_streams(self):
+        """
+        Benchmarks concurrent streaming chats against a real agent network on a fake llm,
+        served by the grpc.aio server and by the sync gRPC server.
+
+        The grpc.aio server does not need a server worker thread per open stream,
+        but each admitted stream still holds an AsyncioExecutor thread of its own
+        while its agent network runs, so the thread count still grows with the number
+        of streams.  The sync server needs a worker thread per stream on top of that.
+        """
+        num_streams: int = 100
+        log_json: str = FileOfClass(__file__, "../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        with patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json}):
+            aio_threads: int = self.measure_peak_threads(self.run_aio_streams, num_streams)
+            sync_threads: int = self.measure_peak_threads(self.run_sync_streams, num_streams)
+
+        self.assertGreater(aio_threads, num_streams // 2)
+        self.assertLess(aio_threads, sync_threads)
+
+    def measure_peak_threads(self, run_streams: Callable[[int], List[str]], num_streams: int) -> int:
+        """
+        :param run_streams: A callable running the given number of streams
+                    and returning the final answer of each
+        :param num_streams: The number of concurrent streams to run
+        :return: The peak number of threads started while the streams ran
+        """
+        start_threads: int = threading.active_count()
+        peak: List[int] = [start_threads]
+        done = threading.Event()
+
+        def sample():
+            while not done.wait(0.005):
+                peak[0] = max(peak[0], threading.active_count())
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            answers: List[str] = run_streams(num_streams)
+        finally:
+            done.set()
+            sampler.join()
+
+        self.assertEqual([FAKE_ANSWER] * num_streams, answers)
+        return peak[0] - start_threads
+
+    def run_aio_streams(self, num_streams: int) -> List[str]:
+        """
+        :param num_streams: The number of concurrent streams to run
+        :return: The final answer of each stream
+        """
+        service = AsyncAgentService(HttpLogger(["user_id", "request_id"]), None, AGENT_NAME,
+                                    FakeAgentNetworkProvider(), AgentServerLogging("test", "request_id user_id"),
+                                    ServerContext())
+
+        async def run_streams() -> List[str]:
+            server, port = await self.start_server(self.create_servicer(service))
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                    return await self.gather_answers(self.create_streaming_chat(channel), num_streams)
+            finally:
+                await server.stop(None)
+
+        return asyncio.run(run_streams())
+
+    def run_sync_streams(self, num_streams: int) -> List[str]:
+        """
+        :param num_streams: The number of concurrent streams to run
+        :return: The final answer of each stream
+        """
+        servicer = GrpcAgentService(FakeRequestLogger(), None, AGENT_NAME, FakeAgentNetworkProvider(),
+                                    AgentServerLogging("test", "request_id user_id"), ServerContext())
+        router = DynamicAgentRouter()
+        router.add_service(AgentServiceStub.prepare_service_name(AGENT_NAME),
+                           AgentServicerToServer(servicer).build_rpc_handlers())
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=num_streams))
+        server.add_generic_rpc_handlers((router,))
+        port: int = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+
+        async def run_streams() -> List[str]:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                return await self.gather_answers(self.create_streaming_chat(channel), num_streams)
+
+        try:
+            return asyncio.run(run_streams())
+        finally:
+            server.stop(None)
+
+    @staticmethod
+    async def gather_answers(streaming_chat, num_streams: int) -> List[str]:
+        """
+        :param streaming_chat: A callable for the StreamingChat method
+        :param num_streams: The number of concurrent streams to run
+        :return: The final answer of each stream
+        """
+        async def one_chat(index: int) -> str:
+            # pylint: disable=no-member
+            request = agent_pb2.ChatRequest()
+            request.user_message.text = f"hello {index}"
+            answer: str = None
+            async for response in streaming_chat(request):
+                if response.response.type == chat_pb2.ChatMessage.AGENT_FRAMEWORK:
+                    answer = response.response.text
+            return answer
+
+        return await asyncio.gather(*[one_chat(index) for index in range(num_streams)])
+
+    def test_rejection(self):
+        """
+        Tests that requests beyond the admission limits are rejected with RESOURCE_EXHAUSTED.
+        """
+        admission = AdmissionController(max_concurrent=1, max_queued=0)
+        service = FakeAsyncAgentService(admission, num_messages=3, llm_seconds=0.2)
+
+        async def run_test():
+            server, port = await self.start_server(self.create_servicer(service))
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                    streaming_chat = self.create_streaming_chat(channel)
+                    # pylint: disable=no-member
+                    request = agent_pb2.ChatRequest()
+                    request.user_message.text = "hello"
+
+                    async def consume() -> int:
+                        return len([response async for response in streaming_chat(request)])
+
+                    first = asyncio.create_task(consume())
+                    await asyncio.sleep(0.1)
+                    with self.assertRaises(grpc.aio.AioRpcError) as context:
+                        await consume()
+                    self.assertEqual(grpc.StatusCode.RESOURCE_EXHAUSTED, context.exception.code())
+                    self.assertEqual(3, await first)
+            finally:
+                await server.stop(None)
+
+        asyncio.run(run_test())
+        self.assertEqual(0, admission.get_stats().get("active"))
@@ -0,0 +1,138 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+
+import aiohttp
+import tornado.httpserver
+import tornado.netutil
+import tornado.web
+
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.http.handlers.memory_profile_handler import MemoryProfileHandler
+from neuro_san.service.utils.memory_profiler import MemoryProfiler
+from tests.neuro_san.service.utils.test_memory_profiler import LEAKED
+from tests.neuro_san.service.utils.test_memory_profiler import LeakyCodedTool
+from tests.neuro_san.service.utils.test_memory_profiler import find_line
+
+ADMIN_TOKEN: str = "let-me-in"
+AUTHORIZATION: Dict[str, str] = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+
+
+class TestMemoryProfileHandler(TestCase):
+    """
+    Unit tests for MemoryProfileHandler class.
+    """
+
+    def setUp(self):
+        MemoryProfiler.shared = None
+
+    def tearDown(self):
+        MemoryProfiler.get_shared().configure(tracing=False)
+        MemoryProfiler.shared = None
+        LEAKED.clear()
+
+    def test_endpoints(self):
+        """
+        Tests finding a leak in a CodedTool through the endpoints
+        """
+        log_json: str = FileOfClass(__file__, "../../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        with patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json}):
+            asyncio.run(self.run_requests())
+
+    # pylint: disable=too-many-locals,too-many-statements
+    async def run_requests(self):
+        """
+        Makes the requests against a server with the memory profiling endpoints
+        """
+        handlers: List[Any] = []
+        for op in ("status", "snapshots", "top", "diff", "objects", "requests"):
+            path: str = "/api/v1/admin/memory" if op == "status" else f"/api/v1/admin/memory/{op}"
+            handlers.append((path, MemoryProfileHandler,
+                             {"forwarded_request_metadata": ["user_id", "request_id"],
+                              "admin_token": ADMIN_TOKEN,
+                              "op": op}))
+        server = tornado.httpserver.HTTPServer(tornado.web.Application(handlers))
+        sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+        server.add_sockets(sockets)
+        base_url: str = f"http://127.0.0.1:{sockets[0].getsockname()[1]}/api/v1/admin/memory"
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                # Nobody gets in without the token
+                for headers in ({}, {"Authorization": "Bearer nope"}, {"Authorization": ADMIN_TOKEN}):
+                    async with session.get(base_url, headers=headers) as response:
+                        self.assertEqual(401, response.status)
+
+                async with session.post(f"{base_url}/snapshots", headers=AUTHORIZATION, json={}) as response:
+                    self.assertEqual(400, response.status)
+                    self.assertEqual("Memory tracing is off", (await response.json()).get("error"))
+
+                # Bodies that are not valid UTF-8 or not a JSON object are bad requests, not errors
+                for body in (b"\xff\xfe{", b"[1, 2]"):
+                    async with session.post(base_url, headers=AUTHORIZATION, data=body) as response:
+                        self.assertEqual(400, response.status)
+                        self.assertEqual("Invalid JSON format", (await response.json()).get("error"))
+
+                async with session.post(base_url, headers=AUTHORIZATION,
+                                        json={"tracing": True, "request_sample_rate": 0.25}) as response:
+                    status: Dict[str, Any] = await response.json()
+                    self.assertTrue(status.get("tracing"))
+                    self.assertEqual(0.25, status.get("request_sample_rate"))
+
+                async with session.post(f"{base_url}/snapshots", headers=AUTHORIZATION,
+                                        json={"name": "before"}) as response:
+                    self.assertEqual("before", (await response.json()).get("name"))
+
+                objects_url: str = f"{base_url}/objects?types=BaseMessage,LeakyCodedTool"
+                async with session.get(objects_url, headers=AUTHORIZATION) as response:
+                    before: Dict[str, int] = await response.json()
+
+                tool = LeakyCodedTool()
+                for _ in range(10):
+                    await tool.async_invoke({}, {})
+
+                async with session.get(f"{base_url}/diff?snapshot=before&limit=3",
+                                       headers=AUTHORIZATION) as response:
+                    differences: List[Dict[str, Any]] = await response.json()
+                    self.assertEqual(find_line("leaks buffers"), differences[0].get("line"))
+                    self.assertTrue(differences[0].get("file").endswith("test_memory_profiler.py"))
+
+                async with session.get(objects_url, headers=AUTHORIZATION) as response:
+                    after: Dict[str, int] = await response.json()
+                    self.assertEqual(10, after.get("BaseMessage") - before.get("BaseMessage"))
+                    self.assertEqual(1, after.get("LeakyCodedTool"))
+
+                async with session.get(f"{base_url}/top?limit=2", headers=AUTHORIZATION) as response:
+                    self.assertEqual(2, len(await response.json()))
+
+                async with session.get(f"{base_url}/diff?snapshot=nope", headers=AUTHORIZATION) as response:
+                    self.assertEqual(404, response.status)
+                async with session.get(f"{base_url}/diff", headers=AUTHORIZATION) as response:
+                    self.assertEqual(400, response.status)
+                async with session.get(f"{base_url}/top?group_by=nope", headers=AUTHORIZATION) as response:
+                    self.assertEqual(400, response.status)
+
+                async with session.get(f"{base_url}/requests", headers=AUTHORIZATION) as response:
+                    self.assertEqual({}, await response.json())
+
+                async with session.post(base_url, headers=AUTHORIZATION, json={"tracing": False}) as response:
+                    self.assertFalse((await response.json()).get("tracing"))
+        finally:
+            server.stop()
+            await server.close_all_connections()
@@ -0,0 +1,194 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import json
+import socket
+
+import aiohttp
+import tornado.httpserver
+import tornado.netutil
+import tornado.web
+
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.http.handlers.shard_forwarding_handler import ShardForwardingHandler
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.server.http_server_app import HttpServerApp
+from neuro_san.service.http.server.http_shard_router import FORWARDED_FROM_SHARD_HEADER
+from neuro_san.service.http.server.http_shard_router import HttpShardRouter
+from neuro_san.service.http.server.network_shard_map import NetworkShardMap
+from neuro_san.service.http.server.remote_shard_matcher import RemoteShardMatcher
+
+
+class OwnerHandler(tornado.web.RequestHandler):
+    """
+    Stands in for the agent request handlers of the worker owning an agent network.
+    Streams back a few lines describing the request it got.
+    """
+
+    # pylint: disable=abstract-method
+    async def post(self, agent_name: str, method: str):
+        """
+        Streams back lines describing the request
+        """
+        self.set_header("Content-Type", "application/json-lines")
+        self.set_header("X-Owner", "yes")
+        lines: List[Dict[str, Any]] = [
+            {"agent_name": agent_name, "method": method},
+            {"forwarded_from": self.request.headers.get(FORWARDED_FROM_SHARD_HEADER)},
+            {"body": json.loads(self.request.body)},
+        ]
+        for line in lines:
+            self.write(json.dumps(line) + "\n")
+            await self.flush()
+
+    async def get(self, agent_name: str, method: str):
+        """
+        Refuses the request
+        """
+        _ = method
+        self.set_status(404)
+        self.write({"error": f"{agent_name} not found"})
+
+
+class TestShardForwardingHandler(TestCase):
+    """
+    Unit tests for ShardForwardingHandler class, along with RemoteShardMatcher.
+    """
+
+    AGENT_NAME: str = "hello_world"
+
+    def make_router(self, socket_dir: str) -> Tuple[HttpShardRouter, int]:
+        """
+        :param socket_dir: The directory for the unix domain sockets
+        :return: A tuple of a router for the shard not owning AGENT_NAME, and the owning shard index
+        """
+        router = HttpShardRouter(NetworkShardMap(2), 8080, socket_dir)
+        owner: int = router.get_owner(self.AGENT_NAME)
+        router.set_shard_index(1 - owner)
+        return router, owner
+
+    def test_matcher(self):
+        """
+        Tests which requests get forwarded
+        """
+        router = HttpShardRouter(NetworkShardMap(2), 8080, "/tmp")
+        matcher = RemoteShardMatcher(router)
+        owner: int = router.get_owner(self.AGENT_NAME)
+
+        def make_request(path: str, headers: Dict[str, str] = None, address_family: int = socket.AF_INET):
+            connection = SimpleNamespace(context=SimpleNamespace(address_family=address_family))
+            return tornado.httputil.HTTPServerRequest(method="POST", uri=path,
+                                                      headers=tornado.httputil.HTTPHeaders(headers or {}),
+                                                      connection=connection)
+
+        streaming_path: str = f"/api/v1/{self.AGENT_NAME}/streaming_chat"
+
+        # Before forking, everything is local
+        self.assertIsNone(matcher.match(make_request(streaming_path)))
+
+        router.set_shard_index(owner)
+        self.assertIsNone(matcher.match(make_request(streaming_path)))
+
+        router.set_shard_index(1 - owner)
+        for method in ("function", "connectivity", "streaming_chat"):
+            result: Dict[str, Any] = matcher.match(make_request(f"/api/v1/{self.AGENT_NAME}/{method}"))
+            self.assertEqual([self.AGENT_NAME.encode("utf-8")], result.get("path_args"))
+
+        self.assertIsNone(matcher.match(make_request("/api/v1/list")))
+        self.assertIsNone(matcher.match(make_request("/healthz")))
+        forwarded = make_request(streaming_path, {FORWARDED_FROM_SHARD_HEADER: "1"}, socket.AF_UNIX)
+        self.assertIsNone(matcher.match(forwarded))
+
+        # Public requests claiming to be forwarded are routed like any other, minus the claim
+        spoofed = make_request(streaming_path, {FORWARDED_FROM_SHARD_HEADER: "1"})
+        self.assertIsNotNone(matcher.match(spoofed))
+        self.assertNotIn(FORWARDED_FROM_SHARD_HEADER, spoofed.headers)
+
+    def test_forwarding(self):
+        """
+        Tests that requests for the other shard's network come back from the other shard
+        """
+        log_json: str = FileOfClass(__file__, "../../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        with TemporaryDirectory() as socket_dir, \
+                patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json}):
+            router, owner = self.make_router(socket_dir)
+            results: Dict[str, Any] = asyncio.run(self.run_requests(router, owner))
+
+        self.assertEqual(200, results["post_status"])
+        self.assertEqual("yes", results["post_owner"])
+        self.assertEqual([{"agent_name": self.AGENT_NAME, "method": "streaming_chat"},
+                          {"forwarded_from": str(1 - owner)},
+                          {"body": {"user_message": {"text": "Hi"}}}],
+                         results["post_lines"])
+
+        self.assertEqual(404, results["get_status"])
+
+        # Owner went away, as it would when crashed and not yet restarted
+        self.assertEqual(503, results["down_status"])
+
+    async def run_requests(self, router: HttpShardRouter, owner: int) -> Dict[str, Any]:
+        """
+        :param router: The router for the forwarding shard
+        :param owner: The index of the owning shard
+        :return: A dictionary of results to check
+        """
+        owner_app = tornado.web.Application([(r"/api/v1/([^/]+)/([^/]+)", OwnerHandler)])
+        owner_server = tornado.httpserver.HTTPServer(owner_app)
+        owner_server.add_socket(tornado.netutil.bind_unix_socket(router.get_socket_path(owner)))
+
+        request_data: Dict[str, Any] = {
+            "agent_policy": None,
+            "forwarded_request_metadata": ["user_id", "request_id"],
+            "openapi_service_spec_path": None,
+            "network_storage_dict": {},
+            "shard_router": router,
+        }
+        front_app = HttpServerApp([(RemoteShardMatcher(router), ShardForwardingHandler, request_data)],
+                                  -1, HttpLogger(["user_id", "request_id"]), ["user_id", "request_id"])
+        front_server = tornado.httpserver.HTTPServer(front_app)
+        front_sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+        front_server.add_sockets(front_sockets)
+        port: int = front_sockets[0].getsockname()[1]
+
+        results: Dict[str, Any] = {}
+        base_url: str = f"http://127.0.0.1:{port}/api/v1/{self.AGENT_NAME}"
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(f"{base_url}/streaming_chat",
+                                        json={"user_message": {"text": "Hi"}}) as response:
+                    results["post_status"] = response.status
+                    results["post_owner"] = response.headers.get("X-Owner")
+                    results["post_lines"] = [json.loads(line) async for line in response.content]
+
+                async with session.get(f"{base_url}/function") as response:
+                    results["get_status"] = response.status
+
+                owner_server.stop()
+                await owner_server.close_all_connections()
+                async with session.get(f"{base_url}/function") as response:
+                    results["down_status"] = response.status
+        finally:
+            front_server.stop()
+            await front_server.close_all_connections()
+            await router.get_client_session(owner).close()
+
+        return results
@@ -0,0 +1,145 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import json
+import time
+
+import aiohttp
+import tornado.httpserver
+import tornado.netutil
+
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.internals.utils.request_deadline import RequestDeadline
+from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.server.http_server_app import HttpServerApp
+
+# How soon after the client goes away its request should be cancelled
+RECLAIM_SECONDS: float = 2.0
+
+
+class SlowAsyncAgentService:
+    """
+    Stands in for an AsyncAgentService whose agent network sends one message
+    and then takes a long time to come up with the next one.
+    """
+
+    def __init__(self):
+        self.timeout_seconds: float = None
+        self.cancelled_at: float = None
+        self.released: bool = False
+
+    async def admit_request(self, request_metadata: Dict[str, Any]) -> float:
+        """
+        Always admits the request
+        """
+        _ = request_metadata
+        return 0.0
+
+    def release_request(self):
+        """
+        Records the release of the request
+        """
+        self.released = True
+
+    async def streaming_chat(self, request_dict: Dict[str, Any],
+                             request_metadata: Dict[str, Any],
+                             timeout_seconds: float = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Sends a message, then waits on a slow tool
+        """
+        _ = request_dict, request_metadata
+        self.timeout_seconds = timeout_seconds
+        done: bool = False
+        try:
+            yield {"response": {"type": "AGENT", "text": "Calling tools"}}
+            await asyncio.sleep(60.0)
+            yield {"response": {"type": "AI", "text": "Done"}}
+            done = True
+        finally:
+            # Like the real thing, the work is cancelled when the generator is closed early,
+            # whether that happens while waiting on the tool or on the client.
+            if not done:
+                self.cancelled_at = time.monotonic()
+
+
+class TestStreamingChatHandler(TestCase):
+    """
+    Tests for how StreamingChatHandler deals with deadlines and clients going away.
+    """
+
+    def test_client_gone(self):
+        """
+        Tests that a client closing its connection cancels the request
+        while the agent network is busy and nothing is being sent.
+        """
+        service = SlowAsyncAgentService()
+
+        async def get_service(_handler: StreamingChatHandler, agent_name: str,
+                              metadata: Dict[str, Any]) -> SlowAsyncAgentService:
+            _ = agent_name, metadata
+            return service
+
+        log_json: str = FileOfClass(__file__, "../../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        with patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json}), \
+                patch.object(StreamingChatHandler, "get_service", get_service):
+            gone_at: float = asyncio.run(self.run_request(service))
+
+        self.assertEqual(2.5, service.timeout_seconds)
+        self.assertIsNotNone(service.cancelled_at)
+        self.assertLess(service.cancelled_at - gone_at, RECLAIM_SECONDS)
+        self.assertTrue(service.released)
+
+    async def run_request(self, service: SlowAsyncAgentService) -> float:
+        """
+        :param service: The fake service
+        :return: The monotonic time at which the client went away
+        """
+        request_data: Dict[str, Any] = {
+            "agent_policy": None,
+            "forwarded_request_metadata": ["user_id", "request_id"],
+            "openapi_service_spec_path": None,
+            "network_storage_dict": {},
+        }
+        app = HttpServerApp([(r"/api/v1/([^/]+)/streaming_chat", StreamingChatHandler, request_data)],
+                            -1, HttpLogger(["user_id", "request_id"]), ["user_id", "request_id"])
+        server = tornado.httpserver.HTTPServer(app)
+        sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+        server.add_sockets(sockets)
+        url: str = f"http://127.0.0.1:{sockets[0].getsockname()[1]}/api/v1/slow_network/streaming_chat"
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, json={"user_message": {"text": "hello"}},
+                                        headers={RequestDeadline.HEADER: "2.5"}) as response:
+                    first: Dict[str, Any] = json.loads(await response.content.readline())
+                    self.assertEqual("Calling tools", first.get("response").get("text"))
+                    # Let the handler get past flushing, so it is only waiting on the agent network
+                    await asyncio.sleep(0.5)
+                    gone_at: float = time.monotonic()
+                    response.close()
+
+            # Give the server a chance to notice
+            while service.cancelled_at is None and time.monotonic() - gone_at < RECLAIM_SECONDS:
+                await asyncio.sleep(0.05)
+        finally:
+            server.stop()
+            await server.close_all_connections()
+
+        return gone_at
@@ -0,0 +1,54 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import ToolMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class CrunchingChatModel(BaseChatModel):
+    """
+    Chat model which always calls the "crunch" tool once, and then reports its result,
+    so that agent networks using it spend their time in the tool instead of waiting on an LLM.
+    """
+
+    rounds: int = 100
+
+    @property
+    def _llm_type(self) -> str:
+        return "crunching"
+
+    def _generate(self, messages: List[BaseMessage], stop: List[str] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        tool_messages: List[ToolMessage] = [message for message in messages if isinstance(message, ToolMessage)]
+        if len(tool_messages) > 0:
+            message = AIMessage(content=f"Crunched. {tool_messages[-1].content}")
+        else:
+            message = AIMessage(content="", tool_calls=[{
+                "name": "crunch",
+                "args": {"rounds": self.rounds},
+                "id": "call_crunch",
+            }])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        formatted_tools: List[Dict[str, Any]] = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, **kwargs)
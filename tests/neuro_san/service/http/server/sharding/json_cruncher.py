@@ -0,0 +1,48 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import json
+
+from neuro_san.interfaces.coded_tool import CodedTool
+
+# About 300KB of JSON
+DOCUMENT: str = json.dumps([
+    {
+        "id": index,
+        "name": f"record {index}",
+        "tags": [f"tag_{tag}" for tag in range(8)],
+        "values": [index * 0.5 + value for value in range(16)],
+        "nested": {"flag": index % 2 == 0, "text": "lorem ipsum dolor sit amet " * 2},
+    }
+    for index in range(1000)
+])
+
+
+class JsonCruncher(CodedTool):
+    """
+    CodedTool which does nothing but burn CPU parsing JSON.
+    """
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        """
+        :param args: An argument dictionary with a "rounds" key
+                saying how many times to parse the document
+        :param sly_data: Not used
+        :return: The total of a value over all the parsed documents
+        """
+        total: float = 0.0
+        for _ in range(int(args.get("rounds", 1))):
+            records = json.loads(DOCUMENT)
+            total += records[-1]["values"][-1]
+        return f"Total is {total}"
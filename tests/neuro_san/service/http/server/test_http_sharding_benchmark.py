@@ -0,0 +1,247 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+import psutil
+import pytest
+
+from neuro_san.internals.utils.file_of_class import FileOfClass
+
+NUM_NETWORKS: int = 4
+NUM_REQUESTS: int = 48
+CONCURRENCY: int = 8
+STARTUP_TIMEOUT_SECONDS: float = 120.0
+
+CHAT_MODEL_CLASS: str = "tests.neuro_san.service.http.server.sharding.crunching_chat_model.CrunchingChatModel"
+AGENT_TOOL_PATH: str = "tests.neuro_san.service.http.server.sharding"
+
+
+class TestHttpShardingBenchmark(TestCase):
+    """
+    Compares throughput of CPU-bound agent networks served by a single http server instance
+    with that of the same agent networks sharded across several http server instances.
+    """
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()    # pylint: disable=consider-using-with
+        self.manifest_file: str = self.write_registry(self.temp_dir.name)
+        self.server: subprocess.Popen = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.stop_server()
+        self.temp_dir.cleanup()
+
+    @pytest.mark.integration
+    def test_sharding_throughput(self):
+        """
+        Tests that throughput grows with the number of worker processes the machine can actually run,
+        and that a crashed worker gets replaced.
+        """
+        num_cores: int = psutil.cpu_count(logical=False) or os.cpu_count()
+        # Always shard over at least 2 workers, so forwarding is exercised even on a single core.
+        num_workers: int = max(2, min(NUM_NETWORKS, num_cores))
+
+        port: int = self.start_server(1, sharding=False)
+        single_rps: float = asyncio.run(self.run_requests(port))
+        self.stop_server()
+
+        port = self.start_server(num_workers, sharding=True)
+        sharded_rps: float = asyncio.run(self.run_requests(port))
+
+        expected_speedup: float = min(num_workers, num_cores)
+        speedup: float = sharded_rps / single_rps
+        print(f"{num_cores} cores: 1 instance {single_rps:.2f} requests/sec, "
+              f"{num_workers} sharded instances {sharded_rps:.2f} requests/sec, speedup {speedup:.2f}x")
+        self.assertGreater(speedup, 0.7 * expected_speedup)
+
+        # Kill a worker. The supervisor should bring it back, owning the same networks.
+        workers: List[psutil.Process] = psutil.Process(self.server.pid).children()
+        self.assertEqual(num_workers, len(workers))
+        workers[0].kill()
+        workers[0].wait()
+        deadline: float = time.time() + STARTUP_TIMEOUT_SECONDS
+        while len(psutil.Process(self.server.pid).children()) < num_workers:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.5)
+
+        results: List[int] = asyncio.run(self.run_until_all_succeed(port))
+        self.assertEqual([200] * NUM_NETWORKS, results)
+
+    @staticmethod
+    def write_registry(registry_dir: str) -> str:
+        """
+        :param registry_dir: Where to write the registry files
+        :return: The path to the manifest file
+        """
+        manifest: Dict[str, bool] = {}
+        for index in range(NUM_NETWORKS):
+            network: Dict[str, Any] = {
+                "llm_config": {"class": CHAT_MODEL_CLASS},
+                "tools": [
+                    {
+                        "name": "cruncher",
+                        "function": {"description": "I crunch JSON."},
+                        "instructions": "Always call the crunch tool and return what it says.",
+                        "tools": ["crunch"],
+                    },
+                    {
+                        "name": "crunch",
+                        "function": {
+                            "description": "Parses a lot of JSON",
+                            "parameters": {
+                                "type": "object",
+                                "properties": {
+                                    "rounds": {"type": "int", "description": "How much JSON to parse"}
+                                },
+                                "required": ["rounds"]
+                            }
+                        },
+                        "class": "json_cruncher.JsonCruncher",
+                    },
+                ],
+            }
+            file_name: str = f"crunch_{index}.hocon"
+            with open(os.path.join(registry_dir, file_name), "w", encoding="utf-8") as hocon_file:
+                json.dump(network, hocon_file)
+            manifest[file_name] = True
+
+        manifest_file: str = os.path.join(registry_dir, "manifest.hocon")
+        with open(manifest_file, "w", encoding="utf-8") as hocon_file:
+            json.dump(manifest, hocon_file)
+        return manifest_file
+
+    def start_server(self, num_instances: int, sharding: bool) -> int:
+        """
+        :param num_instances: The number of http server instances
+        :param sharding: Whether to shard agent networks across instances
+        :return: The http port the server is listening on once ready
+        """
+        with socket.socket() as free_socket:
+            free_socket.bind(("127.0.0.1", 0))
+            port: int = free_socket.getsockname()[1]
+
+        repo_root: str = FileOfClass(__file__, "../../../../..").get_basis()
+        env: Dict[str, str] = dict(os.environ)
+        env.update({
+            "PYTHONPATH": os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH")])),
+            "OPENAI_API_KEY": env.get("OPENAI_API_KEY", "not-used"),
+            "AGENT_MANIFEST_FILE": self.manifest_file,
+            "AGENT_TOOL_PATH": AGENT_TOOL_PATH,
+            "AGENT_HTTP_SHARD_WEIGHTS": " ".join(f"crunch_{index}:1" for index in range(NUM_NETWORKS)),
+            "AGENT_HTTP_SHARD_SOCKET_DIR": self.temp_dir.name,
+            "AGENT_SERVICE_LOG_LEVEL": "WARNING",
+        })
+        command: List[str] = [sys.executable, "-m", "neuro_san.service.main_loop.server_main_loop",
+                              "--port", "0", "--http_port", str(port),
+                              "--http_server_instances", str(num_instances),
+                              "--http_sharding", "true" if sharding else "false"]
+        # pylint: disable=consider-using-with
+        self.server = subprocess.Popen(command, env=env, cwd=repo_root,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                       start_new_session=True)
+        asyncio.run(self.wait_until_ready(port, num_instances if sharding else 0))
+        return port
+
+    def stop_server(self):
+        """
+        Stops the server along with all of its worker processes
+        """
+        os.killpg(self.server.pid, signal.SIGKILL)
+        self.server.wait()
+        self.server = None
+
+    async def wait_until_ready(self, port: int, num_sockets: int):
+        """
+        :param port: The http port of the server
+        :param num_sockets: The number of worker sockets to wait for
+        """
+        deadline: float = time.time() + STARTUP_TIMEOUT_SECONDS
+        async with aiohttp.ClientSession() as session:
+            while True:
+                self.assertLess(time.time(), deadline, "Server did not come up")
+                self.assertIsNone(self.server.poll(), "Server exited")
+                try:
+                    async with session.get(f"http://127.0.0.1:{port}/readyz") as response:
+                        ready: bool = response.status == 200
+                except aiohttp.ClientError:
+                    ready = False
+                sockets: List[str] = [name for name in os.listdir(self.temp_dir.name) if name.endswith(".sock")]
+                if ready and len(sockets) >= num_sockets:
+                    return
+                await asyncio.sleep(0.5)
+
+    async def chat(self, session: aiohttp.ClientSession, port: int, index: int) -> int:
+        """
+        :param session: The ClientSession to use
+        :param port: The http port of the server
+        :param index: The index of the request
+        :return: The http status of the response
+        """
+        url: str = f"http://127.0.0.1:{port}/api/v1/crunch_{index % NUM_NETWORKS}/streaming_chat"
+        async with session.post(url, json={"user_message": {"text": "Crunch away"}}) as response:
+            lines: List[bytes] = [line async for line in response.content]
+            if response.status == 200:
+                self.assertIn("Crunched", lines[-1].decode("utf-8"))
+            return response.status
+
+    async def run_requests(self, port: int) -> float:
+        """
+        :param port: The http port of the server
+        :return: The number of requests per second served
+        """
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def limited_chat(session: aiohttp.ClientSession, index: int) -> int:
+            async with semaphore:
+                return await self.chat(session, port, index)
+
+        async with aiohttp.ClientSession() as session:
+            # Warm up every network
+            await asyncio.gather(*[self.chat(session, port, index) for index in range(NUM_NETWORKS)])
+
+            start: float = time.time()
+            statuses: List[int] = await asyncio.gather(*[limited_chat(session, index)
+                                                         for index in range(NUM_REQUESTS)])
+            elapsed: float = time.time() - start
+
+        self.assertEqual([200] * NUM_REQUESTS, statuses)
+        return NUM_REQUESTS / elapsed
+
+    async def run_until_all_succeed(self, port: int) -> List[int]:
+        """
+        :param port: The http port of the server
+        :return: The http statuses of one request to each network, once they all succeed
+        """
+        deadline: float = time.time() + STARTUP_TIMEOUT_SECONDS
+        async with aiohttp.ClientSession() as session:
+            while True:
+                statuses: List[int] = await asyncio.gather(*[self.chat(session, port, index)
+                                                             for index in range(NUM_NETWORKS)])
+                if statuses == [200] * NUM_NETWORKS or time.time() > deadline:
+                    return statuses
+                await asyncio.sleep(0.5)
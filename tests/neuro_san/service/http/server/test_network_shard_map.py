@@ -0,0 +1,100 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+from neuro_san.service.http.server.network_shard_map import NetworkShardMap
+
+
+class TestNetworkShardMap(TestCase):
+    """
+    Unit tests for NetworkShardMap class.
+    """
+
+    NAMES: List[str] = [f"network_{index}" for index in range(2000)]
+
+    def test_deterministic(self):
+        """
+        Tests that separately constructed maps agree with each other
+        """
+        one = NetworkShardMap(4)
+        other = NetworkShardMap(4)
+        for agent_name in self.NAMES:
+            shard: int = one.get_shard(agent_name)
+            self.assertEqual(shard, other.get_shard(agent_name))
+            self.assertTrue(0 <= shard < 4)
+
+    def test_single_shard(self):
+        """
+        Tests that a single shard owns everything
+        """
+        shard_map = NetworkShardMap(1)
+        for agent_name in self.NAMES:
+            self.assertEqual(0, shard_map.get_shard(agent_name))
+
+        with self.assertRaises(ValueError):
+            NetworkShardMap(0)
+
+    def test_balance(self):
+        """
+        Tests that hashed networks are spread about evenly
+        """
+        num_shards: int = 4
+        shard_map = NetworkShardMap(num_shards)
+        counts: List[int] = [0] * num_shards
+        for agent_name in self.NAMES:
+            counts[shard_map.get_shard(agent_name)] += 1
+
+        expected: float = len(self.NAMES) / num_shards
+        for count in counts:
+            self.assertGreater(count, expected * 0.6)
+            self.assertLess(count, expected * 1.4)
+
+    def test_consistent(self):
+        """
+        Tests that adding a shard only moves the networks which go to the new shard
+        """
+        before = NetworkShardMap(4)
+        after = NetworkShardMap(5)
+        moved: int = 0
+        for agent_name in self.NAMES:
+            if before.get_shard(agent_name) != after.get_shard(agent_name):
+                moved += 1
+                self.assertEqual(4, after.get_shard(agent_name))
+
+        # About 1/5th of networks should move
+        self.assertLess(moved, len(self.NAMES) * 0.35)
+
+    def test_weights(self):
+        """
+        Tests that weighted networks are spread by weight
+        """
+        weights: Dict[str, float] = {"huge": 10.0, "big": 5.0, "medium": 4.0, "small": 1.0}
+        shard_map = NetworkShardMap(2, weights)
+        self.assertEqual(shard_map.get_shard("big"), shard_map.get_shard("medium"))
+        self.assertEqual(shard_map.get_shard("big"), shard_map.get_shard("small"))
+        self.assertNotEqual(shard_map.get_shard("huge"), shard_map.get_shard("big"))
+
+    def test_parse_weights(self):
+        """
+        Tests parsing weights from their string form
+        """
+        self.assertEqual({}, NetworkShardMap.parse_weights(""))
+        self.assertEqual({}, NetworkShardMap.parse_weights(None))
+        self.assertEqual({"music_nerd_pro": 4.0, "hello_world": 0.5},
+                         NetworkShardMap.parse_weights(" music_nerd_pro:4  hello_world:0.5 "))
+
+        for bad in ["hello_world", "hello_world:", ":3", "hello_world:heavy", "hello_world:-1"]:
+            with self.assertRaises(ValueError):
+                NetworkShardMap.parse_weights(bad)
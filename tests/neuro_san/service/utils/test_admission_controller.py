@@ -0,0 +1,163 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import threading
+
+from unittest import TestCase
+
+from neuro_san.service.utils.admission_controller import AdmissionController
+
+
+class TestAdmissionController(TestCase):
+    """
+    Unit tests for AdmissionController class.
+    """
+
+    def test_assumptions(self):
+        """
+        Can we construct?
+        """
+        controller = AdmissionController()
+        self.assertIsNotNone(controller)
+
+    def test_unlimited(self):
+        """
+        Tests that the default controller admits everybody right away.
+        """
+        controller = AdmissionController()
+        for _ in range(100):
+            self.assertEqual(0.0, round(controller.acquire()))
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(100, stats.get("active"))
+        self.assertEqual(0, stats.get("rejected"))
+
+    def test_full_queue_rejects(self):
+        """
+        Tests that requests beyond the concurrency limit and queue length
+        are rejected without waiting.
+        """
+        controller = AdmissionController(max_concurrent=1, max_queued=0, queue_timeout_seconds=10.0)
+        self.assertIsNotNone(controller.acquire())
+        self.assertIsNone(controller.acquire())
+        controller.release()
+        self.assertIsNotNone(controller.acquire())
+
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(2, stats.get("admitted"))
+        self.assertEqual(1, stats.get("rejected"))
+        self.assertEqual(10, controller.get_retry_after_seconds())
+
+    def test_queue_timeout_rejects(self):
+        """
+        Tests that a request waiting in line too long is rejected.
+        """
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=0.05)
+        self.assertIsNotNone(controller.acquire())
+        self.assertIsNone(controller.acquire())
+
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(0, stats.get("queued"))
+        self.assertEqual(1, stats.get("rejected"))
+
+    def test_release_hands_off_to_waiter(self):
+        """
+        Tests that a thread waiting in line is admitted when a slot is released
+        and that its wait time is recorded.
+        """
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=10.0)
+        self.assertIsNotNone(controller.acquire())
+
+        results: List[float] = []
+        waiter = threading.Thread(target=lambda: results.append(controller.acquire()))
+        waiter.start()
+        while controller.get_stats().get("queued") == 0:
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        controller.release()
+        waiter.join(timeout=5.0)
+
+        self.assertEqual(1, len(results))
+        self.assertGreater(results[0], 0.0)
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(1, stats.get("active"))
+        self.assertGreater(stats.get("max_wait_seconds"), 0.0)
+
+    def test_async_waiters_do_not_block_loop(self):
+        """
+        Tests that coroutines waiting in line on the same event loop are admitted
+        in order as slots free up, and that the overflow is rejected.
+        """
+        controller = AdmissionController(max_concurrent=2, max_queued=2, queue_timeout_seconds=10.0)
+
+        async def one_request(index: int, order: List[int]) -> float:
+            wait: float = await controller.async_acquire()
+            if wait is None:
+                return None
+            order.append(index)
+            await asyncio.sleep(0.02)
+            controller.release()
+            return wait
+
+        async def many_requests() -> Tuple[List[float], List[int]]:
+            order: List[int] = []
+            waits: List[float] = await asyncio.gather(*[one_request(index, order) for index in range(5)])
+            return waits, order
+
+        waits, order = asyncio.run(many_requests())
+
+        rejected: List[float] = [wait for wait in waits if wait is None]
+        self.assertEqual(1, len(rejected))
+        self.assertEqual([0, 1, 2, 3], order)
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(0, stats.get("active"))
+        self.assertEqual(4, stats.get("admitted"))
+
+    def test_async_cancel_does_not_leak(self):
+        """
+        Tests that a cancelled coroutine waiting in line does not hold onto a slot.
+        """
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=10.0)
+
+        async def cancel_waiter():
+            await controller.async_acquire()
+            task = asyncio.create_task(controller.async_acquire())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            controller.release()
+
+        asyncio.run(cancel_waiter())
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(0, stats.get("active"))
+        self.assertEqual(0, stats.get("queued"))
+
+    def test_max_wait_seconds(self):
+        """
+        Tests that a caller can cap the wait below the queue timeout.
+        """
+        controller = AdmissionController(max_concurrent=1, max_queued=1, queue_timeout_seconds=10.0)
+        self.assertIsNotNone(controller.acquire())
+        self.assertIsNone(controller.acquire(max_wait_seconds=0.05))
+        self.assertIsNone(asyncio.run(controller.async_acquire(max_wait_seconds=-1.0)))
+
+        stats: Dict[str, Any] = controller.get_stats()
+        self.assertEqual(0, stats.get("queued"))
+        self.assertEqual(2, stats.get("rejected"))
+        self.assertEqual(0.5, controller.get_wait_timeout(0.5))
+        self.assertEqual(10.0, controller.get_wait_timeout())
@@ -0,0 +1,188 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import time
+
+import aiohttp
+import grpc
+import tornado.httpserver
+import tornado.netutil
+
+from neuro_san.api.grpc import agent_pb2
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.server.http_server_app import HttpServerApp
+from neuro_san.service.utils.admission_controller import AdmissionController
+from tests.neuro_san.service.grpc.test_grpc_aio_agent_service import FakeAsyncAgentService
+# Import the module rather than its TestCase, so its tests are not collected again here.
+from tests.neuro_san.service.grpc import test_grpc_aio_agent_service
+
+NUM_CLIENTS: int = 100
+MAX_CONCURRENT: int = 4
+MAX_QUEUED: int = 8
+QUEUE_TIMEOUT_SECONDS: float = 5.0
+
+
+class TestAdmissionLoad(TestCase):
+    """
+    Load tests sending many more concurrent streaming chats than the admission limits allow
+    to fake-llm agent networks.  The overflow is rejected right away, the wait queue never
+    grows past its bound, and everything admitted runs to the end.
+    """
+
+    def setUp(self):
+        self.admission = AdmissionController(max_concurrent=MAX_CONCURRENT, max_queued=MAX_QUEUED,
+                                             queue_timeout_seconds=QUEUE_TIMEOUT_SECONDS)
+        self.peaks: Dict[str, int] = {"active": 0, "queued": 0}
+
+    async def watch_admission(self):
+        """
+        Keeps track of the peak number of active and queued requests until cancelled
+        """
+        while True:
+            stats: Dict[str, Any] = self.admission.get_stats()
+            for key in ("active", "queued"):
+                self.peaks[key] = max(self.peaks[key], stats.get(key))
+            await asyncio.sleep(0.005)
+
+    def check_results(self, statuses: List[str], ok: str, rejected: str, elapsed: float):
+        """
+        :param statuses: The status of each client's request
+        :param ok: The status of a request that ran to the end
+        :param rejected: The status of a rejected request
+        :param elapsed: The number of seconds the whole load took
+        """
+        num_ok: int = statuses.count(ok)
+        num_rejected: int = statuses.count(rejected)
+        stats: Dict[str, Any] = self.admission.get_stats()
+        print(f"{NUM_CLIENTS} clients in {elapsed:.2f}s: {num_ok} served, {num_rejected} rejected, "
+              f"peak active {self.peaks['active']}, peak queued {self.peaks['queued']}, "
+              f"max queue wait {stats.get('max_wait_seconds'):.2f}s")
+
+        # Every request is either served or rejected, nothing fails otherwise.
+        self.assertEqual(NUM_CLIENTS, num_ok + num_rejected)
+        # At least the slots and the queue get served, most of the rest is turned away.
+        self.assertGreaterEqual(num_ok, MAX_CONCURRENT + MAX_QUEUED)
+        self.assertGreater(num_rejected, NUM_CLIENTS // 2)
+        self.assertEqual(num_ok, stats.get("admitted"))
+        self.assertEqual(num_rejected, stats.get("rejected"))
+
+        # The limits hold under load
+        self.assertLessEqual(self.peaks["active"], MAX_CONCURRENT)
+        self.assertLessEqual(self.peaks["queued"], MAX_QUEUED)
+        self.assertEqual(MAX_QUEUED, self.peaks["queued"])
+        self.assertLessEqual(stats.get("max_wait_seconds"), QUEUE_TIMEOUT_SECONDS + 0.5)
+        self.assertEqual(0, stats.get("active"))
+        self.assertEqual(0, stats.get("queued"))
+
+    def test_http_load(self):
+        """
+        Tests that the HTTP server answers the overflow with 429 and a Retry-After header
+        """
+        service = FakeAsyncAgentService(self.admission, num_messages=3, llm_seconds=0.1)
+
+        async def get_service(_handler: StreamingChatHandler, agent_name: str,
+                              metadata: Dict[str, Any]) -> FakeAsyncAgentService:
+            _ = agent_name, metadata
+            return service
+
+        log_json: str = FileOfClass(__file__, "../../../../neuro_san/deploy").get_file_in_basis("logging.json")
+        with patch.dict("os.environ", {"AGENT_SERVICE_LOG_JSON": log_json}), \
+                patch.object(StreamingChatHandler, "get_service", get_service):
+            start: float = time.monotonic()
+            statuses: List[str] = asyncio.run(self.run_http_load())
+            elapsed: float = time.monotonic() - start
+
+        self.check_results(statuses, "200", "429", elapsed)
+
+    async def run_http_load(self) -> List[str]:
+        """
+        :return: The status of each client's request, with its Retry-After header when rejected
+        """
+        request_data: Dict[str, Any] = {
+            "agent_policy": None,
+            "forwarded_request_metadata": ["user_id", "request_id"],
+            "openapi_service_spec_path": None,
+            "network_storage_dict": {},
+        }
+        app = HttpServerApp([(r"/api/v1/([^/]+)/streaming_chat", StreamingChatHandler, request_data)],
+                            -1, HttpLogger(["user_id", "request_id"]), ["user_id", "request_id"])
+        server = tornado.httpserver.HTTPServer(app)
+        sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+        server.add_sockets(sockets)
+        url: str = f"http://127.0.0.1:{sockets[0].getsockname()[1]}/api/v1/fake_agent/streaming_chat"
+        watcher = asyncio.create_task(self.watch_admission())
+
+        async def one_chat(session: aiohttp.ClientSession, index: int) -> str:
+            async with session.post(url, json={"user_message": {"text": f"hello {index}"}}) as response:
+                lines: List[bytes] = [line async for line in response.content]
+                if response.status == 429:
+                    self.assertEqual(str(int(QUEUE_TIMEOUT_SECONDS)), response.headers.get("Retry-After"))
+                else:
+                    self.assertEqual(3, len(lines))
+                return str(response.status)
+
+        try:
+            connector = aiohttp.TCPConnector(limit=0)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                return await asyncio.gather(*[one_chat(session, index) for index in range(NUM_CLIENTS)])
+        finally:
+            watcher.cancel()
+            server.stop()
+            await server.close_all_connections()
+
+    def test_grpc_load(self):
+        """
+        Tests that the grpc.aio server answers the overflow with RESOURCE_EXHAUSTED
+        """
+        service = FakeAsyncAgentService(self.admission, num_messages=3, llm_seconds=0.5)
+        start: float = time.monotonic()
+        statuses: List[str] = asyncio.run(self.run_grpc_load(service))
+        elapsed: float = time.monotonic() - start
+
+        self.check_results(statuses, "OK", grpc.StatusCode.RESOURCE_EXHAUSTED.name, elapsed)
+
+    async def run_grpc_load(self, service: FakeAsyncAgentService) -> List[str]:
+        """
+        :param service: The fake service to serve
+        :return: The status of each client's request
+        """
+        helper = test_grpc_aio_agent_service.TestGrpcAioAgentService
+        server, port = await helper.start_server(helper.create_servicer(service))
+        watcher = asyncio.create_task(self.watch_admission())
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                streaming_chat = helper.create_streaming_chat(channel)
+
+                async def one_chat(index: int) -> str:
+                    # pylint: disable=no-member
+                    request = agent_pb2.ChatRequest()
+                    request.user_message.text = f"hello {index}"
+                    try:
+                        responses: List[Any] = [response async for response in streaming_chat(request)]
+                    except grpc.aio.AioRpcError as exception:
+                        return exception.code().name
+                    self.assertEqual(3, len(responses))
+                    return "OK"
+
+                return await asyncio.gather(*[one_chat(index) for index in range(NUM_CLIENTS)])
+        finally:
+            watcher.cancel()
+            await server.stop(None)
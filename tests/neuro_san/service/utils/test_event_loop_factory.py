@@ -0,0 +1,74 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import importlib
+
+from neuro_san.service.utils.event_loop_factory import EventLoopFactory
+
+
+def import_without_uvloop(name: str, *args, **kwargs):
+    """
+    :param name: The name of the module to import
+    :return: The imported module, as long as it is not uvloop
+    """
+    if name == "uvloop":
+        raise ImportError("No module named 'uvloop'")
+    return importlib.import_module(name, *args, **kwargs)
+
+
+class TestEventLoopFactory(TestCase):
+    """
+    Unit tests for EventLoopFactory class.
+    """
+
+    def test_asyncio(self):
+        """
+        Tests that the standard event loop can always be asked for
+        """
+        factory = EventLoopFactory("asyncio")
+        self.assertEqual("asyncio", factory.get_implementation_name())
+        loop: asyncio.AbstractEventLoop = factory.new_event_loop()
+        try:
+            self.assertEqual(3, loop.run_until_complete(asyncio.sleep(0, result=3)))
+        finally:
+            loop.close()
+
+    def test_fallback(self):
+        """
+        Tests that a missing uvloop falls back to the standard event loop
+        """
+        with patch("neuro_san.service.utils.event_loop_factory.importlib.import_module",
+                   side_effect=import_without_uvloop):
+            for implementation in ("auto", "uvloop"):
+                factory = EventLoopFactory(implementation)
+                self.assertEqual("asyncio", factory.get_implementation_name())
+
+        loop: asyncio.AbstractEventLoop = factory.set_new_event_loop()
+        try:
+            self.assertIsInstance(loop, asyncio.AbstractEventLoop)
+            self.assertIs(loop, asyncio.get_event_loop())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def test_env_var(self):
+        """
+        Tests that the env var picks the implementation
+        """
+        with patch.dict("os.environ", {"AGENT_EVENT_LOOP": "asyncio"}):
+            self.assertEqual("asyncio", EventLoopFactory().get_implementation_name())
+        with patch.dict("os.environ", {"AGENT_EVENT_LOOP": "libuv"}):
+            with self.assertRaises(ValueError):
+                EventLoopFactory()
@@ -0,0 +1,189 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+import time
+
+from langchain_core.messages import HumanMessage
+
+from neuro_san.interfaces.coded_tool import CodedTool
+from neuro_san.service.utils.memory_profiler import MemoryProfiler
+
+# Where the leaky CodedTool below leaks to
+LEAKED: List[Any] = []
+LEAK_SIZE: int = 100_000
+
+
+def find_line(marker: str) -> int:
+    """
+    :param marker: A comment marking a line of this file
+    :return: The line number of the marked line
+    """
+    with open(__file__, encoding="utf-8") as source:
+        for line_number, line in enumerate(source, start=1):
+            if line.rstrip().endswith(f"# {marker}"):
+                return line_number
+    raise ValueError(marker)
+
+
+class LeakyCodedTool(CodedTool):
+    """
+    CodedTool which leaks a buffer and a message every time it is invoked.
+    """
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        LEAKED.append(bytearray(LEAK_SIZE))     # leaks buffers
+        LEAKED.append(HumanMessage(content=args.get("text", "")))
+        return "leaked"
+
+
+class PeakyCodedTool(CodedTool):
+    """
+    CodedTool which uses a lot of memory for a moment, but gives it all back.
+    """
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        scratch = bytearray(args.get("size", 0))
+        await asyncio.sleep(0)
+        return f"used {len(scratch)} bytes"
+
+
+class TestMemoryProfiler(TestCase):
+    """
+    Unit tests for MemoryProfiler class.
+    """
+
+    def setUp(self):
+        self.profiler = MemoryProfiler()
+
+    def tearDown(self):
+        self.profiler.configure(tracing=False)
+        LEAKED.clear()
+
+    def test_off_by_default(self):
+        """
+        Tests that nothing happens, and quickly, until tracing is turned on
+        """
+        self.assertFalse(self.profiler.get_status().get("tracing"))
+        with self.assertRaises(ValueError):
+            self.profiler.take_snapshot("baseline")
+
+        self.profiler.configure(request_sample_rate=1.0)
+        num_requests: int = 100_000
+        start: float = time.perf_counter()
+        for _ in range(num_requests):
+            self.profiler.finish_request_sample("x", self.profiler.start_request_sample())
+        per_request: float = (time.perf_counter() - start) / num_requests
+        print(f"\nPer-request cost with tracing off: {per_request * 1e9:.0f} ns")
+        self.assertLess(per_request, 20e-6)
+        self.assertEqual({}, self.profiler.get_request_samples())
+
+    def test_finds_leak(self):
+        """
+        Tests that a diff against a snapshot points at the leaking line
+        """
+        self.profiler.configure(tracing=True)
+        self.profiler.take_snapshot("baseline")
+
+        num_calls: int = 20
+        tool = LeakyCodedTool()
+        for _ in range(num_calls):
+            asyncio.run(tool.async_invoke({"text": "hello"}, {}))
+
+        differences: List[Dict[str, Any]] = self.profiler.compare_to_snapshot("baseline", limit=5)
+        self.assertEqual(__file__, differences[0].get("file"))
+        self.assertEqual(find_line("leaks buffers"), differences[0].get("line"))
+        self.assertGreaterEqual(differences[0].get("size_diff_bytes"), num_calls * LEAK_SIZE)
+
+        top: List[Dict[str, Any]] = self.profiler.get_top_allocators(limit=5, group_by="filename")
+        self.assertIn(__file__, [allocator.get("file") for allocator in top])
+
+        with self.assertRaises(KeyError):
+            self.profiler.compare_to_snapshot("nope")
+        with self.assertRaises(ValueError):
+            self.profiler.get_top_allocators(group_by="nope")
+
+    def test_tracebacks(self):
+        """
+        Tests that more frames show who called the leaking line
+        """
+        self.profiler.configure(tracing=True, frames=5)
+        self.profiler.take_snapshot("baseline")
+        asyncio.run(LeakyCodedTool().async_invoke({}, {}))
+
+        differences: List[Dict[str, Any]] = self.profiler.compare_to_snapshot("baseline", group_by="traceback")
+        self.assertEqual(find_line("leaks buffers"), differences[0].get("line"))
+        self.assertGreater(len(differences[0].get("traceback")), 1)
+        self.assertTrue(differences[0].get("traceback")[-1].endswith(f":{find_line('leaks buffers')}"))
+
+    def test_count_objects(self):
+        """
+        Tests that leaked objects get counted, subclasses included
+        """
+        before: Dict[str, int] = MemoryProfiler.count_objects()
+        tool = LeakyCodedTool()
+        for _ in range(7):
+            asyncio.run(tool.async_invoke({}, {}))
+        after: Dict[str, int] = MemoryProfiler.count_objects()
+
+        self.assertEqual(7, after.get("BaseMessage") - before.get("BaseMessage"))
+        self.assertEqual(after.get("AgentExecutor"), before.get("AgentExecutor"))
+        self.assertEqual({"LeakyCodedTool": 1}, MemoryProfiler.count_objects(["LeakyCodedTool"]))
+
+    def test_request_samples(self):
+        """
+        Tests that sampled requests report their peak allocation and what they kept
+        """
+        self.profiler.configure(tracing=True, request_sample_rate=0.5)
+        scratch_size: int = 5_000_000
+        tools: Dict[str, CodedTool] = {"peaky": PeakyCodedTool(), "leaky": LeakyCodedTool()}
+        for _ in range(4):
+            for name, tool in tools.items():
+                start_bytes: int = self.profiler.start_request_sample()
+                asyncio.run(tool.async_invoke({"size": scratch_size}, {}))
+                self.profiler.finish_request_sample(name, start_bytes)
+
+        samples: Dict[str, Dict[str, Any]] = self.profiler.get_request_samples()
+        # Every other request is sampled, and that is always the second tool.
+        self.assertEqual({"leaky"}, set(samples.keys()))
+        self.assertEqual(4, samples["leaky"]["num_samples"])
+        self.assertGreaterEqual(samples["leaky"]["last_retained_bytes"], LEAK_SIZE)
+        self.assertLess(samples["leaky"]["max_peak_bytes"], scratch_size)
+
+        self.profiler.configure(request_sample_rate=1.0)
+        for _ in range(3):
+            start_bytes = self.profiler.start_request_sample()
+            asyncio.run(tools["peaky"].async_invoke({"size": scratch_size}, {}))
+            self.profiler.finish_request_sample("peaky", start_bytes)
+
+        samples = self.profiler.get_request_samples()
+        self.assertEqual(3, samples["peaky"]["num_samples"])
+        self.assertGreaterEqual(samples["peaky"]["max_peak_bytes"], scratch_size)
+        self.assertLess(samples["peaky"]["last_retained_bytes"], scratch_size // 10)
+
+        self.profiler.configure(tracing=False)
+        self.assertEqual({}, self.profiler.get_request_samples())
+        self.assertEqual([], self.profiler.get_status().get("snapshots"))
+
+    def test_bad_configuration(self):
+        """
+        Tests that nonsense settings are refused
+        """
+        with self.assertRaises(ValueError):
+            self.profiler.configure(frames=0)
+        with self.assertRaises(ValueError):
+            self.profiler.configure(request_sample_rate=2.0)
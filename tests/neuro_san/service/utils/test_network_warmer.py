@@ -0,0 +1,208 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import os
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.utils.file_of_class import FileOfClass
+from neuro_san.service.utils.network_warmer import NetworkWarmer
+from neuro_san.service.utils.server_status import ServerStatus
+
+LOAD_SECONDS: float = 0.1
+FIRST_LLM_SECONDS: float = 0.2
+
+
+class FakeLlmFactory:
+    """
+    Stands in for a ContextTypeLlmFactory whose first llm for any given model
+    is expensive to create, like the real thing when provider packages and
+    client classes get set up on first use.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.created: List[str] = []
+
+    def load(self):
+        """
+        Loading is not free either
+        """
+        time.sleep(LOAD_SECONDS)
+
+    def create_llm(self, config: Dict[str, Any]) -> str:
+        """
+        :param config: The llm_config
+        :return: A stand-in for an llm
+        """
+        model_name: str = config.get("model_name")
+        if model_name not in self.created:
+            time.sleep(FIRST_LLM_SECONDS)
+            self.created.append(model_name)
+        return model_name
+
+
+class FakeService:
+    """
+    Stands in for an AgentService, which loads its factories upon construction
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.llm_factory = FakeLlmFactory()
+        self.llm_factory.load()
+        self.toolbox_factory = None
+
+    def handle_first_request(self, agent_network: AgentNetwork) -> str:
+        """
+        :param agent_network: The agent network to handle a request for
+        :return: The llm the front man would use
+        """
+        front_man: Dict[str, Any] = agent_network.get_agent_tool_spec(agent_network.find_front_man())
+        config: Dict[str, Any] = agent_network.get_config().get("llm_config")
+        config = front_man.get("llm_config", config)
+        return self.llm_factory.create_llm(config)
+
+
+class FakeServer:
+    """
+    Stands in for a server, which creates services lazily as they are asked for
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.services: Dict[str, FakeService] = {}
+
+    def get_agent_service(self, agent_name: str) -> FakeService:
+        """
+        :param agent_name: name of an agent
+        :return: The service for the agent
+        """
+        if agent_name not in self.services:
+            self.services[agent_name] = FakeService()
+        return self.services[agent_name]
+
+
+class TestNetworkWarmer(TestCase):
+    """
+    Tests for the NetworkWarmer
+    """
+
+    @staticmethod
+    def get_storage(*hocon_files: str) -> AgentNetworkStorage:
+        """
+        :param hocon_files: The hocon files within this repo's registries to put in the storage
+        :return: An AgentNetworkStorage with the agent networks of the hocon files
+        """
+        file_of_class = FileOfClass(__file__, "../../../../neuro_san/registries")
+        restorer = AgentNetworkRestorer()
+        storage = AgentNetworkStorage()
+        for hocon_file in hocon_files:
+            agent_network: AgentNetwork = restorer.restore(file_reference=file_of_class.get_file_in_basis(hocon_file))
+            storage.add_agent_network(agent_network.get_network_name(), agent_network)
+        return storage
+
+    @staticmethod
+    def time_first_request(server: FakeServer, storage: AgentNetworkStorage, agent_name: str) -> float:
+        """
+        :return: The number of seconds the first request to the agent network takes
+        """
+        agent_network: AgentNetwork = storage.get_agent_network_provider(agent_name).get_agent_network()
+        start_time: float = time.monotonic()
+        server.get_agent_service(agent_name).handle_first_request(agent_network)
+        return time.monotonic() - start_time
+
+    def test_first_request_latency(self):
+        """
+        Compares first request latency with warm-up off and on
+        """
+        storage: AgentNetworkStorage = self.get_storage("hello_world.hocon")
+
+        cold_server = FakeServer()
+        cold_seconds: float = self.time_first_request(cold_server, storage, "hello_world")
+
+        warm_server = FakeServer()
+        warmer = NetworkWarmer()
+        warmer.add_service_lookup(warm_server.get_agent_service)
+        warmer.start(storage).result()
+        warm_seconds: float = self.time_first_request(warm_server, storage, "hello_world")
+
+        print(f"\nFirst request: {cold_seconds * 1000:.1f} ms cold, {warm_seconds * 1000:.1f} ms warm")
+        self.assertGreaterEqual(cold_seconds, LOAD_SECONDS + FIRST_LLM_SECONDS)
+        self.assertLess(warm_seconds, LOAD_SECONDS)
+        self.assertIn("hello_world", warmer.get_warm_up_seconds())
+
+    def test_readiness(self):
+        """
+        Tests that the server only reports as ready once the initial warm-up is done
+        """
+        server_status = ServerStatus("test")
+        server_status.grpc_service.set_requested(False)
+        server_status.http_service.set_requested(False)
+        server_status.updater.set_requested(False)
+        self.assertFalse(server_status.is_server_ready())
+
+        storage: AgentNetworkStorage = self.get_storage("hello_world.hocon", "math_guy.hocon")
+        warmer = NetworkWarmer(server_status)
+        warmer.add_service_lookup(FakeServer().get_agent_service)
+        warm_up_seconds: Dict[str, float] = warmer.start(storage).result()
+
+        self.assertTrue(server_status.is_server_ready())
+        self.assertEqual({"hello_world", "math_guy"}, set(warm_up_seconds.keys()))
+
+    def test_reload(self):
+        """
+        Tests that networks added or changed after the initial warm-up are warmed up too
+        """
+        storage: AgentNetworkStorage = self.get_storage("hello_world.hocon")
+        server = FakeServer()
+        warmer = NetworkWarmer()
+        warmer.add_service_lookup(server.get_agent_service)
+        warmer.start(storage).result()
+
+        math_guy: AgentNetwork = self.get_storage("math_guy.hocon") \
+            .get_agent_network_provider("math_guy").get_agent_network()
+        storage.add_agent_network("math_guy", math_guy)
+        storage.remove_agent_network("hello_world")
+
+        # Everything is done on a single thread, so wait for one more thing to get done.
+        warmer.executor.submit(time.sleep, 0).result()
+        self.assertEqual(["math_guy"], list(warmer.get_warm_up_seconds().keys()))
+        self.assertEqual(["gpt-4o"], server.services["math_guy"].llm_factory.created)
+
+    def test_real_factories(self):
+        """
+        Tests warming up with the real llm and toolbox factories,
+        including CodedTool class resolution
+        """
+        storage: AgentNetworkStorage = self.get_storage("math_guy.hocon", "music_nerd_pro.hocon")
+        warmer = NetworkWarmer()
+        # Do not depend on PYTHONPATH to find the CodedTools in this repo
+        with patch.dict(os.environ, {"AGENT_TOOL_PATH": "neuro_san.coded_tools"}):
+            with self.assertNoLogs(warmer.logger, level="WARNING"):
+                warm_up_seconds: Dict[str, float] = warmer.warm_up(storage)
+        print(f"\nWarm-up seconds: {warm_up_seconds}")
+        self.assertEqual({"math_guy", "music_nerd_pro"}, set(warm_up_seconds.keys()))
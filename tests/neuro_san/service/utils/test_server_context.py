@@ -0,0 +1,68 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from unittest import TestCase
+from unittest.mock import patch
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.service.main_loop.server_main_loop import ServerMainLoop
+from neuro_san.service.utils.server_context import ServerContext
+
+
+class TestServerContext(TestCase):
+    """
+    Unit tests for ServerContext class.
+    """
+
+    def test_default_message_queue_args(self):
+        """
+        Tests that the message queue of each request is unbounded by default.
+        """
+        queue = AsyncCollatingQueue(**ServerContext().get_message_queue_args())
+        self.assertEqual(0, queue.max_size)
+        self.assertEqual(AsyncCollatingQueue.BLOCK, queue.overflow_policy)
+
+    def test_set_message_queue_args(self):
+        """
+        Tests that valid message queue settings are kept and invalid ones are rejected.
+        """
+        server_context = ServerContext()
+        server_context.set_message_queue_args(1000, AsyncCollatingQueue.COALESCE, False)
+        queue = AsyncCollatingQueue(**server_context.get_message_queue_args())
+        self.assertEqual(1000, queue.max_size)
+        self.assertEqual(AsyncCollatingQueue.COALESCE, queue.overflow_policy)
+
+        with self.assertRaises(ValueError):
+            server_context.set_message_queue_args(1000, "squash", False)
+
+    def test_message_queue_env_vars(self):
+        """
+        Tests that the message queue env vars are read once at startup,
+        and that invalid values stop the server there.
+        """
+        environ = {
+            "AGENT_MAX_QUEUED_MESSAGES": "50",
+            "AGENT_QUEUED_MESSAGES_OVERFLOW_POLICY": "drop"
+        }
+        with patch.dict("os.environ", environ), patch("sys.argv", ["server"]):
+            main_loop = ServerMainLoop()
+            main_loop.parse_args()
+        self.assertEqual({"max_size": 50, "overflow_policy": "drop", "batch_messages": False},
+                         main_loop.server_context.get_message_queue_args())
+
+        environ["AGENT_QUEUED_MESSAGES_OVERFLOW_POLICY"] = "squash"
+        with patch.dict("os.environ", environ), patch("sys.argv", ["server"]):
+            with self.assertRaises(ValueError):
+                ServerMainLoop().parse_args()
+
+        environ["AGENT_MAX_QUEUED_MESSAGES"] = "many"
+        with patch.dict("os.environ", environ), patch("sys.argv", ["server"]):
+            with self.assertRaises(ValueError):
+                ServerMainLoop().parse_args()
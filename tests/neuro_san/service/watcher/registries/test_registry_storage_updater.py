@@ -0,0 +1,190 @@
+
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import os
+import tempfile
+import threading
+import time
+
+from unittest import TestCase
+
+from neuro_san.service.watcher.registries.change_debouncer import ChangeDebouncer
+from neuro_san.service.watcher.registries.registry_storage_updater import RegistryStorageUpdater
+
+
+class RecordingRegistryStorageUpdater(RegistryStorageUpdater):
+    """
+    RegistryStorageUpdater that records reloads instead of restoring a manifest.
+    """
+
+    def __init__(self, manifest_path: str, update_period_seconds: int = 10):
+        watcher_config: Dict[str, Any] = {
+            "manifest_path": manifest_path,
+            "manifest_update_period_seconds": update_period_seconds,
+        }
+        self.reload_times: List[float] = []
+        self.reloaded = threading.Event()
+        super().__init__({}, watcher_config)
+
+    def update_storage(self):
+        modified, added, deleted = self.observer.reset_event_counters()
+        if modified == added == deleted == 0:
+            return
+        self.reload_times.append(time.monotonic())
+        self.reloaded.set()
+
+
+class PollingRecordingRegistryStorageUpdater(RecordingRegistryStorageUpdater):
+    """
+    Same as above, but always polls.
+    """
+    use_polling: bool = True
+
+
+class TestRegistryStorageUpdater(TestCase):
+    """
+    Unit tests for RegistryStorageUpdater class.
+    """
+
+    def setUp(self):
+        self.old_debounce: str = os.environ.get("AGENT_MANIFEST_UPDATE_DEBOUNCE_SECONDS")
+        os.environ["AGENT_MANIFEST_UPDATE_DEBOUNCE_SECONDS"] = "0.2"
+        # pylint: disable=consider-using-with
+        self.registry_dir = tempfile.TemporaryDirectory()
+        self.manifest_path: str = os.path.join(self.registry_dir.name, "manifest.hocon")
+        self._write(self.manifest_path, "{}")
+
+    def tearDown(self):
+        if self.old_debounce is None:
+            os.environ.pop("AGENT_MANIFEST_UPDATE_DEBOUNCE_SECONDS", None)
+        else:
+            os.environ["AGENT_MANIFEST_UPDATE_DEBOUNCE_SECONDS"] = self.old_debounce
+        self.registry_dir.cleanup()
+
+    @staticmethod
+    def _write(path: str, text: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write(text)
+
+    def test_assumptions(self):
+        """
+        Can we construct? Event driven updaters need no periodic calls.
+        """
+        updater = RecordingRegistryStorageUpdater(self.manifest_path)
+        self.assertTrue(updater.is_event_driven())
+        self.assertEqual(0, updater.get_update_period_in_seconds())
+
+        updater = PollingRecordingRegistryStorageUpdater(self.manifest_path)
+        self.assertFalse(updater.is_event_driven())
+        self.assertEqual(10, updater.get_update_period_in_seconds())
+
+    def test_reacts_to_edit(self):
+        """
+        Tests that an edit is picked up without any update_storage() calls
+        from a StorageWatcher, well before the update period.
+        """
+        updater = RecordingRegistryStorageUpdater(self.manifest_path)
+        updater.start()
+        try:
+            start: float = time.monotonic()
+            self._write(os.path.join(self.registry_dir.name, "agent.hocon"), "{}")
+            self.assertTrue(updater.reloaded.wait(5.0))
+            latency: float = updater.reload_times[0] - start
+            self.assertLess(latency, 2.0)
+        finally:
+            updater.stop()
+
+    def test_burst_coalesces(self):
+        """
+        Tests that a burst of writes and save-and-rename edits results in a single reload.
+        """
+        updater = RecordingRegistryStorageUpdater(self.manifest_path)
+        updater.start()
+        try:
+            for index in range(20):
+                agent_path: str = os.path.join(self.registry_dir.name, f"agent_{index % 5}.hocon")
+                temp_path: str = os.path.join(self.registry_dir.name, f".agent_{index % 5}.hocon.tmp")
+                self._write(temp_path, f"{{ index = {index} }}")
+                os.replace(temp_path, agent_path)
+                self._write(self.manifest_path, f"{{ index = {index} }}")
+
+            self.assertTrue(updater.reloaded.wait(5.0))
+            # Give any stragglers a chance to show up
+            time.sleep(0.6)
+            self.assertEqual(1, len(updater.reload_times))
+            self.assertEqual(1, updater.debouncer.get_stats().get("callbacks"))
+        finally:
+            updater.stop()
+
+    def test_ignores_other_files(self):
+        """
+        Tests that files which are not registry files do not cause reloads.
+        """
+        updater = RecordingRegistryStorageUpdater(self.manifest_path)
+        updater.start()
+        try:
+            self._write(os.path.join(self.registry_dir.name, "notes.txt"), "hello")
+            self.assertFalse(updater.reloaded.wait(0.6))
+        finally:
+            updater.stop()
+
+    def test_idle_cpu(self):
+        """
+        Tests that an idle event driven updater uses less cpu than polling
+        a registry directory with many files.
+        """
+        for index in range(500):
+            self._write(os.path.join(self.registry_dir.name, f"agent_{index}.hocon"), "{}")
+
+        idle_seconds: float = 1.5
+        event_cpu: float = self._measure_idle_cpu(RecordingRegistryStorageUpdater(self.manifest_path),
+                                                  idle_seconds)
+        polling_cpu: float = self._measure_idle_cpu(
+            PollingRecordingRegistryStorageUpdater(self.manifest_path, update_period_seconds=1),
+            idle_seconds)
+        self.assertLess(event_cpu, polling_cpu)
+
+    @staticmethod
+    def _measure_idle_cpu(updater: RegistryStorageUpdater, idle_seconds: float) -> float:
+        updater.start()
+        try:
+            start: float = time.process_time()
+            time.sleep(idle_seconds)
+            return time.process_time() - start
+        finally:
+            updater.stop()
+
+
+class TestChangeDebouncer(TestCase):
+    """
+    Unit tests for ChangeDebouncer class.
+    """
+
+    def test_max_delay(self):
+        """
+        Tests that a steady stream of notifications cannot put off the callback forever.
+        """
+        called = threading.Event()
+        debouncer = ChangeDebouncer(called.set, quiet_seconds=0.2, max_delay_seconds=0.5)
+        debouncer.start()
+        try:
+            start: float = time.monotonic()
+            while not called.is_set() and time.monotonic() - start < 3.0:
+                debouncer.notify()
+                time.sleep(0.05)
+            self.assertTrue(called.is_set())
+            self.assertLess(time.monotonic() - start, 1.5)
+        finally:
+            debouncer.stop()
@@ -0,0 +1,144 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san SDK Software in commercial settings.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import List
+
+import os
+import tempfile
+import threading
+import time
+
+from unittest import TestCase
+
+from neuro_san.interfaces.agent_session import AgentSession
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.test.driver.data_driven_agent_test_driver import DataDrivenAgentTestDriver
+
+LATENCY_SECONDS: float = 0.2
+
+
+class LatencyAgentSession(AgentSession):
+    """
+    AgentSession that answers every request after a simulated LLM latency.
+    """
+
+    def __init__(self, answers: List[str]):
+        """
+        Constructor
+
+        :param answers: The answers to give, popped one per request
+        """
+        self.answers: List[str] = answers
+        self.lock = threading.Lock()
+
+    def function(self, request_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def connectivity(self, request_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def streaming_chat(self, request_dict: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+        time.sleep(LATENCY_SECONDS)
+        with self.lock:
+            answer: str = self.answers.pop(0)
+        yield {
+            "response": {
+                "type": ChatMessageType.AI,
+                "origin": [{"tool": "fake_agent", "instantiation_index": 1}],
+                "text": answer
+            }
+        }
+
+
+class LatencyTestDriver(DataDrivenAgentTestDriver):
+    """
+    Test driver whose sessions are LatencyAgentSessions
+    """
+
+    def __init__(self, answers: List[str], max_parallel_iterations: int = None):
+        super().__init__(TestCase(), max_parallel_iterations=max_parallel_iterations)
+        self.session = LatencyAgentSession(answers)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def create_session(self, connection: str, agent: str, use_direct: bool,
+                       metadata: Dict[str, Any], timeout_in_seconds: float) -> AgentSession:
+        return self.session
+
+
+class TestDataDrivenAgentTestDriver(TestCase):
+    """
+    Tests for parallel iterations in the DataDrivenAgentTestDriver
+    """
+
+    def setUp(self):
+        """
+        Writes a test case hocon with an 8/8 success_ratio
+        """
+        # pylint: disable=consider-using-with
+        self.hocon_file = tempfile.NamedTemporaryFile(mode="w", suffix=".hocon", delete=False)
+        self.hocon_file.write("""
+{
+    "agent": "fake_agent",
+    "connections": ["direct"],
+    "success_ratio": "8/8",
+    "interactions": [
+        {
+            "text": "Say hello",
+            "response": {
+                "text": {
+                    "keywords": "hello"
+                }
+            }
+        }
+    ]
+}
+""")
+        self.hocon_file.close()
+
+    def tearDown(self):
+        os.remove(self.hocon_file.name)
+
+    def test_parallel_is_faster(self):
+        """
+        Tests that parallel iterations take a fraction of the time of sequential ones
+        """
+        sequential = LatencyTestDriver(["hello"] * 8, max_parallel_iterations=1)
+        result: Dict[str, Any] = sequential.one_test(self.hocon_file.name)
+        self.assertTrue(result.get("passed"))
+        self.assertEqual(8, result.get("num_successful"))
+        self.assertGreaterEqual(result.get("elapsed_seconds"), 8 * LATENCY_SECONDS)
+
+        parallel = LatencyTestDriver(["hello"] * 8, max_parallel_iterations=8)
+        result = parallel.one_test(self.hocon_file.name)
+        self.assertTrue(result.get("passed"))
+        self.assertEqual(8, result.get("num_successful"))
+        self.assertLess(result.get("elapsed_seconds"), 4 * LATENCY_SECONDS)
+
+    def test_parallel_failure(self):
+        """
+        Tests that a failing iteration fails the test case when run in parallel
+        """
+        driver = LatencyTestDriver(["hello"] * 7 + ["goodbye"], max_parallel_iterations=4)
+        with self.assertRaises(AssertionError):
+            driver.one_test(self.hocon_file.name)
+
+    def test_many_tests(self):
+        """
+        Tests running many test cases in parallel, collecting results
+        """
+        driver = LatencyTestDriver(["hello"] * 15 + ["goodbye"], max_parallel_iterations=8)
+        results: List[Dict[str, Any]] = driver.many_tests([self.hocon_file.name] * 2, max_parallel_tests=2)
+        self.assertEqual(2, len(results))
+        passed: List[bool] = [result.get("passed") for result in results]
+        self.assertEqual(1, passed.count(True))
+        self.assertEqual(1, passed.count(False))